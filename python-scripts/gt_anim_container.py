@@ -0,0 +1,444 @@
+"""
+ GT Anim Container - Compact binary (columnar) format used to store animation curves
+ github.com/TrevisanGMW/gt-tools - 2026-10-18
+
+ Layout (little-endian):
+    Preamble: magic "GTANIM" (6 bytes), version (uint16), flags (uint16), header size (uint32)
+    Header: JSON (utf-8) with the metadata, the tangent type table and the curve index (offset, size, key count)
+    Blocks: curves are split into chunks of keys (one block per chunk). Each block stores contiguous arrays (columns)
+            in the order of "float_columns" followed by "byte_columns". Blocks can be individually compressed (zlib),
+            so curves (or time ranges of a curve) can be read alone.
+
+ 1.0.0 - 2026-10-18
+ Initial release
+
+ 1.1.0 - 2026-10-18
+ Curves are stored in chunks of keys (container version 2), the index stores the time range of every chunk
+ Added time windows to the reader (only chunks overlapping the window are read from disk)
+ Added "crop_anim_columns"
+
+"""
+from array import array
+import logging
+import json
+import zlib
+import time
+import sys
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger("gt_anim_container")
+logger.setLevel(logging.INFO)
+
+container_magic = b'GTANIM'
+container_version = 2
+default_chunk_size = 1024  # Keys per block
+flag_compressed = 1
+preamble_size = 14  # magic (6) + version (2) + flags (2) + header size (4)
+
+# Columns (the order is the order used in the binary blocks)
+float_columns = ['times', 'values', 'in_angles', 'out_angles', 'in_weights', 'out_weights']
+byte_columns = ['locks', 'in_tangent_types', 'out_tangent_types']
+# Index of each element in the legacy key tuple (JSON ".anim" files)
+legacy_key_layout = ['times', 'values', 'in_angles', 'out_angles', 'locks', 'in_weights', 'out_weights',
+                     'in_tangent_types', 'out_tangent_types']
+# Default table for the tangent types (files store their own table, unknown types are appended)
+default_tangent_types = ['auto', 'spline', 'linear', 'flat', 'step', 'stepnext', 'fixed', 'clamped', 'plateau',
+                         'slow', 'fast']
+
+
+def _to_little_endian(values):
+    """ Swaps the byte order of an array in case the current platform is big-endian """
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values
+
+
+def columns_from_legacy_keys(key_list):
+    """
+    Converts a list of keys in the legacy layout (JSON ".anim" file) into columns
+
+    Args:
+        key_list (list): A list of keys. Each key is a list/tuple ordered as "legacy_key_layout"
+                         e.g. [[1.0, 0.5, 0.0, 0.0, True, 1.0, 1.0, 'auto', 'auto'], ...]
+
+    Returns:
+        columns (dict): A dictionary with the column names as keys and lists as values
+    """
+    columns = {}
+    for index, column in enumerate(legacy_key_layout):
+        columns[column] = [key[index] for key in key_list]
+    return columns
+
+
+def legacy_keys_from_columns(columns):
+    """
+    Converts columns back into a list of keys using the legacy layout (JSON ".anim" file)
+
+    Args:
+        columns (dict): A dictionary with the column names as keys and lists as values
+
+    Returns:
+        key_list (list): A list of tuples ordered as "legacy_key_layout"
+    """
+    return list(zip(*[columns.get(column) for column in legacy_key_layout]))
+
+
+def crop_anim_columns(columns, start=None, end=None):
+    """
+    Keeps only the keys inside a time window
+
+    Args:
+        columns (dict): A dictionary with the column names as keys and lists/arrays as values (sorted by time)
+        start (optional, float): First frame of the window (inclusive). None means no lower limit.
+        end (optional, float): Last frame of the window (inclusive). None means no upper limit.
+
+    Returns:
+        columns (dict): Cropped columns (the provided dictionary is returned if all keys are inside the window)
+    """
+    times = columns.get('times')
+    first = 0
+    last = len(times)
+    if start is not None:
+        while first < last and times[first] < start:
+            first += 1
+    if end is not None:
+        while last > first and times[last - 1] > end:
+            last -= 1
+    if first == 0 and last == len(times):
+        return columns
+    return dict((column, values[first:last]) for column, values in columns.items())
+
+
+def _slice_columns(columns, first, last):
+    """ Gets the keys from "first" (inclusive) to "last" (exclusive) of a dictionary of columns """
+    return dict((column, columns.get(column)[first:last]) for column in legacy_key_layout)
+
+
+def _join_columns(columns_list):
+    """ Concatenates a list of column dictionaries (chunks) into a single dictionary """
+    if len(columns_list) == 1:
+        return columns_list[0]
+    joined = {}
+    for column in legacy_key_layout:
+        values = columns_list[0].get(column)[:]
+        for columns in columns_list[1:]:
+            values.extend(columns.get(column))
+        joined[column] = values
+    return joined
+
+
+def _encode_block(columns, tangent_types, compress):
+    """
+    Encodes the columns of a curve into a binary block
+
+    Args:
+        columns (dict): Curve columns (see "float_columns" and "byte_columns")
+        tangent_types (list): Tangent type table. Unknown types are appended to it.
+        compress (bool): If the block should be compressed using zlib
+
+    Returns:
+        block (bytes): Encoded block
+    """
+    chunks = []
+    for column in float_columns:
+        chunks.append(_to_little_endian(array('d', columns.get(column))).tobytes())
+    chunks.append(array('B', [1 if value else 0 for value in columns.get('locks')]).tobytes())
+    for column in ['in_tangent_types', 'out_tangent_types']:
+        indices = []
+        for tangent_type in columns.get(column):
+            if tangent_type not in tangent_types:
+                tangent_types.append(tangent_type)
+            indices.append(tangent_types.index(tangent_type))
+        chunks.append(array('B', indices).tobytes())
+    block = b''.join(chunks)
+    if compress:
+        block = zlib.compress(block)
+    return block
+
+
+def _decode_block(block, key_count, tangent_types, compressed):
+    """
+    Decodes a binary block back into columns
+
+    Args:
+        block (bytes): Encoded block
+        key_count (int): Number of keys in the curve
+        tangent_types (list): Tangent type table stored in the header
+        compressed (bool): If the block was compressed using zlib
+
+    Returns:
+        columns (dict): A dictionary with the column names as keys and arrays/lists as values
+    """
+    if compressed:
+        block = zlib.decompress(block)
+    columns = {}
+    position = 0
+    float_size = key_count * 8
+    for column in float_columns:
+        values = array('d')
+        values.frombytes(block[position:position + float_size])
+        columns[column] = _to_little_endian(values)
+        position += float_size
+    columns['locks'] = [value == 1 for value in bytearray(block[position:position + key_count])]
+    position += key_count
+    for column in ['in_tangent_types', 'out_tangent_types']:
+        columns[column] = [tangent_types[index] for index in bytearray(block[position:position + key_count])]
+        position += key_count
+    return columns
+
+
+def is_anim_container(file_path):
+    """
+    Checks if a file uses the binary container format (instead of the legacy JSON format)
+
+    Args:
+        file_path (string): Path to the file
+
+    Returns:
+        is_container (bool): True if the file starts with the container magic
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            return file.read(len(container_magic)) == container_magic
+    except (IOError, OSError) as e:
+        logger.debug(str(e))
+        return False
+
+
+def write_anim_container(file_path, metadata, curves, compress=True, chunk_size=default_chunk_size):
+    """
+    Writes animation curves to a binary container file
+
+    Args:
+        file_path (string): Path to the output file
+        metadata (dict): JSON serializable data stored in the header. e.g. {'gt_interface_version': '1.3.26'}
+        curves (dict): A dictionary with the curve name as key (e.g. "left_wrist_ctrl.translateX")
+                       and its columns as value (see "columns_from_legacy_keys")
+        compress (optional, bool): If the curve blocks should be compressed using zlib
+        chunk_size (optional, int): Maximum number of keys per block. Smaller chunks allow reading smaller
+                                    time windows, bigger chunks compress better.
+
+    Returns:
+        file_size (int): Size of the written file in bytes
+    """
+    tangent_types = list(default_tangent_types)
+    blocks = []
+    index = []
+    offset = 0
+    for name, columns in curves.items():
+        times = columns.get('times')
+        chunks = []
+        for first in range(0, max(len(times), 1), chunk_size):
+            chunk_columns = _slice_columns(columns, first, first + chunk_size)
+            block = _encode_block(chunk_columns, tangent_types, compress)
+            blocks.append(block)
+            chunk_times = chunk_columns.get('times')
+            chunks.append({'offset': offset, 'size': len(block), 'key_count': len(chunk_times),
+                           'start': chunk_times[0] if len(chunk_times) else 0,
+                           'end': chunk_times[-1] if len(chunk_times) else 0})
+            offset += len(block)
+        index.append({'name': name, 'key_count': len(times), 'start': times[0] if len(times) else 0,
+                      'end': times[-1] if len(times) else 0, 'chunks': chunks})
+
+    header = json.dumps({'metadata': metadata, 'tangent_types': tangent_types, 'curves': index},
+                        separators=(',', ':')).encode('utf-8')
+    flags = flag_compressed if compress else 0
+    with open(file_path, 'wb') as file:
+        file.write(container_magic)
+        file.write(_to_little_endian(array('H', [container_version, flags])).tobytes())
+        file.write(_to_little_endian(array('I', [len(header)])).tobytes())
+        file.write(header)
+        for block in blocks:
+            file.write(block)
+    return preamble_size + len(header) + offset
+
+
+class AnimContainerReader:
+    """
+    Streaming reader for binary container files. Only the header is loaded when opening the file,
+    curves are read (and decompressed) on demand.
+
+    Usage:
+        with AnimContainerReader(file_path) as reader:
+            for name, columns in reader.iter_curves():
+                ...
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._file = open(file_path, 'rb')
+        try:
+            if self._file.read(len(container_magic)) != container_magic:
+                raise ValueError('"' + file_path + '" is not an animation container file.')
+            version_flags = array('H')
+            version_flags.frombytes(self._file.read(4))
+            version_flags = _to_little_endian(version_flags)
+            self.version, self.flags = version_flags[0], version_flags[1]
+            if self.version > container_version:
+                raise ValueError('Unsupported animation container version: ' + str(self.version))
+            header_size = array('I')
+            header_size.frombytes(self._file.read(4))
+            header_size = _to_little_endian(header_size)[0]
+            header = json.loads(self._file.read(header_size).decode('utf-8'))
+        except Exception:
+            self._file.close()
+            raise
+        self._data_start = preamble_size + header_size
+        self.metadata = header.get('metadata') or {}
+        self.tangent_types = header.get('tangent_types')
+        self.index = {}
+        self._curve_order = []
+        for entry in header.get('curves'):
+            self.index[entry.get('name')] = entry
+            self._curve_order.append(entry.get('name'))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """ Closes the file """
+        self._file.close()
+
+    def curve_names(self):
+        """
+        Gets the name of the stored curves (file order)
+
+        Returns:
+            names (list): A list of curve names. e.g. ["left_wrist_ctrl.translateX", ...]
+        """
+        return list(self._curve_order)
+
+    def _get_chunks(self, name):
+        """ Gets the chunks of a curve (version 1 files store a single block per curve) """
+        entry = self.index.get(name)
+        return entry.get('chunks') or [entry]
+
+    def read_curve(self, name, start=None, end=None):
+        """
+        Reads a single curve from the file (seeks directly into its blocks).
+        If a time window is provided, only the blocks overlapping the window are read.
+
+        Args:
+            name (string): Name of the curve. e.g. "left_wrist_ctrl.translateX"
+            start (optional, float): First frame of the window (inclusive). None means no lower limit.
+            end (optional, float): Last frame of the window (inclusive). None means no upper limit.
+
+        Returns:
+            columns (dict): A dictionary with the column names as keys and arrays/lists as values
+        """
+        chunk_columns = []
+        for chunk in self._get_chunks(name):
+            if (start is not None and chunk.get('end') < start) or (end is not None and chunk.get('start') > end):
+                continue
+            self._file.seek(self._data_start + chunk.get('offset'))
+            columns = _decode_block(self._file.read(chunk.get('size')), chunk.get('key_count'), self.tangent_types,
+                                    bool(self.flags & flag_compressed))
+            chunk_columns.append(crop_anim_columns(columns, start, end))
+        if not chunk_columns:
+            return dict((column, []) for column in legacy_key_layout)
+        return _join_columns(chunk_columns)
+
+    def iter_curves(self, start=None, end=None):
+        """
+        Yields one curve at a time (file order), so only one curve is kept in memory.
+        If a time window is provided, curves without keys inside the window are skipped.
+
+        Args:
+            start (optional, float): First frame of the window (inclusive). None means no lower limit.
+            end (optional, float): Last frame of the window (inclusive). None means no upper limit.
+
+        Yields:
+            curve (tuple): Name of the curve and its columns
+        """
+        for name in self._curve_order:
+            entry = self.index.get(name)
+            if (start is not None and entry.get('end') < start) or (end is not None and entry.get('start') > end):
+                continue
+            columns = self.read_curve(name, start, end)
+            if len(columns.get('times')):
+                yield name, columns
+
+
+def read_anim_container(file_path, start=None, end=None):
+    """
+    Reads all curves of a binary container file
+
+    Args:
+        file_path (string): Path to the file
+        start (optional, float): First frame of the window (inclusive). None means no lower limit.
+        end (optional, float): Last frame of the window (inclusive). None means no upper limit.
+
+    Returns:
+        metadata, curves (tuple): Header metadata (dict) and curves (dict: curve name to columns)
+    """
+    with AnimContainerReader(file_path) as reader:
+        return reader.metadata, dict(reader.iter_curves(start, end))
+
+
+def benchmark_anim_container(curve_count=600, key_count=2000, directory=None):
+    """
+    Compares the size and load time of the legacy JSON format against the binary container (with and without zlib)
+    using synthetic data.
+
+    Args:
+        curve_count (optional, int): Number of generated curves
+        key_count (optional, int): Number of keys per curve
+        directory (optional, string): Where to write the temporary files. Uses the system temp directory if not provided
+
+    Returns:
+        results (dict): Size (bytes) and load time (seconds) for each format.
+                        e.g. {'json': {'size': 1000, 'load_time': 1.0}, 'binary': {...}, 'binary_zlib': {...}}
+    """
+    import tempfile
+    import math
+    directory = directory or tempfile.gettempdir()
+    curves = {}
+    for curve_index in range(curve_count):
+        times = [float(frame) for frame in range(key_count)]
+        curves['ctrl_' + str(curve_index) + '.translateX'] = {
+            'times': times,
+            'values': [math.sin(frame * 0.1 + curve_index) * 10.0 for frame in times],
+            'in_angles': [0.0] * key_count,
+            'out_angles': [0.0] * key_count,
+            'in_weights': [1.0] * key_count,
+            'out_weights': [1.0] * key_count,
+            'locks': [True] * key_count,
+            'in_tangent_types': ['auto'] * key_count,
+            'out_tangent_types': ['auto'] * key_count,
+        }
+    metadata = {'gt_interface_version': 'benchmark', 'gt_export_method': 'object-space'}
+
+    results = {}
+    json_path = os.path.join(directory, 'gt_anim_container_benchmark.json.anim')
+    legacy_dict = dict(metadata)
+    for name, columns in curves.items():
+        legacy_dict[name] = legacy_keys_from_columns(columns)
+    with open(json_path, 'w') as outfile:
+        json.dump(legacy_dict, outfile, indent=4)
+    start = time.perf_counter()
+    with open(json_path) as json_file:
+        json.load(json_file)
+    results['json'] = {'size': os.path.getsize(json_path), 'load_time': time.perf_counter() - start}
+    os.remove(json_path)
+
+    for label, compress in [('binary', False), ('binary_zlib', True)]:
+        binary_path = os.path.join(directory, 'gt_anim_container_benchmark.' + label + '.anim')
+        write_anim_container(binary_path, metadata, curves, compress=compress)
+        start = time.perf_counter()
+        read_anim_container(binary_path)
+        results[label] = {'size': os.path.getsize(binary_path), 'load_time': time.perf_counter() - start}
+        os.remove(binary_path)
+
+    for label, result in results.items():
+        sys.stdout.write('{}: {:.2f} MB, loaded in {:.3f}s\n'.format(label, result.get('size') / 1048576.0,
+                                                                      result.get('load_time')))
+    return results
+
+
+if __name__ == '__main__':
+    benchmark_anim_container()
@@ -0,0 +1,1364 @@
+"""
+ GT Animation Utilities - Common functions used by the animation scripts (bake, switch and curve operations)
+ github.com/TrevisanGMW/gt-tools - 2026-10-18
+
+ 1.0.0 - 2026-10-18
+ Initial release: time sampling through DG contexts, local transform solver and bulk key writer
+
+ 1.0.1 - 2026-10-18
+ Added bulk animation curve readout ("get_node_anim_curves" and "read_anim_curve")
+
+ 1.0.2 - 2026-10-18
+ Added bulk animation curve writer ("write_anim_curve") with an undoable mode and a fast (no undo) mode
+ Added "benchmark_anim_curve_writer"
+
+ 1.0.3 - 2026-10-18
+ Added whole-curve operations used to mirror animation ("duplicate_anim_curve" and "apply_anim_curve")
+ Added "transform_anim_columns" (time offset and value scale of curve data)
+
+ 1.0.4 - 2026-10-18
+ Added differential curve update ("update_anim_curve"): unchanged curves are skipped, changed curves get minimal edits
+
+ 1.0.5 - 2026-10-18
+ Added dense matrix sampling ("sample_matrix_plugs" and "sample_world_matrices") and "decompose_world_matrix"
+ Bake engine uses dense matrix sampling
+
+ 1.0.6 - 2026-10-18
+ Added "bake_world_transforms" and "compose_world_matrix" (bulk bake of world space values)
+
+ 1.0.7 - 2026-10-18
+ Added post-bake key reduction ("simplify_keys", "reduce_keys" and "reduce_baked_keys")
+
+ 1.0.8 - 2026-10-18
+ "bake_world_transforms" accepts a reference space (values relative to an object instead of world)
+
+ 1.0.9 - 2026-10-18
+ "write_anim_curve" and "update_anim_curve" accept a time range (only keys inside it are replaced)
+ Key writers no longer disconnect inputs that are not animation curves (pairBlend, animation layers, constraints)
+ "get_anim_curve" ignores driven key curves (only time-based curves are animation)
+ Removed "sample_plugs" (replaced by "sample_matrix_plugs")
+
+"""
+from array import array
+import maya.api.OpenMaya as OpenMaya
+import maya.cmds as cmds
+import hashlib
+import logging
+import time
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger("gt_anim_utilities")
+logger.setLevel(logging.INFO)
+
+# Channels handled by the transform solver (same order used by the returned dictionaries)
+transform_channels = ['translateX', 'translateY', 'translateZ', 'rotateX', 'rotateY', 'rotateZ']
+
+# API tangent types to the names used by "cmds.keyTangent" (newer types are only added if available)
+tangent_type_names = {}
+for _api_name, _cmds_name in [('kTangentGlobal', 'global'), ('kTangentFixed', 'fixed'), ('kTangentLinear', 'linear'),
+                              ('kTangentFlat', 'flat'), ('kTangentSmooth', 'spline'), ('kTangentStep', 'step'),
+                              ('kTangentSlow', 'slow'), ('kTangentFast', 'fast'), ('kTangentClamped', 'clamped'),
+                              ('kTangentPlateau', 'plateau'), ('kTangentStepNext', 'stepnext'),
+                              ('kTangentAuto', 'auto')]:
+    if hasattr(OpenMaya.MFnAnimCurve, _api_name):
+        tangent_type_names[getattr(OpenMaya.MFnAnimCurve, _api_name)] = _cmds_name
+tangent_type_ids = dict((_cmds_name, _api_type) for _api_type, _cmds_name in tangent_type_names.items())
+
+
+def get_plug(node, attr):
+    """
+    Gets an API plug (MPlug) for the provided node and attribute
+
+    Args:
+        node (string): Name of the node. e.g. "left_wrist_ctrl"
+        attr (string): Name of the attribute. e.g. "worldMatrix"
+
+    Returns:
+        plug (MPlug): Plug for the provided attribute. Array attributes return their first element (logical index 0)
+    """
+    selection = OpenMaya.MSelectionList()
+    selection.add(node)
+    plug = OpenMaya.MFnDependencyNode(selection.getDependNode(0)).findPlug(attr, False)
+    if plug.isArray:
+        plug = plug.elementByLogicalIndex(0)
+    return plug
+
+
+def _get_context(frame):
+    """
+    Creates a DG context for the provided frame (uses the current time unit)
+
+    Args:
+        frame (float): Frame number
+
+    Returns:
+        context (MDGContext): Context that can be used to evaluate plugs at the provided time
+    """
+    return OpenMaya.MDGContext(OpenMaya.MTime(frame, OpenMaya.MTime.uiUnit()))
+
+
+def sample_matrix_plugs(plugs, frames):
+    """
+    Evaluates a list of matrix plugs for every provided frame without changing the current time.
+    Every frame is evaluated once through a DG context, so all plugs share the same scene evaluation.
+
+    Args:
+        plugs (list): A list of matrix plugs (MPlug). e.g. [get_plug('left_wrist_ctrl', 'worldMatrix')]
+        frames (list): A list of frames (float or int) to sample
+
+    Returns:
+        samples (array): Dense array of doubles with the shape (plugs x frames x 16), so the matrix of a plug at
+                         a frame starts at "(plug_index * len(frames) + frame_index) * 16". See "get_sampled_matrix"
+    """
+    frame_count = len(frames)
+    samples = array('d', bytes(8 * 16 * len(plugs) * frame_count))
+    for frame_index, frame in enumerate(frames):
+        previous_context = _get_context(frame).makeCurrent()
+        try:
+            for plug_index, plug in enumerate(plugs):
+                offset = (plug_index * frame_count + frame_index) * 16
+                samples[offset:offset + 16] = array('d', OpenMaya.MFnMatrixData(plug.asMObject()).matrix())
+        finally:
+            previous_context.makeCurrent()
+    return samples
+
+
+def sample_world_matrices(objects, frames):
+    """
+    Samples the world matrix of a list of objects for every provided frame without changing the current time
+
+    Args:
+        objects (list): A list of objects (transforms or joints)
+        frames (list): A list of frames (float or int) to sample
+
+    Returns:
+        samples (array): Dense array of doubles with the shape (objects x frames x 16). See "sample_matrix_plugs"
+    """
+    return sample_matrix_plugs([get_plug(obj, 'worldMatrix') for obj in objects], frames)
+
+
+def get_sampled_matrix(samples, frame_count, index, frame_index):
+    """
+    Gets a matrix from the output of "sample_matrix_plugs" or "sample_world_matrices"
+
+    Args:
+        samples (array): Dense array of sampled matrices
+        frame_count (int): Number of sampled frames
+        index (int): Index of the plug/object
+        frame_index (int): Index of the frame (position in the list of sampled frames)
+
+    Returns:
+        matrix (MMatrix): Sampled matrix
+    """
+    offset = (index * frame_count + frame_index) * 16
+    return OpenMaya.MMatrix(samples[offset:offset + 16])
+
+
+def _to_ui_distance(value):
+    """ Converts an internal distance (centimeters) to the current UI linear unit """
+    return OpenMaya.MDistance(value).asUnits(OpenMaya.MDistance.uiUnit())
+
+
+def _to_ui_angle(value):
+    """ Converts an internal angle (radians) to the current UI angle unit """
+    return OpenMaya.MAngle(value).asUnits(OpenMaya.MAngle.uiUnit())
+
+
+def decompose_world_matrix(world_matrix, rotate_order=0):
+    """
+    Extracts the world translation and rotation of a matrix
+    (same values returned by "cmds.xform(q=True, ws=True, t=True)" and "cmds.xform(q=True, ws=True, ro=True)")
+
+    Args:
+        world_matrix (MMatrix): World matrix of an object
+        rotate_order (optional, int): Rotate order of the object (value of the "rotateOrder" attribute)
+
+    Returns:
+        translate, rotate (tuple): Two lists with XYZ values (UI units)
+    """
+    transformation = OpenMaya.MTransformationMatrix(world_matrix)
+    translation = transformation.translation(OpenMaya.MSpace.kWorld)
+    rotation = transformation.rotation(asQuaternion=False).reorder(rotate_order)
+    return ([_to_ui_distance(translation.x), _to_ui_distance(translation.y), _to_ui_distance(translation.z)],
+            [_to_ui_angle(rotation.x), _to_ui_angle(rotation.y), _to_ui_angle(rotation.z)])
+
+
+def solve_local_transforms(target_world_matrices, parent_world_matrices, rotate_order=0, initial_rotation=None):
+    """
+    Converts a sequence of desired world matrices into local translate/rotate channel values.
+    An euler filter is applied, so every rotation is the closest solution to the previous frame.
+
+    Args:
+        target_world_matrices (list): A list of MMatrix describing the desired world transform for every frame
+        parent_world_matrices (list): A list of MMatrix with the parent world transform for the same frames
+        rotate_order (optional, int): Rotate order of the target (value of the "rotateOrder" attribute)
+        initial_rotation (optional, list): XYZ rotation in radians used as a reference for the first frame.
+                                           Usually the current rotation of the target.
+
+    Returns:
+        channel_values (dict): A dictionary with the channels from "transform_channels" as keys and a list of
+                               values (UI units) as values. e.g. {'translateX': [0.0, 0.5, ...], ...}
+    """
+    channel_values = {}
+    for channel in transform_channels:
+        channel_values[channel] = []
+
+    previous_rotation = None
+    if initial_rotation:
+        previous_rotation = OpenMaya.MEulerRotation(initial_rotation[0], initial_rotation[1], initial_rotation[2],
+                                                    rotate_order)
+
+    for world_matrix, parent_matrix in zip(target_world_matrices, parent_world_matrices):
+        local_matrix = OpenMaya.MTransformationMatrix(world_matrix * parent_matrix.inverse())
+        translation = local_matrix.translation(OpenMaya.MSpace.kTransform)
+        rotation = local_matrix.rotation(asQuaternion=False).reorder(rotate_order)
+        if previous_rotation is not None:
+            rotation = rotation.closestSolution(previous_rotation)
+        previous_rotation = rotation
+
+        channel_values['translateX'].append(_to_ui_distance(translation.x))
+        channel_values['translateY'].append(_to_ui_distance(translation.y))
+        channel_values['translateZ'].append(_to_ui_distance(translation.z))
+        channel_values['rotateX'].append(_to_ui_angle(rotation.x))
+        channel_values['rotateY'].append(_to_ui_angle(rotation.y))
+        channel_values['rotateZ'].append(_to_ui_angle(rotation.z))
+    return channel_values
+
+
+def get_matched_world_matrix(reference_world_matrix, parent_world_matrix, local_matrix):
+    """
+    Computes the world matrix an object would have after matching the position and rotation of a reference
+    (same result as "cmds.matchTransform(target, reference, pos=True, rot=True)"). Scale and shear are kept.
+
+    Args:
+        reference_world_matrix (MMatrix): World matrix of the reference object
+        parent_world_matrix (MMatrix): World matrix of the parent of the target object
+        local_matrix (MMatrix): Current local matrix of the target object (used to extract scale and shear)
+
+    Returns:
+        world_matrix (MMatrix): World matrix of the target after matching the reference
+    """
+    matched = OpenMaya.MTransformationMatrix(reference_world_matrix * parent_world_matrix.inverse())
+    current = OpenMaya.MTransformationMatrix(local_matrix)
+    matched.setScale(current.scale(OpenMaya.MSpace.kTransform), OpenMaya.MSpace.kTransform)
+    matched.setShear(current.shear(OpenMaya.MSpace.kTransform), OpenMaya.MSpace.kTransform)
+    return matched.asMatrix() * parent_world_matrix
+
+
+time_anim_curve_types = ['animCurveTL', 'animCurveTA', 'animCurveTU', 'animCurveTT']
+
+
+def get_anim_curve(node, attr):
+    """
+    Gets the time-based animation curve directly connected to an attribute
+    (driven key curves, e.g. "animCurveUL", are not animation and are ignored)
+
+    Args:
+        node (string): Name of the node
+        attr (string): Name of the attribute
+
+    Returns:
+        anim_curve (string, None): Name of the animation curve. None if the attribute is not animated.
+    """
+    connections = cmds.listConnections(node + '.' + attr, source=True, destination=False, type='animCurve',
+                                       skipConversionNodes=True) or []
+    for connection in connections:
+        if cmds.nodeType(connection) in time_anim_curve_types:
+            return connection
+    return None
+
+
+def _has_input(node, attr):
+    """ Checks if an attribute receives a connection (e.g. animation curve, pairBlend, constraint or animation layer) """
+    return bool(cmds.listConnections(node + '.' + attr, source=True, destination=False))
+
+
+def _paste_anim_curve(anim_curve, node, attr, existing_curve=None, time_range=None):
+    """
+    Moves the keys of an unconnected animation curve to an attribute and deletes the curve
+    ("api" clipboard, so the user clipboard is untouched).
+    If the attribute has no animation curve but is driven by something else (e.g. pairBlend of a constraint or an
+    animation layer), it's keyed with "setKeyframe" first, so the keys go through that input instead of disconnecting it.
+    Attributes that can't be keyed are skipped with a warning.
+
+    Args:
+        anim_curve (string): Name of an unconnected animation curve
+        node (string): Name of the node receiving the keys
+        attr (string): Name of the attribute receiving the keys. e.g. "translateX"
+        existing_curve (optional, string): Time-based curve already connected to the attribute (see "get_anim_curve")
+        time_range (optional, tuple): First and last frame of the keys to replace. None replaces every key.
+
+    Returns:
+        anim_curve (string, None): Name of the animation curve that received the keys. None if the attribute was skipped.
+    """
+    try:
+        if not existing_curve:
+            first_time = cmds.keyframe(anim_curve, index=(0, 0), q=True, timeChange=True)[0]
+            first_value = cmds.keyframe(anim_curve, index=(0, 0), q=True, valueChange=True)[0]
+            cmds.setKeyframe(node, attribute=attr, time=first_time, value=first_value)
+        if time_range:
+            cmds.copyKey(anim_curve, clipboard='api', time=time_range)
+            cmds.pasteKey(node, attribute=attr, clipboard='api', option='replace', time=time_range)
+        else:
+            cmds.copyKey(anim_curve, clipboard='api')
+            cmds.pasteKey(node, attribute=attr, clipboard='api', option='replaceCompletely')
+    except RuntimeError as e:
+        cmds.warning('Unable to key "' + node + '.' + attr + '" through its input connection. '
+                     'The attribute was skipped. (' + str(e).strip() + ')')
+        return None
+    finally:
+        cmds.delete(anim_curve)
+    return existing_curve or (cmds.keyframe(node, attribute=attr, q=True, name=True) or [None])[0]
+
+
+def _get_anim_curve_type(node, attr):
+    """
+    Determines the animation curve type necessary to animate an attribute
+
+    Args:
+        node (string): Name of the node
+        attr (string): Name of the attribute
+
+    Returns:
+        curve_type (string): "animCurveTL", "animCurveTA" or "animCurveTU"
+    """
+    attr_type = cmds.getAttr(node + '.' + attr, type=True)
+    if attr_type == 'doubleLinear':
+        return 'animCurveTL'
+    if attr_type == 'doubleAngle':
+        return 'animCurveTA'
+    return 'animCurveTU'
+
+
+def write_keys(node, attr, times, values, in_tangent_type=None, out_tangent_type=None):
+    """
+    Writes a list of keys to an attribute using a single bulk operation for the whole curve.
+    Existing keys inside the written range are replaced, keys outside the range are kept.
+    Everything is done through undoable commands (no per-key calls).
+
+    Args:
+        node (string): Name of the node receiving the keys
+        attr (string): Name of the attribute receiving the keys (long name). e.g. "translateX"
+        times (list): A list of sorted frames
+        values (list): A list of values (UI units), one per frame
+        in_tangent_type (optional, string): In tangent type. If not provided, global preferences are used.
+        out_tangent_type (optional, string): Out tangent type. If not provided, global preferences are used.
+
+    Returns:
+        anim_curve (string, None): Name of the animation curve that received the keys. None if it couldn't be keyed.
+    """
+    if not times:
+        return get_anim_curve(node, attr)
+    if not in_tangent_type:
+        in_tangent_type = cmds.keyTangent(q=True, g=True, inTangentType=True)[0]
+    if not out_tangent_type:
+        out_tangent_type = cmds.keyTangent(q=True, g=True, outTangentType=True)[0]
+
+    key_time_values = []
+    for frame, value in zip(times, values):
+        key_time_values.extend([frame, value])
+
+    existing_curve = get_anim_curve(node, attr)
+    new_curve = cmds.createNode(_get_anim_curve_type(node, attr),
+                                name=node.split('|')[-1].split(':')[-1] + '_' + attr, skipSelect=True)
+    cmds.setAttr(new_curve + '.ktv[0:' + str(len(times) - 1) + ']', *key_time_values)
+    cmds.keyTangent(new_curve, e=True, index=(0, len(times) - 1),
+                    inTangentType=in_tangent_type, outTangentType=out_tangent_type)
+
+    if not existing_curve and not _has_input(node, attr):
+        cmds.connectAttr(new_curve + '.output', node + '.' + attr, force=True)
+        return new_curve
+
+    # Merge into existing curve (or key through the existing input)
+    return _paste_anim_curve(new_curve, node, attr, existing_curve=existing_curve, time_range=(times[0], times[-1]))
+
+
+def _find_closest_ancestor(node_long_name, candidates_long_names):
+    """
+    Finds the closest ancestor of a node among a list of candidates
+
+    Args:
+        node_long_name (string): Full path of the node
+        candidates_long_names (list): A list of full paths to check against
+
+    Returns:
+        index (int, None): Index of the closest ancestor in the candidates list. None if no ancestors were found.
+    """
+    closest_index = None
+    closest_depth = -1
+    for index, candidate in enumerate(candidates_long_names):
+        if node_long_name.startswith(candidate + '|'):
+            depth = candidate.count('|')
+            if depth > closest_depth:
+                closest_index = index
+                closest_depth = depth
+    return closest_index
+
+
+def _bake_transforms(targets, frames, reference_plugs, get_reference_world, target_channels=None,
+                     in_tangent_type=None, out_tangent_type=None):
+    """
+    Bake engine shared by "bake_matched_transforms" and "bake_world_transforms".
+    Samples the reference plugs and the targets in a single sweep (DG contexts), solves the world matrix each target
+    should have on every frame (keeping its scale and shear), converts it to local space (euler filtered)
+    and writes every channel with a single bulk operation.
+    Targets are processed in order, so if a target is a descendant of a previous target (e.g. FK chains),
+    it accounts for the new pose of its ancestor.
+
+    Args:
+        targets (list): A list of objects to bake
+        frames (list): A list of frames to bake (sorted)
+        reference_plugs (list): Extra matrix plugs sampled with the targets (available to "get_reference_world")
+        get_reference_world (function): Function returning the world matrix to match (position and rotation).
+                                        It receives: samples, frame count, target index, frame index and the current
+                                        world matrix of the target. Reference plugs are the first sampled plugs.
+        target_channels (optional, list): A list (one per target) of channels to key. All "transform_channels"
+                                          are keyed if not provided.
+        in_tangent_type (optional, string): In tangent type. If not provided, global preferences are used.
+        out_tangent_type (optional, string): Out tangent type. If not provided, global preferences are used.
+
+    Returns:
+        keyed_values (dict): A dictionary with the targets as keys and the output of "solve_local_transforms"
+                             as values (only keyed channels are included)
+    """
+    if not frames or not targets:
+        return {}
+
+    targets_long = [cmds.ls(target, long=True)[0] for target in targets]
+    ancestors = [_find_closest_ancestor(targets_long[index], targets_long[:index])
+                 for index in range(len(targets_long))]
+
+    # One plug list for every sampled element, so a single time sweep evaluates all of them
+    plugs = list(reference_plugs)
+    for target in targets:
+        plugs.append(get_plug(target, 'parentMatrix'))
+        plugs.append(get_plug(target, 'matrix'))
+        plugs.append(get_plug(target, 'worldMatrix'))
+    samples = sample_matrix_plugs(plugs, frames)
+    frame_count = len(frames)
+    first_target_plug = len(reference_plugs)
+
+    # Solve matched world matrices (ancestors first)
+    matched_world_matrices = [[] for _ in targets]
+    parent_world_matrices = [[] for _ in targets]
+    for frame_index in range(frame_count):
+        for index in range(len(targets)):
+            parent_world, local_matrix, target_world = [get_sampled_matrix(samples, frame_count, plug_index,
+                                                                           frame_index)
+                                                        for plug_index in range(first_target_plug + index * 3,
+                                                                                first_target_plug + index * 3 + 3)]
+            reference_world = get_reference_world(samples, frame_count, index, frame_index, target_world)
+            ancestor = ancestors[index]
+            if ancestor is not None:
+                ancestor_world = get_sampled_matrix(samples, frame_count, first_target_plug + ancestor * 3 + 2,
+                                                    frame_index)
+                parent_world = parent_world * ancestor_world.inverse() * matched_world_matrices[ancestor][-1]
+            parent_world_matrices[index].append(parent_world)
+            matched_world_matrices[index].append(get_matched_world_matrix(reference_world, parent_world,
+                                                                          local_matrix))
+
+    # Convert to local space and write keys
+    ui_angle = OpenMaya.MAngle.uiUnit()
+    keyed_values = {}
+    for index, target in enumerate(targets):
+        initial_rotation = [OpenMaya.MAngle(value, ui_angle).asRadians()
+                            for value in cmds.getAttr(target + '.rotate', time=frames[0])[0]]
+        channel_values = solve_local_transforms(matched_world_matrices[index], parent_world_matrices[index],
+                                                rotate_order=cmds.getAttr(target + '.rotateOrder'),
+                                                initial_rotation=initial_rotation)
+        keyed_values[target] = {}
+        channels = target_channels[index] if target_channels else transform_channels
+        for channel in channels:
+            if cmds.getAttr(target + '.' + channel, lock=True):
+                continue
+            write_keys(target, channel, frames, channel_values.get(channel),
+                       in_tangent_type=in_tangent_type, out_tangent_type=out_tangent_type)
+            keyed_values[target][channel] = channel_values.get(channel)
+    return keyed_values
+
+
+def bake_matched_transforms(target_reference_pairs, frames, in_tangent_type=None, out_tangent_type=None):
+    """
+    Bakes the translate and rotate channels of a list of targets so they match their references on every frame.
+    The result is the same as running "cmds.matchTransform" + "cmds.setKeyframe" on every frame, but the scene is
+    only evaluated once per frame (through DG contexts, so the current time never changes) and each channel
+    receives all its keys in a single bulk operation.
+    Targets are processed in order, so if a target is a descendant of a previous target (e.g. FK chains),
+    it accounts for the new pose of its ancestor.
+
+    Args:
+        target_reference_pairs (list): A list of pairs [target, reference]. e.g. [['left_wrist_ik_ctrl', 'loc'], ...]
+        frames (list): A list of frames to bake (sorted)
+        in_tangent_type (optional, string): In tangent type. If not provided, global preferences are used.
+        out_tangent_type (optional, string): Out tangent type. If not provided, global preferences are used.
+
+    Returns:
+        keyed_values (dict): A dictionary with the targets as keys and the output of "solve_local_transforms"
+                             as values (only keyed channels are included)
+    """
+    def get_reference_world(samples, frame_count, index, frame_index, target_world):
+        return get_sampled_matrix(samples, frame_count, index, frame_index)
+
+    return _bake_transforms([pair[0] for pair in target_reference_pairs], frames,
+                            [get_plug(pair[1], 'worldMatrix') for pair in target_reference_pairs],
+                            get_reference_world, in_tangent_type=in_tangent_type, out_tangent_type=out_tangent_type)
+
+
+def compose_world_matrix(translate=None, rotate=None, rotate_order=0, world_matrix=None):
+    """
+    Creates a world matrix from world space translate and rotate values
+    (values that would be used with "cmds.xform(ws=True, t=translate, ro=rotate)")
+
+    Args:
+        translate (optional, list): XYZ world translation (UI units). If not provided, it's taken from "world_matrix"
+        rotate (optional, list): XYZ world rotation (UI units, in the provided rotate order).
+                                 If not provided, it's taken from "world_matrix"
+        rotate_order (optional, int): Rotate order of the rotation values (value of the "rotateOrder" attribute)
+        world_matrix (optional, MMatrix): Matrix providing the missing elements
+
+    Returns:
+        world_matrix (MMatrix): Composed world matrix
+    """
+    transformation = OpenMaya.MTransformationMatrix(world_matrix or OpenMaya.MMatrix())
+    if rotate is not None:
+        ui_angle = OpenMaya.MAngle.uiUnit()
+        transformation.setRotation(OpenMaya.MEulerRotation([OpenMaya.MAngle(value, ui_angle).asRadians()
+                                                            for value in rotate], rotate_order))
+    if translate is not None:
+        ui_distance = OpenMaya.MDistance.uiUnit()
+        transformation.setTranslation(OpenMaya.MVector([OpenMaya.MDistance(value, ui_distance).asCentimeters()
+                                                        for value in translate]), OpenMaya.MSpace.kWorld)
+    return transformation.asMatrix()
+
+
+def bake_world_transforms(targets, frames, world_translations=None, world_rotations=None, in_tangent_type=None,
+                          out_tangent_type=None, space=None):
+    """
+    Bakes world space translate and rotate values into the local channels of a list of targets
+    (same result as running "cmds.xform(ws=True)" + "cmds.setKeyframe" on every frame) using a single sweep
+    over time (parent matrices are sampled through DG contexts) and one bulk operation per channel.
+    Rotations are euler filtered.
+    If a space is provided, values are relative to that object instead of world. Its world matrix is sampled in the
+    same sweep, so the targets follow the space (it shouldn't be one of the targets or one of their descendants).
+
+    Args:
+        targets (list): A list of objects to bake
+        frames (list): A list of frames to bake (sorted)
+        world_translations (optional, list): A list (one per target) of world translations (one XYZ list per frame).
+                                             Use None for targets that shouldn't have their translation keyed.
+        world_rotations (optional, list): A list (one per target) of world rotations (one XYZ list per frame, in the
+                                          rotate order of the target). Use None for targets that shouldn't have their
+                                          rotation keyed.
+        in_tangent_type (optional, string): In tangent type. If not provided, global preferences are used.
+        out_tangent_type (optional, string): Out tangent type. If not provided, global preferences are used.
+        space (optional, string): Object used as reference space (values are relative to it). None means world.
+
+    Returns:
+        keyed_values (dict): A dictionary with the targets as keys and the output of "solve_local_transforms"
+                             as values (only keyed channels are included)
+    """
+    world_translations = world_translations or [None] * len(targets)
+    world_rotations = world_rotations or [None] * len(targets)
+    rotate_orders = [cmds.getAttr(target + '.rotateOrder') for target in targets]
+    target_channels = []
+    for translations, rotations in zip(world_translations, world_rotations):
+        target_channels.append((transform_channels[:3] if translations else []) +
+                               (transform_channels[3:] if rotations else []))
+
+    def get_reference_world(samples, frame_count, index, frame_index, target_world):
+        translations = world_translations[index]
+        rotations = world_rotations[index]
+        space_world = get_sampled_matrix(samples, frame_count, 0, frame_index) if space else None
+        current_matrix = target_world * space_world.inverse() if space else target_world
+        matrix = compose_world_matrix(translate=translations[frame_index] if translations else None,
+                                      rotate=rotations[frame_index] if rotations else None,
+                                      rotate_order=rotate_orders[index], world_matrix=current_matrix)
+        return matrix * space_world if space else matrix
+
+    reference_plugs = [get_plug(space, 'worldMatrix')] if space else []
+    return _bake_transforms(targets, frames, reference_plugs, get_reference_world, target_channels=target_channels,
+                            in_tangent_type=in_tangent_type, out_tangent_type=out_tangent_type)
+
+
+def get_channel_tolerance(tolerance, channel):
+    """
+    Gets the tolerance used for a channel
+
+    Args:
+        tolerance (float, dict): A single tolerance used by all channels or a dictionary with tolerances per channel.
+                                 Keys can be the channel name or its prefix.
+                                 e.g. 0.01 or {'translate': 0.01, 'rotate': 0.1} or {'translateX': 0.01, ...}
+        channel (string): Name of the channel. e.g. "translateX"
+
+    Returns:
+        tolerance (float, None): Tolerance for the channel (None if not found)
+    """
+    if not isinstance(tolerance, dict):
+        return tolerance
+    if channel in tolerance:
+        return tolerance.get(channel)
+    for key, value in tolerance.items():
+        if channel.startswith(key):
+            return value
+    return None
+
+
+def simplify_keys(times, values, tolerance):
+    """
+    Finds the keys necessary to represent a list of values within a tolerance (Ramer-Douglas-Peucker).
+    The error is measured on the value axis (against a linear interpolation between the kept keys).
+    First and last keys are always kept.
+
+    Args:
+        times (list): A list of sorted frames
+        values (list): A list of values, one per frame
+        tolerance (float): Maximum difference allowed between the original values and the interpolated values
+
+    Returns:
+        indices (list): Sorted list of indices of the keys to keep
+    """
+    key_count = len(times)
+    if key_count < 3:
+        return list(range(key_count))
+    kept = [False] * key_count
+    kept[0] = kept[-1] = True
+    segments = [(0, key_count - 1)]
+    while segments:
+        first, last = segments.pop()
+        if last - first < 2:
+            continue
+        time_span = float(times[last] - times[first])
+        value_span = values[last] - values[first]
+        worst_index = None
+        worst_error = tolerance
+        for index in range(first + 1, last):
+            interpolated = values[first] + value_span * (times[index] - times[first]) / time_span
+            error = abs(values[index] - interpolated)
+            if error > worst_error:
+                worst_index = index
+                worst_error = error
+        if worst_index is not None:
+            kept[worst_index] = True
+            segments.append((first, worst_index))
+            segments.append((worst_index, last))
+    return [index for index in range(key_count) if kept[index]]
+
+
+def _evaluate_anim_curve(anim_curve, times):
+    """
+    Evaluates an animation curve at a list of frames (without changing the current time)
+
+    Args:
+        anim_curve (string): Name of the animation curve
+        times (list): A list of frames
+
+    Returns:
+        values (list): A list of values (UI units), one per frame
+    """
+    selection = OpenMaya.MSelectionList()
+    selection.add(anim_curve)
+    curve_fn = OpenMaya.MFnAnimCurve(selection.getDependNode(0))
+    time_unit = OpenMaya.MTime.uiUnit()
+    convert = None
+    if curve_fn.animCurveType in (OpenMaya.MFnAnimCurve.kAnimCurveTL, OpenMaya.MFnAnimCurve.kAnimCurveUL):
+        convert = _to_ui_distance
+    elif curve_fn.animCurveType in (OpenMaya.MFnAnimCurve.kAnimCurveTA, OpenMaya.MFnAnimCurve.kAnimCurveUA):
+        convert = _to_ui_angle
+    values = []
+    for frame in times:
+        value = curve_fn.evaluate(OpenMaya.MTime(frame, time_unit))
+        values.append(convert(value) if convert else value)
+    return values
+
+
+def reduce_keys(node, attr, times, values, tolerance, in_tangent_type=None, out_tangent_type=None,
+                max_iterations=8):
+    """
+    Writes a reduced version of a list of keys (usually the output of a bake) to an attribute.
+    The keys are first simplified (see "simplify_keys"), then the written curve is evaluated on every original frame
+    and keys are added back where the interpolated curve (using the actual tangents) is outside the tolerance.
+    Keys outside the range are kept (see "write_keys").
+
+    Args:
+        node (string): Name of the node receiving the keys
+        attr (string): Name of the attribute receiving the keys (long name). e.g. "translateX"
+        times (list): A list of sorted frames
+        values (list): A list of values (UI units), one per frame
+        tolerance (float): Maximum difference allowed between the original values and the reduced curve
+                           (units or degrees, same as the values)
+        in_tangent_type (optional, string): In tangent type. If not provided, global preferences are used.
+        out_tangent_type (optional, string): Out tangent type. If not provided, global preferences are used.
+        max_iterations (optional, int): Maximum number of refinement passes.
+                                        If the tolerance can't be reached, all keys are written.
+
+    Returns:
+        stats (dict): Number of keys before and after the reduction and the maximum error found.
+                      e.g. {'original_keys': 120, 'reduced_keys': 14, 'max_error': 0.004}
+    """
+    kept = simplify_keys(times, values, tolerance)
+    max_error = 0.0
+    for iteration in range(max_iterations + 1):
+        if iteration == max_iterations:  # Couldn't converge, keep everything
+            kept = list(range(len(times)))
+        anim_curve = write_keys(node, attr, [times[index] for index in kept], [values[index] for index in kept],
+                                in_tangent_type=in_tangent_type, out_tangent_type=out_tangent_type)
+        if anim_curve is None:  # Attribute couldn't be keyed (see "_paste_anim_curve")
+            break
+        if len(kept) == len(times):
+            max_error = 0.0
+            break
+        errors = [abs(evaluated - value) for evaluated, value in zip(_evaluate_anim_curve(anim_curve, times), values)]
+        max_error = max(errors)
+        if max_error <= tolerance:
+            break
+        # Add the worst key of every segment outside the tolerance
+        added = []
+        for first, last in zip(kept[:-1], kept[1:]):
+            worst_index = None
+            worst_error = tolerance
+            for index in range(first + 1, last):
+                if errors[index] > worst_error:
+                    worst_index = index
+                    worst_error = errors[index]
+            if worst_index is not None:
+                added.append(worst_index)
+        kept = sorted(kept + added)
+    return {'original_keys': len(times), 'reduced_keys': len(kept), 'max_error': max_error}
+
+
+def reduce_baked_keys(keyed_values, frames, tolerance, in_tangent_type=None, out_tangent_type=None):
+    """
+    Reduces the keys created by a bake (e.g. "bake_matched_transforms" or "bake_world_transforms")
+
+    Args:
+        keyed_values (dict): Output of the bake. e.g. {'ctrl': {'translateX': [0.0, ...], ...}, ...}
+        frames (list): Frames used by the bake (sorted)
+        tolerance (float, dict): Tolerance (units/degrees) for all channels or per channel (see "get_channel_tolerance")
+                                 Channels without a tolerance are not reduced.
+        in_tangent_type (optional, string): In tangent type. If not provided, global preferences are used.
+        out_tangent_type (optional, string): Out tangent type. If not provided, global preferences are used.
+
+    Returns:
+        stats (dict): Number of keys before and after the reduction, the maximum error found and the stats per channel.
+                      e.g. {'original_keys': 1200, 'reduced_keys': 98, 'max_error': 0.008, 'channels': {...}}
+    """
+    stats = {'original_keys': 0, 'reduced_keys': 0, 'max_error': 0.0, 'channels': {}}
+    for node, channel_values in keyed_values.items():
+        for channel, values in channel_values.items():
+            channel_tolerance = get_channel_tolerance(tolerance, channel)
+            if channel_tolerance is None or not values:
+                continue
+            channel_stats = reduce_keys(node, channel, frames, values, channel_tolerance,
+                                        in_tangent_type=in_tangent_type, out_tangent_type=out_tangent_type)
+            stats['channels'][node + '.' + channel] = channel_stats
+            stats['original_keys'] += channel_stats.get('original_keys')
+            stats['reduced_keys'] += channel_stats.get('reduced_keys')
+            stats['max_error'] = max(stats.get('max_error'), channel_stats.get('max_error'))
+    return stats
+
+
+def print_reduction_stats(stats):
+    """
+    Prints the output of "reduce_baked_keys" to the script editor
+
+    Args:
+        stats (dict): Output of "reduce_baked_keys"
+    """
+    print('Key Reduction: ' + str(stats.get('original_keys')) + ' -> ' + str(stats.get('reduced_keys')) +
+          ' keys (' + str(len(stats.get('channels'))) + ' channels). Max error: ' +
+          str(round(stats.get('max_error'), 6)))
+
+
+def get_node_anim_curves(nodes):
+    """
+    Finds the animation curves (time based, so driven keys are ignored) feeding the attributes of a list of nodes.
+    Only connected attributes are visited, so channels without curves are skipped up front.
+
+    Args:
+        nodes (list): A list of node names. e.g. ["left_wrist_ctrl", "right_wrist_ctrl"]
+
+    Returns:
+        node_curves (dict): A dictionary with the node names (as provided) as keys and a dictionary of
+                            attributes (long names) to animation curves (MObject) as values.
+                            e.g. {'left_wrist_ctrl': {'translateX': <MObject>}}. Nodes without curves are omitted.
+    """
+    time_based_curves = [OpenMaya.MFnAnimCurve.kAnimCurveTA, OpenMaya.MFnAnimCurve.kAnimCurveTL,
+                         OpenMaya.MFnAnimCurve.kAnimCurveTT, OpenMaya.MFnAnimCurve.kAnimCurveTU]
+    node_curves = {}
+    selection = OpenMaya.MSelectionList()
+    for node in nodes:
+        selection.add(node)
+    for index, node in enumerate(nodes):
+        connected_plugs = OpenMaya.MFnDependencyNode(selection.getDependNode(index)).getConnections()
+        for plug in connected_plugs:
+            if not plug.isDestination:
+                continue
+            source = plug.source().node()
+            if not source.hasFn(OpenMaya.MFn.kAnimCurve):
+                continue
+            if OpenMaya.MFnAnimCurve(source).animCurveType not in time_based_curves:
+                continue
+            node_curves.setdefault(node, {})[plug.partialName(useLongNames=True)] = source
+    return node_curves
+
+
+def read_anim_curve(anim_curve):
+    """
+    Reads all key data of an animation curve through the API (no per-key commands)
+
+    Args:
+        anim_curve (MObject, string): Animation curve (MObject or node name)
+
+    Returns:
+        columns (dict): A dictionary with lists of key data (UI units, same values returned by "cmds.keyframe"
+                        and "cmds.keyTangent"). Keys: "times", "values", "in_angles", "out_angles", "locks",
+                        "in_weights", "out_weights", "in_tangent_types" and "out_tangent_types".
+                        "locks" stores the weight lock state (same as "cmds.keyTangent(q=True, weightLock=True)")
+    """
+    if not isinstance(anim_curve, OpenMaya.MObject):
+        selection = OpenMaya.MSelectionList()
+        selection.add(anim_curve)
+        anim_curve = selection.getDependNode(0)
+    curve_fn = OpenMaya.MFnAnimCurve(anim_curve)
+    ui_time = OpenMaya.MTime.uiUnit()
+    ui_angle = OpenMaya.MAngle.uiUnit()
+    curve_type = curve_fn.animCurveType
+    if curve_type == OpenMaya.MFnAnimCurve.kAnimCurveTA:
+        convert_value = _to_ui_angle
+    elif curve_type == OpenMaya.MFnAnimCurve.kAnimCurveTL:
+        convert_value = _to_ui_distance
+    else:
+        convert_value = float
+
+    columns = {'times': [], 'values': [], 'in_angles': [], 'out_angles': [], 'locks': [], 'in_weights': [],
+               'out_weights': [], 'in_tangent_types': [], 'out_tangent_types': []}
+    for index in range(curve_fn.numKeys):
+        in_angle, in_weight = curve_fn.getTangentAngleWeight(index, True)
+        out_angle, out_weight = curve_fn.getTangentAngleWeight(index, False)
+        columns['times'].append(curve_fn.input(index).asUnits(ui_time))
+        columns['values'].append(convert_value(curve_fn.value(index)))
+        columns['in_angles'].append(in_angle.asUnits(ui_angle))
+        columns['out_angles'].append(out_angle.asUnits(ui_angle))
+        columns['locks'].append(curve_fn.weightsLocked(index))
+        columns['in_weights'].append(in_weight)
+        columns['out_weights'].append(out_weight)
+        columns['in_tangent_types'].append(tangent_type_names.get(curve_fn.inTangentType(index), 'auto'))
+        columns['out_tangent_types'].append(tangent_type_names.get(curve_fn.outTangentType(index), 'auto'))
+    return columns
+
+
+def duplicate_anim_curve(anim_curve, value_scale=1.0):
+    """
+    Creates an unconnected copy of an animation curve. Values can be scaled (e.g. -1 to mirror a channel),
+    in which case the tangents are scaled with the curve.
+
+    Args:
+        anim_curve (string): Name of the animation curve
+        value_scale (optional, float): Scale applied to the values of the copy (pivot at 0)
+
+    Returns:
+        duplicated_curve (string): Name of the new (unconnected) animation curve
+    """
+    duplicated_curve = cmds.duplicate(anim_curve)[0]
+    if value_scale != 1.0:
+        cmds.scaleKey(duplicated_curve, valueScale=value_scale, valuePivot=0)
+    return duplicated_curve
+
+
+def apply_anim_curve(anim_curve, node, attr):
+    """
+    Makes an unconnected animation curve (e.g. output of "duplicate_anim_curve") drive an attribute.
+    If the attribute has no input, the curve is connected to it. Otherwise, the keys of the existing curve
+    are completely replaced (or the attribute is keyed through its input, see "_paste_anim_curve")
+    and the provided curve is deleted.
+
+    Args:
+        anim_curve (string): Name of an unconnected animation curve
+        node (string): Name of the node receiving the curve
+        attr (string): Name of the attribute receiving the curve. e.g. "translateX"
+
+    Returns:
+        anim_curve (string, None): Name of the animation curve driving the attribute. None if it couldn't be keyed.
+    """
+    existing_curve = get_anim_curve(node, attr)
+    if not existing_curve and not _has_input(node, attr):
+        cmds.connectAttr(anim_curve + '.output', node + '.' + attr, force=True)
+        return cmds.rename(anim_curve, node.split('|')[-1].split(':')[-1] + '_' + attr)
+    return _paste_anim_curve(anim_curve, node, attr, existing_curve=existing_curve)
+
+
+def transform_anim_columns(columns, time_offset=0.0, value_scale=1.0):
+    """
+    Creates a copy of the columns of a curve with a time offset and/or a value scale (e.g. -1 to mirror a channel).
+    Tangent angles follow the sign of the scale, so a mirrored curve (-1) keeps its shape.
+
+    Args:
+        columns (dict): Curve columns (see "read_anim_curve")
+        time_offset (optional, float): Offset (in frames) added to the time of every key
+        value_scale (optional, float): Scale applied to the values (pivot at 0)
+
+    Returns:
+        columns (dict): New columns dictionary (unchanged columns are shared with the original dictionary)
+    """
+    transformed = dict(columns)
+    if time_offset:
+        transformed['times'] = [frame + time_offset for frame in columns.get('times')]
+    if value_scale != 1.0:
+        transformed['values'] = [value * value_scale for value in columns.get('values')]
+        if value_scale < 0:
+            transformed['in_angles'] = [-angle for angle in columns.get('in_angles')]
+            transformed['out_angles'] = [-angle for angle in columns.get('out_angles')]
+    return transformed
+
+
+def _get_index_ranges(indices):
+    """
+    Compresses a sorted list of key indices into contiguous ranges (used by the "index" flag of "cmds.keyTangent")
+
+    Args:
+        indices (list): A sorted list of integers. e.g. [0, 1, 2, 5, 7, 8]
+
+    Returns:
+        ranges (list): A list of tuples (start, end). e.g. [(0, 2), (5, 5), (7, 8)]
+    """
+    ranges = []
+    for index in indices:
+        if ranges and ranges[-1][1] == index - 1:
+            ranges[-1] = (ranges[-1][0], index)
+        else:
+            ranges.append((index, index))
+    return ranges
+
+
+def _group_indices(values):
+    """
+    Groups the indices of a list by value
+
+    Args:
+        values (list): A list of hashable values. e.g. ['auto', 'auto', 'linear']
+
+    Returns:
+        groups (dict): A dictionary with the values as keys and a list of indices as values. e.g. {'auto': [0, 1], ...}
+    """
+    groups = {}
+    for index, value in enumerate(values):
+        groups.setdefault(value, []).append(index)
+    return groups
+
+
+def _is_default_weighted():
+    """ Checks if new animation curves should use weighted tangents (global preferences) """
+    weighted = cmds.keyTangent(q=True, g=True, weightedTangents=True)
+    if isinstance(weighted, list):
+        weighted = weighted[0] if weighted else False
+    return bool(weighted)
+
+
+def _get_tangent_edits(columns, index, weighted):
+    """
+    Gets the tangent angles and weights that need to be set explicitly for a key.
+    Angles are only necessary for "fixed" tangents (other types compute their own angles)
+    and weights are only necessary for weighted curves.
+
+    Args:
+        columns (dict): Curve columns (see "read_anim_curve")
+        index (int): Key index
+        weighted (bool): If the curve uses weighted tangents
+
+    Returns:
+        edits (dict): A dictionary with "in_angle", "out_angle", "in_weight" and "out_weight" (only necessary ones)
+    """
+    edits = {}
+    if columns.get('in_tangent_types')[index] == 'fixed':
+        edits['in_angle'] = columns.get('in_angles')[index]
+    if columns.get('out_tangent_types')[index] == 'fixed':
+        edits['out_angle'] = columns.get('out_angles')[index]
+    if weighted:
+        edits['in_weight'] = columns.get('in_weights')[index]
+        edits['out_weight'] = columns.get('out_weights')[index]
+    return edits
+
+
+def _get_write_time_range(columns, time_range):
+    """ Extends a time range (see "write_anim_curve") so it includes every provided key. None stays None """
+    if time_range is None:
+        return None
+    times = columns.get('times')
+    return min(time_range[0], times[0]), max(time_range[1], times[-1])
+
+
+def _write_anim_curve_undoable(node, attr, columns, time_range=None):
+    """
+    Builds an animation curve from columns using undoable commands (see "write_anim_curve")
+    A new curve receives all keys at once ("ktv" bulk setAttr) and tangents are set for groups of keys.
+    When the attribute already has a curve, its keys are replaced by the new curve keys
+    (only inside "time_range" when provided).
+    """
+    times = columns.get('times')
+    key_count = len(times)
+    key_time_values = []
+    for frame, value in zip(times, columns.get('values')):
+        key_time_values.extend([frame, value])
+
+    existing_curve = get_anim_curve(node, attr)
+    if existing_curve:
+        weighted = bool(cmds.getAttr(existing_curve + '.weightedTangents'))
+    else:
+        weighted = _is_default_weighted()
+
+    new_curve = cmds.createNode(_get_anim_curve_type(node, attr),
+                                name=node.split('|')[-1].split(':')[-1] + '_' + attr, skipSelect=True)
+    cmds.setAttr(new_curve + '.ktv[0:' + str(key_count - 1) + ']', *key_time_values)
+    if weighted:
+        cmds.keyTangent(new_curve, e=True, weightedTangents=True)
+
+    # Tangent types (one call per type)
+    for tangent_type, indices in _group_indices(columns.get('in_tangent_types')).items():
+        cmds.keyTangent(new_curve, e=True, index=_get_index_ranges(indices), inTangentType=tangent_type)
+    for tangent_type, indices in _group_indices(columns.get('out_tangent_types')).items():
+        cmds.keyTangent(new_curve, e=True, index=_get_index_ranges(indices), outTangentType=tangent_type)
+
+    # Angles and weights (only keys that need them)
+    for index in range(key_count):
+        edits = _get_tangent_edits(columns, index, weighted)
+        if not edits:
+            continue
+        if 'in_angle' in edits and 'out_angle' in edits and edits.get('in_angle') != edits.get('out_angle'):
+            cmds.keyTangent(new_curve, e=True, index=(index, index), lock=False)
+        flags = {}
+        for edit, flag in [('in_angle', 'inAngle'), ('out_angle', 'outAngle'),
+                           ('in_weight', 'inWeight'), ('out_weight', 'outWeight')]:
+            if edit in edits:
+                flags[flag] = edits.get(edit)
+        cmds.keyTangent(new_curve, e=True, index=(index, index), **flags)
+
+    if weighted:
+        for is_locked, indices in _group_indices(columns.get('locks')).items():
+            cmds.keyTangent(new_curve, e=True, index=_get_index_ranges(indices), weightLock=bool(is_locked))
+
+    if not existing_curve and not _has_input(node, attr):
+        cmds.connectAttr(new_curve + '.output', node + '.' + attr, force=True)
+        return new_curve
+
+    # Replace existing curve keys (or key through the existing input)
+    return _paste_anim_curve(new_curve, node, attr, existing_curve=existing_curve, time_range=time_range)
+
+
+def _write_anim_curve_api(node, attr, columns, time_range=None):
+    """
+    Builds an animation curve from columns through the API without recording undo (see "write_anim_curve")
+    When the attribute already has a curve, its keys are replaced (only inside "time_range" when provided).
+    Attributes driven by something else (e.g. pairBlend) use the undoable writer, which keys through the input.
+    """
+    existing_curve = get_anim_curve(node, attr)
+    if not existing_curve and _has_input(node, attr):
+        return _write_anim_curve_undoable(node, attr, columns, time_range=time_range)
+    curve_fn = OpenMaya.MFnAnimCurve()
+    if existing_curve:
+        selection = OpenMaya.MSelectionList()
+        selection.add(existing_curve)
+        curve_fn.setObject(selection.getDependNode(0))
+    else:
+        curve_fn.create(get_plug(node, attr))
+        curve_fn.setIsWeighted(_is_default_weighted())
+
+    ui_time = OpenMaya.MTime.uiUnit()
+
+    # Keys outside the time range are kept, new keys are added after the ones before the range
+    key_offset = 0
+    keep_existing_keys = bool(existing_curve and time_range)
+    if keep_existing_keys:
+        for index in reversed(range(curve_fn.numKeys)):
+            frame = curve_fn.input(index).asUnits(ui_time)
+            if time_range[0] <= frame <= time_range[1]:
+                curve_fn.remove(index)
+            elif frame < time_range[0]:
+                key_offset += 1
+    curve_type = curve_fn.animCurveType
+    if curve_type == OpenMaya.MFnAnimCurve.kAnimCurveTA:
+        ui_angle = OpenMaya.MAngle.uiUnit()
+        values = [OpenMaya.MAngle(value, ui_angle).asRadians() for value in columns.get('values')]
+    elif curve_type == OpenMaya.MFnAnimCurve.kAnimCurveTL:
+        ui_distance = OpenMaya.MDistance.uiUnit()
+        values = [OpenMaya.MDistance(value, ui_distance).asCentimeters() for value in columns.get('values')]
+    else:
+        values = list(columns.get('values'))
+
+    in_types = [tangent_type_ids.get(name, OpenMaya.MFnAnimCurve.kTangentGlobal)
+                for name in columns.get('in_tangent_types')]
+    out_types = [tangent_type_ids.get(name, OpenMaya.MFnAnimCurve.kTangentGlobal)
+                 for name in columns.get('out_tangent_types')]
+    common_in_type = max(set(in_types), key=in_types.count)
+    common_out_type = max(set(out_types), key=out_types.count)
+
+    curve_fn.addKeys(OpenMaya.MTimeArray([OpenMaya.MTime(frame, ui_time) for frame in columns.get('times')]),
+                     OpenMaya.MDoubleArray(values), common_in_type, common_out_type, keep_existing_keys)
+
+    weighted = curve_fn.isWeighted
+    ui_angle = OpenMaya.MAngle.uiUnit()
+    for index in range(len(values)):
+        key_index = key_offset + index
+        if in_types[index] != common_in_type:
+            curve_fn.setInTangentType(key_index, in_types[index])
+        if out_types[index] != common_out_type:
+            curve_fn.setOutTangentType(key_index, out_types[index])
+        edits = _get_tangent_edits(columns, index, weighted)
+        if 'in_angle' in edits and 'out_angle' in edits and edits.get('in_angle') != edits.get('out_angle'):
+            curve_fn.setTangentsLocked(key_index, False)
+        if 'in_angle' in edits:
+            curve_fn.setAngle(key_index, OpenMaya.MAngle(edits.get('in_angle'), ui_angle), True)
+        if 'out_angle' in edits:
+            curve_fn.setAngle(key_index, OpenMaya.MAngle(edits.get('out_angle'), ui_angle), False)
+        if weighted:
+            curve_fn.setWeight(key_index, edits.get('in_weight'), True)
+            curve_fn.setWeight(key_index, edits.get('out_weight'), False)
+            curve_fn.setWeightsLocked(key_index, bool(columns.get('locks')[index]))
+    return curve_fn.name()
+
+
+def write_anim_curve(node, attr, columns, undoable=True, time_range=None):
+    """
+    Builds (or replaces) the animation curve of an attribute from columns of key data.
+    Keys are created in bulk and tangents are only set per key when necessary (fixed angles and weighted curves).
+
+    Args:
+        node (string): Name of the node receiving the curve
+        attr (string): Name of the attribute receiving the curve. e.g. "translateX"
+        columns (dict): Key data (UI units, sorted by time) using the same layout returned by "read_anim_curve"
+        undoable (optional, bool): If True, only undoable commands are used (wrap calls in an undo chunk to
+                                   undo multiple curves at once). If False, the curve is built through the API
+                                   without recording undo, which is faster and meant for batch jobs.
+        time_range (optional, tuple): First and last frame of the keys to replace. e.g. (1, 201)
+                                      Existing keys outside of it are kept (windowed or offset imports).
+                                      None replaces the whole curve.
+
+    Returns:
+        anim_curve (string, None): Name of the animation curve that received the keys.
+                                   None if no keys were provided and the attribute is not animated.
+    """
+    if not len(columns.get('times')):
+        return get_anim_curve(node, attr)
+    time_range = _get_write_time_range(columns, time_range)
+    if undoable:
+        return _write_anim_curve_undoable(node, attr, columns, time_range=time_range)
+    return _write_anim_curve_api(node, attr, columns, time_range=time_range)
+
+
+def _get_key_signature(columns, index, weighted, precision=6):
+    """
+    Gets the data that defines a key (time, value, tangent types, fixed angles and, for weighted curves,
+    weights and weight lock). Angles of non-fixed tangents are ignored as they are computed by Maya.
+
+    Args:
+        columns (dict): Curve columns (see "read_anim_curve")
+        index (int): Key index
+        weighted (bool): If the curve uses weighted tangents
+        precision (optional, int): Number of decimals used to compare float values
+
+    Returns:
+        signature (tuple): Hashable representation of the key
+    """
+    edits = _get_tangent_edits(columns, index, weighted)
+    signature = (round(columns.get('times')[index], precision), round(columns.get('values')[index], precision),
+                 columns.get('in_tangent_types')[index], columns.get('out_tangent_types')[index])
+    for edit in ['in_angle', 'out_angle', 'in_weight', 'out_weight']:
+        signature += (round(edits.get(edit), precision) if edit in edits else None,)
+    if weighted:
+        signature += (bool(columns.get('locks')[index]),)
+    return signature
+
+
+def hash_anim_columns(columns, weighted=False):
+    """
+    Hashes the key data of a curve (see "_get_key_signature"), so curves can be compared quickly
+
+    Args:
+        columns (dict): Curve columns (see "read_anim_curve")
+        weighted (optional, bool): If the curve uses weighted tangents
+
+    Returns:
+        digest (string): Hexadecimal digest of the key data
+    """
+    curve_hash = hashlib.sha1()
+    for index in range(len(columns.get('times'))):
+        curve_hash.update(repr(_get_key_signature(columns, index, weighted)).encode('utf-8'))
+    return curve_hash.hexdigest()
+
+
+def _write_key(node, attr, columns, index, weighted):
+    """
+    Writes (creates or replaces) a single key using undoable commands (used for minimal edits)
+
+    Args:
+        node (string): Name of the node receiving the key
+        attr (string): Name of the attribute receiving the key
+        columns (dict): Curve columns (see "read_anim_curve")
+        index (int): Index of the key in the columns
+        weighted (bool): If the curve uses weighted tangents
+    """
+    frame = columns.get('times')[index]
+    cmds.setKeyframe(node, attribute=attr, time=frame, value=columns.get('values')[index])
+    cmds.keyTangent(node, attribute=attr, time=(frame, frame), e=True,
+                    inTangentType=columns.get('in_tangent_types')[index],
+                    outTangentType=columns.get('out_tangent_types')[index])
+    edits = _get_tangent_edits(columns, index, weighted)
+    if 'in_angle' in edits and 'out_angle' in edits and edits.get('in_angle') != edits.get('out_angle'):
+        cmds.keyTangent(node, attribute=attr, time=(frame, frame), e=True, lock=False)
+    flags = {}
+    for edit, flag in [('in_angle', 'inAngle'), ('out_angle', 'outAngle'),
+                       ('in_weight', 'inWeight'), ('out_weight', 'outWeight')]:
+        if edit in edits:
+            flags[flag] = edits.get(edit)
+    if weighted:
+        flags['weightLock'] = bool(columns.get('locks')[index])
+    if flags:
+        cmds.keyTangent(node, attribute=attr, time=(frame, frame), e=True, **flags)
+
+
+def update_anim_curve(node, attr, columns, undoable=True, rewrite_ratio=0.5, time_range=None):
+    """
+    Updates the animation curve of an attribute so it matches the provided key data, touching as little as possible.
+    The current key data is hashed and compared with the incoming data: unchanged curves are skipped and
+    changed curves only receive the necessary key edits (removed, added or modified keys).
+
+    Args:
+        node (string): Name of the node receiving the curve
+        attr (string): Name of the attribute receiving the curve. e.g. "translateX"
+        columns (dict): Key data (UI units, sorted by time) using the same layout returned by "read_anim_curve"
+        undoable (optional, bool): If False, curves that need to be rewritten are written without recording undo.
+        rewrite_ratio (optional, float): If the ratio of keys to edit is higher than this value,
+                                         the whole curve is rewritten instead (see "write_anim_curve")
+        time_range (optional, tuple): First and last frame of the keys to update. e.g. (1, 201)
+                                      Existing keys outside of it are kept. None updates the whole curve.
+
+    Returns:
+        keys_touched (int): Number of keys that were written or removed. 0 means the curve was unchanged.
+    """
+    existing_curve = get_anim_curve(node, attr)
+    if not existing_curve:
+        write_anim_curve(node, attr, columns, undoable=undoable)
+        return len(columns.get('times'))
+
+    weighted = bool(cmds.getAttr(existing_curve + '.weightedTangents'))
+    current_columns = read_anim_curve(existing_curve)
+    time_range = _get_write_time_range(columns, time_range) if len(columns.get('times')) else time_range
+    if time_range:  # Only the keys inside the range are compared
+        in_range = [index for index, frame in enumerate(current_columns.get('times'))
+                    if time_range[0] <= frame <= time_range[1]]
+        current_columns = dict((column, [values[index] for index in in_range])
+                               for column, values in current_columns.items())
+    if hash_anim_columns(current_columns, weighted) == hash_anim_columns(columns, weighted):
+        return 0
+
+    current_keys = {}
+    for index in range(len(current_columns.get('times'))):
+        signature = _get_key_signature(current_columns, index, weighted)
+        current_keys[signature[0]] = (current_columns.get('times')[index], signature)
+    incoming_times = set()
+    changed_indices = []
+    for index in range(len(columns.get('times'))):
+        signature = _get_key_signature(columns, index, weighted)
+        incoming_times.add(signature[0])
+        current_key = current_keys.get(signature[0])
+        if not current_key or current_key[1] != signature:
+            changed_indices.append(index)
+    removed_times = [current_key[0] for rounded_time, current_key in current_keys.items()
+                     if rounded_time not in incoming_times]
+
+    keys_touched = len(changed_indices) + len(removed_times)
+    if keys_touched > max(len(columns.get('times')), len(current_keys)) * rewrite_ratio:
+        write_anim_curve(node, attr, columns, undoable=undoable, time_range=time_range)
+        return len(columns.get('times'))
+
+    if removed_times:
+        cmds.cutKey(node, attribute=attr, time=[(frame, frame) for frame in removed_times], clear=True)
+    for index in changed_indices:
+        _write_key(node, attr, columns, index, weighted)
+    return keys_touched
+
+
+def benchmark_anim_curve_writer(key_count=50000, curve_count=50, include_per_key=False, directory=None):
+    """
+    Imports a synthetic animation file (binary container) onto temporary nodes using the bulk curve writer
+    (undoable and fast modes) and optionally the per-key import (setKeyframe/keyTangent) for comparison.
+    Temporary nodes and files are deleted at the end.
+
+    Args:
+        key_count (optional, int): Total number of keys in the synthetic file
+        curve_count (optional, int): Number of curves in the synthetic file (keys are split between them)
+        include_per_key (optional, bool): If the per-key import should also be measured (slow)
+        directory (optional, string): Where to write the temporary file. Uses the system temp directory if not provided
+
+    Returns:
+        results (dict): Time in seconds for each method. e.g. {'undoable': 1.0, 'fast': 0.5, 'per_key': 60.0}
+    """
+    from gt_anim_container import write_anim_container, AnimContainerReader, legacy_keys_from_columns
+    import tempfile
+    import math
+    import os
+    import sys
+
+    directory = directory or tempfile.gettempdir()
+    keys_per_curve = max(1, key_count // curve_count)
+    node_count = int(math.ceil(curve_count / float(len(transform_channels))))
+    nodes = [cmds.createNode('transform', name='gt_benchmark_writer_' + str(index), skipSelect=True)
+             for index in range(node_count)]
+
+    curves = {}
+    tangent_cycle = ['auto', 'spline', 'linear', 'fixed', 'clamped']
+    for index in range(curve_count):
+        times = [float(frame) for frame in range(keys_per_curve)]
+        tangent_types = [tangent_cycle[frame % len(tangent_cycle)] for frame in range(keys_per_curve)]
+        name = nodes[index // len(transform_channels)] + '.' + transform_channels[index % len(transform_channels)]
+        curves[name] = {'times': times,
+                        'values': [math.sin(frame * 0.1 + index) * 10.0 for frame in times],
+                        'in_angles': [15.0] * keys_per_curve,
+                        'out_angles': [15.0] * keys_per_curve,
+                        'in_weights': [1.0] * keys_per_curve,
+                        'out_weights': [1.0] * keys_per_curve,
+                        'locks': [True] * keys_per_curve,
+                        'in_tangent_types': tangent_types,
+                        'out_tangent_types': list(tangent_types)}
+    file_path = os.path.join(directory, 'gt_anim_writer_benchmark.anim')
+    write_anim_container(file_path, {'gt_interface_version': 'benchmark'}, curves)
+
+    def import_per_key(target, channel, columns):
+        for key in legacy_keys_from_columns(columns):
+            cmds.setKeyframe(target, time=key[0], attribute=channel, value=key[1])
+            cmds.keyTangent(target, at=channel, time=(key[0], key[0]), lock=key[4], e=True)
+            cmds.keyTangent(target, at=channel, time=(key[0], key[0]), inAngle=key[2], e=True)
+            cmds.keyTangent(target, at=channel, time=(key[0], key[0]), outAngle=key[3], e=True)
+            cmds.keyTangent(target, at=channel, time=(key[0], key[0]), inWeight=key[5], e=True)
+            cmds.keyTangent(target, at=channel, time=(key[0], key[0]), outWeight=key[6], e=True)
+            cmds.keyTangent(target, at=channel, time=(key[0], key[0]), inTangentType=key[7], e=True)
+            cmds.keyTangent(target, at=channel, time=(key[0], key[0]), outTangentType=key[8], e=True)
+
+    methods = [('undoable', lambda target, channel, columns: write_anim_curve(target, channel, columns)),
+               ('fast', lambda target, channel, columns: write_anim_curve(target, channel, columns, undoable=False))]
+    if include_per_key:
+        methods.append(('per_key', import_per_key))
+
+    results = {}
+    try:
+        for label, method in methods:
+            cmds.cutKey(nodes, clear=True)
+            start = time.perf_counter()
+            cmds.undoInfo(openChunk=True, chunkName='GT Anim Writer Benchmark')
+            try:
+                with AnimContainerReader(file_path) as reader:
+                    for name, columns in reader.iter_curves():
+                        target, channel = name.split('.')
+                        method(target, channel, columns)
+            finally:
+                cmds.undoInfo(closeChunk=True)
+            results[label] = time.perf_counter() - start
+    finally:
+        cmds.delete(nodes)
+        os.remove(file_path)
+
+    total_keys = keys_per_curve * curve_count
+    for label, elapsed in results.items():
+        sys.stdout.write('{}: {} keys in {:.3f}s ({:.0f} keys/s)\n'.format(label, total_keys, elapsed,
+                                                                         total_keys / max(elapsed, 1e-9)))
+    return results
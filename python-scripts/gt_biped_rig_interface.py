@@ -109,6 +109,48 @@
  Made some functions not protected as they can be helpful in other scripts
  Fixed a little GUI alignment issue
 
+ 1.3.24 - 2026-10-18
+ Replaced the per-frame bake used by the FK/IK switch with a bake engine (single time sweep and bulk keys)
+ Added "benchmark_fk_ik_bake" to compare the bake engine against the previous implementation
+
+ 1.3.25 - 2026-10-18
+ Added "fk_ik_switch_multiple" to switch/bake multiple limbs using a single pass over time
+ Added "Switch All Limbs" button to the FK/IK tab
+
+ 1.3.26 - 2026-10-18
+ Animation export now uses the compact binary container (setting "Export Compact ANIM Files")
+ Animation import detects the file format automatically (binary container or legacy JSON)
+
+ 1.3.27 - 2026-10-18
+ Animation export reads animation curves in bulk (skips channels without curves up front)
+
+ 1.3.28 - 2026-10-18
+ Animation import builds/replaces every curve in bulk ("write_anim_curve") as a single undo operation
+ Added "undoable" parameter to "anim_import" (no undo fast mode for batch jobs)
+ Pose import sets translate, rotate and scale with one call each (when not locked) as a single undo operation
+
+ 1.3.29 - 2026-10-18
+ Added a control resolver index ("get_ctrl_index") built from a single query and cleared by scene changes
+ Pose and animation functions use the control index instead of checking every control individually
+
+ 1.3.30 - 2026-10-18
+ Animation mirror pairs controls using a dictionary and mirrors whole animation curves (no per-key operations)
+ Animation mirror accepts "both" as source side (swaps the animation of both sides)
+
+ 1.3.31 - 2026-10-18
+ Added crowd mode ("pose_import_crowd" and "anim_import_crowd"): a file is read once and applied to many namespaces
+ Crowd mode accepts per-namespace time offsets and mirror flags and reports characters per second
+
+ 1.3.32 - 2026-10-18
+ Added incremental animation import (setting "Incremental ANIM Import"): only changed curves and keys are written
+ Animation import prints the number of curves and keys touched
+
+ 1.3.33 - 2026-10-18
+ Animation import accepts a time window and a time offset (only the window is read from compact ANIM files)
+
+ 1.3.34 - 2026-10-18
+ Added optional key reduction after FK/IK bakes (setting "Reduce Baked Keys")
+
 
  TODO:
     Created flip pose function
@@ -123,12 +165,19 @@ from PySide2.QtWidgets import QWidget
 from PySide2.QtGui import QIcon
 from shiboken2 import wrapInstance
 from maya import OpenMayaUI as OpenMayaUI
+import maya.api.OpenMaya as OpenMaya
+from gt_anim_container import AnimContainerReader, is_anim_container, read_anim_container, write_anim_container
+from gt_anim_container import columns_from_legacy_keys, crop_anim_columns, legacy_keys_from_columns
+from gt_anim_utilities import bake_matched_transforms, get_node_anim_curves, read_anim_curve, write_anim_curve
+from gt_anim_utilities import apply_anim_curve, duplicate_anim_curve, transform_anim_columns, update_anim_curve
+from gt_anim_utilities import print_reduction_stats, reduce_baked_keys
 import maya.cmds as cmds
 import maya.mel as mel
 import logging
 import random
 import json
 import copy
+import time
 import sys
 import os
 import re
@@ -143,7 +192,7 @@ script_name = 'GT Custom Rig Interface'
 unique_rig = ''  # If provided, it will be used in the window title
 
 # Version:
-script_version = "1.3.23"
+script_version = "1.3.34"
 
 # FK/IK Switcher Elements
 left_arm_seamless_dict = {'switch_ctrl': 'left_arm_switch_ctrl',  # Switch Ctrl
@@ -335,6 +384,11 @@ gt_custom_rig_interface_settings = {
     'allow_multiple_instances': False,
     'offset_target': False,
     'key_influence': False,
+    'anim_export_compact': True,
+    'anim_import_incremental': False,
+    'bake_reduce_keys': False,
+    'bake_tolerance_translate': 0.01,
+    'bake_tolerance_rotate': 0.1,
 }
 
 gt_custom_rig_interface_settings_default = copy.deepcopy(gt_custom_rig_interface_settings)
@@ -414,6 +468,172 @@ def _get_metadata(namespace):
         return None
 
 
+# Control Resolver =======================================================================
+_ctrl_index = None  # {namespace: {control_key: node}} - Built on demand, cleared by scene changes
+_ctrl_index_known_names = set()
+_ctrl_index_callbacks = globals().get('_ctrl_index_callbacks', [])  # Kept on reload, so old callbacks can be removed
+
+
+def _get_known_ctrl_names():
+    """
+    Gets the name (without namespace) of every control described in this script
+
+    Returns:
+        ctrl_names (set): A set of control names. e.g. {"left_wrist_ik_ctrl", "cog_ctrl", ...}
+    """
+    ctrl_names = set(gt_ab_center_ctrls)
+    for ctrl_dict in [gt_ab_ik_ctrls, gt_ab_fk_ctrls, gt_ab_general_ctrls]:
+        for obj in ctrl_dict:
+            ctrl_names.add(left_prefix + obj)
+            ctrl_names.add(right_prefix + obj)
+    for seamless_dict in seamless_elements_dictionaries:
+        for element in seamless_dict.values():
+            if element:
+                ctrl_names.add(element)
+    ctrl_names.add('main_ctrl')
+    return ctrl_names
+
+
+def invalidate_ctrl_index(*args):
+    """
+    Clears the control index, so it's rebuilt the next time it's needed.
+    Used by the scene-change callbacks (node added/removed/renamed, references, new/open scene)
+
+    Args:
+        *args: Ignored (callback arguments)
+    """
+    global _ctrl_index
+    _ctrl_index = None
+
+
+def _on_ctrl_index_name_changed(node, previous_name, *args):
+    """
+    Clears the control index when a control is renamed (new or previous name without namespace is a control).
+    Other nodes (e.g. animation curves created during an import) are ignored, so the index is kept.
+
+    Args:
+        node (MObject): Node that was renamed
+        previous_name (string): Name of the node before the change
+        *args: Ignored (callback arguments)
+    """
+    if _ctrl_index is None:
+        return
+    names = [previous_name]
+    try:
+        names.append(OpenMaya.MFnDependencyNode(node).name())
+    except Exception as e:
+        logger.debug(str(e))
+    for name in names:
+        ctrl_key = (name or '').split('|')[-1].rpartition(namespace_separator)[2]
+        if ctrl_key in _ctrl_index_known_names or \
+                any(ctrl_key in namespace_index for namespace_index in _ctrl_index.values()):
+            invalidate_ctrl_index()
+            return
+
+
+def _add_ctrl_index_callbacks():
+    """ Registers the scene-change callbacks that invalidate the control index (only once) """
+    if _ctrl_index_callbacks:
+        return
+    try:
+        _ctrl_index_callbacks.append(OpenMaya.MDGMessage.addNodeAddedCallback(invalidate_ctrl_index, 'transform'))
+        _ctrl_index_callbacks.append(OpenMaya.MDGMessage.addNodeRemovedCallback(invalidate_ctrl_index, 'transform'))
+        _ctrl_index_callbacks.append(OpenMaya.MNodeMessage.addNameChangedCallback(OpenMaya.MObject.kNullObj,
+                                                                                  _on_ctrl_index_name_changed))
+        for scene_message in [OpenMaya.MSceneMessage.kAfterNew, OpenMaya.MSceneMessage.kAfterOpen,
+                              OpenMaya.MSceneMessage.kAfterImport, OpenMaya.MSceneMessage.kAfterCreateReference,
+                              OpenMaya.MSceneMessage.kAfterLoadReference, OpenMaya.MSceneMessage.kAfterUnloadReference,
+                              OpenMaya.MSceneMessage.kAfterRemoveReference]:
+            _ctrl_index_callbacks.append(OpenMaya.MSceneMessage.addCallback(scene_message, invalidate_ctrl_index))
+    except Exception as e:
+        logger.debug(str(e))
+
+
+def remove_ctrl_index_callbacks():
+    """ Removes the scene-change callbacks and clears the control index """
+    for callback_id in _ctrl_index_callbacks:
+        try:
+            OpenMaya.MMessage.removeCallback(callback_id)
+        except Exception as e:
+            logger.debug(str(e))
+    del _ctrl_index_callbacks[:]
+    invalidate_ctrl_index()
+
+
+# Callbacks registered before a reload point to the functions of the previous module
+remove_ctrl_index_callbacks()
+
+
+def get_ctrl_index():
+    """
+    Gets an index of the existing rig controls for every namespace in the scene.
+    The index is built using a single "cmds.ls" query and kept until the scene changes.
+
+    Returns:
+        ctrl_index (dict): A dictionary with namespaces as keys (e.g. "" or "character:")
+                           and a dictionary of control names to nodes as values.
+                           e.g. {'character:': {'left_wrist_ik_ctrl': 'character:left_wrist_ik_ctrl'}}
+    """
+    global _ctrl_index, _ctrl_index_known_names
+    if _ctrl_index is None:
+        _ctrl_index_known_names = _get_known_ctrl_names()
+        ctrl_index = {}
+        for node in cmds.ls(list(_ctrl_index_known_names), recursive=True) or []:
+            namespace, _, ctrl_key = node.split('|')[-1].rpartition(namespace_separator)
+            if namespace:
+                namespace += namespace_separator
+            ctrl_index.setdefault(namespace, {}).setdefault(ctrl_key, node)
+        _add_ctrl_index_callbacks()
+        _ctrl_index = ctrl_index
+    return _ctrl_index
+
+
+def resolve_ctrl(ctrl_key, namespace=''):
+    """
+    Finds a rig control using the control index (see "get_ctrl_index")
+    Controls not described in this script are checked once and stored in the index.
+
+    Args:
+        ctrl_key (string): Name of the control without namespace. e.g. "left_wrist_ik_ctrl"
+        namespace (string): Namespace of the rig. e.g. "character:"
+
+    Returns:
+        node (string, None): Name of the control. None if it doesn't exist.
+    """
+    namespace = namespace.lstrip(namespace_separator)
+    namespace_index = get_ctrl_index().setdefault(namespace, {})
+    if ctrl_key not in namespace_index:
+        if ctrl_key in _ctrl_index_known_names:
+            return None
+        namespace_index[ctrl_key] = namespace + ctrl_key if cmds.objExists(namespace + ctrl_key) else None
+    return namespace_index.get(ctrl_key)
+
+
+def get_available_ctrls(sided_ctrls, center_ctrls=None, namespace=''):
+    """
+    Gets a list of the rig controls that exist in the scene (uses the control index, see "get_ctrl_index")
+
+    Args:
+        sided_ctrls (list): A list of dictionaries or lists of controls without their side prefix (e.g. "_wrist_ctrl")
+        center_ctrls (optional, list): A list of center controls (full names) (e.g. "spine01_ctrl")
+        namespace (string): In case the rig has a namespace, it will be used to properly find the controls.
+
+    Returns:
+        available_ctrls (list): A list of existing controls without namespace (e.g. "left_wrist_ctrl")
+    """
+    available_ctrls = []
+    for ctrl_group in sided_ctrls:
+        for obj in ctrl_group:
+            if resolve_ctrl(left_prefix + obj, namespace=namespace):
+                available_ctrls.append(left_prefix + obj)
+            if resolve_ctrl(right_prefix + obj, namespace=namespace):
+                available_ctrls.append(right_prefix + obj)
+    for obj in center_ctrls or []:
+        if resolve_ctrl(obj, namespace=namespace):
+            available_ctrls.append(obj)
+    return available_ctrls
+
+
 # Main Window ============================================================================
 def build_gui_custom_rig_interface():
     # Retrieve Persistent Settings
@@ -582,6 +802,20 @@ def build_gui_custom_rig_interface():
 
         update_fk_ik_buttons()
 
+    def update_switch_all():
+        """
+        Switches (toggles) all limbs at once using the parameters provided in the UI.
+        When baking, all limbs are baked in a single pass over time.
+        """
+        method = 'bake' if gt_custom_rig_interface_settings.get('auto_key_method_bake') else 'sparse'
+        fk_ik_switch_multiple(seamless_elements_dictionaries, direction='auto',
+                              namespace=cmds.textField(namespace_txt, q=True, text=True) + namespace_separator,
+                              keyframe=gt_custom_rig_interface_settings.get('auto_key_switch'),
+                              start_time=int(gt_custom_rig_interface_settings.get('auto_key_start_frame')),
+                              end_time=int(gt_custom_rig_interface_settings.get('auto_key_end_frame')),
+                              method=method)
+        update_fk_ik_buttons()
+
     def invert_stored_setting(key_string):
         """
         Used for boolean values, it inverts the value, so if True it becomes False and vice-versa.
@@ -746,7 +980,8 @@ def build_gui_custom_rig_interface():
         script_version_title = '  (v' + script_version + ')'
 
     window_gui_custom_rig_interface = cmds.window(rig_interface_window_name, title=script_title + script_version_title,
-                                                  titleBar=True, mnb=False, mxb=False, sizeable=True)
+                                                  titleBar=True, mnb=False, mxb=False, sizeable=True,
+                                                  closeCommand=remove_ctrl_index_callbacks)
 
     cmds.window(rig_interface_window_name, e=True, s=True, wh=[1, 1])
 
@@ -836,6 +1071,10 @@ def build_gui_custom_rig_interface():
     cmds.button(l="Switch", c=lambda x: update_switch(left_leg_seamless_dict, is_auto_switch=True),
                 p=legs_switch_column)  # L
 
+    switch_all_column = cmds.rowColumnLayout(nc=1, cw=[(1, 243)], cs=[(1, 2)], p=fk_ik_switch_tab)
+    cmds.separator(h=btn_margin, style='none', p=switch_all_column)  # Empty Space
+    cmds.button(l="Switch All Limbs", c=lambda x: update_switch_all(), p=switch_all_column)
+
     # Auto Key Settings (Switch Settings)
     cmds.rowColumnLayout(nc=1, cw=[(1, 245)], cs=[(1, 6)], p=fk_ik_switch_tab)
     cmds.separator(h=15)  # Empty Space
@@ -1056,6 +1295,60 @@ def build_gui_custom_rig_interface():
                     c=lambda x: build_custom_help_window(offset_target_thumbnail_help_message,
                                                          offset_target_thumbnail_help_title))
 
+        # Export Compact Animation Files
+        is_option_enabled = True
+        cmds.text(' ', bgc=(enabled_bgc_color if is_option_enabled else disabled_bgc_color), h=20)  # Tiny Empty Space
+        cmds.checkBox(label='  Export Compact ANIM Files',
+                      value=gt_custom_rig_interface_settings.get('anim_export_compact'), ebg=True,
+                      cc=lambda x: invert_stored_setting('anim_export_compact'), en=is_option_enabled)
+
+        anim_export_compact_help_message = 'Exports animation using a compact binary format (compressed columns ' \
+                                           'of keyframe data) instead of JSON.\nCompact files are much smaller ' \
+                                           'and faster to import.\n\nBoth formats can be imported, the format ' \
+                                           'is detected automatically. Deactivate it in case you need to read or ' \
+                                           'edit the exported data as text.'
+        anim_export_compact_help_title = 'Export Compact ANIM Files'
+        cmds.button(l='?', bgc=enabled_bgc_color,
+                    c=lambda x: build_custom_help_window(anim_export_compact_help_message,
+                                                         anim_export_compact_help_title))
+
+        # Incremental Animation Import
+        is_option_enabled = True
+        cmds.text(' ', bgc=(enabled_bgc_color if is_option_enabled else disabled_bgc_color), h=20)  # Tiny Empty Space
+        cmds.checkBox(label='  Incremental ANIM Import',
+                      value=gt_custom_rig_interface_settings.get('anim_import_incremental'), ebg=True,
+                      cc=lambda x: invert_stored_setting('anim_import_incremental'), en=is_option_enabled)
+
+        anim_import_incremental_help_message = 'Compares the imported animation with the animation in the scene ' \
+                                               'and only writes what changed.\nUnchanged curves are skipped and ' \
+                                               'changed curves only receive the necessary key edits.\n\nUseful ' \
+                                               'when importing slightly edited versions of the same file. ' \
+                                               'The number of curves and keys touched is printed to the ' \
+                                               'Script Editor.'
+        anim_import_incremental_help_title = 'Incremental ANIM Import'
+        cmds.button(l='?', bgc=enabled_bgc_color,
+                    c=lambda x: build_custom_help_window(anim_import_incremental_help_message,
+                                                         anim_import_incremental_help_title))
+
+        # Reduce Baked Keys
+        is_option_enabled = True
+        cmds.text(' ', bgc=(enabled_bgc_color if is_option_enabled else disabled_bgc_color), h=20)  # Tiny Empty Space
+        cmds.checkBox(label='  Reduce Baked Keys',
+                      value=gt_custom_rig_interface_settings.get('bake_reduce_keys'), ebg=True,
+                      cc=lambda x: invert_stored_setting('bake_reduce_keys'), en=is_option_enabled)
+
+        bake_reduce_keys_help_message = 'After baking an FK/IK switch, removes the keys that can be reproduced ' \
+                                        'by the curve within a tolerance.\nTolerances: ' + \
+                                        str(gt_custom_rig_interface_settings.get('bake_tolerance_translate')) + \
+                                        ' units (translate) and ' + \
+                                        str(gt_custom_rig_interface_settings.get('bake_tolerance_rotate')) + \
+                                        ' degrees (rotate).\n\nThe number of keys before and after the ' \
+                                        'reduction and the maximum error are printed to the Script Editor.'
+        bake_reduce_keys_help_title = 'Reduce Baked Keys'
+        cmds.button(l='?', bgc=enabled_bgc_color,
+                    c=lambda x: build_custom_help_window(bake_reduce_keys_help_message,
+                                                         bake_reduce_keys_help_title))
+
         # Export Thumbnail With Pose
         is_option_enabled = False
         cmds.text(' ', bgc=(enabled_bgc_color if is_option_enabled else disabled_bgc_color), h=20)  # Tiny Empty Space
@@ -1121,6 +1414,35 @@ def _open_gt_tools_documentation():
     cmds.showHelp('https://github.com/TrevisanGMW/gt-tools/tree/release/docs#-gt-auto-biped-rigger-', absolute=True)
 
 
+def _get_clavicle_influence_attr(ik_fk_dict, namespace=''):
+    """
+    Gets the auto clavicle influence attribute (incompatible with the switch) of an FK/IK system
+
+    Args:
+        ik_fk_dict (dict): A dictionary containing the elements that are part of the system you want to switch
+        namespace (optional, string): In case the rig has a namespace, it will be used to properly select the controls.
+
+    Returns:
+        attribute (string, None): Attribute path (e.g. "left_wrist_ik_ctrl.clavicleInfluence") or None if not used
+    """
+    if not ik_fk_dict.get('incompatible_attr_holder'):
+        return None
+    ns_incompatible_attr_holder = namespace + ik_fk_dict.get('incompatible_attr_holder')
+    available_attributes = cmds.listAttr(ns_incompatible_attr_holder, userDefined=True) or []
+    if 'autoClavicleInfluence' in available_attributes:  # Before V1.7
+        return ns_incompatible_attr_holder + '.autoClavicleInfluence'
+    return ns_incompatible_attr_holder + '.clavicleInfluence'
+
+
+def _print_auto_clavicle_warning():
+    """ Warns the user that the auto clavicle is active (it might cause pose offsets after a switch) """
+    cmds.inViewMessage(
+        amg='</span><span style=\"color:#FF0000;text-decoration:underline;\">Warning:</span>'
+            '<span style=\"color:#FFFFFF;\"> Auto clavicle was activated, any unexpected pose offset is '
+            'likely coming from this automation.',
+        pos='botLeft', fade=True, alpha=.9, fadeStayTime=2000)
+
+
 def fk_ik_switch(ik_fk_dict, direction='fk_to_ik', namespace='', keyframe=False, start_time=0, end_time=0,
                  method='sparse'):
     """
@@ -1239,15 +1561,10 @@ def fk_ik_switch(ik_fk_dict, direction='fk_to_ik', namespace='', keyframe=False,
         cmds.warning('No controls were found. Make sure you are using the correct namespace.')
     else:
         auto_clavicle_value = None
-        if ik_fk_dict.get('incompatible_attr_holder'):
-            ns_incompatible_attr_holder = namespace + ik_fk_dict.get('incompatible_attr_holder')
-            available_attributes = cmds.listAttr(ns_incompatible_attr_holder, userDefined=True)
-            if 'autoClavicleInfluence' in available_attributes:  # Before V1.7
-                auto_clavicle_value = cmds.getAttr(ns_incompatible_attr_holder + '.autoClavicleInfluence')
-                cmds.setAttr(ns_incompatible_attr_holder + '.autoClavicleInfluence', 0)
-            else:
-                auto_clavicle_value = cmds.getAttr(ns_incompatible_attr_holder + '.clavicleInfluence')
-                cmds.setAttr(ns_incompatible_attr_holder + '.clavicleInfluence', 0)
+        clavicle_influence_attr = _get_clavicle_influence_attr(ik_fk_dict, namespace)
+        if clavicle_influence_attr:
+            auto_clavicle_value = cmds.getAttr(clavicle_influence_attr)
+            cmds.setAttr(clavicle_influence_attr, 0)
         if keyframe:
             if method.lower() == 'sparse':  # Only Influence Switch
                 original_time = cmds.currentTime(q=True)
@@ -1266,38 +1583,24 @@ def fk_ik_switch(ik_fk_dict, direction='fk_to_ik', namespace='', keyframe=False,
                 if start_time >= end_time:
                     cmds.warning('Invalid range. Please review the start and end frames and try again.')
                 else:
-                    original_time = cmds.currentTime(q=True)
-                    cmds.currentTime(start_time)
-                    current_time = cmds.currentTime(q=True)
-                    if gt_custom_rig_interface_settings.get('key_influence'):
-                        cmds.setKeyframe(namespace + ik_fk_dict.get('switch_ctrl'), time=current_time,
-                                         attribute='influenceSwitch')  # Start Switch
-                    for index in range(end_time - start_time):
-                        cmds.currentTime(current_time)
-                        switch(match_only=True)
-                        if direction == 'fk_to_ik':
-                            for channel in ['t', 'r']:
-                                for dimension in ['x', 'y', 'z']:
-                                    cmds.setKeyframe(namespace + ik_fk_dict.get('end_ik_ctrl'), time=current_time,
-                                                     attribute=channel + dimension)  # Wrist IK Ctrl
-                                    cmds.setKeyframe(namespace + ik_fk_dict.get('pvec_ik_ctrl'), time=current_time,
-                                                     attribute=channel + dimension)  # PVec Elbow IK Ctrl
-
-                        if direction == 'ik_to_fk':
-                            for channel in ['t', 'r']:
-                                for dimension in ['x', 'y', 'z']:
-                                    cmds.setKeyframe(namespace + ik_fk_dict.get('base_fk_ctrl'), time=current_time,
-                                                     attribute=channel + dimension)  # Shoulder FK Ctrl
-                                    cmds.setKeyframe(namespace + ik_fk_dict.get('end_fk_ctrl'), time=current_time,
-                                                     attribute=channel + dimension)  # Wrist FK Ctrl
-                                    cmds.setKeyframe(namespace + ik_fk_dict.get('mid_fk_ctrl'), time=current_time,
-                                                     attribute=channel + dimension)  # Elbow FK Ctrl
-                        current_time += 1
-                    switch()
-                    if gt_custom_rig_interface_settings.get('key_influence'):
-                        cmds.setKeyframe(namespace + ik_fk_dict.get('switch_ctrl'), time=current_time,
-                                         attribute='influenceSwitch')  # End Switch
-                    cmds.currentTime(original_time)
+                    function_name = 'GT FK/IK Bake'
+                    cmds.undoInfo(openChunk=True, chunkName=function_name)
+                    try:
+                        switch_attr = namespace + ik_fk_dict.get('switch_ctrl') + '.influenceSwitch'
+                        if gt_custom_rig_interface_settings.get('key_influence'):  # Start Switch
+                            cmds.setKeyframe(switch_attr, time=start_time,
+                                             value=cmds.getAttr(switch_attr, time=start_time))
+                        _fk_ik_bake(ik_fk_dict, direction, namespace, start_time, end_time,
+                                    tolerance=_get_bake_tolerance())
+                        influence_value = 1 if direction == 'fk_to_ik' else 0
+                        cmds.setAttr(switch_attr, influence_value)
+                        if gt_custom_rig_interface_settings.get('key_influence'):  # End Switch
+                            cmds.setKeyframe(switch_attr, time=end_time, value=influence_value)
+                    except Exception as e:
+                        cmds.warning('An error occurred while baking. Please check if a namespace is necessary or '
+                                     'if a control was deleted.     Error: ' + str(e))
+                    finally:
+                        cmds.undoInfo(closeChunk=True, chunkName=function_name)
                     print_inview_feedback()
             else:
                 cmds.warning('Invalid method was provided. Must be either "sparse" or "bake", but got ' + method)
@@ -1305,20 +1608,10 @@ def fk_ik_switch(ik_fk_dict, direction='fk_to_ik', namespace='', keyframe=False,
             switch()
             print_inview_feedback()
 
-        if ik_fk_dict.get('incompatible_attr_holder'):
-            ns_incompatible_attr_holder = namespace + ik_fk_dict.get('incompatible_attr_holder')
-            available_attributes = cmds.listAttr(ns_incompatible_attr_holder, userDefined=True)
-            if 'autoClavicleInfluence' in available_attributes:  # Before V1.7
-                cmds.setAttr(ns_incompatible_attr_holder + '.autoClavicleInfluence', auto_clavicle_value)
-            else:
-                cmds.setAttr(ns_incompatible_attr_holder + '.clavicleInfluence', auto_clavicle_value)
+        if clavicle_influence_attr:
+            cmds.setAttr(clavicle_influence_attr, auto_clavicle_value)
             if auto_clavicle_value != 0:
-                # Print Feedback
-                cmds.inViewMessage(
-                    amg='</span><span style=\"color:#FF0000;text-decoration:underline;\">Warning:</span>'
-                        '<span style=\"color:#FFFFFF;\"> Auto clavicle was activated, any unexpected pose offset is '
-                        'likely coming from this automation.',
-                    pos='botLeft', fade=True, alpha=.9, fadeStayTime=2000)
+                _print_auto_clavicle_warning()
 
 
 def fk_ik_switch_auto(ik_fk_dict, namespace='', keyframe=False, start_time=0, end_time=0, method='sparse'):
@@ -1351,6 +1644,236 @@ def fk_ik_switch_auto(ik_fk_dict, namespace='', keyframe=False, start_time=0, en
         cmds.warning('An error occurred. Please check if a namespace is necessary.     Error: ' + str(e))
 
 
+def fk_ik_switch_multiple(ik_fk_dicts, direction='auto', namespace='', keyframe=False, start_time=0, end_time=0,
+                          method='sparse'):
+    """
+    Switches multiple FK/IK systems (e.g. all four limbs) at once.
+    When baking, all systems share the same time sweep, so the cost grows with the number of frames instead of
+    frames multiplied by the number of limbs.
+
+    Args:
+        ik_fk_dicts (list): A list of dictionaries containing the elements of the systems you want to switch
+        direction (optional, string): "fk_to_ik", "ik_to_fk" or "auto". When "auto", each system is toggled based on
+                                      its current influenceSwitch value. ("0-0.5":IK and "0.5-1":FK)
+        namespace (optional, string): In case the rig has a namespace, it will be used to properly select the controls.
+        keyframe (optional, bool): If active it will create keyframes using the provided range and method
+        start_time (optional, int): Where to create the first keyframe
+        end_time (optional, int): Where to create the last keyframe
+        method (optional, string): Method used for creating the keyframes. Either 'sparse' or 'bake'.
+
+    Returns:
+        switched_systems (list): A list of pairs [ik_fk_dict, direction] for the systems that were switched
+    """
+    switched_systems = []
+    for ik_fk_dict in ik_fk_dicts:
+        switch_attr = namespace + ik_fk_dict.get('switch_ctrl') + '.influenceSwitch'
+        if not cmds.objExists(switch_attr):
+            continue
+        system_direction = direction
+        if direction == 'auto':
+            system_direction = 'fk_to_ik' if cmds.getAttr(switch_attr) < 0.5 else 'ik_to_fk'
+        switched_systems.append([ik_fk_dict, system_direction])
+
+    if not switched_systems:
+        cmds.warning('No switch controls were found. Please check if a namespace is necessary.')
+        return switched_systems
+
+    if not keyframe or method.lower() != 'bake':  # Nothing to share, each switch only affects a single frame
+        for ik_fk_dict, system_direction in switched_systems:
+            fk_ik_switch(ik_fk_dict, system_direction, namespace=namespace, keyframe=keyframe,
+                         start_time=start_time, end_time=end_time, method=method)
+        return switched_systems
+
+    if start_time >= end_time:
+        cmds.warning('Invalid range. Please review the start and end frames and try again.')
+        return []
+
+    function_name = 'GT FK/IK Bake Multiple'
+    cmds.undoInfo(openChunk=True, chunkName=function_name)
+    clavicle_values = {}
+    try:
+        for ik_fk_dict, system_direction in switched_systems:
+            clavicle_influence_attr = _get_clavicle_influence_attr(ik_fk_dict, namespace)
+            if clavicle_influence_attr:
+                clavicle_values[clavicle_influence_attr] = cmds.getAttr(clavicle_influence_attr)
+                cmds.setAttr(clavicle_influence_attr, 0)
+            if gt_custom_rig_interface_settings.get('key_influence'):  # Start Switch
+                switch_attr = namespace + ik_fk_dict.get('switch_ctrl') + '.influenceSwitch'
+                cmds.setKeyframe(switch_attr, time=start_time, value=cmds.getAttr(switch_attr, time=start_time))
+
+        # Single sweep for every system
+        target_reference_pairs = []
+        for ik_fk_dict, system_direction in switched_systems:
+            target_reference_pairs.extend(_get_fk_ik_bake_pairs(ik_fk_dict, system_direction, namespace))
+        frames = list(range(int(start_time), int(end_time)))
+        keyed_values = bake_matched_transforms(target_reference_pairs, frames)
+        tolerance = _get_bake_tolerance()
+        if tolerance:
+            print_reduction_stats(reduce_baked_keys(keyed_values, frames, tolerance))
+
+        for ik_fk_dict, system_direction in switched_systems:
+            switch_attr = namespace + ik_fk_dict.get('switch_ctrl') + '.influenceSwitch'
+            influence_value = 1 if system_direction == 'fk_to_ik' else 0
+            cmds.setAttr(switch_attr, influence_value)
+            if gt_custom_rig_interface_settings.get('key_influence'):  # End Switch
+                cmds.setKeyframe(switch_attr, time=end_time, value=influence_value)
+    except Exception as e:
+        cmds.warning('An error occurred while baking. Please check if a namespace is necessary or '
+                     'if a control was deleted.     Error: ' + str(e))
+    finally:
+        for clavicle_influence_attr, clavicle_value in clavicle_values.items():
+            cmds.setAttr(clavicle_influence_attr, clavicle_value)
+        cmds.undoInfo(closeChunk=True, chunkName=function_name)
+
+    unique_message = '<' + str(random.random()) + '>'
+    unique_message += '<span style=\"color:#FFFFFF;\">Switched ' + str(len(switched_systems)) + ' systems</span>  '
+    unique_message += '(Start: <span style=\"color:#FFFFFF;\">' + str(start_time) + '</span> End: '
+    unique_message += '<span style=\"color:#FFFFFF;\">' + str(end_time) + '</span> Method: '
+    unique_message += '<span style=\"color:#FFFFFF;\">Bake</span> )'
+    cmds.inViewMessage(amg=unique_message, pos='botLeft', fade=True, alpha=.9)
+    if [value for value in clavicle_values.values() if value != 0]:
+        _print_auto_clavicle_warning()
+    return switched_systems
+
+
+def _get_fk_ik_bake_pairs(ik_fk_dict, direction, namespace=''):
+    """
+    Gets the controls that receive keys during a bake and the references they match (same pairs used by the switch)
+
+    Args:
+        ik_fk_dict (dict): A dictionary containing the elements that are part of the system you want to switch
+        direction (string): Either "fk_to_ik" or "ik_to_fk". It determines what is the source and what is the target.
+        namespace (optional, string): In case the rig has a namespace, it will be used to properly select the controls.
+
+    Returns:
+        target_reference_pairs (list): A list of pairs [control, reference] (with namespace). Parents come first.
+    """
+    if direction == 'fk_to_ik':
+        end_reference = ik_fk_dict.get('end_ik_reference') or ik_fk_dict.get('end_fk_jnt')
+        pairs = [[ik_fk_dict.get('end_ik_ctrl'), end_reference],
+                 [ik_fk_dict.get('pvec_ik_ctrl'), ik_fk_dict.get('mid_ik_reference')]]
+    else:
+        pairs = [[ik_fk_dict.get('base_fk_ctrl'), ik_fk_dict.get('base_ik_jnt')],
+                 [ik_fk_dict.get('mid_fk_ctrl'), ik_fk_dict.get('mid_ik_jnt')],
+                 [ik_fk_dict.get('end_fk_ctrl'), ik_fk_dict.get('end_ik_jnt')]]
+    return [[namespace + target, namespace + reference] for target, reference in pairs]
+
+
+def _get_bake_tolerance():
+    """
+    Gets the key reduction tolerance used after a bake (from the settings)
+
+    Returns:
+        tolerance (dict, None): Tolerance per channel (see "gt_anim_utilities.reduce_baked_keys").
+                                None if "bake_reduce_keys" is deactivated.
+    """
+    if not gt_custom_rig_interface_settings.get('bake_reduce_keys'):
+        return None
+    return {'translate': gt_custom_rig_interface_settings.get('bake_tolerance_translate'),
+            'rotate': gt_custom_rig_interface_settings.get('bake_tolerance_rotate')}
+
+
+def _fk_ik_bake(ik_fk_dict, direction, namespace, start_time, end_time, tolerance=None):
+    """
+    Bake engine used by "fk_ik_switch" when using the "bake" method.
+    Samples the references for the whole range in a single sweep (without moving the timeline), solves the control
+    transforms and writes every channel with one bulk operation. Keys are created from "start_time" up to
+    "end_time" (not included), matching the previous per-frame implementation.
+    If a tolerance is provided, the baked keys are reduced (see "gt_anim_utilities.reduce_baked_keys").
+
+    Args:
+        ik_fk_dict (dict): A dictionary containing the elements that are part of the system you want to switch
+        direction (string): Either "fk_to_ik" or "ik_to_fk". It determines what is the source and what is the target.
+        namespace (string): In case the rig has a namespace, it will be used to properly select the controls.
+        start_time (int): Where to create the first keyframe
+        end_time (int): End of the range (last keyframe is created at "end_time - 1")
+        tolerance (optional, float, dict): Key reduction tolerance (units/degrees), either for all channels or per
+                                           channel. e.g. {'translate': 0.01, 'rotate': 0.1}. None skips the reduction.
+
+    Returns:
+        keyed_values (dict): Values keyed for every control (see "gt_anim_utilities.bake_matched_transforms")
+    """
+    frames = list(range(int(start_time), int(end_time)))
+    keyed_values = bake_matched_transforms(_get_fk_ik_bake_pairs(ik_fk_dict, direction, namespace), frames)
+    if tolerance:
+        print_reduction_stats(reduce_baked_keys(keyed_values, frames, tolerance))
+    return keyed_values
+
+
+def _fk_ik_bake_per_frame(ik_fk_dict, direction, namespace, start_time, end_time):
+    """
+    Previous bake implementation (moves the timeline, matches and keys every channel one frame at a time).
+    Kept as a reference for "benchmark_fk_ik_bake".
+
+    Args:
+        ik_fk_dict (dict): A dictionary containing the elements that are part of the system you want to switch
+        direction (string): Either "fk_to_ik" or "ik_to_fk". It determines what is the source and what is the target.
+        namespace (string): In case the rig has a namespace, it will be used to properly select the controls.
+        start_time (int): Where to create the first keyframe
+        end_time (int): End of the range (last keyframe is created at "end_time - 1")
+    """
+    original_time = cmds.currentTime(q=True)
+    pairs = _get_fk_ik_bake_pairs(ik_fk_dict, direction, namespace)
+    try:
+        for current_time in range(int(start_time), int(end_time)):
+            cmds.currentTime(current_time)
+            for target, reference in pairs:
+                cmds.matchTransform(target, reference, pos=1, rot=1)
+            for target, reference in pairs:
+                for channel in ['t', 'r']:
+                    for dimension in ['x', 'y', 'z']:
+                        cmds.setKeyframe(target, time=current_time, attribute=channel + dimension)
+    finally:
+        cmds.currentTime(original_time)
+
+
+def benchmark_fk_ik_bake(ik_fk_dict, direction='fk_to_ik', namespace='', start_time=1, end_time=101):
+    """
+    Compares the bake engine against the previous per-frame implementation.
+    Both bakes are undone after they run, so the scene is left untouched.
+
+    Args:
+        ik_fk_dict (dict): A dictionary containing the elements that are part of the system you want to switch
+        direction (optional, string): Either "fk_to_ik" or "ik_to_fk".
+        namespace (optional, string): In case the rig has a namespace, it will be used to properly select the controls.
+        start_time (optional, int): Where to create the first keyframe
+        end_time (optional, int): End of the range (not included)
+
+    Returns:
+        results (dict): Frames per second for both implementations and the max difference between their keys.
+                        e.g. {'per_frame_fps': 40.0, 'engine_fps': 900.0, 'speedup': 22.5, 'max_difference': 0.0}
+    """
+    frame_count = max(int(end_time) - int(start_time), 1)
+    pairs = _get_fk_ik_bake_pairs(ik_fk_dict, direction, namespace)
+    channels = ['translateX', 'translateY', 'translateZ', 'rotateX', 'rotateY', 'rotateZ']
+    results = {}
+    keyed = {}
+    for label, bake_function in [('per_frame', _fk_ik_bake_per_frame), ('engine', _fk_ik_bake)]:
+        cmds.undoInfo(openChunk=True, chunkName='GT FK/IK Bake Benchmark')
+        try:
+            start = time.perf_counter()
+            bake_function(ik_fk_dict, direction, namespace, start_time, end_time)
+            elapsed = max(time.perf_counter() - start, 1e-9)
+            keyed[label] = [cmds.keyframe(target, attribute=channel, time=(start_time, end_time - 1), query=True,
+                                          valueChange=True) or [] for target, _ in pairs for channel in channels]
+        finally:
+            cmds.undoInfo(closeChunk=True, chunkName='GT FK/IK Bake Benchmark')
+            cmds.undo()
+        results[label + '_fps'] = frame_count / elapsed
+
+    max_difference = 0.0
+    for per_frame_values, engine_values in zip(keyed.get('per_frame'), keyed.get('engine')):
+        for per_frame_value, engine_value in zip(per_frame_values, engine_values):
+            max_difference = max(max_difference, abs(per_frame_value - engine_value))
+    results['max_difference'] = max_difference
+    results['speedup'] = results.get('engine_fps') / results.get('per_frame_fps')
+    sys.stdout.write('FK/IK Bake Benchmark ({} frames): per-frame {:.1f} fps, engine {:.1f} fps ({:.1f}x). '
+                     'Max difference: {:.6f}\n'.format(frame_count, results.get('per_frame_fps'),
+                                                       results.get('engine_fps'), results.get('speedup'),
+                                                       max_difference))
+    return results
+
+
 def pose_reset(ab_ik_ctrls, ab_fk_ctrls, ab_center_ctrls, namespace=''):
     """
     Reset transforms list of controls back to 0 Translate and Rotate values.
@@ -1362,28 +1885,8 @@ def pose_reset(ab_ik_ctrls, ab_fk_ctrls, ab_center_ctrls, namespace=''):
         namespace (string): In case the rig has a namespace, it will be used to properly select the controls.
     
     """
-    available_ctrls = []
-    for obj in ab_ik_ctrls:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
-
-    for obj in ab_fk_ctrls:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
-
-    for obj in gt_ab_general_ctrls:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
-
-    for obj in ab_center_ctrls:
-        if cmds.objExists(namespace + obj):
-            available_ctrls.append(obj)
+    available_ctrls = get_available_ctrls([ab_ik_ctrls, ab_fk_ctrls, gt_ab_general_ctrls], ab_center_ctrls,
+                                          namespace=namespace)
 
     if len(available_ctrls) == 0:
         cmds.warning('No controls were found. Please check if a namespace is necessary.')
@@ -1408,7 +1911,7 @@ def pose_reset(ab_ik_ctrls, ab_fk_ctrls, ab_center_ctrls, namespace=''):
     # Special Cases
     special_case_ctrls = ['left_fingers_ctrl', 'right_fingers_ctrl']
     for ctrl in special_case_ctrls:
-        if cmds.objExists(namespace + ctrl):
+        if resolve_ctrl(ctrl, namespace=namespace):
             if cmds.getAttr(namespace + ctrl + '.' + 'sz', lock=True) is False:
                 cmds.setAttr(namespace + ctrl + '.' + 'sz', 2)
 
@@ -1429,12 +1932,7 @@ def pose_mirror(gt_ab_ctrls, source_side, namespace=''):
         gt_ab_ctrls_dict.update(ctrl_dict)
 
     # Find available Ctrls
-    available_ctrls = []
-    for obj in gt_ab_ctrls_dict:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
+    available_ctrls = get_available_ctrls([gt_ab_ctrls_dict], namespace=namespace)
 
     # Start Mirroring
     if len(available_ctrls) != 0:
@@ -1543,28 +2041,8 @@ def pose_export(namespace=''):
     pose_file = ''
 
     # Find Available Controls
-    available_ctrls = []
-    for obj in gt_ab_ik_ctrls:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
-
-    for obj in gt_ab_fk_ctrls:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
-
-    for obj in gt_ab_general_ctrls:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
-
-    for obj in gt_ab_center_ctrls:
-        if cmds.objExists(namespace + obj):
-            available_ctrls.append(obj)
+    available_ctrls = get_available_ctrls([gt_ab_ik_ctrls, gt_ab_fk_ctrls, gt_ab_general_ctrls],
+                                          gt_ab_center_ctrls, namespace=namespace)
 
     # No Controls were found
     if len(available_ctrls) == 0:
@@ -1603,6 +2081,158 @@ def pose_export(namespace=''):
             cmds.warning("Couldn't write to file. Please make sure the exporting directory is accessible.")
 
 
+def _set_unlocked_os_attrs(target, attr, values, locked_attrs):
+    """
+    Sets a compound attribute (e.g. "translate") to the provided values (Uses "cmds.setAttr" function so
+    object space). All values are set in a single call when no channels are locked, otherwise only the
+    unlocked channels are set (one by one).
+    
+    Args:
+        target (string): Name of the target object (object that will receive transforms)
+        attr (string): Name of the compound attribute. e.g. "translate", "rotate" or "scale"
+        values (list): Three values (XYZ) used to set the attribute. e.g. [1.5, 2, 5]
+        locked_attrs (list): Locked attributes of the target (output of "cmds.listAttr(locked=True)")
+    
+    """
+    channels = [attr + dimension for dimension in ['X', 'Y', 'Z']]
+    if attr not in locked_attrs and not set(channels).intersection(locked_attrs):
+        try:
+            cmds.setAttr(target + '.' + attr, *values)
+            return
+        except Exception as exception:
+            logger.debug(str(exception))
+    for channel, value in zip(channels, values):
+        if channel in locked_attrs:
+            continue
+        try:
+            cmds.setAttr(target + '.' + channel, value)
+        except Exception as exception:
+            logger.debug(str(exception))
+
+
+def _get_mirror_mapping(ctrl_keys):
+    """
+    Maps controls to the control on the opposite side (used to apply mirrored poses and animation)
+
+    Args:
+        ctrl_keys (list): A list of controls without namespace. e.g. ["left_wrist_ik_ctrl", "cog_ctrl"]
+
+    Returns:
+        mirror_mapping (dict): A dictionary with the provided controls as keys and a tuple as value:
+                               (opposite control, inverted channels). Inverted channels is a tuple with two tuples
+                               [(Is Translate XYZ inverted?), (Is Rotate XYZ inverted?)] or None if the control is
+                               not mirrored (e.g. center controls)
+    """
+    gt_ab_ctrls_dict = {}
+    for ctrl_dict in [gt_ab_ik_ctrls, gt_ab_fk_ctrls, gt_ab_general_ctrls]:
+        gt_ab_ctrls_dict.update(ctrl_dict)
+    mirror_mapping = {}
+    for ctrl_key in ctrl_keys:
+        mirror_mapping[ctrl_key] = (ctrl_key, None)
+        for source_prefix, target_prefix in [(left_prefix, right_prefix), (right_prefix, left_prefix)]:
+            side_tag = ctrl_key[len(source_prefix):]
+            if ctrl_key.startswith(source_prefix) and side_tag in gt_ab_ctrls_dict:
+                key = gt_ab_ctrls_dict.get(side_tag)
+                mirror_mapping[ctrl_key] = (target_prefix + side_tag, (key[0], key[1]))
+                break
+    return mirror_mapping
+
+
+def _apply_pose_data(data, namespace='', mirror_mapping=None):
+    """
+    Applies the data of a POSE file to the controls of a rig
+
+    Args:
+        data (dict): Data loaded from a POSE file
+        namespace (string): In case the rig has a namespace, it will be used to properly select the controls.
+        mirror_mapping (optional, dict): If provided, the pose is mirrored. See "_get_mirror_mapping"
+    """
+    for ctrl in data:
+        if ctrl == 'gt_interface_version' or ctrl == 'gt_export_method':
+            continue
+        current_object = data.get(ctrl)  # Name, T, R, S
+        ctrl_key, translate, rotate = current_object[0], current_object[1], current_object[2]
+        if mirror_mapping:
+            ctrl_key, inverted = mirror_mapping.get(ctrl_key, (ctrl_key, None))
+            if inverted:
+                translate = [value * -1 if is_inverted else value for value, is_inverted in zip(translate, inverted[0])]
+                rotate = [value * -1 if is_inverted else value for value, is_inverted in zip(rotate, inverted[1])]
+        if resolve_ctrl(ctrl_key, namespace=namespace):
+            target = namespace + ctrl_key
+            locked_attrs = cmds.listAttr(target, locked=True) or []
+            _set_unlocked_os_attrs(target, 'translate', translate, locked_attrs)
+            _set_unlocked_os_attrs(target, 'rotate', rotate, locked_attrs)
+            _set_unlocked_os_attrs(target, 'scale', current_object[3], locked_attrs)
+
+
+def _apply_anim_curves(curve_items, namespace='', time_offset=0, mirror_mapping=None, undoable=True,
+                       incremental=False, start_time=None, end_time=None):
+    """
+    Applies animation curves (loaded from an ANIM file) to the controls of a rig
+
+    Args:
+        curve_items (iterable): Pairs of curve name (e.g. "left_wrist_ctrl.translateX") and curve columns
+        namespace (string): In case the rig has a namespace, it will be used to properly select the controls.
+        time_offset (optional, float): Offset (in frames) added to the time of every key
+        mirror_mapping (optional, dict): If provided, the animation is mirrored. See "_get_mirror_mapping"
+        undoable (optional, bool): If False, curves are written without recording undo (see "write_anim_curve")
+        incremental (optional, bool): If True, unchanged curves are skipped and changed curves only receive the
+                                      necessary key edits (see "update_anim_curve")
+        start_time (optional, float): First frame of the imported window (before the offset). None means the first key
+        end_time (optional, float): Last frame of the imported window (before the offset). None means the last key
+                                    Windowed or offset imports only replace the keys inside the (offset) window,
+                                    whole-clip imports replace the whole curve.
+
+    Returns:
+        stats (dict): Number of curves written ("curves"), keys written or removed ("keys")
+                      and unchanged curves ("skipped")
+    """
+    transform_axes = {'translateX': (0, 0), 'translateY': (0, 1), 'translateZ': (0, 2),
+                      'rotateX': (1, 0), 'rotateY': (1, 1), 'rotateZ': (1, 2),
+                      'tx': (0, 0), 'ty': (0, 1), 'tz': (0, 2), 'rx': (1, 0), 'ry': (1, 1), 'rz': (1, 2)}
+    stats = {'curves': 0, 'keys': 0, 'skipped': 0}
+
+    # Resolve every target control before writing (curves created while writing don't affect the control index)
+    targets = []
+    for key, columns in curve_items:
+        try:
+            obj, attr = key.split('.')
+            value_scale = 1.0
+            if mirror_mapping:
+                obj, inverted = mirror_mapping.get(obj, (obj, None))
+                axis = transform_axes.get(attr)
+                if inverted and axis and inverted[axis[0]][axis[1]]:
+                    value_scale = -1.0
+            if resolve_ctrl(obj, namespace=namespace):
+                targets.append((namespace + obj, attr, columns, value_scale))
+        except Exception as e:
+            logger.debug(str(e))
+
+    is_windowed = start_time is not None or end_time is not None or time_offset
+    for target, attr, columns, value_scale in targets:
+        try:
+            time_range = None
+            times = columns.get('times')
+            if is_windowed and len(times):
+                time_range = ((times[0] if start_time is None else start_time) + time_offset,
+                              (times[-1] if end_time is None else end_time) + time_offset)
+            if time_offset or value_scale != 1.0:
+                columns = transform_anim_columns(columns, time_offset=time_offset, value_scale=value_scale)
+            if incremental:
+                keys_touched = update_anim_curve(target, attr, columns, undoable=undoable, time_range=time_range)
+            else:
+                write_anim_curve(target, attr, columns, undoable=undoable, time_range=time_range)
+                keys_touched = len(columns.get('times'))
+            if keys_touched:
+                stats['curves'] += 1
+                stats['keys'] += keys_touched
+            else:
+                stats['skipped'] += 1
+        except Exception as e:
+            logger.debug(str(e))
+    return stats
+
+
 def pose_import(debugging=False, debugging_path='', namespace=''):
     """
     Imports a POSE (JSON) file containing the translate, rotate and scale data for the rig controls
@@ -1621,45 +2251,9 @@ def pose_import(debugging=False, debugging_path='', namespace=''):
     
     """
 
-    def set_unlocked_os_attr(target, attr, value):
-        """
-        Sets an attribute to the provided value in case it's not locked (Uses "cmds.setAttr" function so object space)
-        
-        Args:
-            target (string): Name of the target object (object that will receive transforms)
-            attr (string): Name of the attribute to apply (no need to add ".", e.g. "rx" would be enough)
-            value (float): Value used to set attribute. e.g. 1.5, 2, 5...
-        
-        """
-        try:
-            if not cmds.getAttr(target + '.' + attr, lock=True):
-                cmds.setAttr(target + '.' + attr, value)
-        except Exception as exception:
-            logger.debug(str(exception))
-
     # Find Available Controls
-    available_ctrls = []
-    for obj in gt_ab_ik_ctrls:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
-
-    for obj in gt_ab_fk_ctrls:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
-
-    for obj in gt_ab_general_ctrls:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
-
-    for obj in gt_ab_center_ctrls:
-        if cmds.objExists(namespace + obj):
-            available_ctrls.append(obj)
+    available_ctrls = get_available_ctrls([gt_ab_ik_ctrls, gt_ab_fk_ctrls, gt_ab_general_ctrls],
+                                          gt_ab_center_ctrls, namespace=namespace)
 
     if not debugging:
         file_name = cmds.fileDialog2(fileFilter=script_name + " - POSE File (*.pose)", dialogStyle=2, fileMode=1,
@@ -1698,19 +2292,11 @@ def pose_import(debugging=False, debugging_path='', namespace=''):
 
                     if is_operation_valid:
                         # Object-Space
-                        for ctrl in data:
-                            if ctrl != 'gt_interface_version' and ctrl != 'gt_export_method':
-                                current_object = data.get(ctrl)  # Name, T, R, S
-                                if cmds.objExists(namespace + current_object[0]):
-                                    set_unlocked_os_attr(namespace + current_object[0], 'tx', current_object[1][0])
-                                    set_unlocked_os_attr(namespace + current_object[0], 'ty', current_object[1][1])
-                                    set_unlocked_os_attr(namespace + current_object[0], 'tz', current_object[1][2])
-                                    set_unlocked_os_attr(namespace + current_object[0], 'rx', current_object[2][0])
-                                    set_unlocked_os_attr(namespace + current_object[0], 'ry', current_object[2][1])
-                                    set_unlocked_os_attr(namespace + current_object[0], 'rz', current_object[2][2])
-                                    set_unlocked_os_attr(namespace + current_object[0], 'sx', current_object[3][0])
-                                    set_unlocked_os_attr(namespace + current_object[0], 'sy', current_object[3][1])
-                                    set_unlocked_os_attr(namespace + current_object[0], 'sz', current_object[3][2])
+                        cmds.undoInfo(openChunk=True, chunkName='GT Pose Import')
+                        try:
+                            _apply_pose_data(data, namespace=namespace)
+                        finally:
+                            cmds.undoInfo(closeChunk=True)
                         unique_message = '<' + str(random.random()) + '>'
                         unique_message += '<span style=\"color:#FFFFFF;\">Pose imported from </span>'
                         unique_message += '<span style=\"color:#FF0000;text-decoration:underline;\">'
@@ -1740,28 +2326,8 @@ def pose_flip(namespace=''):
     is_valid = True
 
     # Find Available Controls
-    available_ctrls = []
-    for obj in gt_ab_ik_ctrls:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
-
-    for obj in gt_ab_fk_ctrls:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
-
-    for obj in gt_ab_general_ctrls:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
-
-    for obj in gt_ab_center_ctrls:
-        if cmds.objExists(namespace + obj):
-            available_ctrls.append(obj)
+    available_ctrls = get_available_ctrls([gt_ab_ik_ctrls, gt_ab_fk_ctrls, gt_ab_general_ctrls],
+                                          gt_ab_center_ctrls, namespace=namespace)
 
     # No Controls were found
     if len(available_ctrls) == 0:
@@ -1840,237 +2406,95 @@ def anim_reset(namespace=''):
 
 def anim_mirror(gt_ab_ctrls, source_side, namespace=''):
     """
-    Mirrors the character animation from one side to the other
+    Mirrors the character animation from one side to the other.
+    Controls are paired by their name without the side prefix and every animation curve is mirrored as a whole
+    (the curve is copied and its values/tangents are scaled when the channel is inverted).
 
     Args:
         gt_ab_ctrls (list) : A list of dictionaries of controls without their side prefix (e.g. "_wrist_ctrl")
-        source_side (string): Source of the pose. "left" or "right"
+        source_side (string): Source of the animation. "left" or "right". Use "both" to swap the animation
+                              of both sides (mirrored) instead.
         namespace (string): In case the rig has a namespace, it will be used to properly select the controls.
     
     """
-
-    def invert_float_list_values(float_list):
-        """
-        Returns a list where all the float values are inverted. For example, if the value is 5, it will then become -5.
-
-        Args:
-            float_list (list) : A list of floats.
-
-        Returns:
-            inverted_float_list (list): A list of floats with their values inverted
-    
-        """
-
-        inverted_values = []
-        for val in float_list:
-            inverted_values.append(val * -1)
-        return inverted_values
-
     # Merge Dictionaries
     gt_ab_ctrls_dict = {}
     for ctrl_dict in gt_ab_ctrls:
         gt_ab_ctrls_dict.update(ctrl_dict)
 
     # Find available Ctrls
-    available_ctrls = []
-    for obj in gt_ab_ctrls_dict:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
+    available_ctrls = get_available_ctrls([gt_ab_ctrls_dict], namespace=namespace)
 
     # Start Mirroring
     if len(available_ctrls) != 0:
 
         errors = []
 
-        right_side_objects = []
-        left_side_objects = []
-
+        # Pair Controls (key: name without side prefix)
+        side_pairs = {}
         for obj in available_ctrls:
-            if right_prefix in obj:
-                right_side_objects.append(obj)
-
-        for obj in available_ctrls:
-            if left_prefix in obj:
-                left_side_objects.append(obj)
-
-        for left_obj in left_side_objects:
-            for right_obj in right_side_objects:
-                remove_side_tag_left = left_obj.replace(left_prefix, '')
-                remove_side_tag_right = right_obj.replace(right_prefix, '')
-                if remove_side_tag_left == remove_side_tag_right:
-                    # print(right_obj + ' was paired with ' + left_obj)
-
-                    key = gt_ab_ctrls_dict.get(
-                        remove_side_tag_right)  # TR = [(inverted?,inverted?,inverted?),(inverted?,inverted?,inverted?)]
-
-                    # Mirroring Transform?, Inverting it? (X,Y,Z), Transform name.
-                    transforms = [[True, key[0][0], 'tx'],
-                                  [True, key[0][1], 'ty'],
-                                  [True, key[0][2], 'tz'],
-                                  [True, key[1][0], 'rx'],
-                                  [True, key[1][1], 'ry'],
-                                  [True, key[1][2], 'rz']]
-
-                    if len(key) > 2:  # Mirroring Scale?
-                        transforms.append([True, False, 'sx'])
-                        transforms.append([True, False, 'sy'])
-                        transforms.append([True, False, 'sz'])
-
-                    # Transfer Right to Left 
-                    if source_side is 'right':
-                        for transform in transforms:
-                            if transform[0]:  # Using Transform? Inverted? Name of the Attr
-                                try:
-                                    attr = transform[2]
-
-                                    # Get Values
-                                    frames = cmds.keyframe(namespace + right_obj, q=1, at=attr)
-                                    values = cmds.keyframe(namespace + right_obj, q=1, at=attr, valueChange=True)
-
-                                    in_angle_tangent = cmds.keyTangent(namespace + right_obj, at=attr, inAngle=True,
-                                                                       query=True)
-                                    out_angle_tangent = cmds.keyTangent(namespace + right_obj, at=attr, outAngle=True,
-                                                                        query=True)
-                                    is_locked = cmds.keyTangent(namespace + right_obj, at=attr, weightLock=True,
-                                                                query=True)
-                                    in_weight = cmds.keyTangent(namespace + right_obj, at=attr, inWeight=True,
-                                                                query=True)
-                                    out_weight = cmds.keyTangent(namespace + right_obj, at=attr, outWeight=True,
-                                                                 query=True)
-                                    in_tangent_type = cmds.keyTangent(namespace + right_obj, at=attr,
-                                                                      inTangentType=True, query=True)
-                                    out_tangent_type = cmds.keyTangent(namespace + right_obj, at=attr,
-                                                                       outTangentType=True, query=True)
-
-                                    if transform[1]:  # Inverted?
-                                        values = invert_float_list_values(values)
-                                        in_angle_tangent = invert_float_list_values(in_angle_tangent)
-                                        out_angle_tangent = invert_float_list_values(out_angle_tangent)
-                                        in_weight = invert_float_list_values(in_weight)
-                                        out_weight = invert_float_list_values(out_weight)
-
-                                    # Set Keys/Values
-                                    for index in range(len(values)):
-                                        time = frames[index]
-                                        cmds.setKeyframe(namespace + left_obj, time=time, attribute=attr,
-                                                         value=values[index])
-                                        # Set Tangents
-                                        cmds.keyTangent(namespace + left_obj, at=attr, time=(time, time),
-                                                        lock=is_locked[index], e=True)
-                                        cmds.keyTangent(namespace + left_obj, at=attr, time=(time, time),
-                                                        inAngle=in_angle_tangent[index], e=True)
-                                        cmds.keyTangent(namespace + left_obj, at=attr, time=(time, time),
-                                                        outAngle=out_angle_tangent[index], e=True)
-                                        cmds.keyTangent(namespace + left_obj, at=attr, time=(time, time),
-                                                        inWeight=in_weight[index], e=True)
-                                        cmds.keyTangent(namespace + left_obj, at=attr, time=(time, time),
-                                                        outWeight=out_weight[index], e=True)
-                                        cmds.keyTangent(namespace + left_obj, at=attr, time=(time, time),
-                                                        inTangentType=in_tangent_type[index], e=True)
-                                        cmds.keyTangent(namespace + left_obj, at=attr, time=(time, time),
-                                                        outTangentType=out_tangent_type[index], e=True)
-                                except Exception as e:
-                                    logger.debug(str(e))  # 0 keyframes
-
-                        # Other Attributes
-                        attributes = cmds.listAnimatable(namespace + right_obj)
-                        default_channels = ['translateX', 'translateY', 'translateZ', 'rotateX', 'rotateY', 'rotateZ']
-                        for attr in attributes:
-                            try:
-                                short_attr = attr.split('.')[-1]
-                                if short_attr not in default_channels:
-                                    # Get Keys/Values
-                                    frames = cmds.keyframe(namespace + right_obj, q=1, at=short_attr)
-                                    values = cmds.keyframe(namespace + right_obj, q=1, at=short_attr, valueChange=True)
-
-                                    # Set Keys/Values
-                                    for index in range(len(values)):
-                                        cmds.setKeyframe(namespace + left_obj, time=frames[index], attribute=short_attr,
-                                                         value=values[index])
-                            except Exception as e:
-                                logger.debug(str(e))  # 0 keyframes
-
-                    # Transfer Left to Right
-                    if source_side is 'left':
-                        for transform in transforms:
-                            if transform[0]:  # Using Transform? Inverted? Name of the Attr
-                                try:
-                                    attr = transform[2]
-
-                                    # Get Values
-                                    frames = cmds.keyframe(namespace + left_obj, q=1, at=attr)
-                                    values = cmds.keyframe(namespace + left_obj, q=1, at=attr, valueChange=True)
-
-                                    in_angle_tangent = cmds.keyTangent(namespace + left_obj, at=attr, inAngle=True,
-                                                                       query=True)
-                                    out_angle_tangent = cmds.keyTangent(namespace + left_obj, at=attr, outAngle=True,
-                                                                        query=True)
-                                    is_locked = cmds.keyTangent(namespace + left_obj, at=attr, weightLock=True,
-                                                                query=True)
-                                    in_weight = cmds.keyTangent(namespace + left_obj, at=attr, inWeight=True,
-                                                                query=True)
-                                    out_weight = cmds.keyTangent(namespace + left_obj, at=attr, outWeight=True,
-                                                                 query=True)
-                                    in_tangent_type = cmds.keyTangent(namespace + left_obj, at=attr, inTangentType=True,
-                                                                      query=True)
-                                    out_tangent_type = cmds.keyTangent(namespace + left_obj, at=attr,
-                                                                       outTangentType=True, query=True)
-
-                                    if transform[1]:  # Inverted?
-                                        values = invert_float_list_values(values)
-                                        in_angle_tangent = invert_float_list_values(in_angle_tangent)
-                                        out_angle_tangent = invert_float_list_values(out_angle_tangent)
-                                        in_weight = invert_float_list_values(in_weight)
-                                        out_weight = invert_float_list_values(out_weight)
-
-                                    # Set Keys/Values
-                                    for index in range(len(values)):
-                                        time = frames[index]
-                                        cmds.setKeyframe(namespace + right_obj, time=time, attribute=attr,
-                                                         value=values[index])
-                                        # Set Tangents
-                                        cmds.keyTangent(namespace + right_obj, at=attr, time=(time, time),
-                                                        lock=is_locked[index], e=True)
-                                        cmds.keyTangent(namespace + right_obj, at=attr, time=(time, time),
-                                                        inAngle=in_angle_tangent[index], e=True)
-                                        cmds.keyTangent(namespace + right_obj, at=attr, time=(time, time),
-                                                        outAngle=out_angle_tangent[index], e=True)
-                                        cmds.keyTangent(namespace + right_obj, at=attr, time=(time, time),
-                                                        inWeight=in_weight[index], e=True)
-                                        cmds.keyTangent(namespace + right_obj, at=attr, time=(time, time),
-                                                        outWeight=out_weight[index], e=True)
-                                        cmds.keyTangent(namespace + right_obj, at=attr, time=(time, time),
-                                                        inTangentType=in_tangent_type[index], e=True)
-                                        cmds.keyTangent(namespace + right_obj, at=attr, time=(time, time),
-                                                        outTangentType=out_tangent_type[index], e=True)
-                                except Exception as e:
-                                    logger.debug(str(e))  # 0 keyframes
-
-                        # Other Attributes
-                        attributes = cmds.listAnimatable(namespace + left_obj)
-                        default_channels = ['translateX', 'translateY', 'translateZ', 'rotateX', 'rotateY', 'rotateZ']
-                        for attr in attributes:
-                            try:
-                                short_attr = attr.split('.')[-1]
-                                if short_attr not in default_channels:
-                                    # Get Keys/Values
-                                    frames = cmds.keyframe(namespace + left_obj, q=1, at=short_attr)
-                                    values = cmds.keyframe(namespace + left_obj, q=1, at=short_attr, valueChange=True)
-
-                                    # Set Keys/Values
-                                    for index in range(len(values)):
-                                        cmds.setKeyframe(namespace + right_obj, time=frames[index],
-                                                         attribute=short_attr, value=values[index])
-                            except Exception as e:
-                                logger.debug(str(e))  # 0 keyframes
+            for side_prefix in [left_prefix, right_prefix]:
+                if obj.startswith(side_prefix):
+                    side_pairs.setdefault(obj[len(side_prefix):], {})[side_prefix] = obj
+
+        directions = []  # Source, Target
+        if source_side in ['right', 'both']:
+            directions.append((right_prefix, left_prefix))
+        if source_side in ['left', 'both']:
+            directions.append((left_prefix, right_prefix))
+
+        source_nodes = set()
+        for side_tag, pair in side_pairs.items():
+            if len(pair) == 2:
+                for source_prefix, target_prefix in directions:
+                    source_nodes.add(namespace + pair.get(source_prefix))
+        node_curves = get_node_anim_curves(list(source_nodes))
+
+        cmds.undoInfo(openChunk=True, chunkName='GT Anim Mirror')
+        try:
+            # Copy all source curves first (so both sides can be swapped)
+            mirrored_curves = []  # Target node, attribute, mirrored curve
+            for side_tag, pair in side_pairs.items():
+                if len(pair) != 2:
+                    continue
+                # TR = [(inverted?,inverted?,inverted?),(inverted?,inverted?,inverted?)]
+                key = gt_ab_ctrls_dict.get(side_tag)
+                inverted_channels = {'translateX': key[0][0], 'translateY': key[0][1], 'translateZ': key[0][2],
+                                     'rotateX': key[1][0], 'rotateY': key[1][1], 'rotateZ': key[1][2]}
+                for source_prefix, target_prefix in directions:
+                    source_obj = namespace + pair.get(source_prefix)
+                    target_obj = namespace + pair.get(target_prefix)
+                    for attr, anim_curve in node_curves.get(source_obj, {}).items():
+                        try:
+                            if cmds.getAttr(target_obj + '.' + attr, lock=True):
+                                errors.append(target_obj + ' "' + attr + '" is locked.')
+                                continue
+                            value_scale = -1.0 if inverted_channels.get(attr) else 1.0
+                            curve_name = OpenMaya.MFnDependencyNode(anim_curve).name()
+                            mirrored_curves.append((target_obj, attr, duplicate_anim_curve(curve_name, value_scale)))
+                        except Exception as e:
+                            logger.debug(str(e))
+                            errors.append(target_obj + ' "' + attr + '" could not be mirrored. (' + str(e) + ')')
+
+            # Apply copied curves
+            for target_obj, attr, mirrored_curve in mirrored_curves:
+                try:
+                    apply_anim_curve(mirrored_curve, target_obj, attr)
+                except Exception as e:
+                    logger.debug(str(e))
+                    errors.append(target_obj + ' "' + attr + '" could not be mirrored. (' + str(e) + ')')
+                    if cmds.objExists(mirrored_curve):
+                        cmds.delete(mirrored_curve)
+        finally:
+            cmds.undoInfo(closeChunk=True)
 
         # Print Feedback
         unique_message = '<' + str(random.random()) + '>'
         source_message = '(Left to Right)'
         if source_side == 'right':
             source_message = '(Right to Left)'
+        elif source_side == 'both':
+            source_message = '(Swapped Sides)'
         unique_message += '<span style=\"color:#FFFFFF;\">Animation </span>'
         unique_message += '<span style=\"color:#FF0000;text-decoration:underline;\"> mirrored!</span> ' + source_message
         cmds.inViewMessage(amg=unique_message, pos='botLeft', fade=True, alpha=.9)
@@ -2089,7 +2513,9 @@ def anim_mirror(gt_ab_ctrls, source_side, namespace=''):
 
 def anim_export(namespace=''):
     """
-    Exports an ANIM (JSON) file containing the translation, rotation and scale keyframe data from the rig controls.
+    Exports an ANIM file containing the translation, rotation and scale keyframe data from the rig controls.
+    Uses the compact binary container by default (see "gt_anim_container"). If the "anim_export_compact" setting
+    is deactivated, the legacy JSON format is used instead.
 
     Args:
         namespace (string): In case the rig has a namespace, it will be used to properly select the controls.
@@ -2100,28 +2526,8 @@ def anim_export(namespace=''):
     successfully_created_file = False
 
     # Find Available Controls
-    available_ctrls = []
-    for obj in gt_ab_ik_ctrls:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
-
-    for obj in gt_ab_fk_ctrls:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
-
-    for obj in gt_ab_general_ctrls:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
-
-    for obj in gt_ab_center_ctrls:
-        if cmds.objExists(namespace + obj):
-            available_ctrls.append(obj)
+    available_ctrls = get_available_ctrls([gt_ab_ik_ctrls, gt_ab_fk_ctrls, gt_ab_general_ctrls],
+                                          gt_ab_center_ctrls, namespace=namespace)
 
     # No Controls were found
     if len(available_ctrls) == 0:
@@ -2140,32 +2546,25 @@ def anim_export(namespace=''):
 
     if successfully_created_file and is_valid:
         export_dict = {'gt_interface_version': script_version, 'gt_export_method': 'object-space'}
+        export_curves = {}
 
-        # Extract Keyframes:
+        # Extract Keyframes (one connection lookup for all controls, one readout per curve)
+        node_curves = get_node_anim_curves([namespace + obj for obj in available_ctrls])
         for obj in available_ctrls:
-            attributes = cmds.listAnimatable(namespace + obj)
-            for attr in attributes:
+            for attr, anim_curve in node_curves.get(namespace + obj, {}).items():
                 try:
-                    short_attr = attr.split('.')[-1]
-                    frames = cmds.keyframe(namespace + obj, q=1, at=short_attr)
-                    values = cmds.keyframe(namespace + obj, q=1, at=short_attr, valueChange=True)
-                    in_angle_tangent = cmds.keyTangent(namespace + obj, at=short_attr, inAngle=True, query=True)
-                    out_angle_tangent = cmds.keyTangent(namespace + obj, at=short_attr, outAngle=True, query=True)
-                    is_locked = cmds.keyTangent(namespace + obj, at=short_attr, weightLock=True, query=True)
-                    in_weight = cmds.keyTangent(namespace + obj, at=short_attr, inWeight=True, query=True)
-                    out_weight = cmds.keyTangent(namespace + obj, at=short_attr, outWeight=True, query=True)
-                    in_tangent_type = cmds.keyTangent(namespace + obj, at=short_attr, inTangentType=True, query=True)
-                    out_tangent_type = cmds.keyTangent(namespace + obj, at=short_attr, outTangentType=True, query=True)
-                    export_dict['{}.{}'.format(obj, short_attr)] = list(
-                        zip(frames, values, in_angle_tangent, out_angle_tangent, is_locked, in_weight, out_weight,
-                            in_tangent_type, out_tangent_type))
+                    export_curves['{}.{}'.format(obj, attr)] = read_anim_curve(anim_curve)
                 except Exception as e:
                     logger.debug(str(e))
-                    pass  # 0 keyframes
 
         try:
-            with open(pose_file, 'w') as outfile:
-                json.dump(export_dict, outfile, indent=4)
+            if gt_custom_rig_interface_settings.get('anim_export_compact'):
+                write_anim_container(pose_file, export_dict, export_curves, compress=True)
+            else:
+                for curve_name, columns in export_curves.items():
+                    export_dict[curve_name] = legacy_keys_from_columns(columns)
+                with open(pose_file, 'w') as outfile:
+                    json.dump(export_dict, outfile, indent=4)
 
             unique_message = '<' + str(random.random()) + '>'
             unique_message += '<span style=\"color:#FFFFFF;\">Current Animation exported to </span>'
@@ -2178,41 +2577,36 @@ def anim_export(namespace=''):
             cmds.warning("Couldn't write to file. Please make sure the exporting directory is accessible.")
 
 
-def anim_import(debugging=False, debugging_path='', namespace=''):
+def anim_import(debugging=False, debugging_path='', namespace='', undoable=True, incremental=None, start_time=None,
+                end_time=None, time_offset=0):
     """
-    Imports an ANIM (JSON) file containing the translation, rotation and scale keyframe data for the rig controls
-    (exported using the "_anim_export" function)
+    Imports an ANIM file containing the translation, rotation and scale keyframe data for the rig controls
+    (exported using the "_anim_export" function).
+    The format (binary container or legacy JSON) is detected automatically.
     Uses the imported data to set the translation, rotation and scale of every control curve
+    Every animation curve is built (or replaced) in bulk, the whole import is a single undo operation.
     
     Args:
         debugging (bool): If debugging, the function will attempt to load the file provided in the
                           "debugging_path" parameter
         debugging_path (string): Debugging path for the import function
         namespace (string): In case the rig has a namespace, it will be used to properly select the controls.
+        undoable (optional, bool): If False, curves are written without recording undo (faster, for batch jobs)
+        incremental (optional, bool): If True, only curves and keys that differ from the scene are written.
+                                      If not provided, the "anim_import_incremental" setting is used.
+        start_time (optional, float): First frame of the time window to import. None means the start of the file.
+        end_time (optional, float): Last frame of the time window to import. None means the end of the file.
+                                    For binary container files, only the keys inside the window are read from disk.
+        time_offset (optional, float): Offset (in frames) added to the imported keys. e.g. Importing the window
+                                       1200-1400 with an offset of -1199 places the keys from frame 1 to 201.
+                                       Windowed or offset imports keep the existing keys outside the new range.
     """
+    if incremental is None:
+        incremental = gt_custom_rig_interface_settings.get('anim_import_incremental')
+
     # Find Available Controls
-    available_ctrls = []
-    for obj in gt_ab_ik_ctrls:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
-
-    for obj in gt_ab_fk_ctrls:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
-
-    for obj in gt_ab_general_ctrls:
-        if cmds.objExists(namespace + left_prefix + obj):
-            available_ctrls.append(left_prefix + obj)
-        if cmds.objExists(namespace + right_prefix + obj):
-            available_ctrls.append(right_prefix + obj)
-
-    for obj in gt_ab_center_ctrls:
-        if cmds.objExists(namespace + obj):
-            available_ctrls.append(obj)
+    available_ctrls = get_available_ctrls([gt_ab_ik_ctrls, gt_ab_fk_ctrls, gt_ab_general_ctrls],
+                                          gt_ab_center_ctrls, namespace=namespace)
 
     if not debugging:
         file_name = cmds.fileDialog2(fileFilter=script_name + " - ANIM File (*.anim)", dialogStyle=2, fileMode=1,
@@ -2229,75 +2623,261 @@ def anim_import(debugging=False, debugging_path='', namespace=''):
 
     if file_exists:
         try:
-            with open(anim_file) as json_file:
-                data = json.load(json_file)
-                try:
-                    is_operation_valid = True
+            if is_anim_container(anim_file):
+                reader = AnimContainerReader(anim_file)
+                data = reader.metadata
+                curve_items = reader.iter_curves(start_time, end_time)
+            else:
+                reader = None
+                with open(anim_file) as json_file:
+                    data = json.load(json_file)
+                curve_items = ((key, crop_anim_columns(columns_from_legacy_keys(dict_value), start_time, end_time))
+                               for key, dict_value in data.items()
+                               if key != 'gt_interface_version' and key != 'gt_export_method')
+            try:
+                is_operation_valid = True
 
-                    if not data.get('gt_interface_version'):
-                        is_operation_valid = False
-                        cmds.warning("Imported file doesn't seem to be compatible or is missing data.")
+                if not data.get('gt_interface_version'):
+                    is_operation_valid = False
+                    cmds.warning("Imported file doesn't seem to be compatible or is missing data.")
+                else:
+                    import_version = float(re.sub("[^0-9]", "", str(data.get('gt_interface_version'))))
+                    logger.debug(str(import_version))
+
+                if data.get('gt_export_method'):
+                    import_method = data.get('gt_export_method')
+                    logger.debug(str(import_method))
+
+                if len(available_ctrls) == 0:
+                    cmds.warning('No controls were found. Please check if a namespace is necessary.')
+                    is_operation_valid = False
+
+                if is_operation_valid:
+                    # Object-Space
+                    undo_state = cmds.undoInfo(q=True, state=True)
+                    if undoable:
+                        cmds.undoInfo(openChunk=True, chunkName='GT Anim Import')
                     else:
-                        import_version = float(re.sub("[^0-9]", "", str(data.get('gt_interface_version'))))
-                        logger.debug(str(import_version))
+                        cmds.undoInfo(stateWithoutFlush=False)
+                    try:
+                        stats = _apply_anim_curves(curve_items, namespace=namespace, time_offset=time_offset,
+                                                   undoable=undoable, incremental=incremental,
+                                                   start_time=start_time, end_time=end_time)
+                    finally:
+                        if undoable:
+                            cmds.undoInfo(closeChunk=True)
+                        else:
+                            cmds.undoInfo(stateWithoutFlush=undo_state)
+
+                    unique_message = '<' + str(random.random()) + '>'
+                    unique_message += '<span style=\"color:#FFFFFF;\">Animation imported from </span>'
+                    unique_message += '<span style=\"color:#FF0000;text-decoration:underline;\">'
+                    unique_message += os.path.basename(anim_file) + '</span><span style=\"color:#FFFFFF;\">.</span>'
+                    cmds.inViewMessage(amg=unique_message, pos='botLeft', fade=True, alpha=.9)
+                    sys.stdout.write('Animation imported from the file "' + anim_file + '". ')
+                    sys.stdout.write('{} curves and {} keys touched ({} curves unchanged).\n'.format(
+                        stats.get('curves'), stats.get('keys'), stats.get('skipped')))
 
-                    if data.get('gt_export_method'):
-                        import_method = data.get('gt_export_method')
-                        logger.debug(str(import_method))
+            except Exception as e:
+                logger.debug(str(e))
+                cmds.warning('An error occurred when importing the pose. Make sure you imported a valid ANIM file.')
+            finally:
+                if reader:
+                    reader.close()
+        except Exception as e:
+            logger.debug(str(e))
+            cmds.warning("Couldn't read the file. Please make sure the selected file is accessible.")
 
-                    if len(available_ctrls) == 0:
-                        cmds.warning('No controls were found. Please check if a namespace is necessary.')
-                        is_operation_valid = False
 
-                    if is_operation_valid:
-                        # Object-Space
-                        for key, dict_value in data.items():
-                            if key != 'gt_interface_version' and key != 'gt_export_method':
-                                for key_data in dict_value:
-                                    # Unpack Data
-                                    time = key_data[0]
-                                    value = key_data[1]
-                                    in_angle_tangent = key_data[2]
-                                    out_angle_tangent = key_data[3]
-                                    is_locked = key_data[4]
-                                    in_weight = key_data[5]
-                                    out_weight = key_data[6]
-                                    in_tangent_type = key_data[7]
-                                    out_tangent_type = key_data[8]
-
-                                    try:
-                                        obj, attr = key.split('.')
-                                        cmds.setKeyframe(namespace + obj, time=time, attribute=attr, value=value)
-                                        cmds.keyTangent(namespace + obj, at=attr, time=(time, time), lock=is_locked,
-                                                        e=True)
-                                        cmds.keyTangent(namespace + obj, at=attr, time=(time, time),
-                                                        inAngle=in_angle_tangent, e=True)
-                                        cmds.keyTangent(namespace + obj, at=attr, time=(time, time),
-                                                        outAngle=out_angle_tangent, e=True)
-                                        cmds.keyTangent(namespace + obj, at=attr, time=(time, time), inWeight=in_weight,
-                                                        e=True)
-                                        cmds.keyTangent(namespace + obj, at=attr, time=(time, time),
-                                                        outWeight=out_weight, e=True)
-                                        cmds.keyTangent(namespace + obj, at=attr, time=(time, time),
-                                                        inTangentType=in_tangent_type, e=True)
-                                        cmds.keyTangent(namespace + obj, at=attr, time=(time, time),
-                                                        outTangentType=out_tangent_type, e=True)
-                                    except Exception as e:
-                                        logger.debug(str(e))
+def _read_anim_file(anim_file, start_time=None, end_time=None):
+    """
+    Reads all curves of an ANIM file (binary container or legacy JSON)
 
-                        unique_message = '<' + str(random.random()) + '>'
-                        unique_message += '<span style=\"color:#FFFFFF;\">Animation imported from </span>'
-                        unique_message += '<span style=\"color:#FF0000;text-decoration:underline;\">'
-                        unique_message += os.path.basename(anim_file) + '</span><span style=\"color:#FFFFFF;\">.</span>'
-                        cmds.inViewMessage(amg=unique_message, pos='botLeft', fade=True, alpha=.9)
-                        sys.stdout.write('Animation imported from the file "' + anim_file + '".')
+    Args:
+        anim_file (string): Path to the ANIM file
+        start_time (optional, float): First frame of the time window to read. None means the start of the file.
+        end_time (optional, float): Last frame of the time window to read. None means the end of the file.
 
-                except Exception as e:
-                    logger.debug(str(e))
-                    cmds.warning('An error occurred when importing the pose. Make sure you imported a valid ANIM file.')
-        except Exception as e:
-            logger.debug(str(e))
-            cmds.warning("Couldn't read the file. Please make sure the selected file is accessible.")
+    Returns:
+        metadata, curves (tuple): File metadata (dict) and curves (dict: curve name to columns)
+    """
+    if is_anim_container(anim_file):
+        return read_anim_container(anim_file, start_time, end_time)
+    with open(anim_file) as json_file:
+        data = json.load(json_file)
+    metadata = {}
+    curves = {}
+    for key, dict_value in data.items():
+        if key == 'gt_interface_version' or key == 'gt_export_method':
+            metadata[key] = dict_value
+        else:
+            columns = crop_anim_columns(columns_from_legacy_keys(dict_value), start_time, end_time)
+            if len(columns.get('times')):
+                curves[key] = columns
+    return metadata, curves
+
+
+def _print_crowd_feedback(operation, character_count, elapsed_time, file_path):
+    """
+    Prints the result of a crowd operation (throughput in characters per second)
+
+    Args:
+        operation (string): Name of the operation. e.g. "Pose" or "Animation"
+        character_count (int): Number of characters that received the data
+        elapsed_time (float): Time spent applying the data (seconds)
+        file_path (string): Path of the imported file
+    """
+    characters_per_second = character_count / max(elapsed_time, 1e-6)
+    unique_message = '<' + str(random.random()) + '>'
+    unique_message += '<span style=\"color:#FFFFFF;\">' + operation + ' imported to </span>'
+    unique_message += '<span style=\"color:#FF0000;text-decoration:underline;\">' + str(character_count)
+    unique_message += ' characters</span><span style=\"color:#FFFFFF;\">.</span>'
+    cmds.inViewMessage(amg=unique_message, pos='botLeft', fade=True, alpha=.9)
+    sys.stdout.write('{} from "{}" imported to {} characters in {:.3f}s ({:.1f} characters/s).\n'.format(
+        operation, file_path, character_count, elapsed_time, characters_per_second))
+
+
+def _match_crowd_values(values, namespaces, default, description):
+    """
+    Makes a list of per-character values (e.g. time offsets) the same length as the list of namespaces.
+    Missing values are filled with the default and extra values are ignored (both cases print a warning).
+
+    Args:
+        values (list, None): A list of values (one per namespace). None uses the default for every namespace.
+        namespaces (list): A list of namespaces (one per character)
+        default (any): Value used for the namespaces without a value. e.g. 0 or False
+        description (string): Name of the values used in the warning. e.g. "time offsets"
+
+    Returns:
+        values (list): A list with one value per namespace
+    """
+    if values is None:
+        return [default] * len(namespaces)
+    values = list(values)
+    if len(values) != len(namespaces):
+        cmds.warning('{} {} were provided for {} namespaces. Missing values use "{}" and extra values are '
+                     'ignored.'.format(len(values), description, len(namespaces), default))
+    return (values + [default] * len(namespaces))[:len(namespaces)]
+
+
+def pose_import_crowd(namespaces, pose_file='', mirror_flags=None):
+    """
+    Imports a POSE file once and applies it to multiple characters (same rig referenced multiple times)
+
+    Args:
+        namespaces (list): A list of namespaces (one per character). e.g. ["char01:", "char02:"]
+        pose_file (optional, string): Path to the POSE file. If not provided, a file dialog is opened.
+        mirror_flags (optional, list): A list of booleans (one per namespace). True applies the mirrored pose.
+
+    Returns:
+        characters_per_second (float): Throughput of the operation. 0 if nothing was imported.
+    """
+    if not pose_file:
+        file_name = cmds.fileDialog2(fileFilter=script_name + " - POSE File (*.pose)", dialogStyle=2, fileMode=1,
+                                     okCaption='Import', caption='Importing Crowd Pose for "' + script_name + '"') or []
+        if not file_name:
+            return 0
+        pose_file = file_name[0]
+
+    try:
+        with open(pose_file) as json_file:
+            data = json.load(json_file)
+    except Exception as e:
+        logger.debug(str(e))
+        cmds.warning("Couldn't read the file. Please make sure the selected file is accessible.")
+        return 0
+
+    if not data.get('gt_interface_version'):
+        cmds.warning("Imported file doesn't seem to be compatible or is missing data.")
+        return 0
+
+    mirror_flags = _match_crowd_values(mirror_flags, namespaces, False, 'mirror flags')
+    mirror_mapping = _get_mirror_mapping([ctrl for ctrl in data
+                                          if ctrl != 'gt_interface_version' and ctrl != 'gt_export_method'])
+    character_count = 0
+    start = time.perf_counter()
+    cmds.undoInfo(openChunk=True, chunkName='GT Pose Import Crowd')
+    try:
+        for namespace, is_mirrored in zip(namespaces, mirror_flags):
+            if not get_available_ctrls([gt_ab_ik_ctrls, gt_ab_fk_ctrls, gt_ab_general_ctrls], gt_ab_center_ctrls,
+                                       namespace=namespace):
+                cmds.warning('No controls were found for the namespace "' + namespace + '".')
+                continue
+            _apply_pose_data(data, namespace=namespace, mirror_mapping=mirror_mapping if is_mirrored else None)
+            character_count += 1
+    finally:
+        cmds.undoInfo(closeChunk=True)
+    elapsed_time = time.perf_counter() - start
+
+    _print_crowd_feedback('Pose', character_count, elapsed_time, pose_file)
+    return character_count / max(elapsed_time, 1e-6)
+
+
+def anim_import_crowd(namespaces, anim_file='', time_offsets=None, mirror_flags=None, undoable=True, start_time=None,
+                      end_time=None):
+    """
+    Imports an ANIM file once and applies it to multiple characters (same rig referenced multiple times)
+
+    Args:
+        namespaces (list): A list of namespaces (one per character). e.g. ["char01:", "char02:"]
+        anim_file (optional, string): Path to the ANIM file. If not provided, a file dialog is opened.
+        time_offsets (optional, list): A list of time offsets in frames (one per namespace). e.g. [0, 5, 12]
+        mirror_flags (optional, list): A list of booleans (one per namespace). True applies the mirrored animation.
+        undoable (optional, bool): If False, curves are written without recording undo (faster, for batch jobs)
+        start_time (optional, float): First frame of the time window to import. None means the start of the file.
+        end_time (optional, float): Last frame of the time window to import. None means the end of the file.
+
+    Returns:
+        characters_per_second (float): Throughput of the operation. 0 if nothing was imported.
+    """
+    if not anim_file:
+        file_name = cmds.fileDialog2(fileFilter=script_name + " - ANIM File (*.anim)", dialogStyle=2, fileMode=1,
+                                     okCaption='Import',
+                                     caption='Importing Crowd Animation for "' + script_name + '"') or []
+        if not file_name:
+            return 0
+        anim_file = file_name[0]
+
+    try:
+        metadata, curves = _read_anim_file(anim_file, start_time, end_time)
+    except Exception as e:
+        logger.debug(str(e))
+        cmds.warning("Couldn't read the file. Please make sure the selected file is accessible.")
+        return 0
+
+    if not metadata.get('gt_interface_version'):
+        cmds.warning("Imported file doesn't seem to be compatible or is missing data.")
+        return 0
+
+    time_offsets = _match_crowd_values(time_offsets, namespaces, 0, 'time offsets')
+    mirror_flags = _match_crowd_values(mirror_flags, namespaces, False, 'mirror flags')
+    mirror_mapping = _get_mirror_mapping(set(curve_name.split('.')[0] for curve_name in curves))
+    character_count = 0
+    undo_state = cmds.undoInfo(q=True, state=True)
+    start = time.perf_counter()
+    if undoable:
+        cmds.undoInfo(openChunk=True, chunkName='GT Anim Import Crowd')
+    else:
+        cmds.undoInfo(stateWithoutFlush=False)
+    try:
+        for namespace, time_offset, is_mirrored in zip(namespaces, time_offsets, mirror_flags):
+            if not get_available_ctrls([gt_ab_ik_ctrls, gt_ab_fk_ctrls, gt_ab_general_ctrls], gt_ab_center_ctrls,
+                                       namespace=namespace):
+                cmds.warning('No controls were found for the namespace "' + namespace + '".')
+                continue
+            _apply_anim_curves(curves.items(), namespace=namespace, time_offset=time_offset,
+                               mirror_mapping=mirror_mapping if is_mirrored else None, undoable=undoable,
+                               start_time=start_time, end_time=end_time)
+            character_count += 1
+    finally:
+        if undoable:
+            cmds.undoInfo(closeChunk=True)
+        else:
+            cmds.undoInfo(stateWithoutFlush=undo_state)
+    elapsed_time = time.perf_counter() - start
+
+    _print_crowd_feedback('Animation', character_count, elapsed_time, anim_file)
+    return character_count / max(elapsed_time, 1e-6)
 
 
 # Build UI
@@ -35,15 +35,40 @@
  1.4.2 - 2021-09-03
     Added import line for fileTexturePathResolver
 
+ 1.5.0 - 2026-10-18
+    Checks now share a scene snapshot (SceneSnapshot) instead of querying the scene again and again
+    Added "run_checklist" and "benchmark_checklist_refresh"
+
+ 1.5.1 - 2026-10-18
+    Added incremental refresh (only the checks and nodes affected by tracked scene changes are evaluated again)
+
+ 1.6.0 - 2026-10-18
+    Moved the checks to "gt_render_checklist_logic" (they now return structured results instead of updating the window)
+    Checks can be performed without a window (see "gt_render_checklist_batch")
+
+ 1.7.0 - 2026-10-18
+    Added "Time" column (time, maya.cmds calls and nodes visited by each check) also included in the report
+    Added "Export Timing (JSON)" button
+
+ 1.7.1 - 2026-10-18
+    Polygon checks share the mesh statistics of "gt_render_checklist_logic" (one pass through the API per mesh)
+
+ 1.7.2 - 2026-10-18
+    Default object names can be changed in the settings (comma separated list)
+
  Todo:
     Add checks for xgen
     Create a better error handling option for the total texture count function
     
 """
+import maya.api.OpenMaya as om
 import maya.cmds as cmds
 import maya.mel as mel
 import copy
+import json
 import sys
+import gt_render_checklist_logic as checklist_logic
+from gt_render_checklist_logic import SceneSnapshot
 from maya import OpenMayaUI as omui
 
 try:
@@ -62,7 +87,7 @@ except ImportError:
 script_name = "GT Render Checklist" 
 
 # Versions
-script_version = "1.4.2"
+script_version = "1.7.2"
 maya_version = cmds.about(version=True)
 
 # Python Version
@@ -75,30 +100,8 @@ warning_color = (1.0, 1.0, 0.17)
 error_color = (1.0, 0.17, 0.17)
 exception_color = 0.2, 0.2, 0.2
 
-# Checklist Items - Item Number [Name, Expected Value]
-checklist_items = { 0 : ["Frame Rate", "film"],
-                    1 : ["Scene Units", "cm"],
-                    2 : ["Output Resolution", ["1920","1080"] ],
-                    3 : ["Total Texture Count", [40, 50] ],
-                    4 : ["Network File Paths", ["C:\\"] ], # Uses startswith and ignores slashes
-                    5 : ["Network Reference Paths", ["C:\\"] ], # Uses startswith and ignores slashes
-                    6 : ["Unparented Objects", 0],
-                    7 : ["Total Triangle Count", [1800000, 2000000] ],
-                    8 : ["Total Poly Object Count", [90, 100] ],
-                    9 : ["Shadow Casting Lights", [2, 3] ],
-                   10 : ["RS Shadow Casting Lights", [3, 4]],
-                   11 : ["Ai Shadow Casting Lights", [3, 4]],
-                   12 : ["Default Object Names", 0],
-                   13 : ["Objects Assigned to lambert1", 0],
-                   14 : ["Ngons", 0],
-                   15 : ["Non-manifold Geometry", 0],
-                   16 : ["Empty UV Sets", 0],
-                   17 : ["Frozen Transforms", 0],
-                   18 : ["Animated Visibility", 0],
-                   19 : ["Non Deformer History", 0 ],
-                   20 : ["Textures Color Space", 0 ],
-                   21 : ["Other Network Paths", ["C:\\"] ] 
-                  }
+# Checklist Items - Item Number [Name, Expected Value] (See "gt_render_checklist_logic")
+checklist_items = copy.deepcopy(checklist_logic.default_checklist_items)
 
 # Store Default Values for Reseting
 settings_default_checklist_values = copy.deepcopy(checklist_items)
@@ -107,7 +110,8 @@ settings_default_checklist_values = copy.deepcopy(checklist_items)
 checklist_settings = { "is_settings_visible" : False,
                        "checklist_column_height" : 0,
                        "checklist_buttons_height" : 0,
-                       "settings_text_fields" : []
+                       "settings_text_fields" : [],
+                       "incremental_refresh" : False # Only check what changed since the last refresh
                      }
 
 
@@ -126,9 +130,16 @@ def get_persistent_settings_render_checklist():
             for stored_item in stored_checklist_items:
                 for item in checklist_items:
                     if stored_item == item:
-                        checklist_items[item][1] = stored_checklist_items.get(stored_item)[1]
+                        stored_value = stored_checklist_items.get(stored_item)[1]
+                        # Ignore values stored before an item started using a list (e.g. "Default Object Names")
+                        if isinstance(checklist_items[item][1], list) and not isinstance(stored_value, list):
+                            continue
+                        checklist_items[item][1] = stored_value
         except:
             print('Couldn\'t load persistent settings, try resetting it in the help menu.')
+    
+    if cmds.optionVar(exists=("gt_render_checklist_incremental")):
+        checklist_settings["incremental_refresh"] = bool(cmds.optionVar(q=("gt_render_checklist_incremental")))
             
 
 
@@ -145,6 +156,8 @@ def set_persistent_settings_render_checklist():
 def reset_persistent_settings_render_checklist():
     ''' Resets persistant settings for GT Render Checklist '''
     cmds.optionVar( remove='gt_render_checklist_setup' )
+    cmds.optionVar( remove='gt_render_checklist_incremental' )
+    checklist_settings["incremental_refresh"] = False
     get_persistent_settings_render_checklist()
     build_gui_gt_render_checklist()
     build_gui_help_gt_render_checklist()
@@ -157,8 +170,15 @@ def build_gui_gt_render_checklist():
     window_name = "build_gui_gt_render_checklist"
     if cmds.window(window_name, exists=True):
         cmds.deleteUI(window_name, window=True)
+    
+    # Incremental Refresh - Cached results are only valid for the current window
+    scene_change_tracker.stop()
+    checklist_cache["snapshot"] = None
+    checklist_cache["results"] = {}
+    if checklist_settings.get("incremental_refresh"):
+        scene_change_tracker.start()
 
-    cmds.window(window_name, title=script_name + '  (v' + script_version + ')', mnb=False, mxb=False, s=True)
+    cmds.window(window_name, title=script_name + '  (v' + script_version + ')', mnb=False, mxb=False, s=True, cc=lambda: scene_change_tracker.stop())
 
     main_column = cmds.columnLayout()
 
@@ -195,7 +215,7 @@ def build_gui_gt_render_checklist():
 
     # Settings : 
     font_size ='smallPlainLabelFont'
-    items_for_settings = [0, 1, 2, 3, 4, 5, 7, 8, 9, 10, 11, 21] # Allow user to update expected values
+    items_for_settings = [0, 1, 2, 3, 4, 5, 7, 8, 9, 10, 11, 12, 21] # Allow user to update expected values
     items_with_warnings = [3, 7, 8, 9, 10, 11] # Allow users to update warning values too
     def create_settings_items(items, items_for_settings, items_with_warnings):
         for item in items:
@@ -234,12 +254,14 @@ def build_gui_gt_render_checklist():
 
 
     # Checklist Column  ==========================================================
-    checklist_column = cmds.rowColumnLayout(nc=3, cw=[(1, 165), (2, 35), (3, 90)], cs=[(1, 20), (2, 6), (3, 6)], p=main_column) 
+    checklist_column = cmds.rowColumnLayout(nc=4, cw=[(1, 150), (2, 35), (3, 62), (4, 45)], cs=[(1, 20), (2, 6), (3, 4), (4, 4)], p=main_column) 
     
     # Header
     cmds.text(l="Operation", align="left")
     cmds.text(l='Status', align="left")
     cmds.text(l='Info', align="center")
+    cmds.text(l='Time', align="center")
+    cmds.separator(h=5, style='none')
     cmds.separator(h=5, style='none')
     cmds.separator(h=5, style='none')
     cmds.separator(h=5, style='none')
@@ -251,6 +273,7 @@ def build_gui_gt_render_checklist():
             cmds.text(l=checklist_items.get(item)[0] + ': ', align="left")
             cmds.button("status_" + item_id , l='', h=14, bgc=def_color)
             cmds.text("output_" + item_id, l='...', align="center")
+            cmds.text("time_" + item_id, l='...', align="center", fn='smallPlainLabelFont')
 
     create_checklist_items(checklist_items)
 
@@ -265,6 +288,10 @@ def build_gui_gt_render_checklist():
     cmds.button(l='Generate Report', h=30, c=lambda args: checklist_generate_report())
     cmds.separator(h=10, style='none')
     cmds.button(l='Refresh', h=30, c=lambda args: checklist_refresh())
+    cmds.separator(h=5, style='none')
+    cmds.checkBox(l='Incremental Refresh (Only check what changed)', v=checklist_settings.get("incremental_refresh"), cc=lambda args: set_incremental_refresh(args))
+    cmds.separator(h=5, style='none')
+    cmds.button(l='Export Timing (JSON)', h=20, c=lambda args: export_profile_to_json())
     cmds.separator(h=8, style='none')
     
     settings_buttons = cmds.rowColumnLayout(nc=1, cw=[(1, 300)], cs=[(1,10)], p=main_column, h=1)
@@ -327,32 +354,107 @@ def build_gui_gt_render_checklist():
     
 
 
+def run_checklist(shared_snapshot=True, incremental=False):
+    '''
+    Runs every check and returns their results
+
+            Parameters:
+                    shared_snapshot (bool): If True, the scene is queried once and the snapshot is shared by every check.
+                                            If False, the checks query Maya directly, without a snapshot (used for benchmarking)
+                    incremental (bool): If True, only the checks affected by the changes tracked since the last refresh
+                                        are evaluated again (see "SceneChangeTracker"), other results come from the cache
+
+            Returns:
+                    results (list): A list of result dictionaries, one for each check (see "gt_render_checklist_logic")
+    '''
+    snapshot = None
+    changed_types = None # None = Evaluate every check
+    checklist_cache['snapshot_profile'] = None
+    if incremental and shared_snapshot:
+        full_refresh, changed_nodes = scene_change_tracker.pop_changes()
+        snapshot = checklist_cache.get('snapshot')
+        with checklist_logic.CheckProfiler() as profiler:
+            if full_refresh or snapshot is None:
+                snapshot = SceneSnapshot()
+            else:
+                changed_types = set(snapshot.update(changed_nodes).values())
+        checklist_cache['snapshot'] = snapshot
+        checklist_cache['snapshot_profile'] = profiler.get_profile()
+    elif shared_snapshot:
+        with checklist_logic.CheckProfiler() as profiler:
+            snapshot = SceneSnapshot()
+        checklist_cache['snapshot_profile'] = profiler.get_profile()
+    else:
+        snapshot = checklist_logic.DirectSceneQueries()
+    
+    results = []
+    for check_function, input_types in checklist_functions:
+        result = checklist_cache.get('results').get(check_function.__name__)
+        if changed_types is not None and input_types is not None and result is not None:
+            is_affected = False
+            for input_type in input_types:
+                if changed_types.intersection(snapshot.get_derived_types(input_type)):
+                    is_affected = True
+                    break
+            if not is_affected: # Status and output in the window are still up to date
+                result = dict(result, profile=dict(cached_profile))
+                update_profile_column(result)
+                results.append(result)
+                continue
+        
+        with checklist_logic.CheckProfiler() as profiler:
+            result = check_function(snapshot)
+        result['profile'] = profiler.get_profile()
+        update_profile_column(result)
+        checklist_cache.get('results')[check_function.__name__] = result
+        results.append(result)
+    return results
+
+
+# Profile of the checks that were not evaluated again (Incremental Refresh)
+cached_profile = {'time' : 0.0, 'cmds_calls' : 0, 'nodes_visited' : 0, 'commands' : {}, 'cached' : True}
+
+
+def format_profile(profile):
+    '''
+    Returns a profile as text. e.g. "0.052s - Maya calls: 14 - Nodes visited: 120"
+
+            Parameters:
+                    profile (dict): Profile of a check (see "gt_render_checklist_logic.CheckProfiler")
+    '''
+    if profile.get('cached'):
+        return 'Cached (Nothing it depends on changed since the last refresh)'
+    return str(round(profile.get('time'), 3)) + 's - Maya calls: ' + str(profile.get('cmds_calls')) + \
+           ' - Nodes visited: ' + str(profile.get('nodes_visited'))
+
+
+def update_profile_column(result):
+    '''
+    Shows the time spent by a check in the "Time" column (Maya calls and nodes visited are shown as a tooltip)
+
+            Parameters:
+                    result (dict): Profiled result of a check
+    '''
+    item_id = get_item_id(result.get('name'))
+    if not cmds.text("time_" + item_id, exists=True):
+        return
+    profile = result.get('profile')
+    if profile.get('cached'):
+        time_label = '-'
+    elif profile.get('time') < 1:
+        time_label = str(int(round(profile.get('time') * 1000))) + 'ms'
+    else:
+        time_label = str(round(profile.get('time'), 2)) + 's'
+    cmds.text("time_" + item_id, e=True, l=time_label, ann=format_profile(profile))
+
+
 def checklist_refresh():
     # Save Current Selection For Later
     current_selection = cmds.ls(selection=True)
     
-    check_frame_rate()
-    check_scene_units()
-    check_output_resolution()
-    check_total_texture_count()
-    check_network_file_paths()
-    check_network_reference_paths()
-    check_unparented_objects()  
-    check_total_triangle_count()
-    check_total_poly_object_count()
-    check_shadow_casting_light_count()
-    check_rs_shadow_casting_light_count()
-    check_ai_shadow_casting_light_count()
-    check_default_object_names()
-    check_objects_assigned_to_lambert1()
-    check_ngons()
-    check_non_manifold_geometry()
-    check_empty_uv_sets()
-    check_frozen_transforms()
-    check_animated_visibility()
-    check_non_deformer_history()
-    check_textures_color_space()
-    check_other_network_paths()
+    # Files on disk can change without changing the scene (e.g. new UDIM tiles)
+    checklist_logic.get_filesystem_probe().clear()
+    run_checklist(incremental=checklist_settings.get('incremental_refresh'))
     
     # Clear Selection
     cmds.selectMode( object=True )
@@ -366,41 +468,77 @@ def checklist_generate_report():
     # Save Current Selection For Later
     current_selection = cmds.ls(selection=True)
     
-    report_strings = []
-    report_strings.append(check_frame_rate())
-    report_strings.append(check_scene_units())
-    report_strings.append(check_output_resolution())
-    report_strings.append(check_total_texture_count())
-    report_strings.append(check_network_file_paths())
-    report_strings.append(check_network_reference_paths())
-    report_strings.append(check_unparented_objects())
-    report_strings.append(check_total_triangle_count())
-    report_strings.append(check_total_poly_object_count())
-    report_strings.append(check_shadow_casting_light_count())
-    report_strings.append(check_rs_shadow_casting_light_count())
-    report_strings.append(check_ai_shadow_casting_light_count())
-    report_strings.append(check_default_object_names())
-    report_strings.append(check_objects_assigned_to_lambert1())
-    report_strings.append(check_ngons())
-    report_strings.append(check_non_manifold_geometry())
-    report_strings.append(check_empty_uv_sets())
-    report_strings.append(check_frozen_transforms())
-    report_strings.append(check_animated_visibility())
-    report_strings.append(check_non_deformer_history())
-    report_strings.append(check_textures_color_space())
-    report_strings.append(check_other_network_paths())
+    results = run_checklist(incremental=checklist_settings.get('incremental_refresh'))
     
     # Clear Selection
     cmds.selectMode( object=True )
     cmds.select(clear=True)
     
     # Show Report
+    report_strings = []
+    for result in results:
+        report_strings.append(result.get('report') + '\n(Time: ' + format_profile(result.get('profile')) + ')')
+    profile_data = checklist_logic.get_profile_data(results, snapshot_profile=checklist_cache.get('snapshot_profile'))
+    timing_string = '\n*** Timing ***\n'
+    if profile_data.get('snapshot'):
+        timing_string += 'Scene snapshot: ' + format_profile(profile_data.get('snapshot')) + '\n'
+    timing_string += 'Total: ' + format_profile(profile_data.get('total'))
+    report_strings.append(timing_string)
     export_report_to_txt(report_strings)
     
     # Reselect Previous Selection
     cmds.select(current_selection)
     
 
+def export_profile_to_json(file_path=None):
+    '''
+    Exports the time, maya.cmds calls and nodes visited by every check to a JSON file (used to track regressions)
+    If the checklist wasn't refreshed yet, it's refreshed first.
+
+            Parameters:
+                    file_path (string): Path to the JSON file. If not provided, the user is asked for one
+
+            Returns:
+                    profile_data (dict): Exported data (None if nothing was exported)
+    '''
+    results = [checklist_cache.get('results').get(check_function.__name__) for check_function, input_types in checklist_functions]
+    if None in results:
+        checklist_refresh()
+        results = [checklist_cache.get('results').get(check_function.__name__) for check_function, input_types in checklist_functions]
+
+    if file_path is None:
+        file_name = cmds.fileDialog2(fileFilter="JSON (*.json)", dialogStyle=2, okCaption= 'Export', caption= 'Exporting Timing for "' + script_name + '"') or []
+        if len(file_name) == 0:
+            return None
+        file_path = file_name[0]
+
+    profile_data = checklist_logic.get_profile_data(results, snapshot_profile=checklist_cache.get('snapshot_profile'))
+    try:
+        with open(file_path, 'w') as json_file:
+            json.dump(profile_data, json_file, indent=4)
+    except:
+        cmds.warning('Couldn\'t write to file. Please make sure the saving location is accessible.')
+        return None
+    print('Timing exported to "' + file_path + '"')
+    return profile_data
+
+
+def set_incremental_refresh(is_enabled):
+    '''
+    Enables or disables the incremental refresh (stored as a persistent setting)
+    
+            Parameters:
+                    is_enabled (bool): If True, changes are tracked so the next refreshes only check what changed
+    '''
+    checklist_settings["incremental_refresh"] = is_enabled
+    cmds.optionVar( iv=('gt_render_checklist_incremental', int(is_enabled)))
+    checklist_cache["snapshot"] = None
+    if is_enabled:
+        scene_change_tracker.start()
+    else:
+        scene_change_tracker.stop()
+    
+
     
 # Creates Help GUI
 def build_gui_help_gt_render_checklist():
@@ -490,7 +628,7 @@ def build_gui_help_gt_render_checklist():
 
     cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(11)[0] +': error if more than ' + str(checklist_items.get(11)[1][1]) + '\n     warning if more than ' + str(checklist_items.get(11)[1][0]) + '.' + '\n\n')   
  
-    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(12)[0] +': error if using default names.' + '\n  warning if containing default names.\n    Examples of default names:\n      "pCube1" = Error\n      "pointLight1" = Error\n      "nurbsPlane1" = Error\n      "my_pCube" = Warning\n\n')  
+    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(12)[0] +': error if using default names.' + '\n  warning if containing default names.\n    Examples of default names:\n      "pCube1" = Error\n      "pointLight1" = Error\n      "nurbsPlane1" = Error\n      "my_pCube" = Warning\n    The list of default names can be changed in the settings.\n     Please use a comma "," to separate the names.\n\n')  
 
     cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(13)[0] +': error if anything is assigned.\n\n') 
         
@@ -510,6 +648,9 @@ def build_gui_help_gt_render_checklist():
     
     cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(21)[0] +': must start with ' + str(checklist_items.get(21)[1]) + '\n   This function completely ignore slashes.\n   You may use a list as custom value.\n   Use a comma "," to separate multiple paths\n   This function checks:\n     Audio Nodes, \n     Mash Audio Nodes,\n     nCache Nodes,\n     Maya Fluid Cache Nodes,\n     Arnold Volumes/Standins/Lights,\n     Redshift Proxy/Volume/Normal/Lights,\n     Alembic/BIF/GPU Cache,\n     Golaem Common and Cache Nodes' + '\n') 
 
+    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='\n[ ] Time: time spent by each check (hover it to see how many Maya commands were called and nodes visited).\n     "-" means the check wasn\'t evaluated again (Incremental Refresh). Use "Export Timing (JSON)" to compare scene versions.\n')
+    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='\n[ ] Incremental Refresh: while the window is open, the script keeps track of the nodes that change.\n     When refreshing, only the checks affected by these changes are evaluated again (and only for the changed nodes).\n     Opening/importing scenes or loading references causes a full refresh.\n') 
+
     cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=1, it='') # Bring Back to the Top
 
     cmds.separator(h=checklist_spacing, style='none') # Empty Space
@@ -553,27 +694,297 @@ def build_gui_help_gt_render_checklist():
     def close_help_gui():
         if cmds.window(window_name, exists=True):
             cmds.deleteUI(window_name, window=True)
-    
+
+
+# Scene Change Tracking (Incremental Refresh) ===================================================
+class SceneChangeTracker:
+    '''
+    Keeps track of the nodes that changed since the last refresh (added, removed, renamed, reparented,
+    connected or with attributes changed). Callbacks are only registered while the checklist window is open.
+    Operations that change too much at once (new scene, open, import, references) and time changes (animated values)
+    request a full refresh instead.
+    '''
+    attribute_change_flags = (om.MNodeMessage.kAttributeSet | om.MNodeMessage.kConnectionMade | om.MNodeMessage.kConnectionBroken |
+                              om.MNodeMessage.kAttributeAdded | om.MNodeMessage.kAttributeRemoved | om.MNodeMessage.kAttributeRenamed |
+                              om.MNodeMessage.kAttributeArrayAdded | om.MNodeMessage.kAttributeArrayRemoved)
+
+    def __init__(self):
+        self.dirty_nodes = {} # {name : type}
+        self.full_refresh = True
+        self.is_paused = False
+        self.callback_ids = []
+        self.node_callback_ids = {} # {MObjectHandle hash : callback id}
+
+    def is_running(self):
+        return len(self.callback_ids) > 0
+
+    def start(self):
+        ''' Registers the callbacks. The next refresh is a full refresh. '''
+        self.stop()
+        self.full_refresh = True
+        self.callback_ids.append(om.MDGMessage.addNodeAddedCallback(self._on_node_added, 'dependNode'))
+        self.callback_ids.append(om.MDGMessage.addNodeRemovedCallback(self._on_node_removed, 'dependNode'))
+        self.callback_ids.append(om.MDGMessage.addConnectionCallback(self._on_connection))
+        self.callback_ids.append(om.MDagMessage.addAllDagChangesCallback(self._on_dag_change))
+        self.callback_ids.append(om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, self._on_name_changed))
+        self.callback_ids.append(om.MDGMessage.addTimeChangeCallback(self._on_time_changed))
+        for message in [om.MSceneMessage.kBeforeNew, om.MSceneMessage.kBeforeOpen, om.MSceneMessage.kBeforeImport,
+                        om.MSceneMessage.kBeforeCreateReference, om.MSceneMessage.kBeforeRemoveReference,
+                        om.MSceneMessage.kBeforeLoadReference, om.MSceneMessage.kBeforeUnloadReference]:
+            self.callback_ids.append(om.MSceneMessage.addCallback(message, self._on_before_scene_change))
+        for message in [om.MSceneMessage.kAfterNew, om.MSceneMessage.kAfterOpen, om.MSceneMessage.kAfterImport,
+                        om.MSceneMessage.kAfterCreateReference, om.MSceneMessage.kAfterRemoveReference,
+                        om.MSceneMessage.kAfterLoadReference, om.MSceneMessage.kAfterUnloadReference]:
+            self.callback_ids.append(om.MSceneMessage.addCallback(message, self._on_after_scene_change))
+        self._add_all_node_callbacks()
+
+    def stop(self):
+        ''' Removes every callback and forgets the changes '''
+        self._remove_all_node_callbacks()
+        for callback_id in self.callback_ids:
+            try:
+                om.MMessage.removeCallback(callback_id)
+            except:
+                pass
+        self.callback_ids = []
+        self.dirty_nodes = {}
+        self.full_refresh = True
+        self.is_paused = False
+
+    def pop_changes(self):
+        '''
+        Returns the changes since the last call and starts tracking again from scratch
+
+                Returns:
+                        full_refresh (bool): True if the changes couldn't be tracked (everything must be checked again)
+                        dirty_nodes (dict): Nodes that changed {name : type}
+        '''
+        changes = (self.full_refresh or not self.is_running(), self.dirty_nodes)
+        self.dirty_nodes = {}
+        self.full_refresh = False
+        return changes
+
+    # Per Node Callbacks (Attribute Changes) ---------------------------------
+    def _add_node_callback(self, node):
+        handle_hash = om.MObjectHandle(node).hashCode()
+        if handle_hash not in self.node_callback_ids:
+            self.node_callback_ids[handle_hash] = om.MNodeMessage.addAttributeChangedCallback(node, self._on_attribute_changed)
+
+    def _add_all_node_callbacks(self):
+        iterator = om.MItDependencyNodes()
+        while not iterator.isDone():
+            self._add_node_callback(iterator.thisNode())
+            iterator.next()
+
+    def _remove_all_node_callbacks(self):
+        for callback_id in self.node_callback_ids.values():
+            try:
+                om.MMessage.removeCallback(callback_id)
+            except:
+                pass
+        self.node_callback_ids = {}
+
+    # Callback Functions ---------------------------------------------
+    def mark_dirty(self, node, name=None):
+        ''' Adds a node (MObject) to the dirty nodes. A name can be provided in case the node was renamed. '''
+        try:
+            function_set = om.MFnDependencyNode(node)
+            if name is None:
+                name = function_set.name()
+                if node.hasFn(om.MFn.kDagNode):
+                    name = om.MFnDagNode(node).partialPathName()
+            self.dirty_nodes[name] = function_set.typeName
+        except:
+            self.full_refresh = True
+
+    def _on_node_added(self, node, *args):
+        if self.is_paused:
+            return
+        self.mark_dirty(node)
+        self._add_node_callback(node)
+
+    def _on_node_removed(self, node, *args):
+        if self.is_paused:
+            return
+        self.mark_dirty(node)
+        callback_id = self.node_callback_ids.pop(om.MObjectHandle(node).hashCode(), None)
+        if callback_id is not None:
+            om.MMessage.removeCallback(callback_id)
+
+    def _on_attribute_changed(self, message, plug, other_plug, *args):
+        if self.is_paused or not message & self.attribute_change_flags:
+            return
+        self.mark_dirty(plug.node())
+
+    def _on_connection(self, source_plug, destination_plug, made, *args):
+        if self.is_paused:
+            return
+        self.mark_dirty(source_plug.node())
+        self.mark_dirty(destination_plug.node())
+
+    def _on_dag_change(self, message, child, parent, *args):
+        if self.is_paused:
+            return
+        for dag_path in [child, parent]:
+            if dag_path.length() > 0: # World is not a node in the scene
+                self.mark_dirty(dag_path.node())
+
+    def _on_name_changed(self, node, previous_name, *args):
+        if self.is_paused:
+            return
+        self.mark_dirty(node)
+        if previous_name:
+            self.mark_dirty(node, name=previous_name)
+
+    def _on_time_changed(self, *args):
+        self.full_refresh = True # Animated values might be different in the new frame
+
+    def _on_before_scene_change(self, *args):
+        self.is_paused = True # Too many nodes change at once, don't track them one by one
+        self._remove_all_node_callbacks()
+
+    def _on_after_scene_change(self, *args):
+        self.is_paused = False
+        self.full_refresh = True
+        self.dirty_nodes = {}
+        self._add_all_node_callbacks()
+
+
+# The tracker created before a reload (e.g. "execute_script(..., reload=True)") still has its callbacks registered
+previous_scene_change_tracker = globals().get('scene_change_tracker')
+if previous_scene_change_tracker is not None:
+    try:
+        previous_scene_change_tracker.stop()
+    except Exception:
+        pass
+scene_change_tracker = SceneChangeTracker()
+
+# Data kept between refreshes (Incremental Refresh)
+checklist_cache = { "snapshot" : None,
+                    "snapshot_profile" : None,
+                    "results" : {}
+                  }
+
+
+def benchmark_checklist_refresh(repeat=3):
+    '''
+    Compares the time spent running the checks with a shared snapshot (what "checklist_refresh" does) against
+    the time spent when each check queries Maya directly (targeted queries, as before the snapshot existed).
+    Results are printed and returned.
+
+            Parameters:
+                    repeat (int): How many times each approach runs (the best time is used)
+
+            Returns:
+                    results (dict): Times in seconds {'shared_snapshot': float, 'direct_queries': float, 'speedup': float}
+    '''
+    if not cmds.window("build_gui_gt_render_checklist", exists=True):
+        build_gui_gt_render_checklist()
+
+    def run_checks(shared_snapshot):
+        current_selection = cmds.ls(selection=True)
+        start_time = checklist_logic._timer()
+        run_checklist(shared_snapshot)
+        elapsed_time = checklist_logic._timer() - start_time
+        cmds.select(current_selection)
+        return elapsed_time
+
+    shared_times = []
+    direct_times = []
+    for index in range(repeat):
+        shared_times.append(run_checks(True))
+        direct_times.append(run_checks(False))
+
+    results = {'shared_snapshot' : min(shared_times),
+               'direct_queries' : min(direct_times)}
+    results['speedup'] = results.get('direct_queries') / max(results.get('shared_snapshot'), 1e-9)
+
+    print('#' * 80)
+    print('Nodes in the scene: ' + str(len(cmds.ls())))
+    print('Shared snapshot: ' + str(round(results.get('shared_snapshot'), 3)) + 's')
+    print('Direct queries (no snapshot): ' + str(round(results.get('direct_queries'), 3)) + 's')
+    print('Speedup: ' + str(round(results.get('speedup'), 2)) + 'x')
+    print('#' * 80)
+    return results
+
 
 # Checklist Functions Start Here ================================================================
+# The checks are performed by "gt_render_checklist_logic", the functions below update the window and create the patch functions
+
+def get_item_id(item_name):
+    ''' Returns the ID used by the status button and output text of an item. e.g. "Frame Rate" > "frame_rate" '''
+    return item_name.lower().replace(" ","_").replace("-","_")
+
+
+def update_checklist_item(result, patch_function=None):
+    '''
+    Updates the status button and output text of an item using the result of a check
+
+            Parameters:
+                    result (dict): Result returned by a check (see "gt_render_checklist_logic")
+                    patch_function (function): Called when clicking on the status of warnings and errors
+    '''
+    item_id = get_item_id(result.get('name'))
+    status = result.get('status')
+    message = result.get('message')
+
+    if status == 'pass':
+        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message(message))
+    elif status == 'warning':
+        cmds.button("status_" + item_id, e=True, bgc=warning_color, l= '', c=lambda args: patch_function())
+    elif status == 'error':
+        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: patch_function())
+    else: # Exception
+        cmds.button("status_" + item_id, e=True, bgc=exception_color, l= '', c=lambda args: print_message(message, as_warning=True))
+
+    cmds.text("output_" + item_id, e=True, l=result.get('output') )
+
+
+def warning_dialog(result, extra_buttons=None, bottom_message=''):
+    '''
+    Shows the message of a check in a warning dialog ("OK", extra buttons and "Ignore Warning" or "Ignore Issue")
+
+            Parameters:
+                    result (dict): Result returned by a check (see "gt_render_checklist_logic")
+                    extra_buttons (list): Buttons added between "OK" and the ignore button. e.g. ['Select Ngons']
+                    bottom_message (string): Text added to the end of the message
+
+            Returns:
+                    user_input (string): Button clicked by the user
+    '''
+    extra_buttons = extra_buttons or []
+    item_id = get_item_id(result.get('name'))
+    cancel_message = 'Ignore Issue'
+    if result.get('status') == 'warning':
+        cancel_message = 'Ignore Warning'
+
+    buttons = ['OK']
+    buttons.extend(extra_buttons)
+    buttons.append(cancel_message)
+
+    user_input = cmds.confirmDialog(
+                title=result.get('name'),
+                message=result.get('message') + bottom_message,
+                button=buttons,
+                defaultButton='OK',
+                cancelButton=cancel_message,
+                dismissString=cancel_message,
+                icon="warning")
+
+    if user_input == 'Ignore Warning':
+        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '')
+    elif user_input not in extra_buttons:
+        cmds.button("status_" + item_id, e=True, l= '')
+    return user_input
+
 
 # Item 0 - Frame Rate
-def check_frame_rate():
-    item_name = checklist_items.get(0)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(0)[1]
-    received_value = cmds.currentUnit( query=True, time=True ) # Frame Rate
-    issues_found = 0
-
-    if received_value == expected_value:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message(item_name + ': '  + str(received_value).capitalize())) 
-        issues_found = 0
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: patch_frame_rate())
-        issues_found = 1
-        
-    cmds.text("output_" + item_id, e=True, l=str(received_value).capitalize() )
-    
+def check_frame_rate(snapshot=None):
+    result = checklist_logic.check_frame_rate(snapshot, checklist_items)
+    item_name = result.get('name')
+    expected_value = result.get('expected_value')
+    received_value = result.get('received_value')
+
     # Patch Function ----------------------
     def patch_frame_rate():
         user_input = cmds.confirmDialog(
@@ -582,45 +993,30 @@ def check_frame_rate():
                     button=['Yes, change it for me', 'Ignore Issue'],
                     defaultButton='Yes, change it for me',
                     cancelButton='Ignore Issue',
-                    dismissString='Ignore Issue', 
+                    dismissString='Ignore Issue',
                     icon="question")
 
         if user_input == 'Yes, change it for me':
-            try: 
+            try:
                 cmds.currentUnit( time=expected_value )
                 print("Your " + item_name.lower() + " was changed to " + expected_value)
             except:
                 cmds.warning('Failed to use custom setting "' + str(expected_value) +  '"  as your new frame rate.')
             check_frame_rate()
         else:
-            cmds.button("status_" + item_id, e=True, l= '')
-    
-    # Return string for report ------------
-    if issues_found > 0:
-        string_status = str(issues_found) + " issue found. The expected " + item_name.lower() + ' was "'  + str(expected_value).capitalize() + '" and yours is "' + str(received_value).capitalize() + '"'
-    else: 
-        string_status = str(issues_found) + " issues found. The expected " + item_name.lower() + ' was "'  + str(expected_value).capitalize() + '" and yours is "' + str(received_value).capitalize() + '"'
-    return '\n*** ' + item_name + " ***\n" + string_status
-    
-    
+            cmds.button("status_" + get_item_id(item_name), e=True, l= '')
+
+    update_checklist_item(result, patch_frame_rate)
+    return result
+
 
 # Item 1 - Scene Units =========================================================================
-def check_scene_units():
-    item_name = checklist_items.get(1)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(1)[1]
-    received_value = cmds.currentUnit( query=True, linear=True )
-    issues_found = 0
-
-    if received_value.lower() == str(expected_value).lower():
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message(item_name + ': "'  + str(received_value) + '".')) 
-        issues_found = 0
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: patch_scene_units())
-        issues_found = 1
-        
-    cmds.text("output_" + item_id, e=True, l=str(received_value).capitalize() )
-    
+def check_scene_units(snapshot=None):
+    result = checklist_logic.check_scene_units(snapshot, checklist_items)
+    item_name = result.get('name')
+    expected_value = result.get('expected_value')
+    received_value = result.get('received_value')
+
     # Patch Function ----------------------
     def patch_scene_units():
         user_input = cmds.confirmDialog(
@@ -629,7 +1025,7 @@ def check_scene_units():
                     button=['Yes, change it for me', 'Ignore Issue'],
                     defaultButton='Yes, change it for me',
                     cancelButton='Ignore Issue',
-                    dismissString='Ignore Issue', 
+                    dismissString='Ignore Issue',
                     icon="question")
 
         if user_input == 'Yes, change it for me':
@@ -640,40 +1036,19 @@ def check_scene_units():
                 cmds.warning('Failed to use custom setting "' + str(expected_value) +  '"  as your new scene unit.')
             check_scene_units()
         else:
-            cmds.button("status_" + item_id, e=True, l= '')
+            cmds.button("status_" + get_item_id(item_name), e=True, l= '')
+
+    update_checklist_item(result, patch_scene_units)
+    return result
 
-    # Return string for report ------------
-    if issues_found > 0:
-        string_status = str(issues_found) + " issue found. The expected " + item_name.lower() + ' was "'  + str(expected_value).capitalize() + '" and yours is "' + str(received_value).capitalize() + '"'
-    else: 
-        string_status = str(issues_found) + " issues found. The expected " + item_name.lower() + ' was "'  + str(expected_value).capitalize() + '" and yours is "' + str(received_value).capitalize() + '"'
-    return '\n*** ' + item_name + " ***\n" + string_status
 
 # Item 2 - Output Resolution =========================================================================
-def check_output_resolution():
-    item_name = checklist_items[2][0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items[2][1]
-    
-    # Check Custom Value
-    custom_settings_failed = False
-    if isinstance(expected_value, list):
-        if len(expected_value) < 2:
-            custom_settings_failed = True
-            expected_value = settings_default_checklist_values[2][1]
-            
-    received_value = [cmds.getAttr("defaultResolution.width"), cmds.getAttr("defaultResolution.height")]
-    issues_found = 0
-
-    if str(received_value[0]).replace(' ','') == str(expected_value[0]).replace(' ','') and str(received_value[1]).replace(' ','') == str(expected_value[1].replace(' ','')):
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message(item_name + ': "' + str(received_value[0]) + 'x' + str(received_value[1]) + '".')) 
-        issues_found = 0
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: patch_output_resolution())
-        issues_found = 1
-        
-    cmds.text("output_" + item_id, e=True, l=str(received_value[0]) + 'x' + str(received_value[1]) )
-    
+def check_output_resolution(snapshot=None):
+    result = checklist_logic.check_output_resolution(snapshot, checklist_items)
+    item_name = result.get('name')
+    expected_value = result.get('expected_value')
+    received_value = result.get('received_value')
+
     # Patch Function ----------------------
     def patch_output_resolution():
         user_input = cmds.confirmDialog(
@@ -682,8 +1057,8 @@ def check_output_resolution():
                     button=['Yes, change it for me', 'Ignore Issue'],
                     defaultButton='Yes, change it for me',
                     cancelButton='Ignore Issue',
-                    dismissString='Ignore Issue', 
-                    icon="question")  
+                    dismissString='Ignore Issue',
+                    icon="question")
 
         if user_input == 'Yes, change it for me':
             try:
@@ -694,1630 +1069,276 @@ def check_output_resolution():
                 cmds.warning('Failed to use custom setting "' + str(expected_value[0]) + 'x' + str(expected_value[1]) + '" as your new resolution.')
             check_output_resolution()
         else:
-            cmds.button("status_" + item_id, e=True, l= '')
-            
-    # Return string for report ------------
-    if issues_found > 0:
-        string_status = str(issues_found) + " issue found. The expected " + item_name.lower() + ' was "'  + str(expected_value[0]) + 'x' + str(expected_value[1]) + '" and yours is "' + str(received_value[0]) + 'x' + str(received_value[1]) + '"'
-    else: 
-        string_status = str(issues_found) + " issues found. The expected " + item_name.lower() + ' was "'  + str(expected_value[0]) + 'x' + str(expected_value[1]) + '" and yours is "' + str(received_value[0]) + 'x' + str(received_value[1]) + '"'
-    if custom_settings_failed:
-        string_status = '1 issue found. The custom resolution settings provided couldn\'t be used to check your resolution'
-        cmds.button("status_" + item_id, e=True, bgc=exception_color, l= '', c=lambda args: print_message('The custom value provided couldn\'t be used to check the resolution.', as_warning=True))
-    return '\n*** ' + item_name + " ***\n" + string_status
+            cmds.button("status_" + get_item_id(item_name), e=True, l= '')
 
-# Item 3 - Total Texture Count =========================================================================
-def check_total_texture_count():
-    item_name = checklist_items.get(3)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(3)[1] 
-
-    received_value = 0 
-    issues_found = 0
-
-    # Check Custom Value
-    custom_settings_failed = False
-    if isinstance(expected_value[0], int) == False or isinstance(expected_value[1], int) == False:
-        custom_settings_failed = True
-
-
-    # Count Textures
-    all_file_nodes = cmds.ls(type="file")
-    for file in all_file_nodes:
-        uv_tiling_mode = cmds.getAttr(file + '.uvTilingMode')
-        if uv_tiling_mode != 0:
-            use_frame_extension = cmds.getAttr(file + '.useFrameExtension')
-            file_path = cmds.getAttr(file + ".fileTextureName")
-            
-            try:
-                import maya.app.general.fileTexturePathResolver 
-                udim_file_pattern = maya.app.general.fileTexturePathResolver.getFilePatternString(file_path, use_frame_extension, uv_tiling_mode)
-                udim_textures = maya.app.general.fileTexturePathResolver.findAllFilesForPattern(udim_file_pattern, None)
-            except:
-                udim_textures = 0
-            received_value +=len(udim_textures) 
-        else:
-            received_value +=1
-        
-    
-    # Manager Message
-    patch_message = 'Your ' + item_name.lower() + ' should be reduced from "' + str(received_value) + '" to less than "' + str(expected_value[1]) + '".\n (UDIM tiles are counted as individual textures)'
-    cancel_button = 'Ignore Issue'
-    
-    
-    if received_value <= expected_value[1] and received_value > expected_value[0]:
-        cmds.button("status_" + item_id, e=True, bgc=warning_color, l= '', c=lambda args: warning_total_texture_count()) 
-        patch_message = 'Your ' + item_name.lower() + ' is "' + str(received_value) + '" which is a high number.\nConsider optimizing. (UDIM tiles are counted as individual textures)'
-        cancel_button = 'Ignore Warning'
-        issues_found = 0
-    elif received_value <= expected_value[1]:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message(item_name + ': "'  + str(received_value) + '". (UDIM tiles are counted as individual textures)')) 
+    update_checklist_item(result, patch_output_resolution)
+    return result
 
-        issues_found = 0
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_total_texture_count())
-        issues_found = 1
-        
-    cmds.text("output_" + item_id, e=True, l=received_value )
-    
 
-    # Patch Function ----------------------
-    def warning_total_texture_count():
-        user_input = cmds.confirmDialog(
-                    title=item_name,
-                    message=patch_message,
-                    button=['OK', cancel_button],
-                    defaultButton='OK',
-                    cancelButton='Ignore Issue',
-                    dismissString='Ignore Issue', 
-                    icon="warning")
-
-        if user_input == 'Ignore Warning':
-            cmds.button("status_" + item_id, e=True, l= '', bgc=pass_color)
-        else:
-            cmds.button("status_" + item_id, e=True, l= '')
-    
-    # Return string for report ------------
-    if issues_found > 0:
-        string_status = str(issues_found) + " issue found. The expected " + item_name.lower() + ' was less than "'  + str(expected_value[1]) + '" and yours is "' + str(received_value) + '"'
-    else: 
-        string_status = str(issues_found) + " issues found. The expected " + item_name.lower() + ' was less than "'  + str(expected_value[1]) + '" and yours is "' + str(received_value) + '"'
-    if custom_settings_failed:
-        string_status = '1 issue found. The custom value provided couldn\'t be used to check your total texture count'
-        cmds.button("status_" + item_id, e=True, bgc=exception_color, l= '', c=lambda args: print_message('The custom value provided couldn\'t be used to check your total texture count', as_warning=True))
-    return '\n*** ' + item_name + " ***\n" + string_status
-    
-# Item 4 - Network File Paths =========================================================================
-def check_network_file_paths():
-    item_name = checklist_items.get(4)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(4)[1]
-    incorrect_file_nodes = []
-    
-    # Count Incorrect File Nodes
-    all_file_nodes = cmds.ls(type="file")
-    for file in all_file_nodes:
-        file_path = cmds.getAttr(file + ".fileTextureName")
-        if file_path != '':
-            file_path_no_slashes = file_path.replace('/','').replace('\\','')
-            for valid_path in expected_value:
-                if not file_path_no_slashes.startswith(valid_path.replace('/','').replace('\\','')):
-                    incorrect_file_nodes.append(file)
-        else:
-            incorrect_file_nodes.append(file)
+# Item 3 - Total Texture Count =========================================================================
+def check_total_texture_count(snapshot=None):
+    result = checklist_logic.check_total_texture_count(snapshot, checklist_items)
+    update_checklist_item(result, lambda: warning_dialog(result))
+    return result
 
 
-    if len(incorrect_file_nodes) == 0:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('All file nodes currently sourced from the network.')) 
-        issues_found = 0
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_network_file_paths())
-        issues_found = len(incorrect_file_nodes)
-        
-    cmds.text("output_" + item_id, e=True, l=len(incorrect_file_nodes) )
-    
-    # Patch Function ----------------------
-    def warning_network_file_paths():
-        user_input = cmds.confirmDialog(
-                    title=item_name,
-                    message=str(len(incorrect_file_nodes)) + ' of your file node paths aren\'t pointing to the network drive. \nPlease change their path to a network location. \n\n(Too see a list of nodes, generate a full report)',
-                    button=['OK', 'Ignore Issue'],
-                    defaultButton='OK',
-                    cancelButton='Ignore Issue',
-                    dismissString='Ignore Issue', 
-                    icon="warning")
+# Item 4 - Network File Paths =========================================================================
+def check_network_file_paths(snapshot=None):
+    result = checklist_logic.check_network_file_paths(snapshot, checklist_items)
+    update_checklist_item(result, lambda: warning_dialog(result))
+    return result
 
-        if user_input == '':
-            pass
-        else:
-            cmds.button("status_" + item_id, e=True, l= '')
-    
-    # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
-    if issues_found > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
-        for file_node in incorrect_file_nodes: 
-            string_status = string_status + '"' + file_node +  '" isn\'t pointing to the the network drive. Your texture files should be sourced from the network.\n'
-    else: 
-        string_status = str(issues_found) + ' issues found. All textures were sourced from the network'
-    return '\n*** ' + item_name + " ***\n" + string_status
 
 # Item 5 - Network Reference Paths =========================================================================
-def check_network_reference_paths():
-    item_name = checklist_items.get(5)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(5)[1]
-    incorrect_reference_nodes = []
-    
-    # Count Incorrect Reference Nodes
-    reference_list = cmds.ls(rf = True)
-    try:
-        for ref in reference_list:
-            ref_path = cmds.referenceQuery(ref, filename = True)
-            if ref_path != '':
-                ref_path_no_slashes = ref_path.replace('/','').replace('\\','')
-                for valid_path in expected_value:
-                    if not ref_path_no_slashes.startswith(valid_path.replace('/','').replace('\\','')):
-                        incorrect_reference_nodes.append(ref)
-            else:
-                incorrect_reference_nodes.append(ref)
-    except:
-        print('One of your references is not associated with a reference file!')
+def check_network_reference_paths(snapshot=None):
+    result = checklist_logic.check_network_reference_paths(snapshot, checklist_items)
+    update_checklist_item(result, lambda: warning_dialog(result))
+    return result
 
-    
-    if len(incorrect_reference_nodes) == 0:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('All file nodes currently sourced from the network.')) 
-        issues_found = 0
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_network_reference_paths())
-        issues_found = len(incorrect_reference_nodes)
-        
-    cmds.text("output_" + item_id, e=True, l=len(incorrect_reference_nodes) )
-    
-    # Patch Function ----------------------
-    def warning_network_reference_paths():
-        user_input = cmds.confirmDialog(
-                    title=item_name,
-                    message=str(len(incorrect_reference_nodes)) + ' of your reference paths aren\'t pointing to the network drive. \nPlease change their path to a network location. \n\n(Too see a list of nodes, generate a full report)',
-                    button=['OK', 'Ignore Issue'],
-                    defaultButton='OK',
-                    cancelButton='Ignore Issue',
-                    dismissString='Ignore Issue', 
-                    icon="warning")
 
-        if user_input == '':
-            pass
-        else:
-            cmds.button("status_" + item_id, e=True, l= '')
-    
-    # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
-    if issues_found > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
-        for file_node in incorrect_reference_nodes: 
-            string_status = string_status + '"' + file_node +  '" isn\'t pointing to the the network drive. Your references should be sourced from the network.\n'
-    else: 
-        string_status = str(issues_found) + ' issues found. All references were sourced from the network'
-    return '\n*** ' + item_name + " ***\n" + string_status
-    
 # Item 6 - Unparented Objects =========================================================================
-def check_unparented_objects():
-    item_name = checklist_items.get(6)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(6)[1]
-    unparented_objects = []
-
-    # Count Unparented Objects
-    geo_dag_nodes = cmds.ls(geometry=True)
-    for obj in geo_dag_nodes:
-        first_parent = cmds.listRelatives(obj, p=True, f=True) # Check if it returned something?
-        children_members = cmds.listRelatives(first_parent[0], c=True, type="transform") or []
-        parents_members = cmds.listRelatives(first_parent[0], ap=True, type="transform") or []
-        if len(children_members) + len(parents_members) == 0:
-            if cmds.nodeType(obj) != "mentalrayIblShape":
-                unparented_objects.append(obj)
-
-    if len(unparented_objects) == 0:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('No unparented objects were found.')) 
-        issues_found = 0
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_unparented_objects())
-        issues_found = len(unparented_objects)
-        
-    cmds.text("output_" + item_id, e=True, l=len(unparented_objects) )
-    
-    # Patch Function ----------------------
-    def warning_unparented_objects():
-        user_input = cmds.confirmDialog(
-                    title=item_name,
-                    message= str(len(unparented_objects)) + ' unparented object(s) found in this scene. \nIt\'s likely that these objects need to be part of a hierarchy.\n\n(Too see a list of objects, generate a full report)',
-                    button=['OK', 'Ignore Issue'],
-                    defaultButton='OK',
-                    cancelButton='Ignore Issue',
-                    dismissString='Ignore Issue', 
-                    icon="warning")
-
-        if user_input == '':
-            pass
-        else:
-            cmds.button("status_" + item_id, e=True, l= '')
-    
-    # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
-    if issues_found > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
-        for obj in unparented_objects: 
-            string_status = string_status + '"' + obj +  '" has no parent or child nodes. It should likely be part of a hierarchy.\n'
-        string_status = string_status[:-1]
-    else: 
-        string_status = str(issues_found) + ' issues found. No unparented objects were found.'
-    return '\n*** ' + item_name + " ***\n" + string_status
+def check_unparented_objects(snapshot=None):
+    result = checklist_logic.check_unparented_objects(snapshot, checklist_items)
+    update_checklist_item(result, lambda: warning_dialog(result))
+    return result
 
 
 # Item 7 - Total Triangle Count =========================================================================
-def check_total_triangle_count():
-    item_name = checklist_items.get(7)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(7)[1][1]
-    inbetween_value = checklist_items.get(7)[1][0]
-    unparented_objects = []
-    
-    # Check Custom Value
-    custom_settings_failed = False
-    if isinstance(expected_value, int) == False or isinstance(inbetween_value, int) == False:
-        custom_settings_failed = True
-
-    all_poly_count = cmds.ls(type="mesh", flatten=True)
-    scene_tri_count = 0;
-    smoothedObjCount = 0;
-    
-    for obj in all_poly_count:
-        smooth_level = cmds.getAttr(obj + ".smoothLevel")
-        smooth_state = cmds.getAttr(obj + ".displaySmoothMesh")
-        total_tri_count = cmds.polyEvaluate(obj, t=True)
-        total_edge_count = cmds.polyEvaluate(obj, e=True)
-        total_face_count = cmds.polyEvaluate(obj, f=True)
-
-        if smooth_state > 0 and smooth_level != 0:
-            one_subdiv_tri_count = (total_edge_count * 4)
-            if smooth_level > 1:
-                multi_subdiv_tri_count = one_subdiv_tri_count * (4 ** (smooth_level-1))
-                scene_tri_count = scene_tri_count + multi_subdiv_tri_count
-            else:
-                scene_tri_count += one_subdiv_tri_count
-        else:
-            scene_tri_count += total_tri_count
-                
-    if scene_tri_count < expected_value and scene_tri_count > inbetween_value:
-        cmds.button("status_" + item_id, e=True, bgc=warning_color, l= '', c=lambda args: warning_total_triangle_count())
-        issues_found = 0;
-        patch_message = 'Your scene has ' + str(scene_tri_count) + ' triangles, which is high. \nConsider optimizing it if possible.'
-        cancel_message= "Ignore Warning"
-    elif scene_tri_count < expected_value:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('Your scene has ' + str(scene_tri_count) +  ' triangles. \nGood job keeping the triangle count low!.')) 
-        issues_found = 0;
-        patch_message = ''
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_total_triangle_count())
-        issues_found = 1;
-        patch_message = 'Your scene has ' + str(scene_tri_count) + ' triangles. You should try to keep it under ' + str(expected_value) + '.\n\n' + 'In case you see a different number on your "Heads Up Display > Poly Count" option.  It\'s likely that you have "shapeOrig" nodes in your scene. These are intermediate shape nodes usually created by deformers. If you don\'t have deformations on your scene, you can delete these to reduce triangle count.\n'
-        cancel_message= "Ignore Issue"
-        
-    cmds.text("output_" + item_id, e=True, l=scene_tri_count )
-    
-    # Patch Function ----------------------
-    def warning_total_triangle_count():
-        user_input = cmds.confirmDialog(
-                    title=item_name,
-                    message= patch_message,
-                    button=['OK', cancel_message],
-                    defaultButton='OK',
-                    cancelButton=cancel_message,
-                    dismissString=cancel_message, 
-                    icon="warning")
-
-        if user_input == "Ignore Warning":
-            cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message(str(issues_found) + ' issues found. Your scene has ' + str(scene_tri_count) +  ' triangles, which is high. \nConsider optimizing it if possible.') )
-        else:
-            cmds.button("status_" + item_id, e=True, l= '')
-    
-                    
-    # Return string for report ------------
-    if scene_tri_count > inbetween_value and scene_tri_count < expected_value:
-        string_status = str(issues_found) + ' issues found. Your scene has ' + str(scene_tri_count) +  ' triangles, which is high. Consider optimizing it if possible.' 
-    elif scene_tri_count < expected_value:
-        string_status = str(issues_found) + ' issues found. Your scene has ' + str(scene_tri_count) +  ' triangles. Good job keeping the triangle count low!.' 
-    else: 
-        string_status = str(issues_found) + ' issue found. Your scene has ' + str(scene_tri_count) + ' triangles. You should try to keep it under ' + str(expected_value) + '.'
-    if custom_settings_failed:
-        string_status = '1 issue found. The custom value provided couldn\'t be used to check your total triangle count'
-        cmds.button("status_" + item_id, e=True, bgc=exception_color, l= '', c=lambda args: print_message('The custom value provided couldn\'t be used to check your total triangle count', as_warning=True))
-    return '\n*** ' + item_name + " ***\n" + string_status
+def check_total_triangle_count(snapshot=None):
+    result = checklist_logic.check_total_triangle_count(snapshot, checklist_items)
+    update_checklist_item(result, lambda: warning_dialog(result))
+    return result
+
 
 # Item 8 - Total Poly Object Count =========================================================================
-def check_total_poly_object_count():
-    item_name = checklist_items.get(8)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(8)[1][1]
-    inbetween_value = checklist_items.get(8)[1][0]
-    
-    # Check Custom Values
-    custom_settings_failed = False
-    if isinstance(expected_value, int) == False or isinstance(inbetween_value, int) == False:
-        custom_settings_failed = True
-    
-    all_polymesh = cmds.ls(type= "mesh")
-
-    if len(all_polymesh) < expected_value and len(all_polymesh) > inbetween_value:
-        cmds.button("status_" + item_id, e=True, bgc=warning_color, l= '', c=lambda args: warning_total_poly_object_count())
-        issues_found = 0;
-        patch_message = 'Your scene contains "' + str(len(all_polymesh)) + '" polygon meshes, which is a high number. \nConsider optimizing it if possible.'
-        cancel_message= "Ignore Warning"
-    elif len(all_polymesh) < expected_value:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('Your scene contains "' +str(len(all_polymesh)) + '" polygon meshes.')) 
-        issues_found = 0;
-        patch_message = ''
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_total_poly_object_count())
-        issues_found = 1;
-        patch_message = str(len(all_polymesh)) + ' polygon meshes in your scene. \nTry to keep this number under ' + str(expected_value) + '.'
-        cancel_message= "Ignore Issue"
-        
-    cmds.text("output_" + item_id, e=True, l=len(all_polymesh) )
-    
-    # Patch Function ----------------------
-    def warning_total_poly_object_count():
-        user_input = cmds.confirmDialog(
-                    title=item_name,
-                    message= patch_message,
-                    button=['OK', cancel_message],
-                    defaultButton='OK',
-                    cancelButton=cancel_message,
-                    dismissString=cancel_message, 
-                    icon="warning")
-
-        if user_input == "Ignore Warning":
-            cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message(str(issues_found) + ' issues found. Your scene contains ' + str(len(all_polymesh)) +  ' polygon meshes, which is a high number. \nConsider optimizing it if possible.') )
-        else:
-            cmds.button("status_" + item_id, e=True, l= '')
-    
-    # Return string for report ------------
-    if len(all_polymesh) < expected_value and len(all_polymesh) > inbetween_value:
-        string_status = str(issues_found) + ' issues found. Your scene contains "' +  str(len(all_polymesh)) + '" polygon meshes, which is a high number. Consider optimizing it if possible.'
-    elif len(all_polymesh) < expected_value:
-        string_status = str(issues_found) + ' issues found. Your scene contains "' + str(len(all_polymesh)) + '" polygon meshes.'
-    else: 
-        string_status = str(issues_found) + ' issue found. Your scene contains "' + str(len(all_polymesh)) + '" polygon meshes. Try to keep this number under "' + str(expected_value) + '".'
-    if custom_settings_failed:
-        string_status = '1 issue found. The custom value provided couldn\'t be used to check your total poly count'
-        cmds.button("status_" + item_id, e=True, bgc=exception_color, l= '', c=lambda args: print_message('The custom value provided couldn\'t be used to check your total poly count', as_warning=True))
-    return '\n*** ' + item_name + " ***\n" + string_status
-    
-    
+def check_total_poly_object_count(snapshot=None):
+    result = checklist_logic.check_total_poly_object_count(snapshot, checklist_items)
+    update_checklist_item(result, lambda: warning_dialog(result))
+    return result
+
+
 # Item 9 - Shadow Casting Light Count =========================================================================
-def check_shadow_casting_light_count():
-    item_name = checklist_items.get(9)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(9)[1][1]
-    inbetween_value = checklist_items.get(9)[1][0]
-    
-    # Check Custom Values
-    custom_settings_failed = False
-    if isinstance(expected_value, int) == False or isinstance(inbetween_value, int) == False:
-        custom_settings_failed = True
-    
-    all_lights = cmds.ls(lights=True)
-    shadow_casting_lights = []
-   
-    for light in all_lights:
-        shadow_state = cmds.getAttr (light + ".useRayTraceShadows")
-        if shadow_state == 1:
-            shadow_casting_lights.append(light)
-
-    if len(shadow_casting_lights) < expected_value and len(shadow_casting_lights) > inbetween_value:
-        cmds.button("status_" + item_id, e=True, bgc=warning_color, l= '', c=lambda args: warning_shadow_casting_light_count())
-        issues_found = 0;
-        patch_message = 'Your scene contains "' + str(len(shadow_casting_lights)) + '" shadow casting lights, which is a high number. \nConsider optimizing it if possible.'
-        cancel_message= "Ignore Warning"
-    elif len(shadow_casting_lights) < expected_value:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('Your scene contains "' +str(len(shadow_casting_lights)) + '" shadow casting lights.')) 
-        issues_found = 0;
-        patch_message = ''
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_shadow_casting_light_count())
-        issues_found = 1;
-        patch_message = 'Your scene contains ' + str(len(shadow_casting_lights)) + ' shadow casting lights.\nTry to keep this number under ' + str(expected_value) + '.'
-        cancel_message= "Ignore Issue"
-        
-    cmds.text("output_" + item_id, e=True, l=len(shadow_casting_lights) )
-    
-    # Patch Function ----------------------
-    def warning_shadow_casting_light_count():
-        user_input = cmds.confirmDialog(
-                    title=item_name,
-                    message= patch_message,
-                    button=['OK', cancel_message],
-                    defaultButton='OK',
-                    cancelButton=cancel_message,
-                    dismissString=cancel_message, 
-                    icon="warning")
-
-        if user_input == "Ignore Warning":
-            cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message(str(issues_found) + ' issues found. Your scene contains ' + str(len(shadow_casting_lights)) +  ' shadow casting lights, which is a high number. \nConsider optimizing it if possible.') )
-        else:
-            cmds.button("status_" + item_id, e=True, l= '')
-    
-    # Return string for report ------------
-    if len(shadow_casting_lights) < expected_value and len(shadow_casting_lights) > inbetween_value:
-        string_status = str(issues_found) + ' issues found. Your scene contains "' +  str(len(shadow_casting_lights)) + '" shadow casting lights, which is a high number. Consider optimizing it if possible.'
-    elif len(shadow_casting_lights) < expected_value:
-        string_status = str(issues_found) + ' issues found. Your scene contains "' + str(len(shadow_casting_lights)) + '" shadow casting lights.'
-    else: 
-        string_status = str(issues_found) + ' issue found. Your scene contains "' + str(len(shadow_casting_lights)) + '" shadow casting lights, you should keep this number under "' + str(expected_value) + '".'
-    if custom_settings_failed:
-        string_status = '1 issue found. The custom value provided couldn\'t be used to check your shadow casting lights.'
-        cmds.button("status_" + item_id, e=True, bgc=exception_color, l= '', c=lambda args: print_message('The custom value provided couldn\'t be used to check your shadow casting lights.', as_warning=True))
-    return '\n*** ' + item_name + " ***\n" + string_status
-    
-    
+def check_shadow_casting_light_count(snapshot=None):
+    result = checklist_logic.check_shadow_casting_light_count(snapshot, checklist_items)
+    update_checklist_item(result, lambda: warning_dialog(result))
+    return result
+
+
 # Item 10 - Redshift Shadow Casting Light Count =========================================================================
-def check_rs_shadow_casting_light_count():
-    item_name = checklist_items.get(10)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(10)[1][1]
-    inbetween_value = checklist_items.get(10)[1][0]
-    
-    # Check Custom Values
-    custom_settings_failed = False
-    if isinstance(expected_value, int) == False or isinstance(inbetween_value, int) == False:
-        custom_settings_failed = True
-    
-    rs_physical_type = "RedshiftPhysicalLight" # Used to check if Redshift is loaded
-    
-    node_types = cmds.ls(nodeTypes=True)
-    
-    if rs_physical_type in node_types: # is RS loaded?
-    
-        rs_physical = cmds.ls(type=rs_physical_type)
-        rs_photometric = cmds.ls(type="RedshiftIESLight")
-        rs_portal = cmds.ls(type="RedshiftPortalLight")
-        rs_dome = cmds.ls(type="RedshiftDomeLight")
-        
-        all_rs_lights = []
-        all_rs_lights.extend(rs_physical)
-        all_rs_lights.extend(rs_photometric)
-        all_rs_lights.extend(rs_portal)
-        all_rs_lights.extend(rs_dome)
-        
-        rs_shadow_casting_lights = []
-       
-        for rs_light in all_rs_lights:
-            if rs_light != "<done>":
-                if cmds.objectType(rs_light) != "RedshiftPortalLight": # For some odd reason portal lights use an attribute called "shadows" instead of "shadow"
-                    rs_shadow_state = cmds.getAttr (rs_light + ".shadow")
-                else:
-                    rs_shadow_state = cmds.getAttr (rs_light + ".shadows")
-                if rs_shadow_state == 1:
-                    rs_shadow_casting_lights.append(rs_light)
-      
-       
-        if len(rs_shadow_casting_lights) < expected_value and len(rs_shadow_casting_lights) > inbetween_value:
-            cmds.button("status_" + item_id, e=True, bgc=warning_color, l= '', c=lambda args: warning_rs_shadow_casting_light_count())
-            issues_found = 0;
-            patch_message = 'Your scene contains "' + str(len(rs_shadow_casting_lights)) + '" Redshift shadow casting lights, which is a high number. \nConsider optimizing it if possible.'
-            cancel_message= "Ignore Warning"
-        elif len(rs_shadow_casting_lights) < expected_value:
-            cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('Your scene contains "' +str(len(rs_shadow_casting_lights)) + '" Redshift shadow casting lights.')) 
-            issues_found = 0;
-            patch_message = ''
-        else: 
-            cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_rs_shadow_casting_light_count())
-            issues_found = 1;
-            patch_message = 'Your scene contains ' + str(len(rs_shadow_casting_lights)) + ' Redshift shadow casting lights.\nTry to keep this number under ' + str(expected_value) + '.'
-            cancel_message= "Ignore Issue"
-            
-        cmds.text("output_" + item_id, e=True, l=len(rs_shadow_casting_lights) )
-        
-        # Patch Function ----------------------
-        def warning_rs_shadow_casting_light_count():
-            user_input = cmds.confirmDialog(
-                        title=item_name,
-                        message= patch_message,
-                        button=['OK', cancel_message],
-                        defaultButton='OK',
-                        cancelButton=cancel_message,
-                        dismissString=cancel_message, 
-                        icon="warning")
-
-            if user_input == "Ignore Warning":
-                cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message(str(issues_found) + ' issues found. Your scene contains ' + str(len(rs_shadow_casting_lights)) +  ' Redshift shadow casting lights, which is a high number. \nConsider optimizing it if possible.') )
-            else:
-                cmds.button("status_" + item_id, e=True, l= '')
-        
-        # Return string for report ------------
-        if len(rs_shadow_casting_lights) < expected_value and len(rs_shadow_casting_lights) > inbetween_value:
-            string_status = str(issues_found) + ' issues found. Your scene contains "' +  str(len(rs_shadow_casting_lights)) + '" Redshift shadow casting lights, which is a high number. Consider optimizing it if possible.'
-        elif len(rs_shadow_casting_lights) < expected_value:
-            string_status = str(issues_found) + ' issues found. Your scene contains "' + str(len(rs_shadow_casting_lights)) + '" Redshift shadow casting lights.'
-        else: 
-            string_status = str(issues_found) + ' issue found. Your scene contains "' + str(len(rs_shadow_casting_lights)) + '" Redshift shadow casting lights, you should keep this number under "' + str(expected_value) + '".'
-        if custom_settings_failed:
-            string_status = '1 issue found. The custom value provided couldn\'t be used to check your Redshift shadow casting lights.'
-            cmds.button("status_" + item_id, e=True, bgc=exception_color, l= '', c=lambda args: print_message('The custom value provided couldn\'t be used to check your Redshift shadow casting lights.', as_warning=True))
-        return '\n*** ' + item_name + " ***\n" + string_status
-    else:
-        cmds.button("status_" + item_id, e=True, bgc=exception_color, l= '', c=lambda args: print_message('No Redshift light types exist in the scene. Redshift plugin doesn\'t seem to be loaded.', as_warning=True))
-        cmds.text("output_" + item_id, e=True, l='No Redshift' )
-        return '\n*** ' + item_name + " ***\n" + '0 issues found, but no Redshift light types exist in the scene. Redshift plugin doesn\'t seem to be loaded.'
+def check_rs_shadow_casting_light_count(snapshot=None):
+    result = checklist_logic.check_rs_shadow_casting_light_count(snapshot, checklist_items)
+    update_checklist_item(result, lambda: warning_dialog(result))
+    return result
+
 
 # Item 11 - Arnold Shadow Casting Light Count =========================================================================
-def check_ai_shadow_casting_light_count():
-    item_name = checklist_items.get(11)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(11)[1][1]
-    inbetween_value = checklist_items.get(11)[1][0]
-    
-    # Check Custom Values
-    custom_settings_failed = False
-    if isinstance(expected_value, int) == False or isinstance(inbetween_value, int) == False:
-        custom_settings_failed = True
-    
-    ai_physical_type = "aiAreaLight" # Used to check if Arnold is loaded
-    
-    node_types = cmds.ls(nodeTypes=True)
+def check_ai_shadow_casting_light_count(snapshot=None):
+    result = checklist_logic.check_ai_shadow_casting_light_count(snapshot, checklist_items)
+    update_checklist_item(result, lambda: warning_dialog(result))
+    return result
 
-    if ai_physical_type in node_types: # is Arnold loaded?
-    
-        ai_sky_dome = cmds.ls(type="aiSkyDomeLight")
-        ai_mesh = cmds.ls(type="aiMeshLight")
-        ai_photometric = cmds.ls(type="aiPhotometricLight")
-        ai_area = cmds.ls(type=ai_physical_type)
-        #ai_portal = cmds.ls(type="aiLightPortal")
-        
-        all_ai_lights = []
-        all_ai_lights.extend(ai_sky_dome)
-        all_ai_lights.extend(ai_mesh)
-        all_ai_lights.extend(ai_photometric)
-        all_ai_lights.extend(ai_area)
-        #all_ai_lights.extend(ai_portal)
-        
-        ai_shadow_casting_lights = []
-       
-        for ai_light in all_ai_lights :
-            rs_shadow_state = cmds.getAttr (ai_light + ".aiCastShadows")
-            if rs_shadow_state == 1:
-                ai_shadow_casting_lights.append(ai_light)
-      
-       
-        if len(ai_shadow_casting_lights) < expected_value and len(ai_shadow_casting_lights) > inbetween_value:
-            cmds.button("status_" + item_id, e=True, bgc=warning_color, l= '', c=lambda args: warning_ai_shadow_casting_light_count())
-            issues_found = 0;
-            patch_message = 'Your scene contains "' + str(len(ai_shadow_casting_lights)) + '" Arnold shadow casting lights, which is a high number. \nConsider optimizing it if possible.'
-            cancel_message= "Ignore Warning"
-        elif len(ai_shadow_casting_lights) < expected_value:
-            cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('Your scene contains "' +str(len(ai_shadow_casting_lights)) + '" Arnold shadow casting lights.')) 
-            issues_found = 0;
-            patch_message = ''
-        else: 
-            cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_ai_shadow_casting_light_count())
-            issues_found = 1;
-            patch_message = 'Your scene contains ' + str(len(ai_shadow_casting_lights)) + ' Arnold shadow casting lights.\nTry to keep this number under ' + str(expected_value) + '.'
-            cancel_message= "Ignore Issue"
-            
-        cmds.text("output_" + item_id, e=True, l=len(ai_shadow_casting_lights) )
-        
-        # Patch Function ----------------------
-        def warning_ai_shadow_casting_light_count():
-            user_input = cmds.confirmDialog(
-                        title=item_name,
-                        message= patch_message,
-                        button=['OK', cancel_message],
-                        defaultButton='OK',
-                        cancelButton=cancel_message,
-                        dismissString=cancel_message, 
-                        icon="warning")
-
-            if user_input == "Ignore Warning":
-                cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message(str(issues_found) + ' issues found. Your scene contains ' + str(len(ai_shadow_casting_lights)) +  ' Arnold shadow casting lights, which is a high number. \nConsider optimizing it if possible.') )
-            else:
-                cmds.button("status_" + item_id, e=True, l= '')
-        
-        # Return string for report ------------
-        if len(ai_shadow_casting_lights) < expected_value and len(ai_shadow_casting_lights) > inbetween_value:
-            string_status = str(issues_found) + ' issues found. Your scene contains "' +  str(len(ai_shadow_casting_lights)) + '" Arnold shadow casting lights, which is a high number. Consider optimizing it if possible.'
-        elif len(ai_shadow_casting_lights) < expected_value:
-            string_status = str(issues_found) + ' issues found. Your scene contains "' + str(len(ai_shadow_casting_lights)) + '" Arnold shadow casting lights.'
-        else: 
-            string_status = str(issues_found) + ' issue found. Your scene contains "' + str(len(ai_shadow_casting_lights)) + '" Arnold shadow casting lights, you should keep this number under "' + str(expected_value) + '".'
-        if custom_settings_failed:
-            string_status = '1 issue found. The custom value provided couldn\'t be used to check your Arnold shadow casting lights.'
-            cmds.button("status_" + item_id, e=True, bgc=exception_color, l= '', c=lambda args: print_message('The custom value provided couldn\'t be used to check your Arnold shadow casting lights.', as_warning=True))
-        return '\n*** ' + item_name + " ***\n" + string_status
-    else:
-        cmds.button("status_" + item_id, e=True, bgc=exception_color, l= '', c=lambda args: print_message('No Arnold light types exist in the scene. Arnold plugin doesn\'t seem to be loaded.', as_warning=True))
-        cmds.text("output_" + item_id, e=True, l='No Arnold' )
-        return '\n*** ' + item_name + " ***\n" + '0 issues found, but no Arnold light types exist in the scene. Arnold plugin doesn\'t seem to be loaded.'
-
-# Item 12 - Default Object Names ========================================================================= 
-def check_default_object_names():
-    item_name = checklist_items.get(12)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(12)[1]
-    
-    offending_objects = []
-    possible_offenders = []
-
-    default_object_names = ["nurbsSphere", "nurbsCube", "nurbsCylinder", "nurbsCone",\
-     "nurbsPlane", "nurbsTorus", "nurbsCircle", "nurbsSquare", "pSphere", "pCube", "pCylinder",\
-     "pCone", "pPlane", "pTorus", "pPrism", "pPyramid", "pPipe", "pHelix", "pSolid", "rsPhysicalLight",\
-     "rsIESLight", "rsPortalLight", "aiAreaLight" ,"rsDomeLight", "aiPhotometricLight", "aiLightPortal", \
-     "ambientLight", "directionalLight", "pointLight", "spotLight", "areaLight", "volumeLight"]
-     
-    all_objects = cmds.ls(lt=True, lf=True, g=True)
-    
-    for obj in all_objects:
-        for def_name in default_object_names:
-            if obj.startswith(def_name):
-                offending_objects.append(obj)
-            elif def_name in obj:
-                possible_offenders.append(obj)
-    
-    # Manage Strings
-    if len(possible_offenders) == 1:
-        patch_message_warning = str(len(possible_offenders)) + ' object contains a string extremelly similar to the default names.\n(Ignore this warning if the name describes your object properly)'
-    else:
-        patch_message_warning = str(len(possible_offenders)) + ' objects contain a string extremelly similar to the default names.\n(Ignore this warning if the name describes your object properly)'
-    
-    if len(offending_objects) == 1:
-        patch_message_error = str(len(offending_objects)) + ' object was not named properly. \nPlease rename your objects descriptively.'
-    else:
-        patch_message_error = str(len(offending_objects)) + ' objects were not named properly. \nPlease rename your objects descriptively.'
-    
-    # Manage Buttons
-    if len(possible_offenders) != 0 and len(offending_objects) == 0:
-        cmds.button("status_" + item_id, e=True, bgc=warning_color, l= '', c=lambda args: warning_default_object_names()) 
-        issues_found = 0
-    elif len(offending_objects) == 0:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('No unnamed objects were found, well done!')) 
-        issues_found = 0
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_default_object_names())
-        issues_found = len(offending_objects)
-    
-    # Manage Message
-    patch_message = ''
-    cancel_message = 'Ignore Issue'
-            
-    if len(possible_offenders) != 0 and len(offending_objects) == 0:
-        cmds.text("output_" + item_id, e=True, l='[ ' + str(len(possible_offenders)) + ' ]' )
-        patch_message = patch_message_warning
-        cancel_message = 'Ignore Warning'
-    elif len(possible_offenders) == 0:
-        cmds.text("output_" + item_id, e=True, l=str(len(offending_objects)))
-        patch_message = patch_message_error
-    else:
-        cmds.text("output_" + item_id, e=True, l=str(len(offending_objects)) + ' + [ ' + str(len(possible_offenders)) + ' ]' )
-        patch_message = patch_message_error + '\n\n' + patch_message_warning
-        return_message = patch_message_error + '\n' + patch_message_warning
-        
-    # Patch Function ----------------------
-    def warning_default_object_names():
-        user_input = cmds.confirmDialog(
-                    title=item_name,
-                    message= patch_message,
-                    button=['OK', cancel_message],
-                    defaultButton='OK',
-                    cancelButton='Ignore Issue',
-                    dismissString='Ignore Issue', 
-                    icon="warning")
 
-        if user_input == 'Ignore Warning':
-            cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: warning_default_object_names()) 
-        else:
-            cmds.button("status_" + item_id, e=True, l= '')
-    
-    # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
-    if issues_found > 0 or len(possible_offenders) > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
-        for obj in offending_objects: 
-            string_status = string_status + '"' + obj +  '" was not named properly. Please rename your object descriptively.\n'
-        if len(offending_objects) != 0 and len(possible_offenders) == 0:
-            string_status = string_status[:-1]
-        
-        for obj in possible_offenders: 
-            string_status = string_status + '"' + obj +  '"  contains a string extremelly similar to the default names.\n'
-        if len(possible_offenders) != 0:
-            string_status = string_status[:-1]
-    else: 
-        string_status = str(issues_found) + ' issues found. No unnamed objects were found, well done!'
-    return '\n*** ' + item_name + " ***\n" + string_status
+# Item 12 - Default Object Names =========================================================================
+def check_default_object_names(snapshot=None):
+    result = checklist_logic.check_default_object_names(snapshot, checklist_items)
+    update_checklist_item(result, lambda: warning_dialog(result))
+    return result
 
 
 # Item 13 - Objects Assigned to lambert1 =========================================================================
-def check_objects_assigned_to_lambert1():
-    item_name = checklist_items.get(13)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(13)[1]
-    
-    lambert1_objects = cmds.sets("initialShadingGroup", q=True) or []
-    
-    if len(lambert1_objects) == 0:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('No objects were assigned to lambert1.')) 
-        issues_found = 0
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_objects_assigned_to_lambert1())
-        issues_found = len(lambert1_objects)
-        
-    cmds.text("output_" + item_id, e=True, l=len(lambert1_objects) )
-    
-    if len(lambert1_objects) == 1:
-        patch_message = str(len(lambert1_objects)) + ' object is assigned to lambert1. \nMake sure no objects are assigned to lambert1.\n\n(Too see a list of objects, generate a full report)'
-    else:
-        patch_message = str(len(lambert1_objects)) + ' objects are assigned to lambert1. \nMake sure no objects are assigned to lambert1.\n\n(Too see a list of objects, generate a full report)'
-    
-    # Patch Function ----------------------
-    def warning_objects_assigned_to_lambert1():
-        user_input = cmds.confirmDialog(
-                    title=item_name,
-                    message= patch_message,
-                    button=['OK', 'Ignore Issue'],
-                    defaultButton='OK',
-                    cancelButton='Ignore Issue',
-                    dismissString='Ignore Issue', 
-                    icon="warning")
+def check_objects_assigned_to_lambert1(snapshot=None):
+    result = checklist_logic.check_objects_assigned_to_lambert1(snapshot, checklist_items)
+    update_checklist_item(result, lambda: warning_dialog(result))
+    return result
 
-        if user_input == '':
-            pass
-        else:
-            cmds.button("status_" + item_id, e=True, l= '')
-    
-    # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
-    if issues_found > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
-        for obj in lambert1_objects: 
-            string_status = string_status + '"' + obj +  '"  is assigned to lambert1. It should be assigned to another shader.\n'
-        string_status = string_status[:-1]
-    else: 
-        string_status = str(issues_found) + ' issues found. No objects are assigned to lambert1.'
-    return '\n*** ' + item_name + " ***\n" + string_status
 
 # Item 14 - Ngons =========================================================================
-def check_ngons():
-    item_name = checklist_items.get(14)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(14)[1]
-    
+def check_ngons(snapshot=None):
+    result = checklist_logic.check_ngons(snapshot, checklist_items)
 
-    ngon_mel_command = 'string $ngons[] = `polyCleanupArgList 3 { "1","2","1","0","1","0","0","0","0","1e-005","0","1e-005","0","1e-005","0","-1","0" }`;'
-    ngons_list = mel.eval(ngon_mel_command)
-    cmds.select(clear=True)
-    
-    print('') # Clear Any Warnings
- 
-
-    if len(ngons_list) == 0:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('No ngons were found in your scene. Good job!')) 
-        issues_found = 0
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_ngons())
-        issues_found = len(ngons_list)
-        
-    cmds.text("output_" + item_id, e=True, l=len(ngons_list) )
-    
-    if len(ngons_list) == 1:
-        patch_message = str(len(ngons_list)) + ' ngon found in your scene. \nMake sure no faces have more than 4 sides.\n\n(Too see a list of objects, generate a full report)'
-    else:
-        patch_message = str(len(ngons_list)) + ' ngons found in your scene. \nMake sure no faces have more than 4 sides.\n\n(Too see a list of objects, generate a full report)'
-    
     # Patch Function ----------------------
     def warning_ngons():
-        user_input = cmds.confirmDialog(
-                    title=item_name,
-                    message= patch_message,
-                    button=['OK', 'Select Ngons', 'Ignore Issue' ],
-                    defaultButton='OK',
-                    cancelButton='Ignore Issue',
-                    dismissString='Ignore Issue', 
-                    icon="warning")
-
+        user_input = warning_dialog(result, ['Select Ngons'])
         if user_input == 'Select Ngons':
-            ngons_list = mel.eval(ngon_mel_command)
-        else:
-            cmds.button("status_" + item_id, e=True, l= '')
-    
-    # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
-    if issues_found > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
-        for obj in ngons_list: 
-            string_status = string_status + '"' + obj +  '"  is an ngon (face with more than 4 sides).\n'
-        string_status = string_status[:-1]
-    else: 
-        string_status = str(issues_found) + ' issues found. No ngons were found in your scene.'
-    return '\n*** ' + item_name + " ***\n" + string_status
+            cmds.select(result.get('nodes'))
+
+    update_checklist_item(result, warning_ngons)
+    return result
+
 
 # Item 15 - Non-manifold Geometry =========================================================================
-def check_non_manifold_geometry():
-    item_name = checklist_items.get(15)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(15)[1]
-    
-    nonmanifold_geo = []
-    nonmanifold_verts = []
-    
-    all_geo = cmds.ls(type='mesh', long=True)
-
-    for geo in all_geo:
-        obj_non_manifold_verts = cmds.polyInfo(geo, nmv=True) or []
-        if len(obj_non_manifold_verts) > 0:
-            nonmanifold_geo.append(geo)
-            nonmanifold_verts.append(obj_non_manifold_verts)
-
-    if len(nonmanifold_geo) == 0:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('No objects with non-manifold geometry in your scene. Well Done!')) 
-        issues_found = 0
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_non_manifold_geometry())
-        issues_found = len(nonmanifold_geo)
-        
-    cmds.text("output_" + item_id, e=True, l=len(nonmanifold_geo) )
-    
-    if len(nonmanifold_geo) == 1:
-        patch_message = str(len(nonmanifold_geo)) + ' object with non-manifold geometry was found in your scene. \n\n(Too see a list of objects, generate a full report)'
-    else:
-        patch_message = str(len(nonmanifold_geo)) + ' objects with non-manifold geometry were found in your scene. \n\n(Too see a list of objects, generate a full report)'
-    
+def check_non_manifold_geometry(snapshot=None):
+    result = checklist_logic.check_non_manifold_geometry(snapshot, checklist_items)
+
     # Patch Function ----------------------
     def warning_non_manifold_geometry():
-        user_input = cmds.confirmDialog(
-                    title=item_name,
-                    message= patch_message,
-                    button=['OK', 'Select Non-manifold Vertices', 'Ignore Issue' ],
-                    defaultButton='OK',
-                    cancelButton='Ignore Issue',
-                    dismissString='Ignore Issue', 
-                    icon="warning")
-                    
-        
+        user_input = warning_dialog(result, ['Select Non-manifold Vertices'])
         if user_input == 'Select Non-manifold Vertices':
             cmds.select(clear=True)
-            for verts in nonmanifold_verts:
-                    cmds.select(verts, add=True)
-        else:
-            cmds.button("status_" + item_id, e=True, l= '')
-    
-    # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
-    if issues_found > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
-        for obj in nonmanifold_geo: 
-            string_status = string_status + '"' + get_short_name(obj) +  '"  has non-manifold geometry.\n'
-        string_status = string_status[:-1]
-    else: 
-        string_status = str(issues_found) + ' issues found. No non-manifold geometry found in your scene.'
-    return '\n*** ' + item_name + " ***\n" + string_status
+            for verts in result.get('non_manifold_vertices'):
+                cmds.select(verts, add=True)
+
+    update_checklist_item(result, warning_non_manifold_geometry)
+    return result
+
 
 # Item 16 - Empty UV Sets =========================================================================
-def check_empty_uv_sets():
-    item_name = checklist_items.get(16)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(16)[1]
-    
-    objects_extra_empty_uv_sets = []
-    objects_single_empty_uv_sets = []
-    
-    all_geo = cmds.ls(type='mesh')
-    
-    for obj in all_geo:
-        all_uv_sets = cmds.polyUVSet(obj, q=True, allUVSets=True) or []
-        if len(all_uv_sets) > 1:
-            for uv_set in all_uv_sets:
-                uv_count = cmds.polyEvaluate(obj, uv=True, uvs=uv_set)
-                if uv_count == 0:
-                    objects_extra_empty_uv_sets.append(obj)
-        else:
-            for uv_set in all_uv_sets:
-                uv_count = cmds.polyEvaluate(obj, uv=True, uvs=uv_set)
-                if uv_count == 0:
-                    objects_single_empty_uv_sets.append(obj)
-
-    if len(objects_extra_empty_uv_sets) == 0:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('No empty UV sets.')) 
-        issues_found = 0
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_empty_uv_sets())
-        issues_found = len(objects_extra_empty_uv_sets)
-        
-    cmds.text("output_" + item_id, e=True, l=len(objects_extra_empty_uv_sets) )
-    
-    if len(objects_extra_empty_uv_sets) == 1:
-        patch_message = str(len(objects_extra_empty_uv_sets)) + ' object found contaning multiple UV Sets and empty UV Sets. \n\n(Too see a list of objects, generate a full report)'
-    else:
-        patch_message = str(len(objects_extra_empty_uv_sets)) + ' objects found contaning multiple UV Sets and empty UV Sets. \n\n(Too see a list of objects, generate a full report)'
-    
+def check_empty_uv_sets(snapshot=None):
+    result = checklist_logic.check_empty_uv_sets(snapshot, checklist_items)
+
     # Patch Function ----------------------
     def warning_empty_uv_sets():
-        user_input = cmds.confirmDialog(
-                    title=item_name,
-                    message= patch_message,
-                    button=['OK', 'Select Objects with Empty UV Sets', 'Ignore Issue' ],
-                    defaultButton='OK',
-                    cancelButton='Ignore Issue',
-                    dismissString='Ignore Issue', 
-                    icon="warning")
-                    
-        
+        user_input = warning_dialog(result, ['Select Objects with Empty UV Sets'])
         if user_input == 'Select Objects with Empty UV Sets':
             cmds.select(clear=True)
-            for obj in objects_extra_empty_uv_sets:
+            for obj in result.get('nodes'):
                 object_transform = cmds.listRelatives(obj, allParents=True, type='transform') or []
                 if len(object_transform) > 0:
                     cmds.select(object_transform, add=True)
                 else:
                     cmds.select(obj, add=True)
-        else:
-            cmds.button("status_" + item_id, e=True, l= '')
-    
-    # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
-    if issues_found > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
-        for obj in objects_extra_empty_uv_sets: 
-            string_status = string_status + '"' + obj +  '" has multiple UV Sets and Empty UV Sets.\n'
-        string_status = string_status[:-1]
-    else: 
-        string_status = str(issues_found) + ' issues found. No geometry with multiple UV Sets and Empty UV Sets.'
-    return '\n*** ' + item_name + " ***\n" + string_status
+
+    update_checklist_item(result, warning_empty_uv_sets)
+    return result
 
 
 # Item 17 - Frozen Transforms =========================================================================
-def check_frozen_transforms():
-    item_name = checklist_items.get(17)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(17)[1]
-    
-    objects_no_frozen_transforms = []
-    
-    all_transforms = cmds.ls(type='transform')
-        
-    for transform in all_transforms:
-        children = cmds.listRelatives(transform, c=True, pa=True) or []
-        for child in children:
-            object_type = cmds.objectType(child)
-            if object_type == 'mesh' or object_type == 'nurbsCurve':
-                if cmds.getAttr(transform + ".rotateX") != 0 or cmds.getAttr(transform + ".rotateY") != 0 or cmds.getAttr(transform + ".rotateZ") != 0:
-                    if len(cmds.listConnections(transform + ".rotateX") or []) == 0 and len(cmds.listConnections(transform + ".rotateY") or []) == 0 and len(cmds.listConnections(transform + ".rotateZ") or []) == 0 and len(cmds.listConnections(transform + ".rotate") or []) == 0:
-                        objects_no_frozen_transforms.append(transform)
-                       
-    if len(objects_no_frozen_transforms) == 0:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('No empty UV sets.')) 
-        issues_found = 0
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=warning_color, l= '?', c=lambda args: warning_frozen_transforms())
-        issues_found = len(objects_no_frozen_transforms)
-        
-    cmds.text("output_" + item_id, e=True, l=len(objects_no_frozen_transforms) )
-    
-    if len(objects_no_frozen_transforms) == 1:
-        patch_message = str(len(objects_no_frozen_transforms)) + ' object has un-frozen transformations. \n\n(Too see a list of objects, generate a full report)'
-    else:
-        patch_message = str(len(objects_no_frozen_transforms)) + ' objects have un-frozen transformations. \n\n(Too see a list of objects, generate a full report)'
-    
+def check_frozen_transforms(snapshot=None):
+    result = checklist_logic.check_frozen_transforms(snapshot, checklist_items)
+
     # Patch Function ----------------------
     def warning_frozen_transforms():
-        user_input = cmds.confirmDialog(
-                    title=item_name,
-                    message= patch_message,
-                    button=['OK', 'Select Objects with un-frozen transformations', 'Ignore Warning' ],
-                    defaultButton='OK',
-                    cancelButton='Ignore Warning',
-                    dismissString='Ignore Warning', 
-                    icon="warning")
-                    
+        user_input = warning_dialog(result, ['Select Objects with un-frozen transformations'])
         if user_input == 'Select Objects with un-frozen transformations':
-            cmds.select(objects_no_frozen_transforms)
-        elif user_input == 'Ignore Warning':
-            cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '')
-        else:
-            cmds.button("status_" + item_id, e=True, l= '')
-    
-    # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
-    if issues_found > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
-        for obj in objects_no_frozen_transforms: 
-            string_status = string_status + '"' + obj +  '" has un-frozen transformations.\n'
-        string_status = string_status[:-1]
-    else: 
-        string_status = str(issues_found) + ' issues found. No objects have un-frozen transformations.'
-    return '\n*** ' + item_name + " ***\n" + string_status
+            cmds.select(result.get('nodes'))
+
+    update_checklist_item(result, warning_frozen_transforms)
+    return result
+
 
 # Item 18 - Animated Visibility =========================================================================
-def check_animated_visibility():
-    item_name = checklist_items.get(18)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(18)[1]
-    
-    objects_animated_visibility = []
-    objects_hidden = []
-    
-    all_transforms = cmds.ls(type='transform')
-    
-    for transform in all_transforms:
-        attributes = cmds.listAttr(transform)
-        if 'visibility' in attributes:
-            if cmds.getAttr(transform + ".visibility") == 0:
-                children = cmds.listRelatives(transform, s=True, pa=True) or []
-                if len(children) != 0:
-                    if cmds.nodeType(children[0]) != "camera":
-                        objects_hidden.append(transform)
-        input_nodes = cmds.listConnections(transform + ".visibility", destination=False, source=True) or []
-        for node in input_nodes:
-            if 'animCurve' in cmds.nodeType(node):
-                objects_animated_visibility.append(transform)
-            
-    
-    # Manage Strings
-    cancel_message = 'Ignore Issue'
+def check_animated_visibility(snapshot=None):
+    result = checklist_logic.check_animated_visibility(snapshot, checklist_items)
+    objects_animated_visibility = result.get('nodes')
+    objects_hidden = result.get('possible_nodes')
+
     buttons_to_add = []
-    
-    if len(objects_hidden) == 1:
-        patch_message_warning = str(len(objects_hidden)) + ' object is hidden.\n'
-    else:
-        patch_message_warning = str(len(objects_hidden)) + ' objects are hidden.\n'
-    
-    if len(objects_animated_visibility) == 1:
-        patch_message_error = str(len(objects_animated_visibility)) + ' object with animated visibility.\n'
-    else:
-        patch_message_error = str(len(objects_animated_visibility)) + ' objects with animated visibility.\n'
-        
-    # Manage Message
-    patch_message = ''
-            
-    if len(objects_hidden) != 0 and len(objects_animated_visibility) == 0:
-        cmds.text("output_" + item_id, e=True, l='[ ' + str(len(objects_hidden)) + ' ]' )
-        patch_message = patch_message_warning
-        cancel_message = 'Ignore Warning'
-        buttons_to_add.append('Select Hidden Objects')
-    elif len(objects_hidden) == 0:
-        cmds.text("output_" + item_id, e=True, l=str(len(objects_animated_visibility)))
-        patch_message = patch_message_error
-        buttons_to_add.append('Select Objects With Animated Visibility')
-    else:
-        cmds.text("output_" + item_id, e=True, l=str(len(objects_animated_visibility)) + ' + [ ' + str(len(objects_hidden)) + ' ]' )
-        patch_message = patch_message_error + '\n\n' + patch_message_warning
-        return_message = patch_message_error + '\n' + patch_message_warning
+    if len(objects_hidden) != 0:
         buttons_to_add.append('Select Hidden Objects')
+    if len(objects_animated_visibility) != 0 or len(objects_hidden) == 0:
         buttons_to_add.append('Select Objects With Animated Visibility')
-    
-    assembled_message = ['OK']
-    assembled_message.extend(buttons_to_add)
-    assembled_message.append(cancel_message)
-    
-    # Manage State
-    if len(objects_hidden) != 0 and len(objects_animated_visibility) == 0:
-        cmds.button("status_" + item_id, e=True, bgc=warning_color, l= '', c=lambda args: warning_animated_visibility()) 
-        issues_found = 0
-    elif len(objects_animated_visibility) == 0:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('No objects with animated visibility or hidden.')) 
-        issues_found = 0
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_animated_visibility())
-        issues_found = len(objects_animated_visibility)
-    
-        
+
     # Patch Function ----------------------
     def warning_animated_visibility():
-        user_input = cmds.confirmDialog(
-                    title= item_name,
-                    message= patch_message,
-                    button= assembled_message,
-                    defaultButton='OK',
-                    cancelButton='Ignore Issue',
-                    dismissString='Ignore Issue', 
-                    icon="warning")
-                    
+        user_input = warning_dialog(result, buttons_to_add)
         if user_input == 'Select Objects With Animated Visibility':
             cmds.select(objects_animated_visibility)
         elif user_input == 'Select Hidden Objects':
             cmds.select(objects_hidden)
-        elif user_input == 'Ignore Warning':
-            cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '')
-        else:
-            cmds.button("status_" + item_id, e=True, l= '')
-        
-    # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
-    if issues_found > 0 or len(objects_hidden) > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
-        for obj in objects_animated_visibility: 
-            string_status = string_status + '"' + obj +  '" has animated visibility.\n'
-        if len(objects_animated_visibility) != 0 and len(objects_hidden) == 0:
-            string_status = string_status[:-1]
-        
-        for obj in objects_hidden: 
-            string_status = string_status + '"' + obj +  '" is hidden.\n'
-        if len(objects_hidden) != 0:
-            string_status = string_status[:-1]
-    else: 
-        string_status = str(issues_found) + ' issues found. No unnamed objects were found, well done!'
-    return '\n*** ' + item_name + " ***\n" + string_status
-    
-    
-    
 
-# Item 19 - Non Deformer History =========================================================================
-def check_non_deformer_history():
-    item_name = checklist_items.get(19)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(19)[1]
-    
-    objects_non_deformer_history = []
-    possible_objects_non_deformer_history = []
-    
+    update_checklist_item(result, warning_animated_visibility)
+    return result
 
-    objects_to_check = []
-    objects_to_check.extend(cmds.ls(typ='nurbsSurface') or [])
-    objects_to_check.extend(cmds.ls(typ='mesh') or [])
-    objects_to_check.extend(cmds.ls(typ='subdiv') or [])
-    objects_to_check.extend(cmds.ls(typ='nurbsCurve') or [])
-    
-    not_history_nodes = ['tweak', 'expression', 'unitConversion', 'time', 'objectSet', 'reference', 'polyTweak', 'blendShape', 'groupId', \
-    'renderLayer', 'renderLayerManager', 'shadingEngine', 'displayLayer', 'skinCluster', 'groupParts', 'mentalraySubdivApprox', 'proximityWrap',\
-    'cluster', 'cMuscleSystem', 'timeToUnitConversion', 'deltaMush', 'tension', 'wire', 'wrinkle', 'softMod', 'jiggle', 'diskCache', 'leastSquaresModifier']
-    
-    possible_not_history_nodes = ['nonLinear','ffd', 'curveWarp', 'wrap', 'shrinkWrap', 'sculpt', 'textureDeformer']
-    
-    # Find Offenders
-    for obj in objects_to_check:
-        history = cmds.listHistory(obj, pdo=1) or []
-        #Convert to string?
-        for node in history:
-            if cmds.nodeType(node) not in not_history_nodes and cmds.nodeType(node) not in possible_not_history_nodes:
-                if obj not in objects_non_deformer_history:
-                    objects_non_deformer_history.append(obj)
-            if cmds.nodeType(node) in possible_not_history_nodes:
-                if obj not in possible_objects_non_deformer_history:
-                    possible_objects_non_deformer_history.append(obj)
 
+# Item 19 - Non Deformer History =========================================================================
+def check_non_deformer_history(snapshot=None):
+    result = checklist_logic.check_non_deformer_history(snapshot, checklist_items)
+    objects_non_deformer_history = result.get('nodes')
+    possible_objects_non_deformer_history = result.get('possible_nodes')
 
-    # Manage Strings
-    cancel_message = 'Ignore Issue'
     buttons_to_add = []
-    
-    if len(possible_objects_non_deformer_history) == 1:
-        patch_message_warning = str(len(possible_objects_non_deformer_history)) + ' object contains deformers often used for modeling.\n'
-    else:
-        patch_message_warning = str(len(possible_objects_non_deformer_history)) + ' objects contain deformers often used for modeling.\n'
-    
-    if len(objects_non_deformer_history) == 1:
-        patch_message_error = str(len(objects_non_deformer_history)) + ' object contains non-deformer history.\n'
-    else:
-        patch_message_error = str(len(objects_non_deformer_history)) + ' objects contain non-deformer history.\n'
-        
-    # Manage Message
-    patch_message = ''
-            
-    if len(possible_objects_non_deformer_history) != 0 and len(objects_non_deformer_history) == 0:
-        cmds.text("output_" + item_id, e=True, l='[ ' + str(len(possible_objects_non_deformer_history)) + ' ]' )
-        patch_message = patch_message_warning
-        cancel_message = 'Ignore Warning'
+    if len(possible_objects_non_deformer_history) != 0:
         buttons_to_add.append('Select Objects With Suspicious Deformers')
-    elif len(possible_objects_non_deformer_history) == 0:
-        cmds.text("output_" + item_id, e=True, l=str(len(objects_non_deformer_history)))
-        patch_message = patch_message_error
+    if len(objects_non_deformer_history) != 0 or len(possible_objects_non_deformer_history) == 0:
         buttons_to_add.append('Select Objects With Non-deformer History')
-    else:
-        cmds.text("output_" + item_id, e=True, l=str(len(objects_non_deformer_history)) + ' + [ ' + str(len(possible_objects_non_deformer_history)) + ' ]' )
-        patch_message = patch_message_error + '\n\n' + patch_message_warning
-        return_message = patch_message_error + '\n' + patch_message_warning
-        buttons_to_add.append('Select Objects With Suspicious Deformers')
-        buttons_to_add.append('Select Objects With Non-deformer History')
-    
-    assembled_message = ['OK']
-    assembled_message.extend(buttons_to_add)
-    assembled_message.append(cancel_message)
-    
-    # Manage State
-    if len(possible_objects_non_deformer_history) != 0 and len(objects_non_deformer_history) == 0:
-        cmds.button("status_" + item_id, e=True, bgc=warning_color, l= '', c=lambda args: warning_non_deformer_history()) 
-        issues_found = 0
-    elif len(objects_non_deformer_history) == 0:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('No objects with non-deformer history were found.')) 
-        issues_found = 0
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_non_deformer_history())
-        issues_found = len(objects_non_deformer_history)
 
     # Patch Function ----------------------
     def warning_non_deformer_history():
-        user_input = cmds.confirmDialog(
-                    title= item_name,
-                    message= patch_message,
-                    button= assembled_message,
-                    defaultButton='OK',
-                    cancelButton='Ignore Issue',
-                    dismissString='Ignore Issue', 
-                    icon="warning")
-                    
+        user_input = warning_dialog(result, buttons_to_add)
         if user_input == 'Select Objects With Non-deformer History':
             cmds.select(objects_non_deformer_history)
         elif user_input == 'Select Objects With Suspicious Deformers':
             cmds.select(possible_objects_non_deformer_history)
-        elif user_input == 'Ignore Warning':
-            cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '')
-        else:
-            cmds.button("status_" + item_id, e=True, l= '')
-    
-    # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
-    if issues_found > 0 or len(possible_objects_non_deformer_history) > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
-        for obj in objects_non_deformer_history: 
-            string_status = string_status + '"' + obj +  '" contains non-deformer history.\n'
-        if len(objects_non_deformer_history) != 0 and len(possible_objects_non_deformer_history) == 0:
-            string_status = string_status[:-1]
-        
-        for obj in possible_objects_non_deformer_history: 
-            string_status = string_status + '"' + obj +  '" contains deformers often used for modeling.\n'
-        if len(possible_objects_non_deformer_history) != 0:
-            string_status = string_status[:-1]
-    else: 
-        string_status = str(issues_found) + ' issues found. No objects with non-deformer history!'
-    return '\n*** ' + item_name + " ***\n" + string_status
-    
-    
+
+    update_checklist_item(result, warning_non_deformer_history)
+    return result
+
+
 # Item 20 - Textures Color Space =========================================================================
-def check_textures_color_space():
-    item_name = checklist_items.get(20)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(20)[1]
-    
-    objects_wrong_color_space = []
-    possible_objects_wrong_color_space = []
-    
-    # These types return an error instead of warning
-    error_types = ['RedshiftMaterial','RedshiftArchitectural', 'RedshiftDisplacement', 'RedshiftColorCorrection', 'RedshiftBumpMap', 'RedshiftSkin', 'RedshiftSubSurfaceScatter',\
-    'aiStandardSurface', 'aiFlat', 'aiCarPaint', 'aiBump2d', '', 'aiToon', 'aiBump3d', 'aiAmbientOcclusion', 'displacementShader']
-        
-    # If type starts with any of these strings it will be tested
-    check_types = ['Redshift', 'ai', 'lambert', 'blinn', 'phong', 'useBackground', 'checker', 'ramp', 'volumeShader', 'displacementShader', 'anisotropic', 'bump2d'] 
-    
-    # These types and connections are allowed to be float3 even though it's raw
-    float3_to_float_exceptions = {'RedshiftBumpMap': 'input',
-                                  'RedshiftDisplacement':'texMap'}
+def check_textures_color_space(snapshot=None):
+    result = checklist_logic.check_textures_color_space(snapshot, checklist_items)
+    objects_wrong_color_space = result.get('nodes')
+    possible_objects_wrong_color_space = result.get('possible_nodes')
 
-    # Count Textures
-    all_file_nodes = cmds.ls(type="file")
-    for file in all_file_nodes:
-        color_space = cmds.getAttr(file + '.colorSpace')
-        
-        has_suspicious_connection = False
-        has_error_node_type = False
-        
-        intput_node_connections = cmds.listConnections(file, destination=True, source=False, plugs=True) or []
-        
-        suspicious_connections = []
-        possible_suspicious_connections = []
-        
-        if color_space.lower() == 'Raw'.lower():
-            for in_con in intput_node_connections:
-                node = in_con.split('.')[0]
-                node_in_con = in_con.split('.')[1]
-                
-                node_type = cmds.objectType(node)
-                
-                if node_type in error_types:
-                    has_error_node_type = True
-                
-                should_be_checked = False
-                for types in check_types:
-                    if node_type.startswith(types):
-                        should_be_checked = True
-                
-                if should_be_checked:
-                    data_type = cmds.getAttr(in_con, type=True)
-                    if data_type == 'float3' and (node_type in float3_to_float_exceptions and node_in_con in float3_to_float_exceptions.values()) == False:
-                            has_suspicious_connection = True
-                            suspicious_connections.append(in_con)
-        
-        if color_space.lower() == 'sRGB'.lower():
-            for in_con in intput_node_connections:
-                node = in_con.split('.')[0]
-                node_in_con = in_con.split('.')[1]
-                
-                node_type = cmds.objectType(node)
-                
-                if node_type in error_types:
-                    has_error_node_type = True
-                
-                should_be_checked = False
-                for types in check_types:
-                    if node_type.startswith(types):
-                        should_be_checked = True
-                
-                if should_be_checked:
-                    data_type = cmds.getAttr(in_con, type=True)
-                    if data_type == 'float':
-                            has_suspicious_connection = True
-                            suspicious_connections.append(in_con)
-                    if node_type in float3_to_float_exceptions and node_in_con in float3_to_float_exceptions.values():
-                            has_suspicious_connection = True
-                            suspicious_connections.append(in_con)
-                  
-        if has_suspicious_connection:
-            if has_error_node_type:
-                objects_wrong_color_space.append([file,suspicious_connections])
-            else:
-                possible_objects_wrong_color_space.append([file,suspicious_connections])
-           
-    
-    # Manage Strings
-    cancel_message = 'Ignore Issue'
-    buttons_to_add = []
-    bottom_message = '\n\n (For a complete list, generate a full report)'
-    
-    if len(possible_objects_wrong_color_space) == 1:
-        patch_message_warning = str(len(possible_objects_wrong_color_space)) + ' file node is using a color space that might not be appropriate for its connection.\n'
-    else:
-        patch_message_warning = str(len(possible_objects_wrong_color_space)) + ' file nodes are using a color space that might not be appropriate for its connection.\n'
-    
-    if len(objects_wrong_color_space) == 1:
-        patch_message_error = str(len(objects_wrong_color_space)) + ' file node is using a color space that is not appropriate for its connection.\n'
-    else:
-        patch_message_error = str(len(objects_wrong_color_space)) + ' file nodes are using a color space that is not appropriate for its connection.\n'
-        
-    
-    # Manage Messages
-    patch_message = ''
     might_have_issues_message = 'Select File Nodes With Possible Issues'
     has_issues_message = 'Select File Nodes With Issues'
-            
-    if len(possible_objects_wrong_color_space) != 0 and len(objects_wrong_color_space) == 0:
-        cmds.text("output_" + item_id, e=True, l='[ ' + str(len(possible_objects_wrong_color_space)) + ' ]' )
-        patch_message = patch_message_warning
-        cancel_message = 'Ignore Warning'
-        buttons_to_add.append(might_have_issues_message)
-    elif len(possible_objects_wrong_color_space) == 0:
-        cmds.text("output_" + item_id, e=True, l=str(len(objects_wrong_color_space)))
-        patch_message = patch_message_error
-        buttons_to_add.append(has_issues_message)
-    else:
-        cmds.text("output_" + item_id, e=True, l=str(len(objects_wrong_color_space)) + ' + [ ' + str(len(possible_objects_wrong_color_space)) + ' ]' )
-        patch_message = patch_message_error + '\n\n' + patch_message_warning
-        return_message = patch_message_error + '\n' + patch_message_warning
+    buttons_to_add = []
+    if len(possible_objects_wrong_color_space) != 0:
         buttons_to_add.append(might_have_issues_message)
+    if len(objects_wrong_color_space) != 0 or len(possible_objects_wrong_color_space) == 0:
         buttons_to_add.append(has_issues_message)
-    
-    assembled_message = ['OK']
-    assembled_message.extend(buttons_to_add)
-    assembled_message.append(cancel_message)
-    
-    # Manage State
-    if len(possible_objects_wrong_color_space) != 0 and len(objects_wrong_color_space) == 0:
-        cmds.button("status_" + item_id, e=True, bgc=warning_color, l= '', c=lambda args: warning_non_deformer_history()) 
-        issues_found = 0
-    elif len(objects_wrong_color_space) == 0:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('No color space issues were found.')) 
-        issues_found = 0
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_non_deformer_history())
-        issues_found = len(objects_wrong_color_space)
 
     # Patch Function ----------------------
-    def warning_non_deformer_history():
-        user_input = cmds.confirmDialog(
-                    title= item_name,
-                    message= patch_message + bottom_message,
-                    button= assembled_message,
-                    defaultButton='OK',
-                    cancelButton='Ignore Issue',
-                    dismissString='Ignore Issue', 
-                    icon="warning")
-                    
+    def warning_textures_color_space():
+        user_input = warning_dialog(result, buttons_to_add, bottom_message='\n\n (For a complete list, generate a full report)')
         if user_input == has_issues_message:
-            cmds.select(clear=True)
-            for obj in objects_wrong_color_space:
-                cmds.select(obj[0], add=True)
+            cmds.select(objects_wrong_color_space)
         elif user_input == might_have_issues_message:
-            cmds.select(clear=True)
-            for obj in possible_objects_wrong_color_space:
-                cmds.select(obj[0], add=True)
-        elif user_input == 'Ignore Warning':
-            cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '')
-        else:
-            cmds.button("status_" + item_id, e=True, l= '')
-    
-    # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
-    if issues_found > 0 or len(possible_objects_wrong_color_space) > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
-        for obj in objects_wrong_color_space: 
-            string_status = string_status + '"' + obj[0] +  '" is using a color space (' + cmds.getAttr(obj[0] + '.colorSpace') + ') that is not appropriate for its connection.\n' 
-            for connection in obj[1]:
-                string_status = string_status + '   "' + connection + '" triggered this error.\n'
-        if len(objects_wrong_color_space) != 0 and len(possible_objects_wrong_color_space) == 0:
-            string_status = string_status[:-1]
-        
-        for obj in possible_objects_wrong_color_space: 
-            string_status = string_status + '"' + obj[0] +  '" might be using a color space (' + cmds.getAttr(obj[0] + '.colorSpace') + ') that is not appropriate for its connection.\n'
-            for connection in obj[1]:
-                string_status = string_status + '   "' + connection + '" triggered this warning.\n'
-        if len(possible_objects_wrong_color_space) != 0:
-            string_status = string_status[:-1]
-    else: 
-        string_status = str(issues_found) + ' issues found. No color space issues were found!'
-    return '\n*** ' + item_name + " ***\n" + string_status
+            cmds.select(possible_objects_wrong_color_space)
 
-    
-    
-# Item 21 - Network Paths (Miscellaneous) - Other Network Paths =========================================================================
-def check_other_network_paths():
-    item_name = checklist_items.get(21)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(21)[1]
-    incorrect_path_nodes = []
-    
-    def check_paths(node_type, path_attribute_name, accepts_empty=False, checks_multiple_paths=False, multiple_paths_spliter=';'):
-        try:
-            all_provided_type_nodes = cmds.ls(type=node_type) or []
-            for node in all_provided_type_nodes:
-                file_path = cmds.getAttr(node + "." + path_attribute_name) or ''
-                
-                if checks_multiple_paths:
-                    file_path = file_path.split[multiple_paths_spliter]
-                    for one_path in file_path:
-                        if one_path != '':
-                            file_path_no_slashes = one_path.replace('/','').replace('\\','')
-                            for valid_path in expected_value:
-                                if not file_path_no_slashes.startswith(valid_path.replace('/','').replace('\\','')):
-                                    incorrect_path_nodes.append([node, node_type])
-                        else:
-                            if not accepts_empty:
-                                incorrect_path_nodes.append([node, node_type])
-                else:
-                    if file_path != '':
-                        file_path_no_slashes = file_path.replace('/','').replace('\\','')
-                        for valid_path in expected_value:
-                            if not file_path_no_slashes.startswith(valid_path.replace('/','').replace('\\','')):
-                                incorrect_path_nodes.append([node, node_type])
-                    else:
-                        if not accepts_empty:
-                            incorrect_path_nodes.append([node, node_type])
-        except:
-            print('Something went wrong when checking the attribute "' + path_attribute_name + '" in the nodes of type "' + str(node_type) + '".')
+    update_checklist_item(result, warning_textures_color_space)
+    return result
 
-            
-    node_types = cmds.ls(nodeTypes=True)
-    
-    # Count Nodes Incorrect  with Incorrect Paths
 
-    # General Checks
-    check_paths('audio', 'filename')
-    check_paths('cacheFile', 'cachePath')
-    
-    # Alembic Cache:
-    if 'AlembicNode' in node_types:
-        check_paths('AlembicNode', 'abc_File')
-    
-    # GPU Cache:
-    if 'gpuCache' in node_types:
-        check_paths('gpuCache', 'cacheFileName')
-    
-    # BIF Cache:
-    if 'BifMeshImportNode' in node_types:
-        check_paths('BifMeshImportNode', 'bifMeshDirectory')
-   
-    # MASH Checks
-    if 'MASH_Audio' in node_types:
-        check_paths('MASH_Audio', 'filename')
-    
-    # Arnold Checks
-    if 'aiAreaLight' in node_types:
-        check_paths('aiStandIn', 'dso')
-        check_paths('aiVolume', 'filename')
-        check_paths('aiPhotometricLight', 'aiFilename')
-    
-    # Redshift Checks
-    if 'RedshiftPhysicalLight' in node_types:
-        check_paths('RedshiftProxyMesh', 'fileName')
-        check_paths('RedshiftVolumeShape', 'fileName')
-        check_paths('RedshiftNormalMap', 'tex0')
-        check_paths('RedshiftDomeLight', 'tex0')
-        check_paths('RedshiftIESLight', 'profile')
-    
-    # Golaem Checks
-    if 'CrowdEntityTypeNode' in node_types:
-        check_paths('SimulationCacheProxyManager', 'destinationTerrainFile', accepts_empty=True)
-        check_paths('SimulationCacheProxyManager', 'skinningShaderFile', accepts_empty=True)
-        check_paths('CrowdEntityTypeNode', 'characterFile', accepts_empty=True)
-        check_paths('CharacterMakerLocator', 'currentFile', accepts_empty=True)
-        check_paths('TerrainLocator', 'navMeshFile', accepts_empty=True)
-        check_paths('SimulationCacheProxy', 'inputCacheDir', accepts_empty=True)
-        # Multiple Files
-        check_paths('SimulationCacheProxy', 'characterFiles', accepts_empty=True, checks_multiple_paths=True)
-        check_paths('CrowdManagerNode', 'characterFiles', accepts_empty=True, checks_multiple_paths=True)
-
-    if len(incorrect_path_nodes) == 0:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('All file nodes currently sourced from the network.')) 
-        issues_found = 0
-    else: 
-        cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_other_network_paths())
-        issues_found = len(incorrect_path_nodes)
-        
-    cmds.text("output_" + item_id, e=True, l=len(incorrect_path_nodes) )
-    
-    # Manage Message
-    string_message = ' paths aren\'t'
-    if len(incorrect_path_nodes) == 1:
-        string_message = ' path isn\'t'
-    
+# Item 21 - Network Paths (Miscellaneous) - Other Network Paths =========================================================================
+def check_other_network_paths(snapshot=None):
+    result = checklist_logic.check_other_network_paths(snapshot, checklist_items)
+
     # Patch Function ----------------------
     def warning_other_network_paths():
-        user_input = cmds.confirmDialog(
-                    title=item_name,
-                    message=str(len(incorrect_path_nodes)) + string_message + ' pointing to the network drive. \nPlease change it to a network location. \n\n(Too see a list of nodes, generate a full report)',
-                    button=['OK','Select Nodes', 'Ignore Issue'],
-                    defaultButton='OK',
-                    cancelButton='Ignore Issue',
-                    dismissString='Ignore Issue', 
-                    icon="warning")
-
+        user_input = warning_dialog(result, ['Select Nodes'])
         if user_input == 'Select Nodes':
             try:
-                only_nodes = []
-                for bad_node in incorrect_path_nodes:
-                    only_nodes.append(bad_node[0])
-                cmds.select(only_nodes)
+                cmds.select(result.get('nodes'))
             except:
                 cmds.warning('Sorry, something went wrong when selecting the nodes.')
-        else:
-            cmds.button("status_" + item_id, e=True, l= '')
-    
-    
-    # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
-    if issues_found > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
-        for bad_node in incorrect_path_nodes: 
-            string_status = string_status + '"' + bad_node[0] +  '" of the type "'+ bad_node[1] + '" isn\'t pointing to the the network drive. Your paths should be sourced from the network.\n'
-    else: 
-        string_status = str(issues_found) + ' issues found. All paths were sourced from the network'
-    return '\n*** ' + item_name + " ***\n" + string_status
-    
-    
-    
-    
+
+    update_checklist_item(result, warning_other_network_paths)
+    return result
+
+
 # Checklist Functions End Here ===================================================================
 
+# Checks in the order they appear - [Function, Input Node Types (None = Always evaluated)]
+# During an incremental refresh, a check is only evaluated again if a node of one of its input types changed
+checklist_functions = [ [check_frame_rate, None],
+                        [check_scene_units, None],
+                        [check_output_resolution, None],
+                        [check_total_texture_count, None], # UDIM tiles depend on files on disk (cached by the filesystem probe)
+                        [check_network_file_paths, ['file']],
+                        [check_network_reference_paths, ['reference']],
+                        [check_unparented_objects, ['dagNode']],
+                        [check_total_triangle_count, ['mesh']],
+                        [check_total_poly_object_count, ['mesh']],
+                        [check_shadow_casting_light_count, ['light']],
+                        [check_rs_shadow_casting_light_count, ['RedshiftPhysicalLight', 'RedshiftIESLight', 'RedshiftPortalLight', 'RedshiftDomeLight']],
+                        [check_ai_shadow_casting_light_count, ['aiSkyDomeLight', 'aiMeshLight', 'aiPhotometricLight', 'aiAreaLight']],
+                        [check_default_object_names, ['dagNode']],
+                        [check_objects_assigned_to_lambert1, ['shadingEngine', 'shape']],
+                        [check_ngons, ['mesh']],
+                        [check_non_manifold_geometry, ['mesh']],
+                        [check_empty_uv_sets, ['mesh']],
+                        [check_frozen_transforms, ['transform', 'shape']],
+                        [check_animated_visibility, ['transform', 'shape', 'animCurve']],
+                        [check_non_deformer_history, ['nurbsSurface', 'mesh', 'subdiv', 'nurbsCurve']],
+                        [check_textures_color_space, ['file']],
+                        [check_other_network_paths, ['audio', 'cacheFile', 'AlembicNode', 'gpuCache', 'BifMeshImportNode', 'MASH_Audio',
+                                                     'aiStandIn', 'aiVolume', 'aiPhotometricLight', 'RedshiftProxyMesh', 'RedshiftVolumeShape',
+                                                     'RedshiftNormalMap', 'RedshiftDomeLight', 'RedshiftIESLight', 'SimulationCacheProxyManager',
+                                                     'CrowdEntityTypeNode', 'CharacterMakerLocator', 'TerrainLocator', 'SimulationCacheProxy',
+                                                     'CrowdManagerNode']]
+                      ]
+
 
 def print_message(message, as_warning=False, as_heads_up_message=False):
     if as_warning:
@@ -2329,8 +1350,9 @@ def print_message(message, as_warning=False, as_heads_up_message=False):
 
 
 def settings_apply_changes(reset_default=False):
-    
+
     settings_buffer = checklist_settings.get('settings_text_fields')
+    checklist_cache["results"] = {} # Expected values might change, cached results are outdated
     
     # Resetting Fields
     if reset_default:
@@ -2370,39 +1392,7 @@ def settings_apply_changes(reset_default=False):
     # Writting / Applying
     for item in settings_buffer:
         stored_value = cmds.textField(item, q=True, text=True)
-        
-        if 'settings_warning_' in item:
-            item_id = item.replace('settings_warning_', '')
-            if stored_value.isdigit():
-                checklist_items[int(item_id)][1][0] = int(stored_value)
-            else:
-                checklist_items[int(item_id)][1][0] = stored_value
-            
-        if 'settings_list_error_' in item:
-            item_id = item.replace('settings_list_error_', '')
-            return_list = []
-            value_as_list = stored_value.split(',')
-            # Convert to number if possible
-            for obj in value_as_list:
-                if obj.isdigit():
-                    return_list.append(int(obj))
-                else:
-                    return_list.append(obj)
-            checklist_items[int(item_id)][1] = return_list
-            
-        if 'settings_1d_error_' in item:
-            item_id = item.replace('settings_1d_error_', '')
-            if stored_value.isdigit():
-                checklist_items[int(item_id)][1] = int(stored_value)
-            else:
-                checklist_items[int(item_id)][1] = stored_value
-            
-        if 'settings_2d_error_' in item:
-            item_id = item.replace('settings_2d_error_', '')
-            if stored_value.isdigit():
-                checklist_items[int(item_id)][1][1] = int(stored_value)
-            else:
-                checklist_items[int(item_id)][1][1] = stored_value
+        checklist_logic.apply_setting(checklist_items, item, stored_value)
                     
 # Used to Export Full Report:
 def export_report_to_txt(list):
@@ -2488,20 +1478,6 @@ def settings_export_state():
         file_handle.close()
         print('File exported to "' + settings_file + '"')
 
-def get_short_name(obj):
-        '''
-        Get the name of the objects without its path (Maya returns full path if name is not unique)
-
-                Parameters:
-                        obj (string) - object to extract short name
-        '''
-        if obj == '':
-            return ''
-        split_path = obj.split('|')
-        if len(split_path) >= 1:
-            short_name = split_path[len(split_path)-1]
-        return short_name
-
 #Build GUI
 get_persistent_settings_render_checklist()
 if __name__ == '__main__':
@@ -0,0 +1,420 @@
+"""
+ GT Render Checklist Batch - Runs GT Render Checklist on a directory of scenes (no user interface)
+ github.com/TrevisanGMW/gt-tools - 2026-10-18
+
+ Every ".ma" and ".mb" file in the directory is opened by a pool of worker processes (one Maya standalone session
+ per worker) and checked with "gt_render_checklist_logic". A JSON and a JUnit report (XML) are written for every
+ scene, followed by a summary ("summary.json") with the time spent and the number of scenes checked per minute.
+
+ Usage (run it with "mayapy"):
+    mayapy gt_render_checklist_batch.py "D:/shots" --output "D:/shots/checklist" --workers 4
+    mayapy gt_render_checklist_batch.py "D:/shots" --recursive --settings "D:/checklist_settings.txt" --plugins mtoa
+
+ Exit code is 1 when a scene has errors or couldn't be opened, so it can be used by a build or a farm job.
+ A scene that crashes its worker or takes longer than the timeout is reported as not opened and the batch continues.
+
+ JUnit reports:
+    Every check is a test case (with the time it took). Errors are failures, warnings are kept in "system-out"
+    and checks that couldn't be performed (e.g. render engine not loaded) are skipped.
+
+ 1.0.0 - 2026-10-18
+ Initial release
+
+ 1.0.1 - 2026-10-18
+ Checks are profiled (time, maya.cmds calls and nodes visited are added to the JSON and JUnit reports)
+
+ 1.0.2 - 2026-10-18
+ Works with the "mayapy" of Maya 2021 and older (Python 2 has no "multiprocessing.get_context")
+ Scenes that crash a worker (e.g. Maya segfault) or take longer than "--timeout" are reported as not opened
+
+"""
+from xml.etree import ElementTree
+import multiprocessing.queues
+import multiprocessing
+import argparse
+import logging
+import json
+import time
+import sys
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger("gt_render_checklist_batch")
+logger.setLevel(logging.INFO)
+
+scene_extensions = ('.ma', '.mb')
+default_scene_timeout = 3600 # Seconds
+_started_scenes = None # Queue used by the workers to tell when they start a scene (see "run_batch")
+summary_file_name = 'summary.json'
+
+
+def find_scenes(directory, recursive=False):
+    '''
+    Finds the Maya scenes (.ma and .mb) in a directory
+
+            Parameters:
+                    directory (string): Path to the directory
+                    recursive (bool): If True, sub-directories are also searched
+
+            Returns:
+                    scenes (list): Sorted list of paths to the scenes
+    '''
+    scenes = []
+    if recursive:
+        for root, dirs, files in os.walk(directory):
+            for file_name in files:
+                if file_name.lower().endswith(scene_extensions):
+                    scenes.append(os.path.join(root, file_name))
+    else:
+        for file_name in os.listdir(directory):
+            file_path = os.path.join(directory, file_name)
+            if os.path.isfile(file_path) and file_name.lower().endswith(scene_extensions):
+                scenes.append(file_path)
+    return sorted(scenes)
+
+
+def get_report_name(scene_path, directory):
+    '''
+    Returns the name used by the reports of a scene (relative path without separators, so names don't collide)
+
+            Parameters:
+                    scene_path (string): Path to the scene
+                    directory (string): Directory being checked
+
+            Returns:
+                    report_name (string): e.g. "seq010__sh010_lighting.ma"
+    '''
+    relative_path = os.path.relpath(scene_path, directory)
+    return relative_path.replace('\\', '__').replace('/', '__')
+
+
+def write_json_report(file_path, scene_path, results, elapsed_time):
+    '''
+    Writes the results of a scene to a JSON file
+
+            Parameters:
+                    file_path (string): Path to the JSON file
+                    scene_path (string): Path to the scene that was checked
+                    results (list): Results returned by "gt_render_checklist_logic.run_checks"
+                    elapsed_time (float): Seconds spent opening and checking the scene
+    '''
+    data = {'scene' : scene_path,
+            'time' : elapsed_time,
+            'results' : results}
+    with open(file_path, 'w') as json_file:
+        json.dump(data, json_file, indent=4, default=str)
+
+
+def write_junit_report(file_path, scene_path, results, elapsed_time, error_message=None):
+    '''
+    Writes the results of a scene to a JUnit (XML) file. Each check is a test case.
+
+            Parameters:
+                    file_path (string): Path to the XML file
+                    scene_path (string): Path to the scene that was checked
+                    results (list): Results returned by "gt_render_checklist_logic.run_checks"
+                    elapsed_time (float): Seconds spent opening and checking the scene
+                    error_message (string): If provided, the scene couldn't be checked (written as a single error)
+    '''
+    scene_name = os.path.basename(scene_path)
+    test_suite = ElementTree.Element('testsuite', name=scene_name, time='%.3f' % elapsed_time)
+    ElementTree.SubElement(ElementTree.SubElement(test_suite, 'properties'), 'property', name='scene', value=scene_path)
+    class_name = 'gt_render_checklist.' + os.path.splitext(scene_name)[0]
+
+    failures = 0
+    skipped = 0
+    errors = 0
+    if error_message is not None:
+        test_case = ElementTree.SubElement(test_suite, 'testcase', classname=class_name, name='Open Scene')
+        ElementTree.SubElement(test_case, 'error', message=error_message.split('\n')[0]).text = error_message
+        errors = 1
+
+    for result in results:
+        test_case = ElementTree.SubElement(test_suite, 'testcase', classname=class_name, name=result.get('name'))
+        if result.get('profile'):
+            test_case.set('time', '%.3f' % result.get('profile').get('time'))
+        status = result.get('status')
+        if status == 'error':
+            failure = ElementTree.SubElement(test_case, 'failure', message=result.get('message'), type=status)
+            failure.text = result.get('details')
+            failures += 1
+        elif status == 'exception':
+            ElementTree.SubElement(test_case, 'skipped', message=result.get('message'))
+            skipped += 1
+        elif status == 'warning':
+            ElementTree.SubElement(test_case, 'system-out').text = result.get('details')
+
+    test_suite.set('tests', str(len(test_suite.findall('testcase'))))
+    test_suite.set('failures', str(failures))
+    test_suite.set('errors', str(errors))
+    test_suite.set('skipped', str(skipped))
+    ElementTree.ElementTree(test_suite).write(file_path, encoding='utf-8', xml_declaration=True)
+
+
+def _initialize_worker(plugins, started_scenes=None):
+    '''
+    Starts Maya (standalone) in a worker process and loads the requested plugins
+
+            Parameters:
+                    plugins (list): Plugins to load. e.g. ['mtoa', 'redshift4maya']
+                    started_scenes (Queue): Receives the path and start time of every scene checked by the worker
+    '''
+    global _started_scenes
+    _started_scenes = started_scenes
+    import maya.standalone
+    maya.standalone.initialize(name='python')
+    import maya.cmds as cmds
+    for plugin in plugins or []:
+        try:
+            cmds.loadPlugin(plugin, quiet=True)
+        except Exception as e:
+            logger.warning('Unable to load plugin "' + plugin + '": ' + str(e))
+
+
+def check_scene(scene_path, directory, output_dir, items=None):
+    '''
+    Opens a scene, runs every check and writes its reports (runs inside a worker process)
+
+            Parameters:
+                    scene_path (string): Path to the scene
+                    directory (string): Directory being checked (used to name the reports)
+                    output_dir (string): Where the reports are written
+                    items (dict): Checklist items (names and expected values). Default values are used if not provided
+
+            Returns:
+                    scene_summary (dict): Counts by status, time and paths to the reports. "opened" is False if the scene couldn't be checked
+    '''
+    import maya.cmds as cmds
+    import gt_render_checklist_logic as checklist_logic
+
+    scene_summary = _create_scene_summary(scene_path, directory, output_dir)
+    start_time = time.time()
+    results = []
+    error_message = None
+    try:
+        cmds.file(scene_path, open=True, force=True, ignoreVersion=True)
+        results = checklist_logic.run_checks(items=items, profile=True)
+    except Exception as e:
+        error_message = 'Unable to check "' + scene_path + '": ' + str(e)
+        scene_summary['opened'] = False
+        scene_summary['message'] = error_message
+    elapsed_time = time.time() - start_time
+
+    for result in results:
+        scene_summary[result.get('status')] += 1
+    scene_summary['time'] = elapsed_time
+
+    write_json_report(scene_summary.get('json'), scene_path, results, elapsed_time)
+    write_junit_report(scene_summary.get('junit'), scene_path, results, elapsed_time, error_message=error_message)
+
+    try:
+        cmds.file(new=True, force=True) # Release the scene before the next one
+    except Exception:
+        pass
+    return scene_summary
+
+
+def _create_scene_summary(scene_path, directory, output_dir):
+    ''' Returns the summary of a scene before it's checked (no issues, paths to its reports) '''
+    report_name = get_report_name(scene_path, directory)
+    scene_summary = {'scene' : scene_path,
+                     'opened' : True,
+                     'json' : os.path.join(output_dir, report_name + '.json'),
+                     'junit' : os.path.join(output_dir, report_name + '.xml')}
+    for status in ['pass', 'warning', 'error', 'exception']:
+        scene_summary[status] = 0
+    return scene_summary
+
+
+def get_failed_scene_summary(scene_path, directory, output_dir, error_message, elapsed_time=0.0):
+    '''
+    Writes the reports of a scene that couldn't be checked by a worker (crash or timeout) and returns its summary
+
+            Parameters:
+                    scene_path (string): Path to the scene
+                    directory (string): Directory being checked (used to name the reports)
+                    output_dir (string): Where the reports are written
+                    error_message (string): Why the scene couldn't be checked
+                    elapsed_time (float): Time spent on the scene (seconds)
+
+            Returns:
+                    scene_summary (dict): Summary of the scene ("opened" is False)
+    '''
+    scene_summary = _create_scene_summary(scene_path, directory, output_dir)
+    scene_summary['opened'] = False
+    scene_summary['message'] = error_message
+    scene_summary['time'] = elapsed_time
+    write_json_report(scene_summary.get('json'), scene_path, [], elapsed_time)
+    write_junit_report(scene_summary.get('junit'), scene_path, [], elapsed_time, error_message=error_message)
+    return scene_summary
+
+
+def _check_scene_task(task):
+    ''' Unpacks the arguments sent to the worker pool (see "check_scene") '''
+    if _started_scenes is not None:
+        _started_scenes.put((task[0], time.time()))
+    return check_scene(*task)
+
+
+def run_batch(directory, output_dir=None, workers=None, settings_file=None, recursive=False, plugins=None, max_scenes_per_worker=None,
+              scene_timeout=default_scene_timeout):
+    '''
+    Runs the checklist on every scene of a directory using a pool of worker processes
+
+            Parameters:
+                    directory (string): Directory containing the scenes (.ma and .mb)
+                    output_dir (string): Where the reports are written. Default is a "checklist_reports" folder inside the directory
+                    workers (int): Number of worker processes (Maya sessions). Default is the number of CPUs
+                    settings_file (string): Settings exported from GT Render Checklist ("Export Settings")
+                    recursive (bool): If True, scenes in sub-directories are also checked
+                    plugins (list): Plugins loaded by every worker before opening scenes. e.g. ['mtoa']
+                    max_scenes_per_worker (int): Restarts a worker after this many scenes (releases memory). None = never
+                    scene_timeout (float): Seconds a worker can spend on a scene. Scenes that take longer or crash
+                                           their worker are reported as not opened
+
+            Returns:
+                    summary (dict): Summary of the batch (also written to "summary.json" in the output directory)
+    '''
+    directory = os.path.abspath(directory)
+    output_dir = os.path.abspath(output_dir or os.path.join(directory, 'checklist_reports'))
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    items = None
+    if settings_file:
+        import gt_render_checklist_logic as checklist_logic
+        items = checklist_logic.load_settings_file(settings_file)
+
+    scenes = find_scenes(directory, recursive=recursive)
+    workers = max(1, min(workers or multiprocessing.cpu_count(), len(scenes) or 1))
+    logger.info('Checking ' + str(len(scenes)) + ' scene(s) using ' + str(workers) + ' worker(s).')
+
+    start_time = time.time()
+    scene_summaries = []
+    if scenes:
+        if hasattr(multiprocessing, 'get_context'):
+            context = multiprocessing.get_context('spawn') # Maya can't be forked
+        else:
+            context = multiprocessing # Python 2 (Maya is only initialized by the workers, see "_initialize_worker")
+        # SimpleQueue writes right away (a crashed worker can't lose the start time like with "Queue")
+        if hasattr(context, 'SimpleQueue'):
+            started_scenes = context.SimpleQueue()
+        else:
+            started_scenes = multiprocessing.queues.SimpleQueue() # Python 2
+        pool = context.Pool(workers, initializer=_initialize_worker, initargs=(plugins, started_scenes), maxtasksperchild=max_scenes_per_worker)
+        has_stuck_workers = False
+        try:
+            # A worker that dies never returns its result, so results are polled instead of waited for
+            pending = {}
+            for scene_path in scenes:
+                pending[scene_path] = pool.apply_async(_check_scene_task, ((scene_path, directory, output_dir, items),))
+            scene_start_times = {}
+            last_progress_time = time.time()
+            while pending:
+                while not started_scenes.empty():
+                    scene_path, scene_start_time = started_scenes.get()
+                    scene_start_times[scene_path] = scene_start_time
+                    last_progress_time = time.time()
+                for scene_path in list(pending):
+                    async_result = pending.get(scene_path)
+                    scene_start_time = scene_start_times.get(scene_path)
+                    if async_result.ready():
+                        try:
+                            scene_summary = async_result.get()
+                        except Exception as e:
+                            scene_summary = get_failed_scene_summary(scene_path, directory, output_dir,
+                                                                     'Unable to check "' + scene_path + '": ' + str(e))
+                    elif scene_start_time is not None and time.time() - scene_start_time > scene_timeout:
+                        has_stuck_workers = True
+                        scene_summary = get_failed_scene_summary(scene_path, directory, output_dir,
+                                                                 'Unable to check "' + scene_path + '": the worker crashed or '
+                                                                 'took longer than ' + str(scene_timeout) + 's', time.time() - scene_start_time)
+                    elif time.time() - last_progress_time > scene_timeout: # Workers keep dying before starting a scene
+                        has_stuck_workers = True
+                        scene_summary = get_failed_scene_summary(scene_path, directory, output_dir,
+                                                                 'Unable to check "' + scene_path + '": no worker was able to start it')
+                    else:
+                        continue
+                    del pending[scene_path]
+                    last_progress_time = time.time()
+                    scene_summaries.append(scene_summary)
+                    if scene_summary.get('opened'):
+                        logger.info('[' + str(len(scene_summaries)) + '/' + str(len(scenes)) + '] ' + scene_summary.get('scene') +
+                                    ' - Errors: ' + str(scene_summary.get('error')) + ', Warnings: ' + str(scene_summary.get('warning')) +
+                                    ' (' + str(round(scene_summary.get('time'), 2)) + 's)')
+                    else:
+                        logger.warning('[' + str(len(scene_summaries)) + '/' + str(len(scenes)) + '] ' + scene_summary.get('message'))
+                if pending:
+                    time.sleep(0.5)
+            pool.close()
+        except:
+            has_stuck_workers = True
+            raise
+        finally:
+            if has_stuck_workers:
+                pool.terminate() # Workers still running a scene that timed out
+            pool.join()
+    elapsed_time = time.time() - start_time
+
+    scene_summaries.sort(key=lambda scene_summary: scene_summary.get('scene'))
+    summary = {'directory' : directory,
+               'output' : output_dir,
+               'workers' : workers,
+               'scenes' : len(scenes),
+               'scenes_not_opened' : len([s for s in scene_summaries if not s.get('opened')]),
+               'scenes_with_errors' : len([s for s in scene_summaries if s.get('error')]),
+               'scenes_with_warnings' : len([s for s in scene_summaries if s.get('warning')]),
+               'time' : elapsed_time,
+               'scenes_per_minute' : len(scenes) / (elapsed_time / 60.0) if elapsed_time > 0 else 0.0,
+               'results' : scene_summaries}
+
+    with open(os.path.join(output_dir, summary_file_name), 'w') as json_file:
+        json.dump(summary, json_file, indent=4)
+
+    logger.info('#' * 80)
+    logger.info('Scenes checked: ' + str(summary.get('scenes')) + ' in ' + str(round(elapsed_time, 2)) + 's (' +
+                str(round(summary.get('scenes_per_minute'), 2)) + ' scenes per minute)')
+    logger.info('Scenes with errors: ' + str(summary.get('scenes_with_errors')) + ', with warnings: ' +
+                str(summary.get('scenes_with_warnings')) + ', not opened: ' + str(summary.get('scenes_not_opened')))
+    logger.info('Reports: ' + output_dir)
+    logger.info('#' * 80)
+    return summary
+
+
+def main(argv=None):
+    '''
+    Command-line entry point (see module description)
+
+            Parameters:
+                    argv (list): Arguments (sys.argv is used if not provided)
+
+            Returns:
+                    exit_code (int): 0 if every scene passed (warnings are allowed), otherwise 1
+    '''
+    parser = argparse.ArgumentParser(description='Runs GT Render Checklist on every Maya scene (.ma/.mb) of a directory.')
+    parser.add_argument('directory', help='Directory containing the scenes.')
+    parser.add_argument('-o', '--output', help='Where the reports are written. (default: DIRECTORY/checklist_reports)')
+    parser.add_argument('-w', '--workers', type=int, help='Number of worker processes. (default: number of CPUs)')
+    parser.add_argument('-s', '--settings', help='Settings file exported from GT Render Checklist.')
+    parser.add_argument('-r', '--recursive', action='store_true', help='Also check scenes in sub-directories.')
+    parser.add_argument('-p', '--plugins', nargs='*', default=[], help='Plugins loaded before opening the scenes. e.g. mtoa redshift4maya')
+    parser.add_argument('--max-scenes-per-worker', type=int, help='Restarts a worker after this many scenes to release memory.')
+    parser.add_argument('-t', '--timeout', type=float, default=default_scene_timeout,
+                        help='Seconds a scene can take before it\'s reported as not opened. (default: ' + str(default_scene_timeout) + ')')
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.directory):
+        logger.error('Directory not found: "' + args.directory + '"')
+        return 1
+
+    summary = run_batch(args.directory, output_dir=args.output, workers=args.workers, settings_file=args.settings,
+                        recursive=args.recursive, plugins=args.plugins, max_scenes_per_worker=args.max_scenes_per_worker,
+                        scene_timeout=args.timeout)
+    if summary.get('scenes_with_errors') or summary.get('scenes_not_opened'):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
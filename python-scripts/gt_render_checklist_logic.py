@@ -0,0 +1,1953 @@
+"""
+ GT Render Checklist Logic - Checks performed by GT Render Checklist (no user interface)
+ github.com/TrevisanGMW/gt-tools - 2026-10-18
+
+ Every check receives a scene snapshot and the checklist items (names and expected values) and returns a
+ dictionary describing its result. The same checks are used by the checklist window and by batch scripts
+ (see "gt_render_checklist_batch.py").
+
+ Result dictionary:
+    item (int) - Item number (key in the checklist items)
+    name (string) - Name of the item. e.g. "Frame Rate"
+    status (string) - "pass", "warning", "error" or "exception" (check couldn't be performed)
+    issues (int) - Number of issues found
+    output (string) - Short description of what was found (shown next to the status in the window)
+    message (string) - Longer description of what was found (shown when clicking on the status)
+    details (string) - Full description used by reports
+    report (string) - Details formatted for the text report
+    nodes (list) - Nodes with issues
+    possible_nodes (list) - Nodes that might have issues (warnings)
+    profile (dict) - Only when profiled (see "CheckProfiler"). Time in seconds, maya.cmds calls and nodes visited
+
+ 1.0.0 - 2026-10-18
+ Initial release (Extracted from GT Render Checklist 1.5.1)
+
+ 1.1.0 - 2026-10-18
+ Added "CheckProfiler" (time, maya.cmds calls and nodes visited by each check) and "get_profile_data"
+
+ 1.2.0 - 2026-10-18
+ Added "MeshStatistics" (single pass through the API), shared by the polygon checks (7, 14, 15 and 16)
+ Ngons are found through the API instead of "polyCleanupArgList" (selection is no longer changed)
+
+ 1.3.0 - 2026-10-18
+ Default object names are matched with a compiled expression ("NamePatternMatcher") and can be changed in the settings
+
+ 1.4.0 - 2026-10-18
+ Added "HistoryAnalyzer" (history nodes are classified once and shared between the objects using them)
+
+ 1.5.0 - 2026-10-18
+ Added "FileSystemProbe" (UDIM tiles searched in parallel, results cached for a few seconds), used by the path checks (3, 4, 5 and 21)
+ Threads only exist while the tiles are searched
+
+ 1.5.1 - 2026-10-18
+ Added "DirectSceneQueries" (same interface as "SceneSnapshot" without cache, used as the benchmark baseline)
+
+"""
+import maya.api.OpenMaya as om
+import maya.cmds as cmds
+from multiprocessing.pool import ThreadPool
+from array import array
+import threading
+import copy
+import time
+import re
+import os
+
+# Most precise clock available (Python 2 doesn't have "perf_counter")
+_timer = getattr(time, 'perf_counter', time.time)
+
+# Checklist Items - Item Number [Name, Expected Value]
+default_checklist_items = { 0 : ["Frame Rate", "film"],
+                            1 : ["Scene Units", "cm"],
+                            2 : ["Output Resolution", ["1920","1080"] ],
+                            3 : ["Total Texture Count", [40, 50] ],
+                            4 : ["Network File Paths", ["C:\\"] ], # Uses startswith and ignores slashes
+                            5 : ["Network Reference Paths", ["C:\\"] ], # Uses startswith and ignores slashes
+                            6 : ["Unparented Objects", 0],
+                            7 : ["Total Triangle Count", [1800000, 2000000] ],
+                            8 : ["Total Poly Object Count", [90, 100] ],
+                            9 : ["Shadow Casting Lights", [2, 3] ],
+                           10 : ["RS Shadow Casting Lights", [3, 4]],
+                           11 : ["Ai Shadow Casting Lights", [3, 4]],
+                           12 : ["Default Object Names", ["nurbsSphere", "nurbsCube", "nurbsCylinder", "nurbsCone", "nurbsPlane", "nurbsTorus",
+                                                          "nurbsCircle", "nurbsSquare", "pSphere", "pCube", "pCylinder", "pCone", "pPlane",
+                                                          "pTorus", "pPrism", "pPyramid", "pPipe", "pHelix", "pSolid", "rsPhysicalLight",
+                                                          "rsIESLight", "rsPortalLight", "aiAreaLight" ,"rsDomeLight", "aiPhotometricLight",
+                                                          "aiLightPortal", "ambientLight", "directionalLight", "pointLight", "spotLight",
+                                                          "areaLight", "volumeLight"] ], # Error if starting with, warning if containing
+                           13 : ["Objects Assigned to lambert1", 0],
+                           14 : ["Ngons", 0],
+                           15 : ["Non-manifold Geometry", 0],
+                           16 : ["Empty UV Sets", 0],
+                           17 : ["Frozen Transforms", 0],
+                           18 : ["Animated Visibility", 0],
+                           19 : ["Non Deformer History", 0 ],
+                           20 : ["Textures Color Space", 0 ],
+                           21 : ["Other Network Paths", ["C:\\"] ]
+                          }
+
+
+# Profiling =====================================================================================
+class _CallCounter:
+    '''
+    Stands in for "maya.cmds" while a check is profiled and counts the commands called through it
+    '''
+    def __init__(self, module):
+        self._module = module
+        self.calls = 0
+        self.calls_by_command = {}
+
+    def __getattr__(self, name):
+        attribute = getattr(self._module, name)
+        if not callable(attribute):
+            return attribute
+        def counted_command(*args, **kwargs):
+            self.calls += 1
+            self.calls_by_command[name] = self.calls_by_command.get(name, 0) + 1
+            return attribute(*args, **kwargs)
+        return counted_command
+
+
+class CheckProfiler:
+    '''
+    Measures what a check costs: wall time, calls to maya.cmds (made by this module) and the number
+    of nodes visited through the scene snapshot. The same profiler can be entered more than once (values add up).
+
+    Usage:
+        with CheckProfiler() as profiler:
+            result = check_ngons(snapshot)
+        result['profile'] = profiler.get_profile()
+    '''
+    active = None # Profiler currently running (SceneSnapshot records the nodes it visits)
+
+    def __init__(self):
+        self.time = 0.0
+        self.cmds_calls = 0
+        self.calls_by_command = {}
+        self.visited_nodes = set()
+        self._previous_state = None
+        self._start_time = 0.0
+
+    def __enter__(self):
+        global cmds
+        self._previous_state = (cmds, CheckProfiler.active)
+        cmds = _CallCounter(cmds)
+        CheckProfiler.active = self
+        self._start_time = _timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global cmds
+        self.time += _timer() - self._start_time
+        cmds_counter = cmds
+        cmds, CheckProfiler.active = self._previous_state
+        self.cmds_calls += cmds_counter.calls
+        for command, calls in cmds_counter.calls_by_command.items():
+            self.calls_by_command[command] = self.calls_by_command.get(command, 0) + calls
+        return False
+
+    def visit(self, node):
+        ''' Records a node visited by the check (plugs are recorded as their node) '''
+        self.visited_nodes.add(node.split('.')[0])
+
+    def get_profile(self):
+        '''
+        Returns what was measured
+
+                Returns:
+                        profile (dict): {'time': seconds, 'cmds_calls': int, 'nodes_visited': int, 'commands': {command: calls}}
+        '''
+        return {'time' : self.time,
+                'cmds_calls' : self.cmds_calls,
+                'nodes_visited' : len(self.visited_nodes),
+                'commands' : dict(self.calls_by_command)}
+
+
+def get_profile_data(results, snapshot_profile=None):
+    '''
+    Combines the profiles of the results into a dictionary that can be saved as JSON (to compare scene versions)
+
+            Parameters:
+                    results (list): Profiled results (see "run_checks" or "CheckProfiler")
+                    snapshot_profile (dict): Profile of the creation/update of the scene snapshot (optional)
+
+            Returns:
+                    profile_data (dict): Scene, Maya version, date, profile of every check and the totals
+    '''
+    totals = {'time' : 0.0, 'cmds_calls' : 0, 'nodes_visited' : 0}
+    checks = []
+    for result in results:
+        profile = result.get('profile') or {}
+        check_data = {'item' : result.get('item'), 'name' : result.get('name'), 'status' : result.get('status')}
+        check_data.update(profile)
+        checks.append(check_data)
+        for key in totals:
+            totals[key] += profile.get(key, 0)
+
+    if snapshot_profile:
+        for key in totals:
+            totals[key] += snapshot_profile.get(key, 0)
+
+    return {'scene' : cmds.file(q=True, sceneName=True),
+            'maya_version' : cmds.about(version=True),
+            'date' : time.strftime('%Y-%m-%d %H:%M:%S'),
+            'snapshot' : snapshot_profile,
+            'checks' : checks,
+            'total' : totals}
+
+
+# Scene Snapshot ================================================================================
+class SceneSnapshot:
+    '''
+    Scene data shared by the checks, so they don't query Maya for the same information over and over.
+    Every node is listed once (name, type and long name) and the DAG relations are extracted from the long names.
+    Per node queries (history, connections, set members, attributes) are cached the first time a check asks for them.
+    '''
+    def __init__(self):
+        self._list_scene()
+
+        # Cached on demand
+        self._derived_types = {}
+        self._history = {}
+        self._connections = {}
+        self._set_members = {}
+        self._node_values = {}
+
+    def _list_scene(self):
+        ''' Lists every node in the scene (names, types, long names and DAG relations) '''
+        listed_nodes = cmds.ls(showType=True) or []
+        self.nodes = listed_nodes[0::2]
+        self.node_types = dict(zip(listed_nodes[0::2], listed_nodes[1::2]))
+
+        long_names = cmds.ls(long=True) or []
+        if len(long_names) != len(self.nodes): # Should never happen, but don't assume the order
+            long_names = [(cmds.ls(node, long=True) or [node])[0] for node in self.nodes]
+        self.long_names = dict(zip(self.nodes, long_names))
+        self.short_names = dict(zip(long_names, self.nodes))
+
+        # DAG Relations (Long Names)
+        self.parents = {}
+        self.children = {}
+        for long_name in long_names:
+            if long_name.startswith('|'):
+                parent = long_name.rsplit('|', 1)[0] or None
+                self.parents[long_name] = parent
+                if parent:
+                    self.children.setdefault(parent, []).append(long_name)
+
+        # Lists that can't be extracted from the node types
+        self.available_node_types = set(cmds.ls(nodeTypes=True) or [])
+        self.references = cmds.ls(rf=True) or []
+        self.geometry = cmds.ls(geometry=True) or []
+        self.lights = cmds.ls(lights=True) or []
+        self.lights_and_geometry = cmds.ls(lt=True, lf=True, g=True) or []
+        self._nodes_by_type = {}
+
+    def update(self, changed_nodes):
+        '''
+        Lists the scene again, but only discards the cached data of the nodes that changed.
+        Nodes with a changed node in their history are also considered changed (e.g. mesh of an edited polySmooth)
+
+                Parameters:
+                        changed_nodes (dict): Nodes that changed since the snapshot was created {name : type}
+
+                Returns:
+                        changed_nodes (dict): Provided nodes plus the nodes affected by them {name : type}
+        '''
+        changed_nodes = dict(changed_nodes)
+        changed_names = set(changed_nodes)
+        for node in changed_nodes:
+            if self.long_names.get(node):
+                changed_names.add(self.long_names.get(node))
+
+        for node, history in self._history.items():
+            if node not in changed_names and changed_names.intersection(history):
+                changed_names.add(node)
+                changed_names.add(self.long_names.get(node, node))
+                changed_nodes[node] = self.node_types.get(node)
+
+        self._list_scene()
+        for node in changed_nodes:
+            if self.long_names.get(node):
+                changed_names.add(self.long_names.get(node))
+
+        self._history = dict((node, history) for node, history in self._history.items() if node not in changed_names)
+        self._connections = dict((key, connections) for key, connections in self._connections.items() if key[0].split('.')[0] not in changed_names)
+        self._set_members = dict((node, members) for node, members in self._set_members.items() if node not in changed_names)
+        self._node_values = dict((key, value) for key, value in self._node_values.items() if key[0] not in changed_names)
+        return changed_nodes
+
+    def get_type(self, node):
+        ''' Returns the type of a node (accepts short or long names) '''
+        self._visit(node)
+        node_type = self.node_types.get(node) or self.node_types.get(self.short_names.get(node))
+        if node_type is None:
+            node_type = cmds.nodeType(node)
+            self.node_types[node] = node_type
+        return node_type
+
+    def get_derived_types(self, node_type):
+        ''' Returns a set with the provided type and every type that inherits from it (Same as "cmds.ls(type=node_type)") '''
+        if node_type not in self._derived_types:
+            try:
+                derived_types = cmds.nodeType(node_type, derived=True, isTypeName=True) or []
+            except:
+                derived_types = [] # Type is not available (e.g. plugin not loaded)
+            self._derived_types[node_type] = set(derived_types) | set([node_type])
+        return self._derived_types.get(node_type)
+
+    def is_type(self, node, node_type):
+        ''' Checks if a node is of the provided type (or inherits from it) '''
+        return self.get_type(node) in self.get_derived_types(node_type)
+
+    def ls(self, node_type, long=False):
+        ''' Returns the nodes of a type in the same order and format as "cmds.ls(type=node_type, long=long)" '''
+        if node_type not in self._nodes_by_type:
+            types = self.get_derived_types(node_type)
+            self._nodes_by_type[node_type] = [node for node in self.nodes if self.node_types.get(node) in types]
+        nodes = self._nodes_by_type.get(node_type)
+        if long:
+            return [self.long_names.get(node) for node in nodes]
+        return list(nodes)
+
+    def get_parent(self, node):
+        ''' Returns the long name of the parent of a DAG node (None if parented to the world) '''
+        self._visit(node)
+        return self.parents.get(self.long_names.get(node, node))
+
+    def get_children(self, node, node_type=None):
+        ''' Returns the long names of the children of a DAG node (optionally filtered by type) '''
+        self._visit(node)
+        children = self.children.get(self.long_names.get(node, node), [])
+        if node_type:
+            return [child for child in children if self.is_type(child, node_type)]
+        return list(children)
+
+    def get_history(self, node):
+        ''' Returns the history of a node (Same as "cmds.listHistory(node, pdo=True)") '''
+        self._visit(node)
+        if node not in self._history:
+            self._history[node] = cmds.listHistory(node, pdo=True) or []
+        return self._history.get(node)
+
+    def get_connections(self, node_or_plug, source=True, destination=True, plugs=False):
+        ''' Returns the connections of a node or plug (Same as "cmds.listConnections") '''
+        self._visit(node_or_plug)
+        key = (node_or_plug, source, destination, plugs)
+        if key not in self._connections:
+            self._connections[key] = cmds.listConnections(node_or_plug, source=source, destination=destination, plugs=plugs) or []
+        return self._connections.get(key)
+
+    def get_set_members(self, set_name):
+        ''' Returns the members of a set (Same as "cmds.sets(set_name, q=True)") '''
+        self._visit(set_name)
+        if set_name not in self._set_members:
+            self._set_members[set_name] = cmds.sets(set_name, q=True) or []
+        return self._set_members.get(set_name)
+
+    def get_node_value(self, node, key, query):
+        '''
+        Returns the result of a query about a node. The result is cached until the node changes (see "update")
+
+                Parameters:
+                        node (string): Name of the node the query is about (results are discarded when it changes)
+                        key (string): Name of the query (must be unique for the node)
+                        query (function): Function called (without arguments) when the result is not cached
+
+                Returns:
+                        value (any): What the query returned
+        '''
+        self._visit(node)
+        if (node, key) not in self._node_values:
+            self._node_values[(node, key)] = query()
+        return self._node_values.get((node, key))
+
+    def get_attr(self, node, attribute):
+        ''' Returns the value of an attribute (Same as "cmds.getAttr(node + '.' + attribute)") '''
+        return self.get_node_value(node, attribute, lambda: cmds.getAttr(node + '.' + attribute))
+
+    def get_mesh_statistics(self, mesh):
+        ''' Returns the statistics of a polygon mesh (see "MeshStatistics"). Cached until the mesh changes '''
+        mesh = self.short_names.get(mesh, mesh) # Short and long names share the same statistics
+        return self.get_node_value(mesh, 'mesh_statistics', lambda: MeshStatistics(mesh))
+
+    def _visit(self, node):
+        ''' Records a node visited by a check when it's being profiled (see "CheckProfiler") '''
+        if CheckProfiler.active is not None and node:
+            CheckProfiler.active.visit(self.short_names.get(node, node))
+
+
+
+class DirectSceneQueries:
+    '''
+    Same interface as "SceneSnapshot", but every call queries Maya directly and nothing is cached
+    (targeted "cmds.ls(type=...)", "listRelatives", "getAttr"... as the checks did before the snapshot).
+    Used as the baseline when benchmarking the shared snapshot.
+    '''
+    @property
+    def available_node_types(self):
+        return set(cmds.ls(nodeTypes=True) or [])
+
+    @property
+    def references(self):
+        return cmds.ls(rf=True) or []
+
+    @property
+    def geometry(self):
+        return cmds.ls(geometry=True) or []
+
+    @property
+    def lights(self):
+        return cmds.ls(lights=True) or []
+
+    @property
+    def lights_and_geometry(self):
+        return cmds.ls(lt=True, lf=True, g=True) or []
+
+    def get_type(self, node):
+        self._visit(node)
+        return cmds.nodeType(node)
+
+    def get_derived_types(self, node_type):
+        try:
+            derived_types = cmds.nodeType(node_type, derived=True, isTypeName=True) or []
+        except:
+            derived_types = [] # Type is not available (e.g. plugin not loaded)
+        return set(derived_types) | set([node_type])
+
+    def is_type(self, node, node_type):
+        self._visit(node)
+        return node_type in (cmds.nodeType(node, inherited=True) or [])
+
+    def ls(self, node_type, long=False):
+        return cmds.ls(type=node_type, long=long) or []
+
+    def get_parent(self, node):
+        self._visit(node)
+        return (cmds.listRelatives(node, parent=True, fullPath=True) or [None])[0]
+
+    def get_children(self, node, node_type=None):
+        self._visit(node)
+        if node_type:
+            return cmds.listRelatives(node, children=True, fullPath=True, type=node_type) or []
+        return cmds.listRelatives(node, children=True, fullPath=True) or []
+
+    def get_history(self, node):
+        self._visit(node)
+        return cmds.listHistory(node, pdo=True) or []
+
+    def get_connections(self, node_or_plug, source=True, destination=True, plugs=False):
+        self._visit(node_or_plug)
+        return cmds.listConnections(node_or_plug, source=source, destination=destination, plugs=plugs) or []
+
+    def get_set_members(self, set_name):
+        self._visit(set_name)
+        return cmds.sets(set_name, q=True) or []
+
+    def get_node_value(self, node, key, query):
+        self._visit(node)
+        return query()
+
+    def get_attr(self, node, attribute):
+        self._visit(node)
+        return cmds.getAttr(node + '.' + attribute)
+
+    def get_mesh_statistics(self, mesh):
+        self._visit(mesh)
+        return MeshStatistics(mesh)
+
+    def _visit(self, node):
+        if CheckProfiler.active is not None and node:
+            CheckProfiler.active.visit(node.split('|')[-1])
+
+
+# Mesh Statistics ===============================================================================
+class MeshStatistics:
+    '''
+    Everything the polygon checks need to know about a mesh, gathered in a single pass through the API
+    (MFnMesh array queries instead of a getAttr/polyEvaluate call per value). IDs are stored in compact arrays.
+
+            Attributes:
+                    mesh (string): Name of the mesh (shape)
+                    transform (string): Name of the transform of the mesh (used to name components like "pCube1.f[0]")
+                    is_intermediate (bool): Intermediate objects are not rendered (e.g. "shapeOrig")
+                    faces, edges, vertices, triangles (int): Component counts (same as "polyEvaluate")
+                    ngon_faces (array): IDs of the faces with more than 4 sides
+                    non_manifold_vertices (array): IDs of the non-manifold vertices (same as "polyInfo -nmv")
+                    uv_sets (list): Names of the UV sets
+                    uv_counts (array): Number of UVs in each UV set (same order as "uv_sets")
+                    smooth_preview (int): Value of "displaySmoothMesh" (0 = Off)
+                    smooth_level (int): Value of "smoothLevel"
+    '''
+    def __init__(self, mesh):
+        self.mesh = mesh
+        selection = om.MSelectionList()
+        selection.add(mesh)
+        dag_path = selection.getDagPath(0)
+        mesh_fn = om.MFnMesh(dag_path)
+
+        transform_path = om.MDagPath(dag_path)
+        transform_path.pop()
+        self.transform = transform_path.partialPathName()
+        self.is_intermediate = mesh_fn.isIntermediateObject
+
+        self.faces = mesh_fn.numPolygons
+        self.edges = mesh_fn.numEdges
+        self.vertices = mesh_fn.numVertices
+
+        # Each query returns an array for the whole mesh (no calls per face)
+        self.triangles = sum(mesh_fn.getTriangles()[0])
+        vertex_counts = mesh_fn.getVertices()[0]
+        self.ngon_faces = array('i', [face_id for face_id, vertex_count in enumerate(vertex_counts) if vertex_count > 4])
+
+        self.uv_sets = list(mesh_fn.getUVSetNames())
+        self.uv_counts = array('i', [mesh_fn.numUVs(uv_set) for uv_set in self.uv_sets])
+
+        self.smooth_preview = mesh_fn.findPlug('displaySmoothMesh', False).asInt()
+        self.smooth_level = mesh_fn.findPlug('smoothLevel', False).asInt()
+
+        # The API has no non-manifold query. "polyInfo" is called once (C++) and only its IDs are kept
+        non_manifold_vertices = []
+        if self.faces:
+            non_manifold_vertices = get_component_ids(cmds.polyInfo(mesh, nmv=True) or [])
+        self.non_manifold_vertices = array('i', non_manifold_vertices)
+
+
+# History Analyzer ==============================================================================
+class HistoryAnalyzer:
+    '''
+    Classifies the history of shapes (deformer-only, suspicious or non-deformer).
+    Every history node is classified once (the result is shared by all the shapes downstream of it) and every shape
+    is classified once, so the time is linear in the size of the history graph.
+
+            Parameters:
+                    snapshot (SceneSnapshot): Scene data used to get the history and node types
+                    ignored_types (list): Types that are not considered history (e.g. deformers like "skinCluster")
+                    suspicious_types (list): Deformers often used for modeling (e.g. "nonLinear")
+    '''
+    deformer_only = 'deformer_only'
+    suspicious = 'suspicious'
+    non_deformer = 'non_deformer'
+
+    def __init__(self, snapshot, ignored_types, suspicious_types):
+        self.snapshot = snapshot
+        self.ignored_types = set(ignored_types)
+        self.suspicious_types = set(suspicious_types)
+        self._node_kinds = {} # History node : kind (None for ignored types)
+        self._shape_kinds = {} # Shape : frozenset of kinds found in its history
+
+    def get_node_kind(self, node):
+        ''' Returns "suspicious", "non_deformer" or None (ignored) for a history node. Its type is only queried once '''
+        if node not in self._node_kinds:
+            node_type = self.snapshot.get_type(node)
+            if node_type in self.suspicious_types:
+                self._node_kinds[node] = self.suspicious
+            elif node_type in self.ignored_types:
+                self._node_kinds[node] = None
+            else:
+                self._node_kinds[node] = self.non_deformer
+        return self._node_kinds.get(node)
+
+    def get_history_kinds(self, shape):
+        ''' Returns a set with the kinds found in the history of a shape ("suspicious" and/or "non_deformer") '''
+        if shape not in self._shape_kinds:
+            kinds = set()
+            for node in set(self.snapshot.get_history(shape)):
+                kind = self.get_node_kind(node)
+                if kind:
+                    kinds.add(kind)
+            self._shape_kinds[shape] = frozenset(kinds)
+        return self._shape_kinds.get(shape)
+
+    def classify(self, shape):
+        ''' Returns the classification of a shape: "non_deformer", "suspicious" or "deformer_only" (worst kind found) '''
+        kinds = self.get_history_kinds(shape)
+        if self.non_deformer in kinds:
+            return self.non_deformer
+        if self.suspicious in kinds:
+            return self.suspicious
+        return self.deformer_only
+
+    def classify_all(self, shapes):
+        ''' Returns a dictionary with the classification of every provided shape {shape : classification} '''
+        return dict((shape, self.classify(shape)) for shape in shapes)
+
+
+# File System Probe =============================================================================
+class FileSystemProbe:
+    '''
+    Filesystem queries used by the path checks (UDIM tiles) and the network path prefixes.
+    Results are cached by normalized pattern for a few seconds, so checks close to each other don't access
+    the storage again (the window clears the cache when refreshing). Patterns that are not cached are probed at the
+    same time by a pool of threads, which is closed as soon as they are done.
+    Only filesystem functions run in the threads (Maya commands must be called from the main thread).
+
+            Parameters:
+                    cache_time (float): Seconds a result is kept (0 = never cached)
+                    threads (int): Maximum number of paths probed at the same time
+    '''
+    def __init__(self, cache_time=30, threads=8):
+        self.cache_time = cache_time
+        self.threads = threads
+        self._cache = {} # (query, normalized path) : (time, result)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize_path(path):
+        ''' Returns the path used as cache key (same path no matter the slashes, case on Windows or "..") '''
+        if not path:
+            return ''
+        return os.path.normcase(os.path.normpath(path))
+
+    @staticmethod
+    def normalize_prefixes(prefixes):
+        ''' Removes the slashes of the expected path prefixes, so they are only normalized once per check '''
+        return [str(prefix).replace('/','').replace('\\','') for prefix in prefixes]
+
+    @staticmethod
+    def get_unmatched_prefixes(path, normalized_prefixes):
+        '''
+        Returns the prefixes a path doesn't start with (slashes are ignored)
+
+                Parameters:
+                        path (string): Path to test. e.g. "C:/textures/file.png"
+                        normalized_prefixes (list): Prefixes returned by "normalize_prefixes"
+
+                Returns:
+                        unmatched_prefixes (list): Prefixes the path doesn't start with
+        '''
+        path_no_slashes = path.replace('/','').replace('\\','')
+        return [prefix for prefix in normalized_prefixes if not path_no_slashes.startswith(prefix)]
+
+    def find_files(self, pattern):
+        ''' Returns the files matching a pattern from "fileTexturePathResolver" (e.g. UDIM tiles) '''
+        return self._probe('find_files', pattern, _find_files_for_pattern)
+
+    def find_all_files(self, patterns):
+        ''' Returns a dictionary with the files matching every pattern {pattern : files} (probed in parallel) '''
+        return self._probe_all('find_files', patterns, _find_files_for_pattern)
+
+    def clear(self):
+        ''' Discards all cached results '''
+        with self._lock:
+            self._cache = {}
+
+    def _probe(self, query, path, function):
+        ''' Returns the cached result of a query or runs it (thread safe) '''
+        key = (query, self.normalize_path(path))
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None and _timer() - cached[0] < self.cache_time:
+            return cached[1]
+        result = function(path)
+        with self._lock:
+            self._cache[key] = (_timer(), result)
+        return result
+
+    def _probe_all(self, query, paths, function):
+        ''' Runs a query for multiple paths, using the threads when more than one path is provided '''
+        unique_paths = list(dict.fromkeys(paths))
+        if len(unique_paths) > 1 and self.threads > 1:
+            pool = ThreadPool(min(self.threads, len(unique_paths)))
+            try:
+                results = pool.map(lambda path: self._probe(query, path, function), unique_paths)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [self._probe(query, path, function) for path in unique_paths]
+        return dict(zip(unique_paths, results))
+
+
+def _find_files_for_pattern(pattern):
+    ''' Returns the files matching a "fileTexturePathResolver" pattern (used by "FileSystemProbe") '''
+    try:
+        import maya.app.general.fileTexturePathResolver
+        return maya.app.general.fileTexturePathResolver.findAllFilesForPattern(pattern, None) or []
+    except:
+        return []
+
+
+_filesystem_probe = None
+
+def get_filesystem_probe():
+    ''' Returns the "FileSystemProbe" shared by the checks (created the first time it's needed) '''
+    global _filesystem_probe
+    if _filesystem_probe is None:
+        _filesystem_probe = FileSystemProbe()
+    return _filesystem_probe
+
+
+# Name Patterns =================================================================================
+class NamePatternMatcher:
+    '''
+    Checks if names start with or contain any of the provided patterns.
+    All patterns are compiled into a single regular expression, so every name is searched once
+    (instead of a "startswith" and a substring test for every pattern).
+    '''
+    starts_with = 'starts_with'
+    contains = 'contains'
+
+    def __init__(self, patterns):
+        patterns = set([str(pattern).strip() for pattern in patterns])
+        patterns.discard('')
+        self.patterns = sorted(patterns, key=lambda pattern: (-len(pattern), pattern))
+        self._expression = None
+        if self.patterns:
+            self._expression = re.compile('|'.join([re.escape(pattern) for pattern in self.patterns]))
+
+    def match(self, name):
+        '''
+        Finds how a name matches the patterns
+
+                Parameters:
+                        name (string): Name to test. e.g. "pCube1"
+
+                Returns:
+                        match_kind (string): "starts_with", "contains" or None (no patterns found in the name)
+        '''
+        if self._expression is None:
+            return None
+        found = self._expression.search(name) # Leftmost match, so it starts at 0 if any pattern is a prefix
+        if found is None:
+            return None
+        if found.start() == 0:
+            return self.starts_with
+        return self.contains
+
+
+_name_pattern_matchers = {}
+
+def get_name_pattern_matcher(patterns):
+    ''' Returns a "NamePatternMatcher" for the provided patterns (compiled once and reused) '''
+    key = tuple(patterns)
+    if key not in _name_pattern_matchers:
+        _name_pattern_matchers[key] = NamePatternMatcher(patterns)
+    return _name_pattern_matchers.get(key)
+
+
+# Helpers ========================================================================================
+def get_component_ids(components):
+    '''
+    Extracts the IDs of a list of components
+
+            Parameters:
+                    components (list): Components. e.g. ['pCube1.vtx[2]', 'pCube1.vtx[4:6]']
+
+            Returns:
+                    ids (list): A list of integers. e.g. [2, 4, 5, 6]
+    '''
+    ids = []
+    for component in components:
+        index = component.rsplit('[', 1)[-1].rstrip(']')
+        if ':' in index:
+            start, end = index.split(':')
+            ids.extend(range(int(start), int(end) + 1))
+        elif index.isdigit():
+            ids.append(int(index))
+    return ids
+
+def get_short_name(obj):
+    '''
+    Get the name of the objects without its path (Maya returns full path if name is not unique)
+
+            Parameters:
+                    obj (string) - object to extract short name
+    '''
+    if obj == '':
+        return ''
+    split_path = obj.split('|')
+    if len(split_path) >= 1:
+        short_name = split_path[len(split_path)-1]
+    return short_name
+
+
+def create_result(item, items, status, issues_found, output, details, message='', nodes=None, possible_nodes=None, **extra_data):
+    '''
+    Creates the dictionary returned by the checks (see module description)
+
+            Parameters:
+                    item (int): Item number (key in the checklist items)
+                    items (dict): Checklist items used by the check
+                    status (string): "pass", "warning", "error" or "exception"
+                    issues_found (int): Number of issues found
+                    output (any): Short description of what was found (converted to string)
+                    details (string): Full description used by reports
+                    message (string): Longer description of what was found
+                    nodes (list): Nodes with issues
+                    possible_nodes (list): Nodes that might have issues
+                    extra_data (any): Extra values used by the patch functions. e.g. received_value="film"
+
+            Returns:
+                    result (dict): Result of the check
+    '''
+    item_name = items.get(item)[0]
+    result = {'item' : item,
+              'name' : item_name,
+              'status' : status,
+              'issues' : issues_found,
+              'output' : str(output),
+              'message' : message,
+              'details' : details,
+              'report' : '\n*** ' + item_name + " ***\n" + details,
+              'nodes' : nodes or [],
+              'possible_nodes' : possible_nodes or []}
+    result.update(extra_data)
+    return result
+
+
+def apply_setting(items, field_name, stored_value):
+    '''
+    Applies a value from the settings (text fields or exported settings file) to the checklist items
+
+            Parameters:
+                    items (dict): Checklist items to update
+                    field_name (string): Name of the setting. e.g. "settings_warning_3" or "settings_list_error_4"
+                    stored_value (string): Value as text
+    '''
+    if 'settings_warning_' in field_name:
+        item_id = field_name.replace('settings_warning_', '')
+        if stored_value.isdigit():
+            items[int(item_id)][1][0] = int(stored_value)
+        else:
+            items[int(item_id)][1][0] = stored_value
+
+    if 'settings_list_error_' in field_name:
+        item_id = field_name.replace('settings_list_error_', '')
+        return_list = []
+        value_as_list = stored_value.split(',')
+        # Convert to number if possible
+        for obj in value_as_list:
+            if obj.isdigit():
+                return_list.append(int(obj))
+            else:
+                return_list.append(obj)
+        items[int(item_id)][1] = return_list
+
+    if 'settings_1d_error_' in field_name:
+        item_id = field_name.replace('settings_1d_error_', '')
+        if stored_value.isdigit():
+            items[int(item_id)][1] = int(stored_value)
+        else:
+            items[int(item_id)][1] = stored_value
+
+    if 'settings_2d_error_' in field_name:
+        item_id = field_name.replace('settings_2d_error_', '')
+        if stored_value.isdigit():
+            items[int(item_id)][1][1] = int(stored_value)
+        else:
+            items[int(item_id)][1][1] = stored_value
+
+
+def load_settings_file(file_path, items=None):
+    '''
+    Reads a settings file created with the "Export Settings" button of GT Render Checklist
+
+            Parameters:
+                    file_path (string): Path to the exported settings (.txt)
+                    items (dict): Checklist items used as a starting point (default values if not provided)
+
+            Returns:
+                    items (dict): A copy of the checklist items with the imported values
+    '''
+    items = copy.deepcopy(items or default_checklist_items)
+    with open(file_path, 'r') as file_handle:
+        for line in file_handle.read().split('\n'):
+            extracted_values = line.split(':"')
+            if len(extracted_values) > 1:
+                apply_setting(items, extracted_values[0], extracted_values[1].replace('"',''))
+    return items
+
+
+def _plural(count, singular, plural):
+    ''' Returns the singular string if count is 1, otherwise the plural string '''
+    if count == 1:
+        return singular
+    return plural
+
+
+def _list_details(issues_found, nodes, node_message, possible_nodes=None, possible_node_message='', no_issues_message=''):
+    '''
+    Creates the details (report) of checks that list nodes. e.g. '2 issues found.\n"pCube1" is hidden.'
+
+            Parameters:
+                    issues_found (int): Number of issues
+                    nodes (list): Nodes with issues
+                    node_message (string): Added after each node. e.g. ' is hidden.'
+                    possible_nodes (list): Nodes that might have issues (warnings)
+                    possible_node_message (string): Added after each possible node
+                    no_issues_message (string): Added after "0 issues found." when nothing was found
+
+            Returns:
+                    details (string): Report string
+    '''
+    possible_nodes = possible_nodes or []
+    if issues_found == 0 and len(possible_nodes) == 0:
+        return str(issues_found) + ' issues found. ' + no_issues_message
+    details = str(issues_found) + ' ' + _plural(issues_found, 'issue', 'issues') + ' found.\n'
+    for obj in nodes:
+        details = details + '"' + obj + '"' + node_message + '\n'
+    for obj in possible_nodes:
+        details = details + '"' + obj + '"' + possible_node_message + '\n'
+    return details[:-1]
+
+
+def _count_status(count, inbetween_value, expected_value):
+    ''' Status of checks that count something (warning if above the in-between value, error if above the expected) '''
+    if count < expected_value and count > inbetween_value:
+        return 'warning'
+    elif count < expected_value:
+        return 'pass'
+    return 'error'
+
+
+def _has_custom_values_failed(*values):
+    ''' Checks if the values provided by the user can't be used as numbers '''
+    for value in values:
+        if isinstance(value, int) == False:
+            return True
+    return False
+
+
+# Checklist Functions Start Here ================================================================
+
+# Item 0 - Frame Rate
+def check_frame_rate(snapshot=None, items=None):
+    items = items or default_checklist_items
+    item_name = items.get(0)[0]
+    expected_value = items.get(0)[1]
+    received_value = cmds.currentUnit( query=True, time=True ) # Frame Rate
+
+    if received_value == expected_value:
+        status = 'pass'
+        issues_found = 0
+    else:
+        status = 'error'
+        issues_found = 1
+
+    details = str(issues_found) + ' ' + _plural(issues_found, 'issue', 'issues') + ' found. The expected ' + item_name.lower() + ' was "'  + str(expected_value).capitalize() + '" and yours is "' + str(received_value).capitalize() + '"'
+    return create_result(0, items, status, issues_found, str(received_value).capitalize(), details,
+                         message=item_name + ': '  + str(received_value).capitalize(),
+                         received_value=received_value, expected_value=expected_value)
+
+
+# Item 1 - Scene Units =========================================================================
+def check_scene_units(snapshot=None, items=None):
+    items = items or default_checklist_items
+    item_name = items.get(1)[0]
+    expected_value = items.get(1)[1]
+    received_value = cmds.currentUnit( query=True, linear=True )
+
+    if received_value.lower() == str(expected_value).lower():
+        status = 'pass'
+        issues_found = 0
+    else:
+        status = 'error'
+        issues_found = 1
+
+    details = str(issues_found) + ' ' + _plural(issues_found, 'issue', 'issues') + ' found. The expected ' + item_name.lower() + ' was "'  + str(expected_value).capitalize() + '" and yours is "' + str(received_value).capitalize() + '"'
+    return create_result(1, items, status, issues_found, str(received_value).capitalize(), details,
+                         message=item_name + ': "'  + str(received_value) + '".',
+                         received_value=received_value, expected_value=expected_value)
+
+
+# Item 2 - Output Resolution =========================================================================
+def check_output_resolution(snapshot=None, items=None):
+    items = items or default_checklist_items
+    item_name = items.get(2)[0]
+    expected_value = items.get(2)[1]
+
+    # Check Custom Value
+    custom_settings_failed = False
+    if isinstance(expected_value, list):
+        if len(expected_value) < 2:
+            custom_settings_failed = True
+            expected_value = default_checklist_items.get(2)[1]
+
+    received_value = [cmds.getAttr("defaultResolution.width"), cmds.getAttr("defaultResolution.height")]
+    resolution_string = str(received_value[0]) + 'x' + str(received_value[1])
+
+    if str(received_value[0]).replace(' ','') == str(expected_value[0]).replace(' ','') and str(received_value[1]).replace(' ','') == str(expected_value[1]).replace(' ',''):
+        status = 'pass'
+        issues_found = 0
+    else:
+        status = 'error'
+        issues_found = 1
+
+    details = str(issues_found) + ' ' + _plural(issues_found, 'issue', 'issues') + ' found. The expected ' + item_name.lower() + ' was "'  + str(expected_value[0]) + 'x' + str(expected_value[1]) + '" and yours is "' + resolution_string + '"'
+    message = item_name + ': "' + resolution_string + '".'
+    if custom_settings_failed:
+        status = 'exception'
+        details = '1 issue found. The custom resolution settings provided couldn\'t be used to check your resolution'
+        message = 'The custom value provided couldn\'t be used to check the resolution.'
+    return create_result(2, items, status, issues_found, resolution_string, details, message=message,
+                         received_value=received_value, expected_value=expected_value)
+
+
+# Item 3 - Total Texture Count =========================================================================
+def check_total_texture_count(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+    item_name = items.get(3)[0]
+    expected_value = items.get(3)[1]
+
+    received_value = 0
+    issues_found = 0
+
+    # Count Textures (UDIM patterns are created here, the tiles are searched in parallel by the filesystem probe)
+    udim_file_patterns = []
+    all_file_nodes = snapshot.ls("file")
+    for file in all_file_nodes:
+        uv_tiling_mode = snapshot.get_attr(file, 'uvTilingMode')
+        if uv_tiling_mode != 0:
+            use_frame_extension = snapshot.get_attr(file, 'useFrameExtension')
+            file_path = snapshot.get_attr(file, 'fileTextureName')
+
+            def get_udim_file_pattern():
+                try:
+                    import maya.app.general.fileTexturePathResolver
+                    return maya.app.general.fileTexturePathResolver.getFilePatternString(file_path, use_frame_extension, uv_tiling_mode)
+                except:
+                    return None
+            udim_file_pattern = snapshot.get_node_value(file, 'udim_file_pattern', get_udim_file_pattern)
+            if udim_file_pattern:
+                udim_file_patterns.append(udim_file_pattern)
+        else:
+            received_value +=1
+
+    udim_textures = get_filesystem_probe().find_all_files(udim_file_patterns)
+    for udim_file_pattern in udim_file_patterns:
+        received_value += len(udim_textures.get(udim_file_pattern))
+
+    # Check Custom Value
+    if _has_custom_values_failed(expected_value[0], expected_value[1]):
+        details = '1 issue found. The custom value provided couldn\'t be used to check your total texture count'
+        return create_result(3, items, 'exception', 1, received_value, details,
+                             message='The custom value provided couldn\'t be used to check your total texture count',
+                             received_value=received_value)
+
+    status = _count_status(received_value, expected_value[0], expected_value[1] + 1) # Count can be equal to the expected value
+    if status == 'warning':
+        message = 'Your ' + item_name.lower() + ' is "' + str(received_value) + '" which is a high number.\nConsider optimizing. (UDIM tiles are counted as individual textures)'
+    elif status == 'pass':
+        message = item_name + ': "'  + str(received_value) + '". (UDIM tiles are counted as individual textures)'
+    else:
+        message = 'Your ' + item_name.lower() + ' should be reduced from "' + str(received_value) + '" to less than "' + str(expected_value[1]) + '".\n (UDIM tiles are counted as individual textures)'
+        issues_found = 1
+
+    details = str(issues_found) + ' ' + _plural(issues_found, 'issue', 'issues') + ' found. The expected ' + item_name.lower() + ' was less than "'  + str(expected_value[1]) + '" and yours is "' + str(received_value) + '"'
+    return create_result(3, items, status, issues_found, received_value, details, message=message, received_value=received_value)
+
+
+# Item 4 - Network File Paths =========================================================================
+def check_network_file_paths(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+    expected_value = items.get(4)[1]
+    incorrect_file_nodes = []
+    filesystem_probe = get_filesystem_probe()
+    valid_paths = filesystem_probe.normalize_prefixes(expected_value)
+
+    # Count Incorrect File Nodes
+    all_file_nodes = snapshot.ls("file")
+    for file in all_file_nodes:
+        file_path = snapshot.get_attr(file, 'fileTextureName')
+        if file_path != '':
+            for unmatched_path in filesystem_probe.get_unmatched_prefixes(file_path, valid_paths):
+                incorrect_file_nodes.append(file)
+        else:
+            incorrect_file_nodes.append(file)
+
+    if len(incorrect_file_nodes) == 0:
+        status = 'pass'
+        message = 'All file nodes currently sourced from the network.'
+    else:
+        status = 'error'
+        message = str(len(incorrect_file_nodes)) + ' of your file node paths aren\'t pointing to the network drive. \nPlease change their path to a network location. \n\n(Too see a list of nodes, generate a full report)'
+    issues_found = len(incorrect_file_nodes)
+
+    details = _list_details(issues_found, incorrect_file_nodes, ' isn\'t pointing to the the network drive. Your texture files should be sourced from the network.',
+                            no_issues_message='All textures were sourced from the network')
+    return create_result(4, items, status, issues_found, len(incorrect_file_nodes), details, message=message, nodes=incorrect_file_nodes)
+
+
+# Item 5 - Network Reference Paths =========================================================================
+def check_network_reference_paths(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+    expected_value = items.get(5)[1]
+    incorrect_reference_nodes = []
+    filesystem_probe = get_filesystem_probe()
+    valid_paths = filesystem_probe.normalize_prefixes(expected_value)
+
+    # Count Incorrect Reference Nodes
+    reference_list = snapshot.references
+    try:
+        for ref in reference_list:
+            ref_path = snapshot.get_node_value(ref, 'filename', lambda: cmds.referenceQuery(ref, filename = True))
+            if ref_path != '':
+                for unmatched_path in filesystem_probe.get_unmatched_prefixes(ref_path, valid_paths):
+                    incorrect_reference_nodes.append(ref)
+            else:
+                incorrect_reference_nodes.append(ref)
+    except:
+        print('One of your references is not associated with a reference file!')
+
+    if len(incorrect_reference_nodes) == 0:
+        status = 'pass'
+        message = 'All file nodes currently sourced from the network.'
+    else:
+        status = 'error'
+        message = str(len(incorrect_reference_nodes)) + ' of your reference paths aren\'t pointing to the network drive. \nPlease change their path to a network location. \n\n(Too see a list of nodes, generate a full report)'
+    issues_found = len(incorrect_reference_nodes)
+
+    details = _list_details(issues_found, incorrect_reference_nodes, ' isn\'t pointing to the the network drive. Your references should be sourced from the network.',
+                            no_issues_message='All references were sourced from the network')
+    return create_result(5, items, status, issues_found, len(incorrect_reference_nodes), details, message=message, nodes=incorrect_reference_nodes)
+
+
+# Item 6 - Unparented Objects =========================================================================
+def check_unparented_objects(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+    unparented_objects = []
+
+    # Count Unparented Objects
+    geo_dag_nodes = snapshot.geometry
+    for obj in geo_dag_nodes:
+        first_parent = snapshot.get_parent(obj)
+        children_members = snapshot.get_children(first_parent, node_type="transform")
+        parents_members = [snapshot.get_parent(first_parent)] if snapshot.get_parent(first_parent) else []
+        if len(children_members) + len(parents_members) == 0:
+            if snapshot.get_type(obj) != "mentalrayIblShape":
+                unparented_objects.append(obj)
+
+    if len(unparented_objects) == 0:
+        status = 'pass'
+        message = 'No unparented objects were found.'
+    else:
+        status = 'error'
+        message = str(len(unparented_objects)) + ' unparented object(s) found in this scene. \nIt\'s likely that these objects need to be part of a hierarchy.\n\n(Too see a list of objects, generate a full report)'
+    issues_found = len(unparented_objects)
+
+    details = _list_details(issues_found, unparented_objects, ' has no parent or child nodes. It should likely be part of a hierarchy.',
+                            no_issues_message='No unparented objects were found.')
+    return create_result(6, items, status, issues_found, len(unparented_objects), details, message=message, nodes=unparented_objects)
+
+
+# Item 7 - Total Triangle Count =========================================================================
+def check_total_triangle_count(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+    expected_value = items.get(7)[1][1]
+    inbetween_value = items.get(7)[1][0]
+
+    all_poly_count = snapshot.ls("mesh")
+    scene_tri_count = 0
+
+    for obj in all_poly_count:
+        mesh_statistics = snapshot.get_mesh_statistics(obj)
+        smooth_level = mesh_statistics.smooth_level
+        smooth_state = mesh_statistics.smooth_preview
+        total_tri_count = mesh_statistics.triangles
+        total_edge_count = mesh_statistics.edges
+
+        if smooth_state > 0 and smooth_level != 0:
+            one_subdiv_tri_count = (total_edge_count * 4)
+            if smooth_level > 1:
+                multi_subdiv_tri_count = one_subdiv_tri_count * (4 ** (smooth_level-1))
+                scene_tri_count = scene_tri_count + multi_subdiv_tri_count
+            else:
+                scene_tri_count += one_subdiv_tri_count
+        else:
+            scene_tri_count += total_tri_count
+
+    # Check Custom Value
+    if _has_custom_values_failed(expected_value, inbetween_value):
+        details = '1 issue found. The custom value provided couldn\'t be used to check your total triangle count'
+        return create_result(7, items, 'exception', 1, scene_tri_count, details,
+                             message='The custom value provided couldn\'t be used to check your total triangle count',
+                             received_value=scene_tri_count)
+
+    status = _count_status(scene_tri_count, inbetween_value, expected_value)
+    issues_found = 0
+    if status == 'warning':
+        message = 'Your scene has ' + str(scene_tri_count) + ' triangles, which is high. \nConsider optimizing it if possible.'
+        details = '0 issues found. Your scene has ' + str(scene_tri_count) +  ' triangles, which is high. Consider optimizing it if possible.'
+    elif status == 'pass':
+        message = 'Your scene has ' + str(scene_tri_count) +  ' triangles. \nGood job keeping the triangle count low!.'
+        details = '0 issues found. Your scene has ' + str(scene_tri_count) +  ' triangles. Good job keeping the triangle count low!.'
+    else:
+        issues_found = 1
+        message = 'Your scene has ' + str(scene_tri_count) + ' triangles. You should try to keep it under ' + str(expected_value) + '.\n\n' + 'In case you see a different number on your "Heads Up Display > Poly Count" option.  It\'s likely that you have "shapeOrig" nodes in your scene. These are intermediate shape nodes usually created by deformers. If you don\'t have deformations on your scene, you can delete these to reduce triangle count.\n'
+        details = '1 issue found. Your scene has ' + str(scene_tri_count) + ' triangles. You should try to keep it under ' + str(expected_value) + '.'
+    return create_result(7, items, status, issues_found, scene_tri_count, details, message=message, received_value=scene_tri_count)
+
+
+# Item 8 - Total Poly Object Count =========================================================================
+def check_total_poly_object_count(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+    expected_value = items.get(8)[1][1]
+    inbetween_value = items.get(8)[1][0]
+
+    all_polymesh = snapshot.ls("mesh")
+    poly_count = len(all_polymesh)
+
+    # Check Custom Values
+    if _has_custom_values_failed(expected_value, inbetween_value):
+        details = '1 issue found. The custom value provided couldn\'t be used to check your total poly count'
+        return create_result(8, items, 'exception', 1, poly_count, details,
+                             message='The custom value provided couldn\'t be used to check your total poly count',
+                             received_value=poly_count)
+
+    status = _count_status(poly_count, inbetween_value, expected_value)
+    issues_found = 0
+    if status == 'warning':
+        message = 'Your scene contains "' + str(poly_count) + '" polygon meshes, which is a high number. \nConsider optimizing it if possible.'
+        details = '0 issues found. Your scene contains "' +  str(poly_count) + '" polygon meshes, which is a high number. Consider optimizing it if possible.'
+    elif status == 'pass':
+        message = 'Your scene contains "' + str(poly_count) + '" polygon meshes.'
+        details = '0 issues found. Your scene contains "' + str(poly_count) + '" polygon meshes.'
+    else:
+        issues_found = 1
+        message = str(poly_count) + ' polygon meshes in your scene. \nTry to keep this number under ' + str(expected_value) + '.'
+        details = '1 issue found. Your scene contains "' + str(poly_count) + '" polygon meshes. Try to keep this number under "' + str(expected_value) + '".'
+    return create_result(8, items, status, issues_found, poly_count, details, message=message, received_value=poly_count)
+
+
+def _check_shadow_casting_lights(item, items, shadow_casting_lights, light_description):
+    '''
+    Creates the result of the checks that count shadow casting lights (Items 9, 10 and 11)
+
+            Parameters:
+                    item (int): Item number
+                    items (dict): Checklist items
+                    shadow_casting_lights (list): Lights casting shadows
+                    light_description (string): Type of light used in the messages. e.g. "Redshift shadow casting lights"
+
+            Returns:
+                    result (dict): Result of the check
+    '''
+    expected_value = items.get(item)[1][1]
+    inbetween_value = items.get(item)[1][0]
+    light_count = len(shadow_casting_lights)
+
+    # Check Custom Values
+    if _has_custom_values_failed(expected_value, inbetween_value):
+        message = 'The custom value provided couldn\'t be used to check your ' + light_description + '.'
+        return create_result(item, items, 'exception', 1, light_count, '1 issue found. ' + message, message=message,
+                             nodes=shadow_casting_lights, received_value=light_count)
+
+    status = _count_status(light_count, inbetween_value, expected_value)
+    issues_found = 0
+    if status == 'warning':
+        message = 'Your scene contains "' + str(light_count) + '" ' + light_description + ', which is a high number. \nConsider optimizing it if possible.'
+        details = '0 issues found. Your scene contains "' +  str(light_count) + '" ' + light_description + ', which is a high number. Consider optimizing it if possible.'
+    elif status == 'pass':
+        message = 'Your scene contains "' + str(light_count) + '" ' + light_description + '.'
+        details = '0 issues found. Your scene contains "' + str(light_count) + '" ' + light_description + '.'
+    else:
+        issues_found = 1
+        message = 'Your scene contains ' + str(light_count) + ' ' + light_description + '.\nTry to keep this number under ' + str(expected_value) + '.'
+        details = '1 issue found. Your scene contains "' + str(light_count) + '" ' + light_description + ', you should keep this number under "' + str(expected_value) + '".'
+    return create_result(item, items, status, issues_found, light_count, details, message=message,
+                         nodes=shadow_casting_lights, received_value=light_count)
+
+
+# Item 9 - Shadow Casting Light Count =========================================================================
+def check_shadow_casting_light_count(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+
+    all_lights = snapshot.lights
+    shadow_casting_lights = []
+
+    for light in all_lights:
+        shadow_state = snapshot.get_attr(light, 'useRayTraceShadows')
+        if shadow_state == 1:
+            shadow_casting_lights.append(light)
+
+    return _check_shadow_casting_lights(9, items, shadow_casting_lights, 'shadow casting lights')
+
+
+# Item 10 - Redshift Shadow Casting Light Count =========================================================================
+def check_rs_shadow_casting_light_count(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+
+    rs_physical_type = "RedshiftPhysicalLight" # Used to check if Redshift is loaded
+
+    node_types = snapshot.available_node_types
+
+    if rs_physical_type not in node_types: # is RS loaded?
+        message = 'No Redshift light types exist in the scene. Redshift plugin doesn\'t seem to be loaded.'
+        return create_result(10, items, 'exception', 0, 'No Redshift', '0 issues found, but ' + message[0].lower() + message[1:], message=message)
+
+    all_rs_lights = []
+    all_rs_lights.extend(snapshot.ls(rs_physical_type))
+    all_rs_lights.extend(snapshot.ls("RedshiftIESLight"))
+    all_rs_lights.extend(snapshot.ls("RedshiftPortalLight"))
+    all_rs_lights.extend(snapshot.ls("RedshiftDomeLight"))
+
+    rs_shadow_casting_lights = []
+
+    for rs_light in all_rs_lights:
+        if rs_light != "<done>":
+            if snapshot.get_type(rs_light) != "RedshiftPortalLight": # For some odd reason portal lights use an attribute called "shadows" instead of "shadow"
+                rs_shadow_state = snapshot.get_attr(rs_light, 'shadow')
+            else:
+                rs_shadow_state = snapshot.get_attr(rs_light, 'shadows')
+            if rs_shadow_state == 1:
+                rs_shadow_casting_lights.append(rs_light)
+
+    return _check_shadow_casting_lights(10, items, rs_shadow_casting_lights, 'Redshift shadow casting lights')
+
+
+# Item 11 - Arnold Shadow Casting Light Count =========================================================================
+def check_ai_shadow_casting_light_count(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+
+    ai_physical_type = "aiAreaLight" # Used to check if Arnold is loaded
+
+    node_types = snapshot.available_node_types
+
+    if ai_physical_type not in node_types: # is Arnold loaded?
+        message = 'No Arnold light types exist in the scene. Arnold plugin doesn\'t seem to be loaded.'
+        return create_result(11, items, 'exception', 0, 'No Arnold', '0 issues found, but ' + message[0].lower() + message[1:], message=message)
+
+    all_ai_lights = []
+    all_ai_lights.extend(snapshot.ls("aiSkyDomeLight"))
+    all_ai_lights.extend(snapshot.ls("aiMeshLight"))
+    all_ai_lights.extend(snapshot.ls("aiPhotometricLight"))
+    all_ai_lights.extend(snapshot.ls(ai_physical_type))
+
+    ai_shadow_casting_lights = []
+
+    for ai_light in all_ai_lights :
+        ai_shadow_state = snapshot.get_attr(ai_light, 'aiCastShadows')
+        if ai_shadow_state == 1:
+            ai_shadow_casting_lights.append(ai_light)
+
+    return _check_shadow_casting_lights(11, items, ai_shadow_casting_lights, 'Arnold shadow casting lights')
+
+
+# Item 12 - Default Object Names =========================================================================
+def check_default_object_names(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+
+    offending_objects = []
+    possible_offenders = []
+
+    default_object_names = items.get(12)[1]
+    if not isinstance(default_object_names, list): # Settings stored by older versions (expected value was 0)
+        default_object_names = default_checklist_items.get(12)[1]
+    matcher = get_name_pattern_matcher(default_object_names)
+
+    all_objects = snapshot.lights_and_geometry
+
+    for obj in all_objects:
+        match_kind = matcher.match(obj)
+        if match_kind == NamePatternMatcher.starts_with:
+            offending_objects.append(obj)
+        elif match_kind == NamePatternMatcher.contains:
+            possible_offenders.append(obj)
+
+    # Manage Strings
+    patch_message_warning = str(len(possible_offenders)) + _plural(len(possible_offenders), ' object contains', ' objects contain') + ' a string extremelly similar to the default names.\n(Ignore this warning if the name describes your object properly)'
+    patch_message_error = str(len(offending_objects)) + _plural(len(offending_objects), ' object was', ' objects were') + ' not named properly. \nPlease rename your objects descriptively.'
+
+    # Manage Status
+    if len(possible_offenders) != 0 and len(offending_objects) == 0:
+        status = 'warning'
+        output = '[ ' + str(len(possible_offenders)) + ' ]'
+        message = patch_message_warning
+    elif len(offending_objects) == 0:
+        status = 'pass'
+        output = '0'
+        message = 'No unnamed objects were found, well done!'
+    else:
+        status = 'error'
+        output = str(len(offending_objects))
+        message = patch_message_error
+        if len(possible_offenders) != 0:
+            output = str(len(offending_objects)) + ' + [ ' + str(len(possible_offenders)) + ' ]'
+            message = patch_message_error + '\n\n' + patch_message_warning
+    issues_found = len(offending_objects)
+
+    details = _list_details(issues_found, offending_objects, ' was not named properly. Please rename your object descriptively.',
+                            possible_offenders, '  contains a string extremelly similar to the default names.',
+                            no_issues_message='No unnamed objects were found, well done!')
+    return create_result(12, items, status, issues_found, output, details, message=message,
+                         nodes=offending_objects, possible_nodes=possible_offenders)
+
+
+# Item 13 - Objects Assigned to lambert1 =========================================================================
+def check_objects_assigned_to_lambert1(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+
+    lambert1_objects = snapshot.get_set_members("initialShadingGroup")
+
+    if len(lambert1_objects) == 0:
+        status = 'pass'
+        message = 'No objects were assigned to lambert1.'
+    else:
+        status = 'error'
+        message = str(len(lambert1_objects)) + _plural(len(lambert1_objects), ' object is', ' objects are') + ' assigned to lambert1. \nMake sure no objects are assigned to lambert1.\n\n(Too see a list of objects, generate a full report)'
+    issues_found = len(lambert1_objects)
+
+    details = _list_details(issues_found, lambert1_objects, '  is assigned to lambert1. It should be assigned to another shader.',
+                            no_issues_message='No objects are assigned to lambert1.')
+    return create_result(13, items, status, issues_found, len(lambert1_objects), details, message=message, nodes=lambert1_objects)
+
+
+# Item 14 - Ngons =========================================================================
+def check_ngons(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+
+    ngons_list = []
+    for obj in snapshot.ls('mesh'):
+        mesh_statistics = snapshot.get_mesh_statistics(obj)
+        if not mesh_statistics.is_intermediate: # Not rendered (same as "polyCleanup")
+            for face_id in mesh_statistics.ngon_faces:
+                ngons_list.append(mesh_statistics.transform + '.f[' + str(face_id) + ']')
+
+    if len(ngons_list) == 0:
+        status = 'pass'
+        message = 'No ngons were found in your scene. Good job!'
+    else:
+        status = 'error'
+        message = str(len(ngons_list)) + _plural(len(ngons_list), ' ngon', ' ngons') + ' found in your scene. \nMake sure no faces have more than 4 sides.\n\n(Too see a list of objects, generate a full report)'
+    issues_found = len(ngons_list)
+
+    details = _list_details(issues_found, ngons_list, '  is an ngon (face with more than 4 sides).',
+                            no_issues_message='No ngons were found in your scene.')
+    return create_result(14, items, status, issues_found, len(ngons_list), details, message=message, nodes=ngons_list)
+
+
+# Item 15 - Non-manifold Geometry =========================================================================
+def check_non_manifold_geometry(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+
+    nonmanifold_geo = []
+    nonmanifold_verts = []
+
+    all_geo = snapshot.ls('mesh', long=True)
+
+    for geo in all_geo:
+        vertex_ids = snapshot.get_mesh_statistics(geo).non_manifold_vertices
+        if len(vertex_ids) > 0:
+            nonmanifold_geo.append(geo)
+            nonmanifold_verts.append([geo + '.vtx[' + str(vertex_id) + ']' for vertex_id in vertex_ids])
+
+    if len(nonmanifold_geo) == 0:
+        status = 'pass'
+        message = 'No objects with non-manifold geometry in your scene. Well Done!'
+    else:
+        status = 'error'
+        message = str(len(nonmanifold_geo)) + _plural(len(nonmanifold_geo), ' object with non-manifold geometry was', ' objects with non-manifold geometry were') + ' found in your scene. \n\n(Too see a list of objects, generate a full report)'
+    issues_found = len(nonmanifold_geo)
+
+    details = _list_details(issues_found, [get_short_name(obj) for obj in nonmanifold_geo], '  has non-manifold geometry.',
+                            no_issues_message='No non-manifold geometry found in your scene.')
+    return create_result(15, items, status, issues_found, len(nonmanifold_geo), details, message=message,
+                         nodes=nonmanifold_geo, non_manifold_vertices=nonmanifold_verts)
+
+
+# Item 16 - Empty UV Sets =========================================================================
+def check_empty_uv_sets(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+
+    objects_extra_empty_uv_sets = []
+
+    all_geo = snapshot.ls('mesh')
+
+    for obj in all_geo:
+        mesh_statistics = snapshot.get_mesh_statistics(obj)
+        if len(mesh_statistics.uv_sets) > 1: # Objects without UVs are ignored if they only have one UV set
+            for uv_count in mesh_statistics.uv_counts:
+                if uv_count == 0:
+                    objects_extra_empty_uv_sets.append(obj)
+
+    if len(objects_extra_empty_uv_sets) == 0:
+        status = 'pass'
+        message = 'No empty UV sets.'
+    else:
+        status = 'error'
+        message = str(len(objects_extra_empty_uv_sets)) + _plural(len(objects_extra_empty_uv_sets), ' object', ' objects') + ' found contaning multiple UV Sets and empty UV Sets. \n\n(Too see a list of objects, generate a full report)'
+    issues_found = len(objects_extra_empty_uv_sets)
+
+    details = _list_details(issues_found, objects_extra_empty_uv_sets, ' has multiple UV Sets and Empty UV Sets.',
+                            no_issues_message='No geometry with multiple UV Sets and Empty UV Sets.')
+    return create_result(16, items, status, issues_found, len(objects_extra_empty_uv_sets), details, message=message,
+                         nodes=objects_extra_empty_uv_sets)
+
+
+# Item 17 - Frozen Transforms =========================================================================
+def check_frozen_transforms(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+
+    objects_no_frozen_transforms = []
+
+    all_transforms = snapshot.ls('transform')
+
+    for transform in all_transforms:
+        children = snapshot.get_children(transform)
+        for child in children:
+            object_type = snapshot.get_type(child)
+            if object_type == 'mesh' or object_type == 'nurbsCurve':
+                if snapshot.get_attr(transform, 'rotateX') != 0 or snapshot.get_attr(transform, 'rotateY') != 0 or snapshot.get_attr(transform, 'rotateZ') != 0:
+                    if len(snapshot.get_connections(transform + ".rotateX")) == 0 and len(snapshot.get_connections(transform + ".rotateY")) == 0 and len(snapshot.get_connections(transform + ".rotateZ")) == 0 and len(snapshot.get_connections(transform + ".rotate")) == 0:
+                        objects_no_frozen_transforms.append(transform)
+
+    if len(objects_no_frozen_transforms) == 0:
+        status = 'pass'
+        message = 'No objects have un-frozen transformations.'
+    else:
+        status = 'warning'
+        message = str(len(objects_no_frozen_transforms)) + _plural(len(objects_no_frozen_transforms), ' object has', ' objects have') + ' un-frozen transformations. \n\n(Too see a list of objects, generate a full report)'
+    issues_found = len(objects_no_frozen_transforms)
+
+    details = _list_details(issues_found, objects_no_frozen_transforms, ' has un-frozen transformations.',
+                            no_issues_message='No objects have un-frozen transformations.')
+    return create_result(17, items, status, issues_found, len(objects_no_frozen_transforms), details, message=message,
+                         nodes=objects_no_frozen_transforms)
+
+
+# Item 18 - Animated Visibility =========================================================================
+def check_animated_visibility(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+
+    objects_animated_visibility = []
+    objects_hidden = []
+
+    all_transforms = snapshot.ls('transform')
+
+    for transform in all_transforms: # Every transform has a "visibility" attribute (inherited from dagNode)
+        if snapshot.get_attr(transform, 'visibility') == 0:
+            children = snapshot.get_children(transform, node_type='shape')
+            if len(children) != 0:
+                if snapshot.get_type(children[0]) != "camera":
+                    objects_hidden.append(transform)
+        input_nodes = snapshot.get_connections(transform + ".visibility", destination=False, source=True)
+        for node in input_nodes:
+            if 'animCurve' in snapshot.get_type(node):
+                objects_animated_visibility.append(transform)
+
+    # Manage Strings
+    patch_message_warning = str(len(objects_hidden)) + _plural(len(objects_hidden), ' object is', ' objects are') + ' hidden.\n'
+    patch_message_error = str(len(objects_animated_visibility)) + _plural(len(objects_animated_visibility), ' object', ' objects') + ' with animated visibility.\n'
+
+    # Manage Status
+    if len(objects_hidden) != 0 and len(objects_animated_visibility) == 0:
+        status = 'warning'
+        output = '[ ' + str(len(objects_hidden)) + ' ]'
+        message = patch_message_warning
+    elif len(objects_animated_visibility) == 0:
+        status = 'pass'
+        output = '0'
+        message = 'No objects with animated visibility or hidden.'
+    else:
+        status = 'error'
+        output = str(len(objects_animated_visibility))
+        message = patch_message_error
+        if len(objects_hidden) != 0:
+            output = str(len(objects_animated_visibility)) + ' + [ ' + str(len(objects_hidden)) + ' ]'
+            message = patch_message_error + '\n\n' + patch_message_warning
+    issues_found = len(objects_animated_visibility)
+
+    details = _list_details(issues_found, objects_animated_visibility, ' has animated visibility.',
+                            objects_hidden, ' is hidden.',
+                            no_issues_message='No unnamed objects were found, well done!')
+    return create_result(18, items, status, issues_found, output, details, message=message,
+                         nodes=objects_animated_visibility, possible_nodes=objects_hidden)
+
+
+# Item 19 - Non Deformer History =========================================================================
+def check_non_deformer_history(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+
+    objects_non_deformer_history = []
+    possible_objects_non_deformer_history = []
+
+    objects_to_check = []
+    objects_to_check.extend(snapshot.ls('nurbsSurface'))
+    objects_to_check.extend(snapshot.ls('mesh'))
+    objects_to_check.extend(snapshot.ls('subdiv'))
+    objects_to_check.extend(snapshot.ls('nurbsCurve'))
+
+    not_history_nodes = ['tweak', 'expression', 'unitConversion', 'time', 'objectSet', 'reference', 'polyTweak', 'blendShape', 'groupId', \
+    'renderLayer', 'renderLayerManager', 'shadingEngine', 'displayLayer', 'skinCluster', 'groupParts', 'mentalraySubdivApprox', 'proximityWrap',\
+    'cluster', 'cMuscleSystem', 'timeToUnitConversion', 'deltaMush', 'tension', 'wire', 'wrinkle', 'softMod', 'jiggle', 'diskCache', 'leastSquaresModifier']
+
+    possible_not_history_nodes = ['nonLinear','ffd', 'curveWarp', 'wrap', 'shrinkWrap', 'sculpt', 'textureDeformer']
+
+    # Find Offenders
+    history_analyzer = HistoryAnalyzer(snapshot, not_history_nodes, possible_not_history_nodes)
+    checked_objects = set()
+    for obj in objects_to_check:
+        if obj in checked_objects:
+            continue
+        checked_objects.add(obj)
+        kinds = history_analyzer.get_history_kinds(obj)
+        if HistoryAnalyzer.non_deformer in kinds:
+            objects_non_deformer_history.append(obj)
+        if HistoryAnalyzer.suspicious in kinds:
+            possible_objects_non_deformer_history.append(obj)
+
+    # Manage Strings
+    patch_message_warning = str(len(possible_objects_non_deformer_history)) + _plural(len(possible_objects_non_deformer_history), ' object contains', ' objects contain') + ' deformers often used for modeling.\n'
+    patch_message_error = str(len(objects_non_deformer_history)) + _plural(len(objects_non_deformer_history), ' object contains', ' objects contain') + ' non-deformer history.\n'
+
+    # Manage Status
+    if len(possible_objects_non_deformer_history) != 0 and len(objects_non_deformer_history) == 0:
+        status = 'warning'
+        output = '[ ' + str(len(possible_objects_non_deformer_history)) + ' ]'
+        message = patch_message_warning
+    elif len(objects_non_deformer_history) == 0:
+        status = 'pass'
+        output = '0'
+        message = 'No objects with non-deformer history were found.'
+    else:
+        status = 'error'
+        output = str(len(objects_non_deformer_history))
+        message = patch_message_error
+        if len(possible_objects_non_deformer_history) != 0:
+            output = str(len(objects_non_deformer_history)) + ' + [ ' + str(len(possible_objects_non_deformer_history)) + ' ]'
+            message = patch_message_error + '\n\n' + patch_message_warning
+    issues_found = len(objects_non_deformer_history)
+
+    details = _list_details(issues_found, objects_non_deformer_history, ' contains non-deformer history.',
+                            possible_objects_non_deformer_history, ' contains deformers often used for modeling.',
+                            no_issues_message='No objects with non-deformer history!')
+    return create_result(19, items, status, issues_found, output, details, message=message,
+                         nodes=objects_non_deformer_history, possible_nodes=possible_objects_non_deformer_history)
+
+
+# Item 20 - Textures Color Space =========================================================================
+def check_textures_color_space(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+
+    objects_wrong_color_space = []
+    possible_objects_wrong_color_space = []
+
+    # These types return an error instead of warning
+    error_types = ['RedshiftMaterial','RedshiftArchitectural', 'RedshiftDisplacement', 'RedshiftColorCorrection', 'RedshiftBumpMap', 'RedshiftSkin', 'RedshiftSubSurfaceScatter',\
+    'aiStandardSurface', 'aiFlat', 'aiCarPaint', 'aiBump2d', '', 'aiToon', 'aiBump3d', 'aiAmbientOcclusion', 'displacementShader']
+
+    # If type starts with any of these strings it will be tested
+    check_types = ['Redshift', 'ai', 'lambert', 'blinn', 'phong', 'useBackground', 'checker', 'ramp', 'volumeShader', 'displacementShader', 'anisotropic', 'bump2d']
+
+    # These types and connections are allowed to be float3 even though it's raw
+    float3_to_float_exceptions = {'RedshiftBumpMap': 'input',
+                                  'RedshiftDisplacement':'texMap'}
+
+    # Count Textures
+    all_file_nodes = snapshot.ls("file")
+    for file in all_file_nodes:
+        color_space = snapshot.get_attr(file, 'colorSpace')
+
+        has_suspicious_connection = False
+        has_error_node_type = False
+
+        intput_node_connections = snapshot.get_connections(file, destination=True, source=False, plugs=True)
+
+        suspicious_connections = []
+
+        for in_con in intput_node_connections:
+            if color_space.lower() not in ['raw', 'srgb']:
+                break
+            node = in_con.split('.')[0]
+            node_in_con = in_con.split('.')[1]
+
+            node_type = snapshot.get_type(node)
+
+            if node_type in error_types:
+                has_error_node_type = True
+
+            should_be_checked = False
+            for types in check_types:
+                if node_type.startswith(types):
+                    should_be_checked = True
+
+            if should_be_checked:
+                data_type = snapshot.get_node_value(node, 'type_' + node_in_con, lambda: cmds.getAttr(in_con, type=True))
+                is_float3_exception = node_type in float3_to_float_exceptions and node_in_con in float3_to_float_exceptions.values()
+                if color_space.lower() == 'raw':
+                    if data_type == 'float3' and is_float3_exception == False:
+                        has_suspicious_connection = True
+                        suspicious_connections.append(in_con)
+                else: # sRGB
+                    if data_type == 'float':
+                        has_suspicious_connection = True
+                        suspicious_connections.append(in_con)
+                    if is_float3_exception:
+                        has_suspicious_connection = True
+                        suspicious_connections.append(in_con)
+
+        if has_suspicious_connection:
+            if has_error_node_type:
+                objects_wrong_color_space.append([file,suspicious_connections])
+            else:
+                possible_objects_wrong_color_space.append([file,suspicious_connections])
+
+    # Manage Strings
+    patch_message_warning = str(len(possible_objects_wrong_color_space)) + _plural(len(possible_objects_wrong_color_space), ' file node is', ' file nodes are') + ' using a color space that might not be appropriate for its connection.\n'
+    patch_message_error = str(len(objects_wrong_color_space)) + _plural(len(objects_wrong_color_space), ' file node is', ' file nodes are') + ' using a color space that is not appropriate for its connection.\n'
+
+    # Manage Status
+    if len(possible_objects_wrong_color_space) != 0 and len(objects_wrong_color_space) == 0:
+        status = 'warning'
+        output = '[ ' + str(len(possible_objects_wrong_color_space)) + ' ]'
+        message = patch_message_warning
+    elif len(objects_wrong_color_space) == 0:
+        status = 'pass'
+        output = '0'
+        message = 'No color space issues were found.'
+    else:
+        status = 'error'
+        output = str(len(objects_wrong_color_space))
+        message = patch_message_error
+        if len(possible_objects_wrong_color_space) != 0:
+            output = str(len(objects_wrong_color_space)) + ' + [ ' + str(len(possible_objects_wrong_color_space)) + ' ]'
+            message = patch_message_error + '\n\n' + patch_message_warning
+    issues_found = len(objects_wrong_color_space)
+
+    # Report
+    if issues_found > 0 or len(possible_objects_wrong_color_space) > 0:
+        details = str(issues_found) + ' ' + _plural(issues_found, 'issue', 'issues') + ' found.\n'
+        for obj in objects_wrong_color_space:
+            details = details + '"' + obj[0] +  '" is using a color space (' + snapshot.get_attr(obj[0], 'colorSpace') + ') that is not appropriate for its connection.\n'
+            for connection in obj[1]:
+                details = details + '   "' + connection + '" triggered this error.\n'
+        for obj in possible_objects_wrong_color_space:
+            details = details + '"' + obj[0] +  '" might be using a color space (' + snapshot.get_attr(obj[0], 'colorSpace') + ') that is not appropriate for its connection.\n'
+            for connection in obj[1]:
+                details = details + '   "' + connection + '" triggered this warning.\n'
+        details = details[:-1]
+    else:
+        details = str(issues_found) + ' issues found. No color space issues were found!'
+    return create_result(20, items, status, issues_found, output, details, message=message,
+                         nodes=[obj[0] for obj in objects_wrong_color_space],
+                         possible_nodes=[obj[0] for obj in possible_objects_wrong_color_space],
+                         connections=objects_wrong_color_space + possible_objects_wrong_color_space)
+
+
+# Item 21 - Network Paths (Miscellaneous) - Other Network Paths =========================================================================
+def check_other_network_paths(snapshot=None, items=None):
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    items = items or default_checklist_items
+    expected_value = items.get(21)[1]
+    incorrect_path_nodes = []
+    filesystem_probe = get_filesystem_probe()
+    valid_paths = filesystem_probe.normalize_prefixes(expected_value)
+
+    def check_paths(node_type, path_attribute_name, accepts_empty=False, checks_multiple_paths=False, multiple_paths_spliter=';'):
+        try:
+            all_provided_type_nodes = snapshot.ls(node_type)
+            for node in all_provided_type_nodes:
+                file_path = snapshot.get_attr(node, path_attribute_name) or ''
+
+                if checks_multiple_paths:
+                    file_path = file_path.split(multiple_paths_spliter)
+                    for one_path in file_path:
+                        if one_path != '':
+                            for unmatched_path in filesystem_probe.get_unmatched_prefixes(one_path, valid_paths):
+                                incorrect_path_nodes.append([node, node_type])
+                        else:
+                            if not accepts_empty:
+                                incorrect_path_nodes.append([node, node_type])
+                else:
+                    if file_path != '':
+                        for unmatched_path in filesystem_probe.get_unmatched_prefixes(file_path, valid_paths):
+                            incorrect_path_nodes.append([node, node_type])
+                    else:
+                        if not accepts_empty:
+                            incorrect_path_nodes.append([node, node_type])
+        except:
+            print('Something went wrong when checking the attribute "' + path_attribute_name + '" in the nodes of type "' + str(node_type) + '".')
+
+    node_types = snapshot.available_node_types
+
+    # Count Nodes Incorrect  with Incorrect Paths
+    for node_type, path_attribute_name, accepts_empty, checks_multiple_paths in get_other_network_path_attributes(node_types):
+        check_paths(node_type, path_attribute_name, accepts_empty=accepts_empty, checks_multiple_paths=checks_multiple_paths)
+
+    if len(incorrect_path_nodes) == 0:
+        status = 'pass'
+        message = 'All file nodes currently sourced from the network.'
+    else:
+        status = 'error'
+        message = str(len(incorrect_path_nodes)) + _plural(len(incorrect_path_nodes), ' path isn\'t', ' paths aren\'t') + ' pointing to the network drive. \nPlease change it to a network location. \n\n(Too see a list of nodes, generate a full report)'
+    issues_found = len(incorrect_path_nodes)
+
+    if issues_found > 0:
+        details = str(issues_found) + ' ' + _plural(issues_found, 'issue', 'issues') + ' found.\n'
+        for bad_node in incorrect_path_nodes:
+            details = details + '"' + bad_node[0] +  '" of the type "'+ bad_node[1] + '" isn\'t pointing to the the network drive. Your paths should be sourced from the network.\n'
+        details = details[:-1]
+    else:
+        details = str(issues_found) + ' issues found. All paths were sourced from the network'
+    return create_result(21, items, status, issues_found, len(incorrect_path_nodes), details, message=message,
+                         nodes=[bad_node[0] for bad_node in incorrect_path_nodes], node_types=[bad_node[1] for bad_node in incorrect_path_nodes])
+
+
+def get_other_network_path_attributes(node_types):
+    '''
+    Returns the path attributes checked by "check_other_network_paths" (Only for the plugins that are loaded)
+
+            Parameters:
+                    node_types (set): Node types available in the scene (used to check which plugins are loaded)
+
+            Returns:
+                    path_attributes (list): A list of [node type, attribute, accepts empty, checks multiple paths]
+    '''
+    # General Checks
+    path_attributes = [['audio', 'filename', False, False],
+                       ['cacheFile', 'cachePath', False, False]]
+
+    # Alembic Cache:
+    if 'AlembicNode' in node_types:
+        path_attributes.append(['AlembicNode', 'abc_File', False, False])
+
+    # GPU Cache:
+    if 'gpuCache' in node_types:
+        path_attributes.append(['gpuCache', 'cacheFileName', False, False])
+
+    # BIF Cache:
+    if 'BifMeshImportNode' in node_types:
+        path_attributes.append(['BifMeshImportNode', 'bifMeshDirectory', False, False])
+
+    # MASH Checks
+    if 'MASH_Audio' in node_types:
+        path_attributes.append(['MASH_Audio', 'filename', False, False])
+
+    # Arnold Checks
+    if 'aiAreaLight' in node_types:
+        path_attributes.append(['aiStandIn', 'dso', False, False])
+        path_attributes.append(['aiVolume', 'filename', False, False])
+        path_attributes.append(['aiPhotometricLight', 'aiFilename', False, False])
+
+    # Redshift Checks
+    if 'RedshiftPhysicalLight' in node_types:
+        path_attributes.append(['RedshiftProxyMesh', 'fileName', False, False])
+        path_attributes.append(['RedshiftVolumeShape', 'fileName', False, False])
+        path_attributes.append(['RedshiftNormalMap', 'tex0', False, False])
+        path_attributes.append(['RedshiftDomeLight', 'tex0', False, False])
+        path_attributes.append(['RedshiftIESLight', 'profile', False, False])
+
+    # Golaem Checks
+    if 'CrowdEntityTypeNode' in node_types:
+        path_attributes.append(['SimulationCacheProxyManager', 'destinationTerrainFile', True, False])
+        path_attributes.append(['SimulationCacheProxyManager', 'skinningShaderFile', True, False])
+        path_attributes.append(['CrowdEntityTypeNode', 'characterFile', True, False])
+        path_attributes.append(['CharacterMakerLocator', 'currentFile', True, False])
+        path_attributes.append(['TerrainLocator', 'navMeshFile', True, False])
+        path_attributes.append(['SimulationCacheProxy', 'inputCacheDir', True, False])
+        # Multiple Files
+        path_attributes.append(['SimulationCacheProxy', 'characterFiles', True, True])
+        path_attributes.append(['CrowdManagerNode', 'characterFiles', True, True])
+    return path_attributes
+
+# Checklist Functions End Here ===================================================================
+
+
+# Checks in the order they appear in the checklist
+checklist_functions = [check_frame_rate,
+                       check_scene_units,
+                       check_output_resolution,
+                       check_total_texture_count,
+                       check_network_file_paths,
+                       check_network_reference_paths,
+                       check_unparented_objects,
+                       check_total_triangle_count,
+                       check_total_poly_object_count,
+                       check_shadow_casting_light_count,
+                       check_rs_shadow_casting_light_count,
+                       check_ai_shadow_casting_light_count,
+                       check_default_object_names,
+                       check_objects_assigned_to_lambert1,
+                       check_ngons,
+                       check_non_manifold_geometry,
+                       check_empty_uv_sets,
+                       check_frozen_transforms,
+                       check_animated_visibility,
+                       check_non_deformer_history,
+                       check_textures_color_space,
+                       check_other_network_paths]
+
+
+def run_check(check_function, item, snapshot, items=None):
+    '''
+    Runs a single check. If the check raises an error (e.g. degenerate mesh or plugin node that can't be queried),
+    an "exception" result is returned instead, so the results of the other checks can still be reported
+
+            Parameters:
+                    check_function (function): Check to run. e.g. "check_ngons"
+                    item (int): Item number of the check (key in the checklist items)
+                    snapshot (SceneSnapshot): Snapshot shared by the checks
+                    items (dict): Checklist items (names and expected values). Default values are used if not provided
+
+            Returns:
+                    result (dict): Result of the check (see module description)
+    '''
+    try:
+        return check_function(snapshot, items)
+    except Exception as e:
+        message = 'The check couldn\'t be performed: ' + str(e)
+        return create_result(item, items or default_checklist_items, 'exception', 1, '?', '1 issue found. ' + message, message=message)
+
+
+def run_checks(snapshot=None, items=None, profile=False):
+    '''
+    Runs every check on the current scene (no user interface)
+
+            Parameters:
+                    snapshot (SceneSnapshot): Snapshot shared by the checks (a new one is created if not provided)
+                    items (dict): Checklist items (names and expected values). Default values are used if not provided
+                    profile (bool): If True, every result gets a "profile" (see "CheckProfiler")
+
+            Returns:
+                    results (list): A list of result dictionaries, one for each check (see module description)
+    '''
+    if snapshot is None:
+        snapshot = SceneSnapshot()
+    results = []
+    for item, check_function in enumerate(checklist_functions):
+        if profile:
+            with CheckProfiler() as profiler:
+                result = run_check(check_function, item, snapshot, items)
+            result['profile'] = profiler.get_profile()
+        else:
+            result = run_check(check_function, item, snapshot, items)
+        results.append(result)
+    return results
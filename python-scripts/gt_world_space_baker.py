@@ -14,8 +14,30 @@
  Minor PEP8 Cleanup
  Dropped Python 2 support (Only Python 3+ now)
 
- TODO:
-    Add sparse key option
+ 1.0.3 - 2026-10-18
+ Extraction changes time once per frame and samples all objects at that frame (instead of once per object)
+ Added "benchmark_world_space_extraction"
+
+ 1.0.4 - 2026-10-18
+ Extraction no longer changes the current time (frames are evaluated through DG contexts)
+
+ 1.0.5 - 2026-10-18
+ Bake converts the stored data to local space in one pass and writes each channel with a single bulk operation
+ Bake no longer changes the current time
+
+ 1.0.6 - 2026-10-18
+ Added optional key reduction after the bake (translate and rotate tolerances)
+
+ 1.0.7 - 2026-10-18
+ Stored data uses "WorldSpaceStorage" (one float64 buffer per channel and a shared time axis)
+ Stored data can be saved to and loaded from disk (bake in another session)
+
+ 1.0.8 - 2026-10-18
+ Added sampling modes: every frame, every Nth frame, sub-frame steps and key times only (sparse bake)
+ Extraction accepts an explicit list of frames ("extract_world_space_data(frames=[...])")
+
+ 1.0.9 - 2026-10-18
+ Added reference space ("Load Space"): transforms are extracted relative to an object and baked following it
 
 """
 try:
@@ -30,8 +52,13 @@ except ImportError:
     from PySide.QtGui import QIcon, QWidget
 
 from maya import OpenMayaUI as OpenMayaUI
+from gt_anim_utilities import bake_world_transforms, decompose_world_matrix, get_sampled_matrix, sample_world_matrices
+from gt_anim_utilities import print_reduction_stats, reduce_baked_keys
+from gt_world_space_storage import WorldSpaceStorage, is_world_space_storage, storage_extension
+from array import array
 import maya.cmds as cmds
 import logging
+import sys
 
 # Logging Setup
 logging.basicConfig()
@@ -42,7 +69,7 @@ logger.setLevel(logging.INFO)
 script_name = "GT - World Space Baker"
 
 # Version:
-script_version = "1.0.2"
+script_version = "1.0.9"
 
 # Settings
 try:
@@ -51,12 +78,27 @@ except NameError:
     gt_world_space_baker_settings = {'stored_elements': [],
                                      'start_time_range': 1,
                                      'end_time_range': 120,
+                                     'reduce_keys': False,
+                                     'translate_tolerance': 0.01,
+                                     'rotate_tolerance': 0.1,
+                                     'sampling_mode': 'every_frame',
+                                     'sampling_nth_frame': 2,
+                                     'sampling_sub_frame_step': 0.5,
+                                     'space_object': '',
                                      }
+# Sampling modes (key: label used in the UI)
+sampling_modes = {'every_frame': 'Every Frame',
+                  'every_nth_frame': 'Every Nth Frame',
+                  'sub_frame': 'Sub-Frame Step',
+                  'key_times': 'Key Times Only',
+                  }
 # Stored Animation (Current Instance)
 try:
     gt_world_space_baker_anim_storage
+    if isinstance(gt_world_space_baker_anim_storage, dict):  # Storage created by a previous version
+        gt_world_space_baker_anim_storage = WorldSpaceStorage()
 except NameError:
-    gt_world_space_baker_anim_storage = {}
+    gt_world_space_baker_anim_storage = WorldSpaceStorage()
 
 
 # Main Form ============================================================================
@@ -71,6 +113,23 @@ def build_gui_world_space_baker():
         """
         gt_world_space_baker_settings['start_time_range'] = cmds.intField(auto_key_start_int_field, q=True, value=True)
         gt_world_space_baker_settings['end_time_range'] = cmds.intField(auto_key_end_int_field, q=True, value=True)
+        gt_world_space_baker_settings['reduce_keys'] = cmds.checkBox(reduce_keys_chk, q=True, value=True)
+        gt_world_space_baker_settings['translate_tolerance'] = cmds.floatField(translate_tolerance_field, q=True,
+                                                                               value=True)
+        gt_world_space_baker_settings['rotate_tolerance'] = cmds.floatField(rotate_tolerance_field, q=True,
+                                                                            value=True)
+        cmds.rowColumnLayout(tolerance_column, e=True, en=gt_world_space_baker_settings.get('reduce_keys'))
+        selected_label = cmds.optionMenu(sampling_mode_menu, q=True, value=True)
+        for mode, label in sampling_modes.items():
+            if label == selected_label:
+                gt_world_space_baker_settings['sampling_mode'] = mode
+        gt_world_space_baker_settings['sampling_nth_frame'] = cmds.intField(sampling_nth_frame_field, q=True,
+                                                                            value=True)
+        gt_world_space_baker_settings['sampling_sub_frame_step'] = cmds.floatField(sampling_sub_frame_field, q=True,
+                                                                                   value=True)
+        sampling_mode = gt_world_space_baker_settings.get('sampling_mode')
+        cmds.intField(sampling_nth_frame_field, e=True, en=sampling_mode == 'every_nth_frame')
+        cmds.floatField(sampling_sub_frame_field, e=True, en=sampling_mode == 'sub_frame')
 
     def object_load_handler():
         """
@@ -105,6 +164,31 @@ def build_gui_world_space_baker():
             cmds.button(ws_anim_extract_btn, e=True, en=False)
             cmds.rowColumnLayout(range_column, e=True, en=False)
 
+    def space_load_handler(clear=False):
+        """
+        Function to handle the space buttons. Stores the selected object as reference space (or clears it).
+
+        Args:
+            clear (optional, bool): If True, the reference space goes back to world
+        """
+        if not clear:
+            current_selection = cmds.ls(selection=True)
+            if len(current_selection) != 1:
+                cmds.warning("Please select only one object to be used as reference space.")
+                return
+            gt_world_space_baker_settings['space_object'] = current_selection[0]
+        else:
+            gt_world_space_baker_settings['space_object'] = ''
+        update_space_button()
+
+    def update_space_button():
+        """ Updates the space status button to reflect the stored space """
+        space_object = gt_world_space_baker_settings.get('space_object', '')
+        if space_object:
+            cmds.button(space_status_btn, e=True, l=space_object, bgc=(.6, .8, .6))
+        else:
+            cmds.button(space_status_btn, e=True, l='World', bgc=(.2, .2, .2))
+
     def get_auto_key_current_frame(target_integer_field='start'):
         """
         Gets the current frame and fills an integer field.
@@ -123,6 +207,24 @@ def build_gui_world_space_baker():
 
         update_stored_settings()
 
+    def load_data_handler():
+        """
+        Function to handle the load data button. Loads a data file and updates the UI to reflect the loaded data.
+        """
+        if not load_world_space_data():
+            return
+        stored_elements = gt_world_space_baker_settings.get('stored_elements')
+        cmds.intField(auto_key_start_int_field, e=True, value=gt_world_space_baker_settings.get('start_time_range'))
+        cmds.intField(auto_key_end_int_field, e=True, value=gt_world_space_baker_settings.get('end_time_range'))
+        if len(stored_elements) == 1:
+            load_message = stored_elements[0]
+        else:
+            load_message = str(len(stored_elements)) + ' objects'
+        cmds.button(selection_status_btn, l=load_message, e=True, bgc=(.6, .8, .6))
+        cmds.button(ws_anim_extract_btn, e=True, en=True)
+        cmds.rowColumnLayout(range_column, e=True, en=True)
+        validate_operation('refresh')
+
     def validate_operation(operation='extract'):
         """ Checks elements one last time before running the script """
 
@@ -206,6 +308,11 @@ def build_gui_world_space_baker():
     selection_status_btn = cmds.button(l="Not loaded yet", bgc=(.2, .2, .2), w=115,
                                        c=lambda x: select_existing_objects(
                                            gt_world_space_baker_settings.get('stored_elements')))
+    cmds.separator(h=5, style='none')  # Empty Space
+    cmds.separator(h=5, style='none')  # Empty Space
+    cmds.button(l="Load Space", c=lambda x: space_load_handler(), w=115)
+    space_status_btn = cmds.button(l="World", bgc=(.2, .2, .2), w=115, c=lambda x: space_load_handler(clear=True))
+    update_space_button()
 
     # 2. Range
     range_column = cmds.rowColumnLayout(nc=1, cw=[(1, 240)], cs=[(1, 20)], p=content_main, en=False)
@@ -226,6 +333,22 @@ def build_gui_world_space_baker():
                                            cc=lambda x: update_stored_settings())
     cmds.button(l="Get", c=lambda x: get_auto_key_current_frame('end'), h=5)  # L
     cmds.separator(h=10, style='none')  # Empty Space
+
+    # Sampling
+    cmds.rowColumnLayout(nc=5, cw=[(1, 110), (2, 20), (3, 35), (4, 25), (5, 40)], cs=[(1, 10), (3, 5), (5, 5)],
+                         p=range_column)
+    sampling_mode_menu = cmds.optionMenu(cc=lambda x: update_stored_settings())
+    for sampling_label in sampling_modes.values():
+        cmds.menuItem(label=sampling_label)
+    cmds.optionMenu(sampling_mode_menu, e=True,
+                    value=sampling_modes.get(gt_world_space_baker_settings.get('sampling_mode', 'every_frame')))
+    cmds.text('N:')
+    sampling_nth_frame_field = cmds.intField(value=gt_world_space_baker_settings.get('sampling_nth_frame', 2),
+                                             min=1, cc=lambda x: update_stored_settings())
+    cmds.text('Step:')
+    sampling_sub_frame_field = cmds.floatField(value=gt_world_space_baker_settings.get('sampling_sub_frame_step', 0.5),
+                                               min=0.01, max=1, precision=2, cc=lambda x: update_stored_settings())
+    cmds.separator(h=10, style='none', p=range_column)  # Empty Space
     cmds.rowColumnLayout(nc=1, cw=[(1, 240)], cs=[(1, 20)], p=content_main)
     cmds.separator(h=7, style='none')  # Empty Space
     ws_anim_extract_btn = cmds.button(l="Extract World Space", bgc=(.3, .3, .3), c=lambda x: validate_operation(),
@@ -244,6 +367,28 @@ def build_gui_world_space_baker():
     cmds.rowColumnLayout(nc=1, cw=[(1, 240)], cs=[(1, 20)], p=content_main)
     cmds.separator(h=6, style='none')  # Empty Space
 
+    # Save/Load Data
+    cmds.rowColumnLayout(nc=2, cw=[(1, 120), (2, 120)], cs=[(1, 20)], p=content_main)
+    cmds.button(l="Save Data", c=lambda x: save_world_space_data(), w=115)
+    cmds.button(l="Load Data", c=lambda x: load_data_handler(), w=115)
+    cmds.separator(h=8, style='none', p=content_main)  # Empty Space
+
+    # Key Reduction
+    cmds.rowColumnLayout(nc=1, cw=[(1, 240)], cs=[(1, 20)], p=content_main)
+    reduce_keys_chk = cmds.checkBox(label='Reduce Keys (Tolerance)',
+                                    value=gt_world_space_baker_settings.get('reduce_keys', False),
+                                    cc=lambda x: update_stored_settings())
+    cmds.separator(h=5, style='none')  # Empty Space
+    tolerance_column = cmds.rowColumnLayout(nc=4, cw=[(1, 70), (2, 45), (3, 70), (4, 45)], cs=[(1, 0), (3, 10)],
+                                            p=content_main)
+    cmds.text('Translate:')
+    translate_tolerance_field = cmds.floatField(value=gt_world_space_baker_settings.get('translate_tolerance', 0.01),
+                                                min=0, precision=3, cc=lambda x: update_stored_settings())
+    cmds.text('Rotate:')
+    rotate_tolerance_field = cmds.floatField(value=gt_world_space_baker_settings.get('rotate_tolerance', 0.1),
+                                             min=0, precision=3, cc=lambda x: update_stored_settings())
+    cmds.separator(h=8, style='none', p=content_main)  # Empty Space
+
     cmds.rowColumnLayout(nc=1, cw=[(1, 240)], cs=[(1, 20)], p=content_main)
 
     ws_anim_bake_btn = cmds.button(l="Bake World Space", bgc=(.3, .3, .3), c=lambda x: validate_operation('bake'),
@@ -292,6 +437,13 @@ def build_gui_help_world_space_baker():
 
     text = '1. Use "Load Selection" to define targets\n2. Enter animation range (Start & End)'
     text += '\n3. Extract and store transforms\n4. Bake transforms when necessary'
+    text += '\n\nSampling determines the extracted frames:\nEvery frame, every Nth frame, sub-frame\n'
+    text += 'steps or only the key times (sparse bake)'
+    text += '\n\n"Load Space" extracts the transforms\nrelative to the selected object, so\n'
+    text += 'the targets follow it when baking.\nClick on the space name to go back\nto world space.'
+    text += '\n\nStored data can be saved to a file\nand loaded later (even in another session)'
+    text += '\n\n"Reduce Keys" removes baked keys that\nare within the tolerance'
+    text += ' (units for\ntranslate, degrees for rotate)'
     cmds.text(l=text, align="left")
     cmds.separator(h=15, style='none')  # Empty Space
 
@@ -355,22 +507,181 @@ def select_existing_objects(stored_list):
         cmds.select(found_elements)
 
 
-def extract_world_space_data():
+def _get_world_space_targets(objects):
+    """
+    Determines which objects have translate and/or rotate channels that can be animated
+
+    Args:
+        objects (list): A list of objects to check
+
+    Returns:
+        targets (list): A list of tuples (object, needs translate, needs rotate). Objects without
+                        animatable translate or rotate channels are ignored.
+    """
+    targets = []
+    for obj in objects:
+        short_attrs = [attr.split('.')[-1] for attr in cmds.listAnimatable(obj) or []]
+        needs_translate = any(attr.startswith('translate') for attr in short_attrs)
+        needs_rotate = any(attr.startswith('rotate') for attr in short_attrs)
+        if needs_translate or needs_rotate:
+            targets.append((obj, needs_translate, needs_rotate))
+    return targets
+
+
+def _get_key_times(objects, start_time, end_time):
+    """
+    Gets the key times of a list of objects and of their parents (animated parents also move the objects)
+
+    Args:
+        objects (list): A list of objects
+        start_time (float): First frame of the range
+        end_time (float): Last frame of the range (inclusive)
+
+    Returns:
+        key_times (list): Sorted list of unique key times inside the range
+    """
+    nodes = set()
+    for obj in objects:
+        path_elements = cmds.ls(obj, long=True)[0].split('|')
+        for index in range(2, len(path_elements) + 1):
+            nodes.add('|'.join(path_elements[:index]))
+    key_times = cmds.keyframe(list(nodes), q=True, timeChange=True, time=(start_time, end_time)) or []
+    return sorted(set(key_times))
+
+
+def get_sample_frames(objects, start_time, end_time, mode='every_frame', nth_frame=2, sub_frame_step=0.5,
+                      frames=None):
+    """
+    Gets the frames sampled during the extraction according to a sampling mode.
+    The first and last frames of the range are always included.
+
+    Args:
+        objects (list): Objects being extracted (used by "key_times")
+        start_time (float): First frame of the range
+        end_time (float): Last frame of the range (inclusive)
+        mode (optional, string): Sampling mode (a key of "sampling_modes"):
+                                 "every_frame": every whole frame
+                                 "every_nth_frame": every "nth_frame" frame
+                                 "sub_frame": every "sub_frame_step" (e.g. 0.5 samples twice per frame)
+                                 "key_times": only frames where the objects (or their parents) have keys
+        nth_frame (optional, int): Interval used by "every_nth_frame"
+        sub_frame_step (optional, float): Interval used by "sub_frame"
+        frames (optional, list): Explicit list of frames. If provided, the mode is ignored (frames outside the range
+                                 are discarded)
+
+    Returns:
+        frames (list): Sorted list of unique frames
+    """
+    if frames is not None:
+        sample_frames = [frame for frame in frames if start_time <= frame <= end_time]
+    elif mode == 'key_times':
+        sample_frames = _get_key_times(objects, start_time, end_time)
+    else:
+        step = 1
+        if mode == 'every_nth_frame':
+            step = max(int(nth_frame), 1)
+        elif mode == 'sub_frame':
+            step = float(sub_frame_step)
+            if step <= 0:
+                raise ValueError('Sub-frame step must be higher than zero.')
+        # Computed from the start (instead of accumulated) to avoid floating point drift
+        sample_frames = [round(start_time + index * step, 6)
+                         for index in range(int((end_time - start_time) / step + 1e-6) + 1)]
+    return sorted(set([float(start_time), float(end_time)] + [float(frame) for frame in sample_frames]))
+
+
+def _sample_world_space(objects, frames, space=None):
+    """
+    Samples the world space translate and rotate values of a list of objects for a list of frames.
+    Frames are evaluated through DG contexts (see "gt_anim_utilities.sample_world_matrices"), so the current time
+    never changes and every object is sampled with a single evaluation per frame.
+    Every sampling mode uses this sampler (see "get_sample_frames").
+    If a space is provided, it's sampled in the same sweep and the values are relative to it (instead of world).
+
+    Args:
+        objects (list): A list of objects to sample
+        frames (list): A list of sorted frames (sub-frames are supported)
+        space (optional, string): Object used as reference space. None means world.
+
+    Returns:
+        anim_storage (WorldSpaceStorage): Storage with "object.translate" and "object.rotate" as channels
+                                          (XYZ values for every frame of the range)
+    """
+    targets = _get_world_space_targets(objects)
+    sampled_objects = [target[0] for target in targets]
+    if space:
+        sampled_objects.append(space)
+    samples = sample_world_matrices(sampled_objects, frames)
+    space_inverse_matrices = []
+    if space:  # Inverted once per frame, shared by every object
+        space_inverse_matrices = [get_sampled_matrix(samples, len(frames), len(targets), frame_index).inverse()
+                                  for frame_index in range(len(frames))]
+
+    anim_storage = WorldSpaceStorage(frames, metadata={'space': space} if space else None)
+    for index, (obj, needs_translate, needs_rotate) in enumerate(targets):
+        rotate_order = cmds.getAttr(obj + '.rotateOrder')
+        translate_values = array('d')
+        rotate_values = array('d')
+        for frame_index in range(len(frames)):
+            matrix = get_sampled_matrix(samples, len(frames), index, frame_index)
+            if space:
+                matrix = matrix * space_inverse_matrices[frame_index]
+            translate, rotate = decompose_world_matrix(matrix, rotate_order)
+            translate_values.extend(translate)
+            rotate_values.extend(rotate)
+        if needs_translate:
+            anim_storage.set_channel('{}.{}'.format(obj, 'translate'), translate_values)
+        if needs_rotate:
+            anim_storage.set_channel('{}.{}'.format(obj, 'rotate'), rotate_values)
+    return anim_storage
+
+
+def _sample_world_space_per_object(objects, start_time, end_time):
+    """
+    Previous extraction method (only used for benchmarking): walks the whole frame range once per object.
+    Uses a frame range instead of a list of frames and the output uses the previous format (a dictionary with
+    "object.translate" and "object.rotate" as keys and lists of frames as values. e.g. [[1.0, [0.0, 1.0, 0.0]], ...])
+    """
+    anim_storage = {}
+    for obj, needs_translate, needs_rotate in _get_world_space_targets(objects):
+        frame_translate_values = []
+        frame_rotate_values = []
+        cmds.currentTime(start_time)
+        for index in range(end_time - start_time + 1):
+            frame_translate_values.append([cmds.currentTime(q=True), cmds.xform(obj, ws=True, q=True, t=True)])
+            frame_rotate_values.append([cmds.currentTime(q=True), cmds.xform(obj, ws=True, q=True, ro=True)])
+            cmds.currentTime(cmds.currentTime(q=True) + 1)
+        if needs_translate:
+            anim_storage['{}.{}'.format(obj, 'translate')] = frame_translate_values
+        if needs_rotate:
+            anim_storage['{}.{}'.format(obj, 'rotate')] = frame_rotate_values
+    return anim_storage
+
+
+def extract_world_space_data(frames=None):
     """
     Extracts the world space data from the objects that were loaded into selections
+    The sampled frames are determined by the sampling mode stored in the settings (see "get_sample_frames")
+
+    Args:
+        frames (optional, list): Explicit list of frames to sample (overrides the sampling mode)
     """
     # Double check target availability
+    space = gt_world_space_baker_settings.get('space_object') or None
+    if space and not cmds.objExists(space):
+        cmds.warning('Reference space "' + space + '" couldn\'t be found. Please load it again or use world space.')
+        return False
     available_ctrls = []
     for obj in gt_world_space_baker_settings.get('stored_elements'):
         if cmds.objExists(obj):
+            if space and cmds.ls(obj, long=True) == cmds.ls(space, long=True):
+                cmds.warning('"' + obj + '" is the reference space, so it was ignored.')
+                continue
             available_ctrls.append(obj)
 
-    # Store Current Time
-    original_time = cmds.currentTime(q=True)
-
     # Last Validation
     is_valid = True
-    if available_ctrls == 0:
+    if len(available_ctrls) == 0:
         is_valid = False
         cmds.warning("Loaded objects couldn't be found. Please review your settings and try again")
     elif gt_world_space_baker_settings.get('start_time_range') >= gt_world_space_baker_settings.get('end_time_range'):
@@ -382,91 +693,212 @@ def extract_world_space_data():
     if is_valid:
         try:
             cmds.refresh(suspend=True)
-            for obj in available_ctrls:
-                attributes = cmds.listAnimatable(obj)
-                needs_ws_transforms = True
-                frame_translate_values = []
-                frame_rotate_values = []
-                for attr in attributes:
-
-                    try:
-                        # WS Values # Translate and Rotate for the desired frame range
-                        if 'translate' in attr or 'rotate' in attr:
-                            if needs_ws_transforms:
-                                cmds.currentTime(gt_world_space_baker_settings.get('start_time_range'))
-
-                                for index in range(gt_world_space_baker_settings.get(
-                                        'end_time_range') - gt_world_space_baker_settings.get('start_time_range') + 1):
-                                    frame_translate_values.append(
-                                        [cmds.currentTime(q=True), cmds.xform(obj, ws=True, q=True, t=True)])
-                                    frame_rotate_values.append(
-                                        [cmds.currentTime(q=True), cmds.xform(obj, ws=True, q=True, ro=True)])
-                                    cmds.currentTime(cmds.currentTime(q=True) + 1)
-                                needs_ws_transforms = False
-
-                            if attr.split('.')[-1].startswith('translate'):
-                                gt_world_space_baker_anim_storage[
-                                    '{}.{}'.format(obj, 'translate')] = frame_translate_values
-
-                            if attr.split('.')[-1].startswith('rotate'):
-                                gt_world_space_baker_anim_storage['{}.{}'.format(obj, 'rotate')] = frame_rotate_values
-                    except Exception as e:
-                        logger.debug(str(e))  # 0 keyframes
+            sample_frames = get_sample_frames(available_ctrls, gt_world_space_baker_settings.get('start_time_range'),
+                                              gt_world_space_baker_settings.get('end_time_range'),
+                                              mode=gt_world_space_baker_settings.get('sampling_mode', 'every_frame'),
+                                              nth_frame=gt_world_space_baker_settings.get('sampling_nth_frame', 2),
+                                              sub_frame_step=gt_world_space_baker_settings.get(
+                                                  'sampling_sub_frame_step', 0.5),
+                                              frames=frames)
+            gt_world_space_baker_anim_storage.update(_sample_world_space(available_ctrls, sample_frames, space=space))
         except Exception as e:
             logger.debug(str(e))  # 0 keyframes
         finally:
             cmds.refresh(suspend=False)
 
-    cmds.currentTime(original_time)
     return True
 
 
+def _get_bake_data(anim_storage):
+    """
+    Regroups the stored data (one channel per "obj.attr") into aligned lists that can be baked in a single pass.
+
+    Args:
+        anim_storage (WorldSpaceStorage): Stored world space data
+
+    Returns:
+        bake_data (tuple): A tuple with the following elements:
+                           objects (list): A list of objects
+                           frames (list): Stored frames (shared time axis)
+                           world_translations (list): One list of XYZ values per frame for every object (or None)
+                           world_rotations (list): One list of XYZ values per frame for every object (or None)
+                           space (string, None): Reference space used during the extraction (None means world)
+    """
+    objects = [obj for obj in anim_storage.get_objects() if cmds.objExists(obj)]
+    world_translations = [anim_storage.get_values(obj + '.translate') for obj in objects]
+    world_rotations = [anim_storage.get_values(obj + '.rotate') for obj in objects]
+    return objects, list(anim_storage.times), world_translations, world_rotations, anim_storage.metadata.get('space')
+
+
 def bake_world_space_data():
     """
     Bakes extracted data using stored world space dictionary (only translate and rotate)
-    """
+    Parent matrices are sampled in a single sweep (without changing the current time), the stored values are
+    converted to local space in one pass (euler filtered) and each channel receives all its keys at once.
+    If the data was extracted relative to a reference space, the objects follow the current motion of that space.
+    If "reduce_keys" is active in the settings, keys within the stored tolerances are removed after the bake.
 
-    # Store Current Time
-    original_time = cmds.currentTime(q=True)
+    Returns:
+        stats (dict, None): Output of "reduce_baked_keys" (None if the keys were not reduced)
+    """
 
     # Last Validation
-    is_valid = True
     if len(gt_world_space_baker_anim_storage) == 0:
-        is_valid = False
         cmds.warning("Couldn't find stored data. Please try extracting it again.")
+        return None
 
     # Bake Keyframes:
-    if is_valid:
-        try:
-            cmds.refresh(suspend=True)
-            cmds.undoInfo(openChunk=True, chunkName='GT World Space Bake')
-            for key, dict_value in gt_world_space_baker_anim_storage.items():
-                for key_data in dict_value:
-                    try:
-                        obj, attr = key.split('.')
-                        time = key_data[0]
-                        value = key_data[1]
-                        cmds.currentTime(time)
-                        if attr == 'translate':
-                            cmds.xform(obj, ws=True, t=value)
-                            cmds.setKeyframe(obj, time=time, attribute='tx')
-                            cmds.setKeyframe(obj, time=time, attribute='ty')
-                            cmds.setKeyframe(obj, time=time, attribute='tz')
-                        if attr == 'rotate':
-                            cmds.xform(obj, ws=True, ro=value)
-                            cmds.setKeyframe(obj, time=time, attribute='rx')
-                            cmds.setKeyframe(obj, time=time, attribute='ry')
-                            cmds.setKeyframe(obj, time=time, attribute='rz')
-                    except Exception as e:
-                        logger.debug(str(e))
-        except Exception as e:
-            logger.debug(str(e))
-        finally:
-            cmds.undoInfo(closeChunk=True, chunkName='GT World Space Bake')
-            cmds.refresh(suspend=False)
+    objects, frames, world_translations, world_rotations, space = _get_bake_data(gt_world_space_baker_anim_storage)
+    if not objects:
+        cmds.warning("Couldn't find stored objects. Please make sure they still exist.")
+        return None
+    if space and not cmds.objExists(space):
+        cmds.warning('Reference space "' + space + '" couldn\'t be found. Please make sure it still exists.')
+        return None
+    stats = None
+    try:
+        cmds.refresh(suspend=True)
+        cmds.undoInfo(openChunk=True, chunkName='GT World Space Bake')
+        keyed_values = bake_world_transforms(objects, frames, world_translations=world_translations,
+                                             world_rotations=world_rotations, space=space)
+        if gt_world_space_baker_settings.get('reduce_keys'):
+            tolerance = {'translate': gt_world_space_baker_settings.get('translate_tolerance', 0.01),
+                         'rotate': gt_world_space_baker_settings.get('rotate_tolerance', 0.1)}
+            stats = reduce_baked_keys(keyed_values, frames, tolerance)
+            print_reduction_stats(stats)
+    except Exception as e:
+        logger.debug(str(e))
+    finally:
+        cmds.undoInfo(closeChunk=True, chunkName='GT World Space Bake')
+        cmds.refresh(suspend=False)
+    return stats
+
+
+def save_world_space_data(file_path=None):
+    """
+    Saves the stored data to disk (binary), so it can be baked in another session
+
+    Args:
+        file_path (optional, string): Path to the output file. If not provided, a file dialog is opened.
+
+    Returns:
+        file_path (string, None): Path to the saved file (None if nothing was saved)
+    """
+    if len(gt_world_space_baker_anim_storage) == 0:
+        cmds.warning("Couldn't find stored data. Please extract it first.")
+        return None
+    if not file_path:
+        file_name = cmds.fileDialog2(fileFilter=script_name + ' - Data File (*' + storage_extension + ')',
+                                     dialogStyle=2, okCaption='Save',
+                                     caption='Saving World Space Data for "' + script_name + '"') or []
+        if not file_name:
+            return None
+        file_path = file_name[0]
+    try:
+        gt_world_space_baker_anim_storage.save(file_path)
+    except Exception as e:
+        logger.debug(str(e))
+        cmds.warning("Couldn't write to file. Please make sure the saving location is available.")
+        return None
+    sys.stdout.write('World space data saved to "' + file_path + '" (' +
+                     str(len(gt_world_space_baker_anim_storage.get_objects())) + ' objects, ' +
+                     str(gt_world_space_baker_anim_storage.frame_count) + ' frames)\n')
+    return file_path
+
+
+def load_world_space_data(file_path=None, use_mmap=None):
+    """
+    Loads data saved with "save_world_space_data", replacing the stored data.
+    The stored objects and range (settings) are updated to reflect the loaded data.
+
+    Args:
+        file_path (optional, string): Path to the data file. If not provided, a file dialog is opened.
+        use_mmap (optional, bool): Memory-maps the file instead of reading it (see "WorldSpaceStorage.load").
+                                   If None, only big files are memory-mapped.
 
-    # Reset to Original Time
-    cmds.currentTime(original_time)
+    Returns:
+        loaded (bool): True if the data was loaded
+    """
+    if not file_path:
+        file_name = cmds.fileDialog2(fileFilter=script_name + ' - Data File (*' + storage_extension + ')',
+                                     dialogStyle=2, fileMode=1, okCaption='Load',
+                                     caption='Loading World Space Data for "' + script_name + '"') or []
+        if not file_name:
+            return False
+        file_path = file_name[0]
+    if not is_world_space_storage(file_path):
+        cmds.warning("Couldn't read the provided file. Please make sure it's a world space data file.")
+        return False
+    try:
+        loaded_storage = WorldSpaceStorage.load(file_path, use_mmap=use_mmap)
+    except Exception as e:
+        logger.debug(str(e))
+        cmds.warning("Couldn't read the provided file. Please make sure it's a world space data file.")
+        return False
+    global gt_world_space_baker_anim_storage
+    gt_world_space_baker_anim_storage.clear()
+    gt_world_space_baker_anim_storage = loaded_storage
+    gt_world_space_baker_settings['stored_elements'] = gt_world_space_baker_anim_storage.get_objects()
+    if gt_world_space_baker_anim_storage.frame_count:
+        gt_world_space_baker_settings['start_time_range'] = int(gt_world_space_baker_anim_storage.times[0])
+        gt_world_space_baker_settings['end_time_range'] = int(gt_world_space_baker_anim_storage.times[-1])
+    return True
+
+
+def benchmark_world_space_extraction(object_count=40, frame_count=1000):
+    """
+    Compares the extraction methods (one DG context sweep for all objects vs. moving the timeline once per object)
+    using a synthetic animated hierarchy (a chain of transforms). The hierarchy is deleted at the end.
+
+    Args:
+        object_count (optional, int): Number of transforms in the synthetic hierarchy
+        frame_count (optional, int): Number of frames to extract
+
+    Returns:
+        results (dict): Time in seconds for each method and if both methods extracted the same data.
+                        e.g. {'single_sweep': 1.0, 'per_object': 40.0, 'matching_data': True}
+    """
+    import time
+    original_time = cmds.currentTime(q=True)
+    objects = []
+    parent = None
+    for index in range(object_count):
+        if parent:
+            obj = cmds.createNode('transform', name='gt_benchmark_ws_' + str(index), parent=parent, skipSelect=True)
+        else:
+            obj = cmds.createNode('transform', name='gt_benchmark_ws_' + str(index), skipSelect=True)
+        cmds.setKeyframe(obj, attribute='translateX', time=1, value=0)
+        cmds.setKeyframe(obj, attribute='translateX', time=frame_count, value=index + 1)
+        cmds.setKeyframe(obj, attribute='rotateY', time=1, value=0)
+        cmds.setKeyframe(obj, attribute='rotateY', time=frame_count, value=(index + 1) * 10)
+        objects.append(cmds.ls(obj, long=True)[0])
+        parent = obj
+
+    results = {}
+    try:
+        cmds.refresh(suspend=True)
+        start = time.perf_counter()
+        single_sweep_data = _sample_world_space(objects, list(range(1, frame_count + 1)))
+        results['single_sweep'] = time.perf_counter() - start
+        start = time.perf_counter()
+        per_object_data = _sample_world_space_per_object(objects, 1, frame_count)
+        results['per_object'] = time.perf_counter() - start
+        max_difference = 0
+        for key, frame_values in per_object_data.items():
+            for (frame, values), (sampled_frame, sampled_values) in zip(frame_values, single_sweep_data.get(key)):
+                max_difference = max([max_difference] + [abs(value - sampled_value) for value, sampled_value
+                                                         in zip(values, sampled_values)])
+        results['matching_data'] = max_difference < 1e-4
+    finally:
+        cmds.refresh(suspend=False)
+        cmds.delete(objects[0])
+        cmds.currentTime(original_time)
+
+    sys.stdout.write('Objects: {}, Frames: {}\n'.format(object_count, frame_count))
+    sys.stdout.write('Single sweep: {:.3f}s\nPer object: {:.3f}s\nSpeedup: {:.1f}x\nMatching data: {}\n'.format(
+        results.get('single_sweep'), results.get('per_object'),
+        results.get('per_object') / max(results.get('single_sweep'), 1e-6), results.get('matching_data')))
+    return results
 
 
 # Build UI
@@ -0,0 +1,323 @@
+"""
+ GT World Space Storage - Compact (array-backed) storage used by GT World Space Baker
+ github.com/TrevisanGMW/gt-tools - 2026-10-18
+
+ Data is stored as one contiguous float64 buffer per channel ("object.translate" or "object.rotate")
+ with XYZ values interleaved (x0, y0, z0, x1, y1, z1, ...) and a single time axis shared by every channel.
+
+ Layout (little-endian):
+    Preamble: magic "GTWSPC" (6 bytes), version (uint16), flags (uint16), header size (uint32)
+    Header: JSON (utf-8) with the frame count, the offset of the time axis, the offset of every channel and metadata
+    Buffers: float64 arrays (8-byte aligned), so they can be memory-mapped and read without copying
+
+ 1.0.0 - 2026-10-18
+ Initial release
+
+ 1.0.1 - 2026-10-18
+ Added "metadata" (e.g. reference space used during the extraction)
+
+"""
+from array import array
+import logging
+import json
+import mmap
+import sys
+import os
+
+# Logging Setup
+logging.basicConfig()
+logger = logging.getLogger("gt_world_space_storage")
+logger.setLevel(logging.INFO)
+
+storage_magic = b'GTWSPC'
+storage_version = 1
+storage_extension = '.wsdata'
+preamble_size = 14  # magic (6) + version (2) + flags (2) + header size (4)
+mmap_threshold = 64 * 1024 * 1024  # Files bigger than this are memory-mapped when "use_mmap" is None
+dimensions = 3  # XYZ
+
+
+def _to_little_endian(values):
+    """ Swaps the byte order of an array in case the current platform is big-endian """
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values
+
+
+def _align(offset, alignment=8):
+    """ Rounds an offset up to the next multiple of "alignment" """
+    return (offset + alignment - 1) // alignment * alignment
+
+
+class WorldSpaceStorage:
+    """
+    Stores world space values for many channels on a shared time axis.
+    It also behaves like the dictionary previously used by GT World Space Baker (read-only),
+    e.g. "storage.get('pSphere1.translate')" returns [[1.0, [0.0, 1.0, 0.0]], ...]
+    """
+
+    def __init__(self, times=None, metadata=None):
+        """
+        Args:
+            times (optional, list): Time axis (frames) shared by every channel
+            metadata (optional, dict): Extra information stored with the data (must be JSON serializable)
+                                       e.g. {'space': 'pCube1'}
+        """
+        self.times = array('d', times or [])
+        self.buffers = {}
+        self.metadata = dict(metadata or {})
+        self._mmap = None
+        self._file = None
+
+    # Dictionary-like interface --------------------------------------------------------------------------------
+    def __len__(self):
+        return len(self.buffers)
+
+    def __contains__(self, key):
+        return key in self.buffers
+
+    def __iter__(self):
+        return iter(self.buffers)
+
+    def keys(self):
+        return self.buffers.keys()
+
+    def items(self):
+        """ Channels in the legacy format (see "get") """
+        return [(key, self.get(key)) for key in self.buffers]
+
+    def get(self, key, default=None):
+        """
+        Gets a channel in the legacy format (a list of [time, [x, y, z]])
+
+        Args:
+            key (string): Name of the channel. e.g. "pSphere1.translate"
+            default (optional, any): Returned if the channel doesn't exist
+
+        Returns:
+            frame_values (list): A list of frames. Each frame is a list with the time and XYZ values.
+        """
+        if key not in self.buffers:
+            return default
+        return [[time, values] for time, values in zip(self.times, self.get_values(key))]
+
+    # Channels -------------------------------------------------------------------------------------------------
+    @property
+    def frame_count(self):
+        return len(self.times)
+
+    @property
+    def nbytes(self):
+        """ Size of the stored values in bytes (time axis included) """
+        return (len(self.times) + sum(len(buffer) for buffer in self.buffers.values())) * 8
+
+    def get_objects(self):
+        """
+        Gets the stored objects (in the order they were stored)
+
+        Returns:
+            objects (list): A list of object names
+        """
+        objects = []
+        for key in self.buffers:
+            obj = key.rsplit('.', 1)[0]
+            if obj not in objects:
+                objects.append(obj)
+        return objects
+
+    def get_buffer(self, key):
+        """
+        Gets the contiguous buffer of a channel (XYZ interleaved)
+
+        Args:
+            key (string): Name of the channel. e.g. "pSphere1.translate"
+
+        Returns:
+            buffer (array, memoryview, None): Values of the channel (None if the channel doesn't exist)
+        """
+        return self.buffers.get(key)
+
+    def get_values(self, key):
+        """
+        Gets the values of a channel as a list of XYZ lists (one per frame)
+
+        Args:
+            key (string): Name of the channel. e.g. "pSphere1.translate"
+
+        Returns:
+            values (list, None): A list of [x, y, z] lists (None if the channel doesn't exist)
+        """
+        buffer = self.buffers.get(key)
+        if buffer is None:
+            return None
+        return [list(buffer[index:index + dimensions]) for index in range(0, len(buffer), dimensions)]
+
+    def set_channel(self, key, values):
+        """
+        Stores the values of a channel (replacing existing values)
+
+        Args:
+            key (string): Name of the channel. e.g. "pSphere1.translate"
+            values (list, array): Either a list of XYZ lists (one per frame) or a flat sequence (XYZ interleaved)
+        """
+        if len(values) and isinstance(values[0], (list, tuple)):
+            buffer = array('d')
+            for xyz in values:
+                buffer.extend(xyz)
+        else:
+            buffer = array('d', values)
+        if len(buffer) != len(self.times) * dimensions:
+            raise ValueError('Channel "' + key + '" has ' + str(len(buffer) // dimensions) +
+                             ' frames, but the time axis has ' + str(len(self.times)) + ' frames.')
+        self.buffers[key] = buffer
+
+    def update(self, other):
+        """
+        Adds the channels of another storage. The time axis and metadata are shared, so if the other storage uses
+        a different time axis or metadata (e.g. another space), the current channels are discarded first.
+
+        Args:
+            other (WorldSpaceStorage): Storage providing the new channels
+        """
+        if list(self.times) != list(other.times) or self.metadata != other.metadata:
+            if self.buffers:
+                logger.debug('Time axis or metadata changed. Previously stored channels were discarded.')
+            self.clear()
+            self.times = array('d', other.times)
+            self.metadata = dict(other.metadata)
+        for key in other.buffers:
+            self.buffers[key] = array('d', other.buffers.get(key))
+
+    def clear(self):
+        """ Removes every channel, the time axis and the metadata (closing memory-mapped files) """
+        self.buffers = {}
+        self.times = array('d')
+        self.metadata = {}
+        self.close()
+
+    def close(self):
+        """ Releases the memory-mapped file (if any). Memory-mapped buffers are copied into memory first. """
+        if self._mmap is None:
+            return
+        self.times = array('d', self.times)
+        for key in self.buffers:
+            self.buffers[key] = array('d', self.buffers.get(key))
+        try:
+            self._mmap.close()
+            self._file.close()
+        except Exception as e:
+            logger.debug(str(e))
+        self._mmap = None
+        self._file = None
+
+    # Persistence ----------------------------------------------------------------------------------------------
+    def save(self, file_path):
+        """
+        Writes the storage to disk (binary)
+
+        Args:
+            file_path (string): Path to the output file
+
+        Returns:
+            file_path (string): Path to the written file
+        """
+        self.close()  # In case the file being written is memory-mapped
+        names = list(self.buffers)
+        # Header size depends on the offsets, so offsets are computed relative to the end of the header first
+        relative_offsets = []
+        offset = len(self.times) * 8
+        for name in names:
+            relative_offsets.append(offset)
+            offset += len(self.buffers.get(name)) * 8
+
+        header = {'frame_count': len(self.times), 'metadata': self.metadata}
+        data_start = _align(preamble_size)
+        while True:  # Offsets change the header size, repeat until the header fits before the data
+            header['times_offset'] = data_start
+            header['channels'] = [[name, data_start + relative] for name, relative in zip(names, relative_offsets)]
+            header_bytes = json.dumps(header).encode('utf-8')
+            if preamble_size + len(header_bytes) <= data_start:
+                break
+            data_start = _align(preamble_size + len(header_bytes))
+
+        with open(file_path, 'wb') as data_file:
+            data_file.write(storage_magic)
+            data_file.write(_to_little_endian(array('H', [storage_version, 0])).tobytes())
+            data_file.write(_to_little_endian(array('I', [len(header_bytes)])).tobytes())
+            data_file.write(header_bytes)
+            data_file.write(b' ' * (data_start - preamble_size - len(header_bytes)))  # Padding (alignment)
+            data_file.write(_to_little_endian(array('d', self.times)).tobytes())
+            for name in names:
+                data_file.write(_to_little_endian(array('d', self.buffers.get(name))).tobytes())
+        return file_path
+
+    @classmethod
+    def load(cls, file_path, use_mmap=None):
+        """
+        Reads a storage file
+
+        Args:
+            file_path (string): Path to a file written by "WorldSpaceStorage.save"
+            use_mmap (optional, bool): If True, the buffers are memory-mapped (read-only, only the frames that are
+                                       accessed are read from disk). If None, files bigger than "mmap_threshold"
+                                       are memory-mapped. (Ignored on big-endian platforms)
+
+        Returns:
+            storage (WorldSpaceStorage): Loaded storage
+        """
+        if use_mmap is None:
+            use_mmap = os.path.getsize(file_path) > mmap_threshold
+        if sys.byteorder != 'little':
+            use_mmap = False
+
+        storage = cls()
+        data_file = open(file_path, 'rb')
+        try:
+            preamble = data_file.read(preamble_size)
+            if preamble[:len(storage_magic)] != storage_magic:
+                raise ValueError('"' + file_path + '" is not a world space storage file.')
+            version = _to_little_endian(array('H', preamble[6:10]))[0]
+            if version > storage_version:
+                raise ValueError('Unsupported storage version: ' + str(version))
+            header_size = _to_little_endian(array('I', preamble[10:14]))[0]
+            header = json.loads(data_file.read(header_size).decode('utf-8'))
+            frame_count = header.get('frame_count')
+            storage.metadata = header.get('metadata') or {}
+
+            if use_mmap:
+                storage._file = data_file
+                storage._mmap = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+                view = memoryview(storage._mmap)
+
+                def read_buffer(offset, count):
+                    return view[offset:offset + count * 8].cast('d')
+            else:
+                def read_buffer(offset, count):
+                    data_file.seek(offset)
+                    return _to_little_endian(array('d', data_file.read(count * 8)))
+
+            storage.times = read_buffer(header.get('times_offset'), frame_count)
+            for name, offset in header.get('channels'):
+                storage.buffers[name] = read_buffer(offset, frame_count * dimensions)
+        finally:
+            if storage._mmap is None:
+                data_file.close()
+        return storage
+
+
+def is_world_space_storage(file_path):
+    """
+    Checks if a file is a world space storage file (using its magic bytes)
+
+    Args:
+        file_path (string): Path to the file
+
+    Returns:
+        is_storage (bool): True if the file starts with the storage magic bytes
+    """
+    try:
+        with open(file_path, 'rb') as data_file:
+            return data_file.read(len(storage_magic)) == storage_magic
+    except Exception as e:
+        logger.debug(str(e))
+        return False